@@ -1,47 +1,179 @@
+import time
+PROCESS_STARTED_AT = time.monotonic()  # Taken before the imports below, for the startup budget
+
 import discord
-from discord.ext import tasks
 from discord import app_commands
-from datetime import datetime, time as dtime
+from datetime import datetime, timedelta
 import re
 import os
 import json
-from pystray import Icon, MenuItem, Menu
-from PIL import Image
+import hashlib
 import threading
-import ctypes
-import sys
-from collections import deque
-import base64
-from io import BytesIO
-from openai import OpenAI
+import io
 import sys
 import asyncio
-from constants import EMBEDDED_ICON, TIMEKEEPER_INSTRUCTIONS, STATUS_INSTRUCTIONS, CHAT_INSTRUCTIONS
-from tokens import API_KEY, TOKEN
-
-
-# Initialize the OpenAI client
-
-client = OpenAI(
-    api_key=API_KEY)
+import logging
+import random
+import aiohttp
+from constants import (TIMEKEEPER_INSTRUCTIONS, STATUS_INSTRUCTIONS, CHAT_INSTRUCTIONS, BATCH_DIRECTIVE_INSTRUCTIONS,
+                       STATUS_BATCH_INSTRUCTIONS)
+from scheduler import ReminderScheduler, plan_next_fire
+from models import MAIN_REMINDER_ID, ReminderTime
+from config_store import ConfigStore
+from storage import open_storage, CONFIG_FILE, DATABASE_FILE
+from llm import (LLMGateway, CircuitBreaker, CircuitOpenError, MAX_CONCURRENCY, BREAKER_ERROR_RATE,
+                 BREAKER_SLOW_CALL_SECONDS, BREAKER_SLOW_CALL_RATE, BREAKER_OPEN_SECONDS)
+from chat_queue import ChatPipeline, BucketMap
+from streaming import stream_to_channel
+from conversation import ConversationStore, CONTEXT_TOKEN_BUDGET, TURN_OVERHEAD_TOKENS, count_tokens, load_encoding
+from pregen import StagedGenerations
+from generation import GenerationBatcher
+from status import StatusEngine
+from dispatcher import ReminderDispatcher
+from outbox import Outbox, outbox_id
+from lease import Lease, LEASE_FILE, LEASE_SECONDS
+from logs import setup_logging, guild_context
+from metrics import (REMINDER_LATENESS, SCHEDULER_LAG, LLM_LATENCY, LLM_REQUESTS, CHAT_FIRST_TEXT,
+                     DISCORD_SEND_LATENCY, STORAGE_IO, LOOP_LAG, LOOP_STALLS, QUEUE_DEPTH, STARTUP_SECONDS,
+                     monitor_loop_lag, serve_metrics)
+from loop_watchdog import LoopWatchdog, sample_profile, STALL_THRESHOLD_SECONDS, PROFILE_MAX_SECONDS
+from settings import get_setting, load_credentials
+
+log = logging.getLogger("timekeeper")
+
+# Time from process start to the first on_ready, in seconds; over budget is logged as a warning
+STARTUP_BUDGET_SECONDS = float(get_setting("TIMEKEEPER_STARTUP_BUDGET", "10"))
+startup_marks = {}  # phase -> seconds since PROCESS_STARTED_AT
+
+
+def mark_startup(phase):
+    if phase not in startup_marks:
+        startup_marks[phase] = time.monotonic() - PROCESS_STARTED_AT
+        STARTUP_SECONDS.set(startup_marks[phase], phase=phase)
+
+
+def report_startup():
+    phases = ", ".join(f"{phase} at {seconds:.2f}s" for phase, seconds in startup_marks.items())
+    # Time spent as an HA standby is not startup time
+    total = startup_marks["ready"] - (startup_marks.get("lease acquired", 0.0) - startup_marks.get("standby", 0.0))
+    if total > STARTUP_BUDGET_SECONDS:
+        log.warning(f"Startup took {total:.2f}s, over the {STARTUP_BUDGET_SECONDS:.0f}s budget ({phases}).")
+    else:
+        log.info(f"Startup took {total:.2f}s ({phases}).")
+
+
+mark_startup("imports")
+
+
+# Credentials come from OPENAI_API_KEY / DISCORD_TOKEN (environment or settings file, see settings.py)
+API_KEY, TOKEN = load_credentials()
+
+# Shared async gateway to the OpenAI API (pooled client, concurrency cap, retries). Its circuit
+# breaker makes calls fail fast while the API is failing or slow; the thresholds are settings:
+#   TIMEKEEPER_LLM_ERROR_RATE      share of recent calls that must fail to open the circuit
+#   TIMEKEEPER_LLM_SLOW_SECONDS    a call at least this slow counts as slow
+#   TIMEKEEPER_LLM_SLOW_RATE       share of recent calls that must be slow to open the circuit
+#   TIMEKEEPER_LLM_OPEN_SECONDS    how long the circuit stays open before a probe call
+llm = LLMGateway(API_KEY, breaker=CircuitBreaker(
+    error_rate=float(get_setting("TIMEKEEPER_LLM_ERROR_RATE", BREAKER_ERROR_RATE)),
+    slow_call_seconds=float(get_setting("TIMEKEEPER_LLM_SLOW_SECONDS", BREAKER_SLOW_CALL_SECONDS)),
+    slow_call_rate=float(get_setting("TIMEKEEPER_LLM_SLOW_RATE", BREAKER_SLOW_CALL_RATE)),
+    open_seconds=float(get_setting("TIMEKEEPER_LLM_OPEN_SECONDS", BREAKER_OPEN_SECONDS)),
+))
+llm_warm_up_task = None  # Started in setup_hook
+
+# In-character text for when the chatbot cannot be reached and nothing better is available
+FALLBACK_REMINDER_MESSAGE = (
+    "⏳ **Timekeeper Directive:** To Mark the Hour ⏳\n\n"
+    "The gears stall and the ghostfield hums with static, yet the hour comes all the same. "
+    "Heed it, for the Timekeeper does not forget."
+)
+
+# Overall timeout in seconds for each kind of LLM call
+LLM_TIMEOUTS = {
+    "reminder": 120,
+    "reminder_batch": 180,
+    "status": 120,
+    "chat": 45,
+    "test": 15,
+}
+
+# How long in seconds a completion may be reused for each kind of call (0 disables caching)
+LLM_CACHE_TTLS = {
+    "reminder": 15 * 60,
+    "reminder_batch": 0,
+    "status": 0,
+    "chat": 60,
+    "test": 5 * 60,
+}
 
 
 # Function to interact with Timekeeper
-def timekeeper_directive(input_text, input_instructions=None):
+async def timekeeper_directive(input_text, input_instructions=None, use_case="reminder", guild_id=None,
+                               cache=True, json_mode=False, history=()):
     if input_instructions is None:
         input_instructions = TIMEKEEPER_INSTRUCTIONS
 
-    # Create the chat completion
-    completion = client.chat.completions.create(
-        model="gpt-4o",  # Replace with the appropriate model name
-        messages=[
-            {"role": "system", "content": input_instructions},
-            {"role": "user", "content": input_text}
-        ]
-    )
-
-    # Return the generated content
-    return completion.choices[0].message.content
+    started_at = time.monotonic()
+    try:
+        response = await llm.complete(input_text, input_instructions, timeout=LLM_TIMEOUTS.get(use_case),
+                                      cache_ttl=llm_cache_ttl(use_case, guild_id) if cache else 0,
+                                      json_mode=json_mode, history=history)
+    except Exception:
+        LLM_REQUESTS.inc(use_case=use_case, outcome="error")
+        raise
+    finally:
+        LLM_LATENCY.observe(time.monotonic() - started_at, use_case=use_case)
+    LLM_REQUESTS.inc(use_case=use_case, outcome="ok")
+    return response
+
+
+def llm_cache_ttl(use_case, guild_id=None):
+    guild = config_store.get_model(guild_id) if guild_id is not None else None
+    if guild is not None and not guild.llm_cache:
+        return 0  # Guild opted out: always ask for a fresh completion
+    return LLM_CACHE_TTLS.get(use_case, 0)
+
+
+async def timekeeper_directives(prompts):
+    """Answer several reminder prompts with one completion; returns a text (or None) per prompt."""
+    request = json.dumps({str(index): prompt for index, prompt in enumerate(prompts, 1)})
+    response = await timekeeper_directive(request, TIMEKEEPER_INSTRUCTIONS + BATCH_DIRECTIVE_INSTRUCTIONS,
+                                          use_case="reminder_batch", json_mode=True)
+    try:
+        directives = json.loads(response)
+    except (TypeError, ValueError):
+        directives = None
+    if not isinstance(directives, dict):
+        log.error("Combined reminder completion was not a JSON object.")
+        return [None] * len(prompts)
+    texts = []
+    for index in range(1, len(prompts) + 1):
+        text = directives.get(str(index))
+        texts.append((text.strip() or None) if isinstance(text, str) else None)
+    return texts
+
+
+async def generate_reminder_text(prompt, guild_id):
+    """Reminder text for `prompt`, batched with other reminders generated at the same moment."""
+    shared = llm_cache_ttl("reminder", guild_id) > 0
+    key = llm.cache_key(prompt, TIMEKEEPER_INSTRUCTIONS)
+    if shared:
+        cached = llm.cache.lookup(key)
+        if cached is not None:
+            return cached
+    text = await generation_batcher.generate(prompt, shared)
+    if shared:
+        llm.cache.put(key, LLM_CACHE_TTLS["reminder"], text)
+    return text
+
+
+# Prompt-mode reminders due together share completions: identical prompts are generated
+# once, distinct ones several to a call (see generation.py). generate_reminder_text() has
+# already looked the prompt up in the response cache and stores the result, so the
+# one-by-one fallback bypasses the cache rather than counting a second miss.
+generation_batcher = GenerationBatcher(
+    lambda prompt, shared: timekeeper_directive(prompt, cache=False), timekeeper_directives)
 
 # Constant for status update interval (in seconds)
 MINUTES = 60
@@ -49,98 +181,106 @@ HOURS = 3600
 DAYS = 86,400
 STATUS_UPDATE_INTERVAL = 24 * HOURS
 
-# Control flag for managing the loop
-status_update_event = asyncio.Event()
+async def generate_statuses(count):
+    """Ask for `count` statuses in one completion; returns the status texts."""
+    response = await timekeeper_directive(f"Generate {count} statuses.", STATUS_INSTRUCTIONS + STATUS_BATCH_INSTRUCTIONS,
+                                          use_case="status", json_mode=True)
+    statuses = json.loads(response).get("statuses")
+    if not isinstance(statuses, list):
+        raise ValueError("Status completion has no list of statuses")
+    return statuses
 
-async def update_status_loop():
-    status_update_event.set()  # Enable the loop initially
-    while status_update_event.is_set():  # Continue only while the event is set
-        try:
-            # Get the status message from timekeeper_directive
-            status_message = timekeeper_directive("", STATUS_INSTRUCTIONS)
-
-            # Determine the activity type based on the message's start
-            if status_message.startswith("Playing"):
-                activity_type = discord.ActivityType.playing
-                status_message = status_message[len("Playing "):].strip()  # Remove the prefix
-            elif status_message.startswith("Listening to"):
-                activity_type = discord.ActivityType.listening
-                status_message = status_message[len("Listening to "):].strip()
-            elif status_message.startswith("Streaming"):
-                activity_type = discord.ActivityType.streaming
-                status_message = status_message[len("Streaming "):].strip()
-            elif status_message.startswith("Watching"):
-                activity_type = discord.ActivityType.watching
-                status_message = status_message[len("Watching "):].strip()
-            elif status_message.startswith("Competing in"):
-                activity_type = discord.ActivityType.competing
-                status_message = status_message[len("Competing in "):].strip()
-            else:
-                # Default behavior: prepend ". " and set activity type to Watching
-                activity_type = discord.ActivityType.watching
-                status_message = " the hourglass drain its last grain."
-
-            # Update the bot's presence
-            activity = discord.Activity(type=activity_type, name=status_message)
-            await bot.change_presence(status=discord.Status.online, activity=activity)
-
-            print(f"Updated status: {status_message} (Type: {activity_type.name})")
-        except Exception as e:
-            print(f"[ERROR] Failed to update status: {e}")
 
-        # Wait for the next update
-        await asyncio.sleep(STATUS_UPDATE_INTERVAL)
+async def apply_status(activity_type, name):
+    activity = discord.Activity(type=getattr(discord.ActivityType, activity_type), name=name)
+    await bot.change_presence(status=discord.Status.online, activity=activity)
 
 
-intents = discord.Intents.default()
-bot = discord.Client(intents=intents)
-tree = app_commands.CommandTree(bot)  # For slash commands
+def save_status_queue(entries):
+    config_store.set_meta("status_queue", entries)
 
-CONFIG_FILE = "timekeeper_bot_config.json"
-reminder_tasks = {}
 
+# The presence rotates through a persisted queue of statuses generated a batch at a
+# time (see status.py); /update_status skips to the next one without an API call
+status_engine = StatusEngine(generate_statuses, apply_status, lambda: config_store.get_meta("status_queue", []),
+                             save_status_queue, interval=STATUS_UPDATE_INTERVAL)
 
-# Circular buffer for console output
-class CircularBuffer:
-    def __init__(self, max_lines=1000):
-        self.buffer = deque(maxlen=max_lines)
 
-    def write(self, message):
-        self.buffer.append(message)
+# Sharding is configured through the environment (or settings file), normally by launcher.py:
+#   TIMEKEEPER_SHARD_COUNT  total number of shards across all processes
+#   TIMEKEEPER_SHARD_IDS    comma-separated shards this process runs (default: all of them)
+#   TIMEKEEPER_WORKER       set to 1 in launcher workers; implies headless mode
+SHARD_COUNT = int(get_setting("TIMEKEEPER_SHARD_COUNT", "0")) or None
+SHARD_IDS = [int(shard_id) for shard_id in get_setting("TIMEKEEPER_SHARD_IDS", "").split(",") if shard_id.strip()] or None
+WORKER_MODE = get_setting("TIMEKEEPER_WORKER") == "1"
 
-    def flush(self):
-        pass
+# Headless mode (--headless or TIMEKEEPER_HEADLESS=1) is for servers: no tray icon or console
+# window, and the log is echoed to stderr instead of being captured for the console
+HEADLESS = WORKER_MODE or "--headless" in sys.argv[1:] or get_setting("TIMEKEEPER_HEADLESS") == "1"
 
-    def replay(self):
-        return ''.join(self.buffer)
+# Active/standby mode (TIMEKEEPER_HA=1): instances started in the same directory compete for
+# a lease in TIMEKEEPER_HA_LEASE_FILE (see lease.py). Standbys wait for it without connecting
+# to Discord; the leader runs everything, and exits if the lease is ever taken over. A standby
+# takes over at most TIMEKEEPER_HA_LEASE_SECONDS (plus one renewal) after the leader stops.
+HA_MODE = get_setting("TIMEKEEPER_HA") == "1"
+ha_lease = None
+if HA_MODE:
+    ha_lease = Lease(get_setting("TIMEKEEPER_HA_LEASE_FILE", LEASE_FILE),
+                     f"timekeeper-{'-'.join(map(str, SHARD_IDS))}" if SHARD_IDS else "timekeeper",
+                     ttl=float(get_setting("TIMEKEEPER_HA_LEASE_SECONDS", LEASE_SECONDS)))
+ha_lease_task = None
+ha_lease_lost = False
 
+intents = discord.Intents.default()
+if SHARD_COUNT:
+    bot = discord.AutoShardedClient(intents=intents, shard_count=SHARD_COUNT, shard_ids=SHARD_IDS)
+else:
+    bot = discord.Client(intents=intents)
 
-# Initialize the circular buffer
-console_buffer = CircularBuffer()
 
-# Redirect output to the buffer
-sys.stdout = console_buffer
-sys.stderr = console_buffer
+def owns_guild(guild_id):
+    """Whether this process runs the shard that Discord routes the guild to."""
+    if not SHARD_COUNT or SHARD_IDS is None:
+        return True
+    return (int(guild_id) >> 22) % SHARD_COUNT in SHARD_IDS
 
 
-# Load configuration from file
-def load_config():
-    try:
-        with open(CONFIG_FILE, "r") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        print("[DEBUG] Config file not found or corrupted. Creating a new one.")
-        return {"guilds": {}}
+class TimekeeperCommandTree(app_commands.CommandTree):
+    async def interaction_check(self, interaction: discord.Interaction):
+        guild_context.set(interaction.guild_id)  # Tag everything logged while handling the command
+        return True
+
+
+tree = TimekeeperCommandTree(bot)  # For slash commands
+
+# 'json' or 'sqlite'; switching to sqlite migrates CONFIG_FILE once. Workers sharing one
+# store must use sqlite, since the JSON backend rewrites every guild on each flush.
+STORAGE_BACKEND = get_setting("TIMEKEEPER_STORAGE", "json")
+
+
+# Everything is logged through a background writer thread (see logs.py) to LOG_FILE and a
+# size-bounded history that the tray console shows. Headless runs (including launcher workers)
+# echo to stderr instead of capturing it, so the service manager or launcher collects it.
+LOG_FILE = f"timekeeper-{'-'.join(map(str, SHARD_IDS))}.log" if SHARD_IDS else "timekeeper.log"
+log_writer = setup_logging(LOG_FILE, capture_stdio=not HEADLESS)
 
 
-def save_config(config):
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=4)
+# Guild configs are loaded once and served from memory; changes are flushed in batches
+config_store = ConfigStore(open_storage(STORAGE_BACKEND, CONFIG_FILE, DATABASE_FILE))
+config_store.load()
+config_flush_task = None
+
+# Every reminder send is journaled before and after it goes out; each worker keeps its own journal
+OUTBOX_FILE = f"timekeeper_outbox-{'-'.join(map(str, SHARD_IDS))}.jsonl" if SHARD_IDS else "timekeeper_outbox.jsonl"
+reminder_outbox = Outbox(OUTBOX_FILE)
+if not HA_MODE:
+    reminder_outbox.load()  # In HA mode this waits for the lease: loading compacts the file (see main)
+mark_startup("state loaded")
+outbox_replayed = False
 
 
 def load_guild_config(guild_id):
-    config = load_config()
-    guild_config = config.get("guilds", {}).get(str(guild_id), {
+    guild_config = config_store.get_guild(guild_id, {
         "channel_id": None,
         "reminder_time": None,
         "reminder_message": None,
@@ -152,101 +292,411 @@ def load_guild_config(guild_id):
 
 
 def save_guild_config(guild_id, guild_config):
-    config = load_config()
-    if "guilds" not in config:
-        config["guilds"] = {}
-    config["guilds"][str(guild_id)] = guild_config
-    save_config(config)
+    config_store.set_guild(guild_id, guild_config)
 
 
-async def reminder_task(guild_id):
-    guild_config = load_guild_config(guild_id)
-    now = datetime.now()
-    if guild_config["last_sent_date"] == now.date().isoformat():
+# The main reminder (MAIN_REMINDER_ID) lives in the top-level config fields; further
+# reminders are records in guild_config["reminders"], keyed by their own IDs.
+MAX_REMINDERS_PER_GUILD = 50
+
+
+# These two work on a guild config dict, for edits; read-only code uses the GuildConfig
+# model from config_store.get_model() instead.
+def get_reminder(guild_config, reminder_id):
+    """Return a reminder's settings dict, or None if the guild has no such reminder.
+
+    The main reminder's settings are the guild config's own top-level keys, so
+    the guild config itself is returned for it. Either way, changes to the
+    result are saved with the guild config.
+    """
+    if reminder_id == MAIN_REMINDER_ID:
+        return guild_config
+    return guild_config.get("reminders", {}).get(reminder_id)
+
+
+def iter_reminders(guild_config):
+    yield MAIN_REMINDER_ID, guild_config
+    yield from guild_config.get("reminders", {}).items()
+
+
+async def reminder_task(key, fire_at):
+    """Scheduler callback: hand the occurrence due at `fire_at` to the dispatcher.
+
+    The next occurrence is queued by record_reminder_batch() once the send has
+    finished, so a crash mid-send leaves the occurrence to the catch-up policy.
+    """
+    guild_id, reminder_id = key
+    guild_context.set(guild_id)
+    guild = config_store.get_model(guild_id)
+    reminder = guild.reminder(reminder_id) if guild is not None else None
+    if reminder is None or not guild.enabled:
         return
-    reminder_time = guild_config["reminder_time"]
-    if reminder_time:
-        try:
-            if reminder_time["type"] == "daily":
-                task_time = dtime.fromisoformat(reminder_time["time"])
-                if now.time().hour == task_time.hour and now.time().minute == task_time.minute:
-                    await send_reminder(guild_id, now)
-            elif reminder_time["type"] == "weekly":
-                task_time = dtime.fromisoformat(reminder_time["time"])
-                if now.strftime("%A") == reminder_time[
-                    "day"] and now.time().hour == task_time.hour and now.time().minute == task_time.minute:
-                    await send_reminder(guild_id, now)
-            elif reminder_time["type"] == "specific":
-                task_datetime = datetime.fromisoformat(reminder_time["datetime"])
-                if now.date() == task_datetime.date() and now.time().hour == task_datetime.time().hour and now.time().minute == task_datetime.time().minute:
-                    await send_reminder(guild_id, now)
-        except (KeyError, ValueError):
-            print(f"[ERROR] Invalid reminder time configuration for guild {guild_id}")
+    lateness = (datetime.now() - fire_at).total_seconds()
+    SCHEDULER_LAG.observe(max(0.0, lateness))
+    if lateness > MISFIRE_GRACE.total_seconds() and CATCH_UP_POLICY == "skip":
+        # The loop stalled past the grace window; the policy says to drop this occurrence
+        log.debug(f"Skipping reminder {reminder_id} for guild {guild_id}: "
+                  f"scheduled {fire_at.isoformat(sep=' ')}, {lateness:.1f}s late.")
+    elif reminder.last_fired_at != fire_at.isoformat():
+        # Each occurrence of a reminder is sent at most once
+        reminder_dispatcher.submit(key, fire_at)
+        return
+    schedule_reminder(guild_id, reminder_id, after=fire_at + timedelta(minutes=1))
 
 
-async def send_reminder(guild_id, now):
-    guild_config = load_guild_config(guild_id)
-    channel_id = guild_config["channel_id"]
-    message_mode = guild_config.get("message_mode", "static")  # Default to 'static' if not set
+async def pregenerate_reminder(key, started_at):
+    """Scheduler callback: start generating a prompt-mode reminder ahead of its fire time."""
+    guild_id, reminder_id = key
+    guild_context.set(guild_id)
+    fire_at = reminder_scheduler.next_fire(key)
+    guild = config_store.get_model(guild_id)
+    reminder = guild.reminder(reminder_id) if guild is not None else None
+    if fire_at is None or reminder is None or reminder.message_mode != "prompt":
+        return
+    prompt = reminder.chatbot_prompt
+    if not prompt:
+        return
+
+    async def generate():
+        try:
+            return await generate_reminder_text(prompt, guild_id)
+        except Exception as e:
+            log.error(f"Pre-generation failed for guild {guild_id} (reminder {reminder_id}): {e!r}")
+            raise
+
+    staged_reminders.start((guild_id, reminder_id, fire_at), prompt, generate(), fire_at + PREGENERATION_TTL)
+    log.debug(f"Pre-generating reminder {reminder_id} for guild {guild_id} due at {fire_at.isoformat(sep=' ')}.")
+
+
+# One scheduler serves every reminder; entries are keyed by (guild ID, reminder ID)
+reminder_scheduler = ReminderScheduler(reminder_task)
+
+# Occurrences up to MISFIRE_GRACE late are still sent. Older misses (downtime, loop
+# stalls) follow CATCH_UP_POLICY: 'fire_late', 'skip' or 'coalesce' (see scheduler.py)
+MISFIRE_GRACE = timedelta(minutes=10)
+CATCH_UP_POLICY = "coalesce"
+
+# Prompt-mode completions are started PREGENERATION_LEAD before the reminder fires and
+# staged until PREGENERATION_TTL after it, so the fire itself only has to send
+PREGENERATION_LEAD = timedelta(minutes=5)
+PREGENERATION_TTL = timedelta(minutes=10)
+pregen_scheduler = ReminderScheduler(pregenerate_reminder)
+staged_reminders = StagedGenerations()
+
+
+async def prepare_reminder(dispatch):
+    """Dispatcher stage 1: resolve the channel and the message text, and journal the send. Returns False to skip."""
+    guild_id, reminder_id = dispatch.key
+    guild_context.set(guild_id)  # Each dispatch runs in its own task, through deliver_reminder too
+    if not is_leader():
+        # The lease may already belong to a standby that will send this occurrence itself
+        log.error(f"Not sending reminder {reminder_id} for guild {guild_id}: this instance is not the HA leader.")
+        return False
+    entry_id = outbox_id(guild_id, reminder_id, dispatch.fire_at)
+    if dispatch.content is not None:
+        # Retry or replay of a journaled send; the text was fixed when it was first journaled
+        return reminder_outbox.is_pending(entry_id)
+    if reminder_outbox.is_known(entry_id):
+        log.debug(f"Reminder {reminder_id} for guild {guild_id} at {dispatch.fire_at.isoformat(sep=' ')} "
+                  f"is already in the outbox. Skipping.")
+        return False
+    guild = config_store.get_model(guild_id)
+    reminder = guild.reminder(reminder_id) if guild is not None else None
+    if reminder is None:
+        return False
+    channel_id = reminder.channel_id
+    message_mode = reminder.message_mode
 
     # Determine the message based on the mode
     if message_mode == "prompt":
-        prompt = guild_config.get("chatbot_prompt")
+        prompt = reminder.chatbot_prompt
         if not prompt:
-            print(f"[ERROR] No prompt set for guild {guild_id}. Skipping reminder.")
-            return
-        reminder_message = timekeeper_directive(prompt)  # Call your chatbot function
+            log.error(f"No prompt set for guild {guild_id} (reminder {reminder_id}). Skipping reminder.")
+            return False
+        try:
+            # Use the pre-generated text if it is ready, otherwise generate it now
+            reminder_message = await staged_reminders.take(dispatch.key + (dispatch.fire_at,), prompt)
+            if reminder_message is None:
+                reminder_message = await generate_reminder_text(prompt, guild_id)
+            if reminder_message != reminder.last_generated_message:
+                remember_generation(guild_id, reminder_id, reminder_message)
+        except Exception as e:
+            # The occurrence still goes out: last good generation, then static message, then canned text
+            reminder_message = (reminder.last_generated_message or reminder.reminder_message
+                                or FALLBACK_REMINDER_MESSAGE)
+            log.error(f"Failed to generate reminder for guild {guild_id} (reminder {reminder_id}), "
+                      f"sending a fallback: {e!r}")
     elif message_mode == "static":
-        reminder_message = guild_config.get("reminder_message")
+        reminder_message = reminder.reminder_message
         if not reminder_message:
-            print(f"[ERROR] No static message set for guild {guild_id}. Skipping reminder.")
-            return
+            log.error(f"No static message set for guild {guild_id} (reminder {reminder_id}). Skipping reminder.")
+            return False
     else:
-        print(f"[ERROR] Invalid message mode for guild {guild_id}. Skipping reminder.")
-        return
+        log.error(f"Invalid message mode for guild {guild_id} (reminder {reminder_id}). Skipping reminder.")
+        return False
+
+    dispatch.route = channel_id
+    dispatch.content = reminder_message
+    try:
+        await reminder_outbox.add(entry_id, guild_id=guild_id, reminder_id=reminder_id,
+                                  fire_at=dispatch.fire_at.isoformat(), channel_id=channel_id, content=reminder_message)
+    except Exception as e:
+        log.error(f"Could not journal reminder {reminder_id} for guild {guild_id}, sending anyway: {e}")
+    return True
+
 
-    # Send the message to the designated channel
-    channel = bot.get_channel(channel_id)
-    if channel:
+def remember_generation(guild_id, reminder_id, text):
+    """Keep a reminder's latest generated text as its fallback for when the chatbot is unavailable."""
+    guild_config = load_guild_config(guild_id)
+    reminder = get_reminder(guild_config, reminder_id)
+    if reminder is not None:
+        reminder["last_generated_message"] = text
+        save_guild_config(guild_id, guild_config)
+
+
+async def deliver_reminder(dispatch):
+    """Dispatcher stage 2: send the prepared message. Returns the send time, or None if it was not sent."""
+    guild_id, reminder_id = dispatch.key
+    entry_id = outbox_id(guild_id, reminder_id, dispatch.fire_at)
+    channel = bot.get_channel(dispatch.route)
+    if not channel:
+        log.error(f"Channel {dispatch.route} not found for guild {guild_id} (reminder {reminder_id}).")
+        await finish_outbox_entry(entry_id, "dropped")
+        return None
+    try:
+        with DISCORD_SEND_LATENCY.time(kind="reminder"):
+            await channel.send(dispatch.content)
+    except discord.Forbidden:
+        log.error(f"Cannot send messages in the channel for guild {guild_id} (reminder {reminder_id}).")
+        await finish_outbox_entry(entry_id, "dropped")
+        return None
+    except (discord.HTTPException, aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+        log.error(f"HTTP error for guild {guild_id} (reminder {reminder_id}): {e}")
+        if is_transient_send_error(e) and dispatch.attempt + 1 < OUTBOX_MAX_ATTEMPTS:
+            retry_reminder_send(dispatch)
+        else:
+            await finish_outbox_entry(entry_id, "dropped")
+        return None
+    sent_at = datetime.now()
+    REMINDER_LATENESS.observe(max(0.0, (sent_at - dispatch.fire_at).total_seconds()))
+    await finish_outbox_entry(entry_id)
+    log.debug(f"Sent reminder {reminder_id} for guild {guild_id}: scheduled {dispatch.fire_at.isoformat(sep=' ')}, "
+              f"sent {sent_at.isoformat(sep=' ', timespec='seconds')}, {(sent_at - dispatch.fire_at).total_seconds():.1f}s late.")
+    return sent_at
+
+
+# Sends that fail with a server error, rate limit or network error are retried from the
+# outbox with jittered exponential backoff; journaled sends are replayed on startup
+OUTBOX_MAX_ATTEMPTS = 5
+OUTBOX_RETRY_BASE = 5  # seconds
+OUTBOX_RETRY_MAX = 300
+OUTBOX_REPLAY_WINDOW = timedelta(hours=12)  # Older pending sends are dropped instead of replayed
+outbox_retry_tasks = set()
+
+
+def is_transient_send_error(error):
+    if isinstance(error, discord.HTTPException):
+        return error.status == 429 or error.status >= 500
+    return isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError, OSError))
+
+
+def retry_reminder_send(dispatch):
+    delay = random.uniform(0, min(OUTBOX_RETRY_MAX, OUTBOX_RETRY_BASE * 2 ** dispatch.attempt))
+    log.debug(f"Retrying reminder {dispatch.key[1]} for guild {dispatch.key[0]} in {delay:.1f}s "
+              f"(attempt {dispatch.attempt + 2} of {OUTBOX_MAX_ATTEMPTS}).")
+
+    async def retry():
+        await asyncio.sleep(delay)
+        reminder_dispatcher.submit(dispatch.key, dispatch.fire_at, dispatch.route, dispatch.content, dispatch.attempt + 1)
+
+    task = asyncio.create_task(retry())
+    outbox_retry_tasks.add(task)
+    task.add_done_callback(outbox_retry_tasks.discard)
+
+
+async def finish_outbox_entry(entry_id, status="done"):
+    try:
+        await reminder_outbox.finish(entry_id, status)
+    except Exception as e:
+        log.error(f"Could not mark outbox entry {entry_id} as {status}: {e}")
+
+
+def replay_outbox():
+    """Resubmit sends journaled by a previous run that never finished."""
+    cutoff = datetime.now() - OUTBOX_REPLAY_WINDOW
+    for record in reminder_outbox.pending():
+        fire_at = datetime.fromisoformat(record["fire_at"])
+        if fire_at < cutoff:
+            log.debug(f"Dropping stale outbox entry {record['id']}.")
+            asyncio.create_task(finish_outbox_entry(record["id"], "dropped"))
+            continue
+        log.debug(f"Replaying outbox entry {record['id']}.")
+        reminder_dispatcher.submit((record["guild_id"], record["reminder_id"]), fire_at,
+                                   record["channel_id"], record["content"])
+
+
+async def record_reminder_batch(dispatches):
+    """Dispatcher stage 3: mark sent occurrences and queue next ones, saving each guild once.
+
+    The outbox already holds the durable record of each send, so the configs
+    are left to the write-behind flusher.
+    """
+    guild_configs = {}
+    for dispatch in dispatches:
+        guild_id, reminder_id = dispatch.key
+        # Reloaded here so changes made while generating are not overwritten
+        if guild_id not in guild_configs:
+            guild_configs[guild_id] = load_guild_config(guild_id)
+        guild_config = guild_configs[guild_id]
+        reminder = get_reminder(guild_config, reminder_id)
+        if reminder is None:
+            continue
+        # Retries and replays can finish after a later occurrence was already sent
+        if dispatch.sent_at and (reminder.get("last_fired_at") or "") < dispatch.fire_at.isoformat():
+            reminder["last_fired_at"] = dispatch.fire_at.isoformat()
+            reminder["last_sent_date"] = dispatch.fire_at.date().isoformat()
+        if guild_config.get("enabled") and not reminder_scheduler.is_scheduled(dispatch.key):
+            schedule_reminder(guild_id, reminder_id, guild_config,
+                              after=dispatch.fire_at + timedelta(minutes=1), persist=False)
+    for guild_id, guild_config in guild_configs.items():
+        save_guild_config(guild_id, guild_config)
+
+
+# Reminders due together are generated and sent as one rate-limited batch (see dispatcher.py)
+reminder_dispatcher = ReminderDispatcher(prepare_reminder, deliver_reminder, record_reminder_batch)
+
+# Metrics (see metrics.py) are shown by /stats and, if TIMEKEEPER_METRICS_PORT is set,
+# served in the Prometheus text format at http://127.0.0.1:<port>/metrics
+METRICS_PORT = int(get_setting("TIMEKEEPER_METRICS_PORT", "0")) or None
+metrics_server = None
+loop_lag_task = None
+
+# A watchdog thread logs the loop thread's stack, with the guild and command it was serving,
+# whenever the event loop goes TIMEKEEPER_STALL_THRESHOLD seconds without running callbacks
+STALL_THRESHOLD = float(get_setting("TIMEKEEPER_STALL_THRESHOLD", STALL_THRESHOLD_SECONDS))
+loop_watchdog = None
+
+# Queue depths are read whenever the metrics are rendered
+QUEUE_DEPTH.track(lambda: len(reminder_scheduler), queue="scheduled_reminders")
+QUEUE_DEPTH.track(lambda: reminder_dispatcher.depth, queue="dispatch")
+QUEUE_DEPTH.track(lambda: reminder_outbox.pending_count, queue="outbox_pending")
+QUEUE_DEPTH.track(lambda: len(staged_reminders), queue="staged_generations")
+QUEUE_DEPTH.track(lambda: chat_pipeline.depth, queue="chat")
+QUEUE_DEPTH.track(lambda: config_store.dirty_count, queue="config_dirty")
+QUEUE_DEPTH.track(lambda: len(status_engine), queue="status_rotation")
+
+
+# Slash commands are only synced with Discord when their schema changed since the last sync.
+# With TIMEKEEPER_DEV_GUILD set, they are synced to that one guild instead, where changes
+# show up immediately; global sync is slow to propagate and heavily rate-limited.
+DEV_GUILD_ID = int(get_setting("TIMEKEEPER_DEV_GUILD", "0")) or None
+
+
+def command_fingerprint(guild=None):
+    """Stable hash of the command schema that a sync for `guild` (None: global) would upload."""
+    payload = []
+    for command in tree.get_commands(guild=guild):
         try:
-            await channel.send(reminder_message)
-            guild_config["last_sent_date"] = now.date().isoformat()
-            save_guild_config(guild_id, guild_config)
-        except discord.Forbidden:
-            print(f"[ERROR] Cannot send messages in the channel for guild {guild_id}.")
-        except discord.HTTPException as e:
-            print(f"[ERROR] HTTP error for guild {guild_id}: {e}")
+            payload.append(command.to_dict(tree))
+        except TypeError:
+            payload.append(command.to_dict())  # discord.py before 2.4 took no arguments
+    payload.sort(key=lambda entry: entry["name"])
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+async def sync_commands(force=False):
+    """Sync the command tree if its schema changed (or `force`); returns whether it synced."""
+    guild = discord.Object(id=DEV_GUILD_ID) if DEV_GUILD_ID else None
+    scope = f"guild:{DEV_GUILD_ID}" if DEV_GUILD_ID else "global"
+    if guild is not None:
+        tree.copy_global_to(guild=guild)
+    fingerprint = command_fingerprint(guild)
+    synced = config_store.get_meta("command_sync", {})
+    if not force and synced.get(scope) == fingerprint:
+        log.info(f"Slash commands unchanged since the last sync ({scope}); skipping sync.")
+        return False
+
+    await tree.sync(guild=guild)
+    synced[scope] = fingerprint
+    config_store.set_meta("command_sync", synced)
+    log.info(f"Slash commands synced successfully ({scope}).")
+    return True
+
+
+async def keep_ha_lease():
+    """Renew the HA lease for as long as this process runs; if it is lost, stop everything and exit."""
+    global ha_lease_lost
+    await ha_lease.keep()
+    ha_lease_lost = True
+    log.error("Lost the HA lease to another instance. Stopping reminders and disconnecting.")
+    reminder_scheduler.stop()
+    pregen_scheduler.stop()
+    reminder_dispatcher.stop()
+    status_engine.stop()
+    await bot.close()
+
+
+def is_leader():
+    """False once this process may no longer be the HA leader; always True outside HA mode."""
+    return ha_lease is None or (not ha_lease_lost and ha_lease.held())
+
+
+@bot.event
+async def setup_hook():
+    # Runs once, before connecting, so the lease keeps being renewed while logging in
+    global ha_lease_task, llm_warm_up_task, encoding_load_task
+    if ha_lease is not None and ha_lease_task is None:
+        ha_lease_task = asyncio.create_task(keep_ha_lease())
+    # Import the openai package in a worker thread while logging in, not on the first call
+    llm_warm_up_task = asyncio.create_task(llm.warm_up())
+    # Chat token counts are estimated until tiktoken's encoding (possibly downloaded) is loaded
+    encoding_load_task = asyncio.create_task(asyncio.to_thread(load_encoding))
 
 
 @bot.event
 async def on_ready():
-    print(f"Logged in as {bot.user}")
-    asyncio.create_task(update_status_loop())  # Start the status updater loop
-    print("Status updater started.")
-    print("Bot is ready to accept commands!")
+    log.info(f"Logged in as {bot.user}")
+    if "ready" not in startup_marks:
+        mark_startup("ready")
+        report_startup()
+    status_engine.start()  # No-op if it is already running (on_ready also fires after reconnects)
+    log.info("Status updater started.")
+    log.info("Bot is ready to accept commands!")
     try:
-        await tree.sync()
-        print("Slash commands synced successfully.")
+        await sync_commands()
     except Exception as e:
-        print(f"[ERROR] Error syncing commands: {e}")
-
-    # Automatically start reminders for all configured guilds
-    config = load_config()
-    for guild_id, guild_config in config.get("guilds", {}).items():
-        guild_id = int(guild_id)
-        if guild_config.get("enabled") and guild_config.get("channel_id") and guild_config.get("reminder_time"):
-            if guild_config.get("message_mode") == "prompt" and guild_config.get("chatbot_prompt"):
-                print(f"[DEBUG] Starting prompt reminder for guild {guild_id}...")
-                start_guild_reminder(guild_id)
-            elif guild_config.get("message_mode") == "static" and guild_config.get("reminder_message"):
-                print(f"[DEBUG] Starting static reminder for guild {guild_id}...")
-                start_guild_reminder(guild_id)
-            else:
-                print(f"[DEBUG] Skipping guild {guild_id}: Missing message for mode.")
-        else:
-            print(f"[DEBUG] Skipping guild {guild_id}: Incomplete configuration or disabled.")
-
-    print("All reminders initialized.")
+        log.error(f"Error syncing commands: {e}")
+
+    global config_flush_task, outbox_replayed, loop_lag_task, metrics_server, loop_watchdog
+    if loop_lag_task is None or loop_lag_task.done():
+        loop_lag_task = asyncio.create_task(monitor_loop_lag())
+    if loop_watchdog is None:
+        loop_watchdog = LoopWatchdog(asyncio.get_running_loop(), STALL_THRESHOLD, on_stall=lambda stall: LOOP_STALLS.inc())
+        loop_watchdog.start()
+    if METRICS_PORT and metrics_server is None:
+        try:
+            metrics_server = await serve_metrics(METRICS_PORT)
+            log.info(f"Metrics served at http://127.0.0.1:{METRICS_PORT}/metrics")
+        except OSError as e:
+            log.error(f"Could not start the metrics endpoint on port {METRICS_PORT}: {e}")
+    if config_flush_task is None or config_flush_task.done():
+        config_flush_task = asyncio.create_task(config_store.run_flusher())
+    reminder_scheduler.start()
+    pregen_scheduler.start()
+    reminder_dispatcher.start()
+    chat_pipeline.start()
+
+    # Sends journaled by a previous run that never completed go out first
+    if not outbox_replayed:
+        outbox_replayed = True
+        replay_outbox()
+
+    # Automatically start reminders for all enabled guilds
+    for guild_id, _ in config_store.enabled_guilds():
+        if owns_guild(guild_id):
+            start_guild_reminder(int(guild_id), catch_up=True)
+
+    log.info("All reminders initialized.")
 
 
 @tree.command(name="channel_set", description="Set the channel where the reminder will be sent.")
@@ -256,6 +706,8 @@ async def channel_set(interaction: discord.Interaction, channel: discord.TextCha
 
     guild_config["channel_id"] = channel.id
     save_guild_config(guild_id, guild_config)
+    if guild_config.get("enabled"):
+        schedule_reminder(guild_id, MAIN_REMINDER_ID, guild_config)
 
     await interaction.response.send_message(f"Reminder channel set to #{channel.name}", ephemeral=True)
 
@@ -270,6 +722,8 @@ async def message_set(interaction: discord.Interaction, message: str):
 
     guild_config["reminder_message"] = processed_message
     save_guild_config(guild_id, guild_config)
+    if guild_config.get("enabled"):
+        schedule_reminder(guild_id, MAIN_REMINDER_ID, guild_config)
 
     await interaction.response.send_message(f"Reminder message set to:\n{processed_message}", ephemeral=True)
 
@@ -280,44 +734,153 @@ async def time_set(interaction: discord.Interaction, time: str):
     guild_config = load_guild_config(guild_id)
 
     try:
-        # Daily format: HH:MM
-        if re.match(r"^\d{2}:\d{2}$", time):
-            guild_config["reminder_time"] = {"type": "daily", "time": time}
-        # Weekly format: Day HH:MM
-        elif re.match(r"^(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday) \d{2}:\d{2}$", time, re.IGNORECASE):
-            day, time_str = time.split(" ")
-            guild_config["reminder_time"] = {"type": "weekly", "day": day.capitalize(), "time": time_str}
-        # Specific date and time: YYYY-MM-DD HH:MM
-        elif re.match(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}$", time):
-            guild_config["reminder_time"] = {"type": "specific", "datetime": time}
-        else:
-            raise ValueError("Invalid time format.")
+        guild_config["reminder_time"] = parse_reminder_time(time)
         save_guild_config(guild_id, guild_config)
+        if guild_config.get("enabled"):
+            schedule_reminder(guild_id, MAIN_REMINDER_ID, guild_config)
         await interaction.response.send_message(f"Reminder time set successfully!", ephemeral=True)
     except ValueError:
-        await interaction.response.send_message(
-            "Invalid time format! Use:\n"
-            "- `HH:MM` for daily reminders.\n"
-            "- `Day HH:MM` for weekly reminders.\n"
-            "- `YYYY-MM-DD HH:MM` for specific reminders.",
-            ephemeral=True
-        )
+        await interaction.response.send_message(INVALID_TIME_MESSAGE, ephemeral=True)
+
+
+INVALID_TIME_MESSAGE = (
+    "Invalid time format! Use:\n"
+    "- `HH:MM` for daily reminders.\n"
+    "- `Day HH:MM` for weekly reminders.\n"
+    "- `YYYY-MM-DD HH:MM` for specific reminders."
+)
+
+
+def parse_reminder_time(time):
+    """Turn the user's time text into a reminder_time dict; raises ValueError if it is not valid."""
+    # Daily format: HH:MM
+    if re.match(r"^\d{2}:\d{2}$", time):
+        reminder_time = {"type": "daily", "time": time}
+    # Weekly format: Day HH:MM
+    elif re.match(r"^(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday) \d{2}:\d{2}$", time, re.IGNORECASE):
+        day, time_str = time.split(" ")
+        reminder_time = {"type": "weekly", "day": day.capitalize(), "time": time_str}
+    # Specific date and time: YYYY-MM-DD HH:MM
+    elif re.match(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}$", time):
+        reminder_time = {"type": "specific", "datetime": time}
+    else:
+        raise ValueError("Invalid time format.")
+
+    ReminderTime.from_dict(reminder_time)  # Rejects out-of-range values such as 25:00
+    return reminder_time
+
+
+def describe_reminder_time(reminder_time):
+    if not reminder_time:
+        return "Not set"
+    if reminder_time["type"] == "daily":
+        return f"Daily at {reminder_time['time']}"
+    if reminder_time["type"] == "weekly":
+        return f"Every {reminder_time['day']} at {reminder_time['time']}"
+    if reminder_time["type"] == "specific":
+        return f"On {reminder_time['datetime']}"
+    return "Not set"
+
+
+def schedule_reminder(guild_id, reminder_id, guild_config=None, after=None, persist=True):
+    """(Re)compute one reminder's next fire time and put it on the scheduler.
+
+    With `persist=False` the updated guild config is left for the caller to save.
+    """
+    if guild_config is None:
+        guild_config = load_guild_config(guild_id)
+    key = (guild_id, reminder_id)
+    reminder = get_reminder(guild_config, reminder_id)
+    fire_at = None
+    if reminder is not None and reminder.get("reminder_time"):
+        try:
+            now = datetime.now()
+            fire_at = plan_next_fire(reminder["reminder_time"], after or now, now, MISFIRE_GRACE, CATCH_UP_POLICY)
+            if fire_at is None:
+                log.debug(f"Reminder {reminder_id} for guild {guild_id} has no future occurrence.")
+        except (KeyError, ValueError):
+            log.error(f"Invalid reminder time configuration for guild {guild_id} (reminder {reminder_id})")
+
+    if fire_at is None:
+        reminder_scheduler.cancel(key)
+    else:
+        reminder_scheduler.schedule(key, fire_at)
+    schedule_pregeneration(key, reminder, fire_at)
+
+    # Persist the next fire time so a restart can catch up on an occurrence missed while it was down
+    changed = False
+    next_fire_at = fire_at.isoformat() if fire_at else None
+    if reminder is not None and reminder.get("next_fire_at") != next_fire_at:
+        reminder["next_fire_at"] = next_fire_at
+        changed = True
+    if changed and persist:
+        save_guild_config(guild_id, guild_config)
+    return fire_at
+
+
+def schedule_pregeneration(key, reminder, fire_at):
+    """Queue the prompt-mode generation for `fire_at`, or drop it if it no longer applies."""
+    if fire_at is None or reminder is None or reminder.get("message_mode") != "prompt" \
+            or not reminder.get("chatbot_prompt"):
+        pregen_scheduler.cancel(key)
+        staged_reminders.discard_prefix(key)
+        return
+    if not staged_reminders.is_staged(key + (fire_at,)):
+        pregen_scheduler.schedule(key, fire_at - PREGENERATION_LEAD)
+
 
+def cancel_reminder(guild_id, reminder_id):
+    key = (guild_id, reminder_id)
+    reminder_scheduler.cancel(key)
+    pregen_scheduler.cancel(key)
+    staged_reminders.discard_prefix(key)
 
-def start_guild_reminder(guild_id):
-    """Start a reminder task for a specific guild if it's not already running."""
-    if guild_id in reminder_tasks and reminder_tasks[guild_id].is_running():
-        print(f"[DEBUG] Reminder task for guild {guild_id} is already running.")
+
+def cancel_guild_reminders(guild_id):
+    guild = config_store.get_model(guild_id)
+    for reminder_id, _ in guild.iter_reminders() if guild is not None else ():
+        cancel_reminder(guild_id, reminder_id)
+
+
+def start_guild_reminder(guild_id, catch_up=False):
+    """Schedule every complete reminder of a guild that is not already scheduled.
+
+    With `catch_up`, occurrences that came due while the bot was not running
+    (their persisted next_fire_at is in the past and was never sent) are
+    handed to the catch-up policy instead of being silently skipped.
+    """
+    guild = config_store.get_model(guild_id)
+    if guild is None:
         return
+    guild_config = load_guild_config(guild_id)
+    for reminder_id, reminder in guild.iter_reminders():
+        if reminder_scheduler.is_scheduled((guild_id, reminder_id)):
+            log.debug(f"Reminder {reminder_id} for guild {guild_id} is already scheduled.")
+            continue
+        if not reminder.is_complete():
+            log.debug(f"Skipping reminder {reminder_id} for guild {guild_id}: Incomplete configuration.")
+            continue
+        after = missed_occurrence(reminder) if catch_up else None
+        fire_at = schedule_reminder(guild_id, reminder_id, guild_config, after=after)
+        if fire_at:
+            log.debug(f"Reminder {reminder_id} for guild {guild_id} scheduled for {fire_at.isoformat(sep=' ')}.")
+
+
+def missed_occurrence(reminder):
+    """Return the Reminder's persisted next fire time if it has passed without being sent, else None."""
+    fire_at = reminder.next_fire_at
+    if fire_at is None or fire_at.isoformat() == reminder.last_fired_at:
+        return None
+    return fire_at if fire_at < datetime.now() else None
 
-    # Define the async task for sending reminders
-    async def run_reminder_task():
-        await reminder_task(guild_id)
 
-    # Create and start the reminder task
-    reminder_tasks[guild_id] = tasks.loop(seconds=10)(run_reminder_task)
-    reminder_tasks[guild_id].start()
-    print(f"[DEBUG] Reminder task for guild {guild_id} started.")
+def next_guild_fire(guild_id):
+    guild = config_store.get_model(guild_id)
+    if guild is None:
+        return None
+    fire_times = [reminder_scheduler.next_fire((guild_id, reminder_id)) for reminder_id, _ in guild.iter_reminders()]
+    fire_times = [fire_at for fire_at in fire_times if fire_at]
+    return min(fire_times) if fire_times else None
 
 
 @tree.command(name="start_reminder", description="Start the reminder task.")
@@ -330,19 +893,29 @@ async def start_reminder(interaction: discord.Interaction):
 
     start_guild_reminder(guild_id)
 
-    await interaction.response.send_message("Reminder task started!", ephemeral=True)
+    message = "Reminder task started!"
+    if not config_store.get_model(guild_id).main.is_complete():
+        message += (" The reminder will be scheduled as soon as its channel, time and message "
+                    "(or prompt, in prompt mode) are all set.")
+    await interaction.response.send_message(message, ephemeral=True)
 
 @tree.command(name="stop_reminder", description="Stop the reminder task.")
 async def stop_reminder(interaction: discord.Interaction):
     guild_id = interaction.guild_id
     guild_config = load_guild_config(guild_id)
 
-    guild_config["last_sent_date"] = None
+    # Forget what was already sent so restarting can send the current occurrences again
+    for _, reminder in iter_reminders(guild_config):
+        reminder["last_sent_date"] = None
+        reminder["last_fired_at"] = None
     guild_config["enabled"] = False
     save_guild_config(guild_id, guild_config)
 
-    if guild_id in reminder_tasks and reminder_tasks[guild_id].is_running():
-        reminder_tasks[guild_id].stop()
+    cancel_guild_reminders(guild_id)
+    try:
+        await reminder_outbox.forget(f"{guild_id}:")
+    except Exception as e:
+        log.error(f"Could not clear sent reminders from the outbox for guild {guild_id}: {e}")
 
     await interaction.response.send_message("Reminder task stopped and state saved.", ephemeral=True)
 
@@ -360,17 +933,16 @@ async def show_config(interaction: discord.Interaction):
     last_sent_date = guild_config["last_sent_date"]
 
     channel_name = f"<#{channel_id}>" if channel_id else "Not set"
-    time_info = "Not set"
-    if reminder_time:
-        if reminder_time["type"] == "daily":
-            time_info = f"Daily at {reminder_time['time']}"
-        elif reminder_time["type"] == "weekly":
-            time_info = f"Every {reminder_time['day']} at {reminder_time['time']}"
-        elif reminder_time["type"] == "specific":
-            time_info = f"On {reminder_time['datetime']}"
+    time_info = describe_reminder_time(reminder_time)
 
     last_sent = last_sent_date if last_sent_date else "Never"
-    is_running = "Yes" if guild_id in reminder_tasks and reminder_tasks[guild_id].is_running() else "No"
+    cache_stats = llm.cache.stats()
+    cache_info = "On" if guild_config.get("llm_cache", True) else "Off"
+    cache_info += f" (bot-wide hit rate {cache_stats['hit_rate']:.0%}, {cache_stats['hits']} hits / {cache_stats['misses']} misses)"
+    extra_reminders = len(guild_config.get("reminders", {}))
+    next_fire = next_guild_fire(guild_id)
+    is_running = f"Yes (next at {next_fire.strftime('%Y-%m-%d %H:%M')})" if next_fire else "No"
+    llm_info = describe_circuit(llm.breaker.stats())
 
     config_message = (
         f"**Current Configuration:**\n"
@@ -380,12 +952,125 @@ async def show_config(interaction: discord.Interaction):
         f"🤖 **Chatbot Prompt:** {chatbot_prompt if chatbot_prompt else 'Not set'}\n"
         f"⚙️ **Message Mode:** {message_mode.capitalize()}\n"
         f"📅 **Last Sent Date:** {last_sent}\n"
+        f"🗃️ **Response Cache:** {cache_info}\n"
+        f"🔌 **Chatbot Circuit:** {llm_info}\n"
+        f"🗂️ **Additional Reminders:** {extra_reminders} (see `/reminder_list`)\n"
         f"🏃 **Script Currently Running:** {is_running}"
     )
 
     await interaction.response.send_message(config_message, ephemeral=True)
 
 
+def describe_circuit(stats):
+    if stats["state"] == CircuitBreaker.OPEN:
+        state = f"Open, failing fast for {stats['retry_after']:.0f}s more (fallback messages in use)"
+    elif stats["state"] == CircuitBreaker.HALF_OPEN:
+        state = "Half-open, probing for recovery"
+    else:
+        state = "Closed"
+    return (f"{state}; {stats['failures']} failed and {stats['slow']} slow of {stats['calls']} recent calls, "
+            f"opened {stats['times_opened']} time(s)")
+
+
+@tree.command(name="reminder_add", description="Add another reminder with its own channel, time and message or prompt.")
+async def reminder_add(interaction: discord.Interaction, channel: discord.TextChannel, time: str,
+                       message: str = None, prompt: str = None):
+    guild_id = interaction.guild_id
+    guild_config = load_guild_config(guild_id)
+
+    if bool(message) == bool(prompt):
+        await interaction.response.send_message(
+            "Provide either a `message` (sent as written) or a `prompt` (generated by the chatbot), but not both.",
+            ephemeral=True
+        )
+        return
+    reminders = guild_config.setdefault("reminders", {})
+    if len(reminders) >= MAX_REMINDERS_PER_GUILD:
+        await interaction.response.send_message(
+            f"This server already has {MAX_REMINDERS_PER_GUILD} additional reminders. Remove one with `/reminder_remove` first.",
+            ephemeral=True
+        )
+        return
+    try:
+        reminder_time = parse_reminder_time(time)
+    except ValueError:
+        await interaction.response.send_message(INVALID_TIME_MESSAGE, ephemeral=True)
+        return
+
+    reminder_id = str(guild_config.get("next_reminder_id", 1))
+    guild_config["next_reminder_id"] = int(reminder_id) + 1
+    reminders[reminder_id] = {
+        "channel_id": channel.id,
+        "reminder_time": reminder_time,
+        "reminder_message": message.replace("\\n", "\n") if message else None,
+        "chatbot_prompt": prompt,
+        "message_mode": "prompt" if prompt else "static",
+        "last_sent_date": None,
+        "last_fired_at": None,
+        "next_fire_at": None,
+    }
+    save_guild_config(guild_id, guild_config)
+
+    if not guild_config.get("enabled"):
+        status = "It will run once reminders are started with `/start_reminder`."
+    else:
+        fire_at = schedule_reminder(guild_id, reminder_id, guild_config)
+        status = f"Next at {fire_at.strftime('%Y-%m-%d %H:%M')}." if fire_at else "It has no future occurrence."
+    await interaction.response.send_message(
+        f"Reminder `{reminder_id}` added: {describe_reminder_time(reminder_time)} in #{channel.name}. {status}",
+        ephemeral=True
+    )
+
+
+@tree.command(name="reminder_list", description="List all reminders configured for this server.")
+async def reminder_list(interaction: discord.Interaction):
+    guild_id = interaction.guild_id
+    guild = config_store.get_model(guild_id)
+
+    lines = []
+    for reminder_id, reminder in guild.iter_reminders() if guild is not None else ():
+        if reminder_id == MAIN_REMINDER_ID and not reminder.reminder_time:
+            continue
+        channel_id = reminder.channel_id
+        next_fire = reminder_scheduler.next_fire((guild_id, reminder_id))
+        next_info = next_fire.strftime("%Y-%m-%d %H:%M") if next_fire else "not scheduled"
+        lines.append(
+            f"`{reminder_id}`: {describe_reminder_time(reminder.reminder_time)} in "
+            f"{f'<#{channel_id}>' if channel_id else 'no channel'} "
+            f"({reminder.message_mode}), next: {next_info}"
+        )
+
+    if not lines:
+        await interaction.response.send_message("No reminders are configured. Use `/time_set` or `/reminder_add`.",
+                                                ephemeral=True)
+        return
+    text = "**Reminders:**\n" + "\n".join(lines)
+    if len(text) > 2000:
+        text = text[:1997] + "..."
+    await interaction.response.send_message(text, ephemeral=True)
+
+
+@tree.command(name="reminder_remove", description="Remove a reminder added with /reminder_add.")
+async def reminder_remove(interaction: discord.Interaction, reminder_id: str):
+    guild_id = interaction.guild_id
+    guild_config = load_guild_config(guild_id)
+
+    if reminder_id == MAIN_REMINDER_ID:
+        await interaction.response.send_message(
+            "The main reminder cannot be removed. Use `/stop_reminder` to stop it.", ephemeral=True)
+        return
+    if reminder_id not in guild_config.get("reminders", {}):
+        await interaction.response.send_message(f"No reminder `{reminder_id}` exists. See `/reminder_list`.",
+                                                ephemeral=True)
+        return
+
+    del guild_config["reminders"][reminder_id]
+    cancel_reminder(guild_id, reminder_id)
+    save_guild_config(guild_id, guild_config)
+
+    await interaction.response.send_message(f"Reminder `{reminder_id}` removed.", ephemeral=True)
+
+
 @tree.command(name="help", description="Get instructions on how to use the Timekeeper Bot.")
 async def help(interaction: discord.Interaction):
     instructions = (
@@ -400,9 +1085,15 @@ async def help(interaction: discord.Interaction):
         "- **Start the reminders** (required) with `/start_reminder`.\n"
         "- **Stop the reminders** with `/stop_reminder`.\n"
         "- **View the current settings** with `/show_config`.\n"
+        "- **Add more reminders** (each with its own channel, time and message or prompt) with `/reminder_add`, "
+        "then view them with `/reminder_list` and delete them with `/reminder_remove`.\n"
+        "- **Always generate fresh responses** (no reuse of cached ones) with `/cache_set False`.\n"
+        "- **Check the bot's health** (reminder lateness, response times, queues) with `/stats` (administrators only).\n"
+        "- **Find out what is slowing the bot down** with `/profile`, which attaches a report of its busiest functions (bot owner only).\n"
         "- **View this message** with `/help`.\n"
         "\n"
-        "*Only one reminder message is sent per day. To reset the reminders for today, use the `/stop_reminder` command followed by the `/start_reminder` command."
+        "*Each scheduled time is sent only once. `/start_reminder` and `/stop_reminder` turn all of the server's reminders on and off; "
+        "to send the current occurrences again, use the `/stop_reminder` command followed by the `/start_reminder` command."
     )
     await interaction.response.send_message(instructions, ephemeral=True)
 
@@ -415,6 +1106,8 @@ async def prompt_set(interaction: discord.Interaction, prompt: str):
     # Save the prompt to the guild configuration
     guild_config["chatbot_prompt"] = prompt
     save_guild_config(guild_id, guild_config)
+    if guild_config.get("enabled"):
+        schedule_reminder(guild_id, MAIN_REMINDER_ID, guild_config)
 
     await interaction.response.send_message(f"Chatbot prompt set to:\n{prompt}", ephemeral=True)
 
@@ -435,13 +1128,15 @@ async def prompt_test(interaction: discord.Interaction):
 
     # Call the chatbot API with a hard timeout
     try:
-        generated_message = await asyncio.wait_for(
-            asyncio.to_thread(timekeeper_directive, prompt),  # Run the blocking API call in a thread
-            timeout=15  # 15-second timeout
-        )
+        generated_message = await timekeeper_directive(prompt, use_case="test", guild_id=guild_id)
         await interaction.followup.send(f"Sample reminder generated:\n{generated_message}")
     except asyncio.TimeoutError:
-        await interaction.followup.send("The chatbot took too long to respond (timeout: 15 seconds). Please try again.")
+        await interaction.followup.send(
+            f"The chatbot took too long to respond (timeout: {LLM_TIMEOUTS['test']} seconds). Please try again.")
+    except CircuitOpenError:
+        await interaction.followup.send(
+            f"The chatbot is unavailable right now. Try again in about {max(1, round(llm.breaker.retry_after()))} seconds; "
+            f"until then, prompt reminders fall back to their last generated message.")
     except Exception as e:
         await interaction.followup.send(f"Error generating reminder: {e}")
 
@@ -475,25 +1170,250 @@ async def mode_set(interaction: discord.Interaction, mode: str):
     # Update the mode in the guild configuration
     guild_config["message_mode"] = mode
     save_guild_config(guild_id, guild_config)
+    if guild_config.get("enabled"):
+        schedule_reminder(guild_id, MAIN_REMINDER_ID, guild_config)
 
     await interaction.response.send_message(
         f"Reminder mode successfully set to '{mode}'.", ephemeral=True
     )
 
+@tree.command(name="cache_set", description="Turn reuse of cached chatbot responses on or off for this server.")
+async def cache_set(interaction: discord.Interaction, enabled: bool):
+    guild_id = interaction.guild_id
+    guild_config = load_guild_config(guild_id)
+
+    guild_config["llm_cache"] = enabled
+    save_guild_config(guild_id, guild_config)
+
+    state = "enabled" if enabled else "disabled: every reminder and reply will be freshly generated"
+    await interaction.response.send_message(f"Response cache {state}.", ephemeral=True)
+
 @tree.command(name="update_status", description="Immediately update the bot's status.")
 async def update_status(interaction: discord.Interaction):
-    global status_update_event
+    status_engine.start()
+    if status_engine.advance():
+        message = "Status updated."
+    else:
+        message = "No statuses are queued; new ones are being generated and the status will update shortly."
+    await interaction.response.send_message(message, ephemeral=True)
+
+
+async def is_bot_owner(user):
+    app_info = await bot.application_info()
+    if app_info.team:
+        return any(member.id == user.id for member in app_info.team.members)
+    return app_info.owner.id == user.id
+
+
+@tree.command(name="sync_commands", description="Force a slash command sync with Discord (bot owner only).")
+@app_commands.default_permissions(administrator=True)
+async def force_sync_commands(interaction: discord.Interaction):
+    if not await is_bot_owner(interaction.user):
+        await interaction.response.send_message("Only the bot's owner can force a command sync.", ephemeral=True)
+        return
+    await interaction.response.defer(ephemeral=True)
+    try:
+        await sync_commands(force=True)
+        await interaction.followup.send("Slash commands synced.", ephemeral=True)
+    except Exception as e:
+        log.error(f"Error syncing commands: {e}")
+        await interaction.followup.send(f"Error syncing commands: {e}", ephemeral=True)
+
 
-    # Stop the current loop
-    status_update_event.clear()
-    print("Stopping the current status update loop...")
+def describe_timing(summary):
+    if not summary["count"]:
+        return "no data"
+    return (f"{summary['count']}× p50 {summary['p50']:.2f}s, p95 {summary['p95']:.2f}s, "
+            f"max {summary['max']:.2f}s")
 
-    # Wait briefly to ensure the loop has stopped
-    await asyncio.sleep(1)
 
-    # Restart the status loop
-    asyncio.create_task(update_status_loop())
-    await interaction.response.send_message("Status updated and loop restarted.", ephemeral=True)
+@tree.command(name="profile", description="Profile the bot for a few seconds and attach its hottest functions (bot owner only).")
+@app_commands.default_permissions(administrator=True)
+@app_commands.describe(seconds=f"How long to sample for, up to {PROFILE_MAX_SECONDS} seconds")
+async def profile(interaction: discord.Interaction, seconds: app_commands.Range[int, 1, PROFILE_MAX_SECONDS] = 10):
+    # The report covers the whole process: every guild, file paths and recent stalls
+    if not await is_bot_owner(interaction.user):
+        await interaction.response.send_message("Only the bot's owner can profile the bot.", ephemeral=True)
+        return
+    await interaction.response.defer(ephemeral=True, thinking=True)
+    # The sampler runs in a worker thread and reads the event loop thread's stack
+    report = await asyncio.to_thread(sample_profile, threading.get_ident(), seconds)
+    stalls = "\n".join(f"- {stall.describe()}" for stall in loop_watchdog.recent) if loop_watchdog else ""
+    if stalls:
+        report += f"\nRecent event loop stalls:\n{stalls}\n"
+    attachment = discord.File(io.BytesIO(report.encode("utf-8")),
+                              filename=f"timekeeper-profile-{datetime.now():%Y%m%d-%H%M%S}.txt")
+    await interaction.followup.send(f"Sampled the event loop for {seconds}s.", file=attachment, ephemeral=True)
+
+
+@tree.command(name="stats", description="Show the bot's runtime metrics (administrators only).")
+@app_commands.default_permissions(administrator=True)
+async def stats(interaction: discord.Interaction):
+    lines = [
+        "**Runtime Stats:**",
+        f"⏰ **Reminder Lateness:** {describe_timing(REMINDER_LATENESS.summary())}",
+        f"🕰️ **Scheduler Lag:** {describe_timing(SCHEDULER_LAG.summary())}",
+    ]
+    for labels in LLM_LATENCY.label_sets():
+        use_case = labels["use_case"]
+        errors = LLM_REQUESTS.value(use_case=use_case, outcome="error")
+        calls = errors + LLM_REQUESTS.value(use_case=use_case, outcome="ok")
+        lines.append(f"🤖 **LLM ({use_case}):** {describe_timing(LLM_LATENCY.summary(**labels))}, "
+                     f"{errors}/{calls} errors")
+    if CHAT_FIRST_TEXT.summary()["count"]:
+        lines.append(f"⚡ **Chat First Text:** {describe_timing(CHAT_FIRST_TEXT.summary())}")
+    for labels in DISCORD_SEND_LATENCY.label_sets():
+        lines.append(f"📨 **Discord Sends ({labels['kind']}):** {describe_timing(DISCORD_SEND_LATENCY.summary(**labels))}")
+    for labels in STORAGE_IO.label_sets():
+        lines.append(f"💾 **Storage ({labels['operation']}):** {describe_timing(STORAGE_IO.summary(**labels))}")
+    generation = generation_batcher.stats()
+    if generation["requests"]:
+        lines.append(f"✍️ **Reminder Generation:** {generation['requests']} texts from {generation['calls']} "
+                     f"completions ({generation['saved']} saved)")
+    memory = conversations.stats()
+    if memory["messages"]:
+        lines.append(f"💬 **Chat Memory:** {memory['messages']} messages in {memory['channels']} channels, "
+                     f"{memory['tokens']} tokens (budget {conversations.budget} per channel)")
+    lines.append(f"🔁 **Event Loop Lag:** {describe_timing(LOOP_LAG.summary())}")
+    depths = ", ".join(f"{queue} {QUEUE_DEPTH.value(queue=queue)}" for queue in (
+        "scheduled_reminders", "dispatch", "outbox_pending", "staged_generations", "chat", "config_dirty", "status_rotation"))
+    lines.append(f"📥 **Queues:** {depths}")
+    if loop_watchdog is not None and loop_watchdog.recent:
+        lines.append(f"🧱 **Loop Stalls:** {LOOP_STALLS.value()} over {STALL_THRESHOLD:.1f}s, "
+                     f"last {loop_watchdog.recent[-1].describe()}")
+    if "ready" in startup_marks:
+        lines.append(f"🚀 **Startup:** {startup_marks['ready']:.2f}s to ready (budget {STARTUP_BUDGET_SECONDS:.0f}s)")
+    if ha_lease is not None:
+        lines.append(f"🛡️ **HA:** leader (lease token {ha_lease.token}, {ha_lease.ttl:.0f}s lease)")
+    await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
+def chat_text(message: discord.Message):
+    """The message as the chatbot sees it: the author's name, then the text with mentions as names."""
+    text = message.content
+    for user in message.mentions:
+        text = re.sub(rf"<@!?{user.id}>", "" if user == bot.user else f"@{user.display_name}", text)
+    text = text.strip()
+    if message.author == bot.user:
+        return text
+    return f"{message.author.display_name}: {text}"
+
+
+def remember_referenced(message: discord.Message):
+    """Return the ID of the message `message` replies to, adding it to the conversation store if it is new there.
+
+    The referenced message comes from the store, or else from the copy Discord
+    sends along with the reply; it is never fetched.
+    """
+    reference = message.reference
+    if reference is None or reference.message_id is None:
+        return None
+    resolved = reference.resolved
+    if conversations.get(reference.message_id) is None and isinstance(resolved, discord.Message) and resolved.content:
+        role = "assistant" if resolved.author == bot.user else "user"
+        reply_to = resolved.reference.message_id if resolved.reference is not None else None
+        conversations.add(resolved.id, message.channel.id, role, chat_text(resolved), reply_to)
+    return reference.message_id
+
+
+def is_reply_to_bot(message: discord.Message):
+    reference = message.reference
+    if reference is None or reference.message_id is None:
+        return False
+    turn = conversations.get(reference.message_id)
+    if turn is not None:
+        return turn.role == "assistant"
+    return isinstance(reference.resolved, discord.Message) and reference.resolved.author == bot.user
+
+
+async def answer_mention(message: discord.Message):
+    guild_id = message.guild.id if message.guild else None
+    guild_context.set(guild_id)
+    text = chat_text(message)
+    reply_to = remember_referenced(message)
+    history = conversations.context(message.channel.id, reply_to,
+                                    reserve=count_tokens(text) + TURN_OVERHEAD_TOKENS)
+    conversations.add(message.id, message.channel.id, "user", text, reply_to)
+    try:
+        if CHAT_STREAMING:
+            sent, response = await stream_mention_reply(message, text, history, guild_id)
+        else:
+            # Call timekeeper_directive() and wait for its response
+            response = await timekeeper_directive(text, CHAT_INSTRUCTIONS, use_case="chat",
+                                                  guild_id=guild_id, history=history)
+            with DISCORD_SEND_LATENCY.time(kind="chat"):
+                sent = await message.channel.send(response)
+    except Exception as e:
+        # Handle errors gracefully
+        await message.channel.send(content="The mechanisms grind, but the spark is dim. Clarity eludes me in this fleeting moment, I cannot answer.")
+        return
+    conversations.add(sent.id, message.channel.id, "assistant", response, message.id)
+
+
+async def stream_mention_reply(message: discord.Message, text, history, guild_id):
+    """Post the reply as soon as the first tokens arrive, then edit it as the rest streams in.
+
+    Returns the sent message and the full reply text.
+    """
+    started_at = time.monotonic()
+    parts = []
+
+    async def pieces():
+        async for piece in llm.stream(text, CHAT_INSTRUCTIONS, timeout=LLM_TIMEOUTS["chat"],
+                                      cache_ttl=llm_cache_ttl("chat", guild_id), history=history):
+            parts.append(piece)
+            yield piece
+
+    try:
+        sent, first_text, complete = await stream_to_channel(message.channel, pieces(), started_at)
+        if sent is None:
+            raise ValueError("Empty completion")
+    except Exception:
+        LLM_REQUESTS.inc(use_case="chat", outcome="error")
+        raise
+    LLM_REQUESTS.inc(use_case="chat", outcome="ok")
+    LLM_LATENCY.observe(complete, use_case="chat")
+    CHAT_FIRST_TEXT.observe(first_text)
+    log.debug(f"Mention reply in channel {message.channel.id} with {len(history)} earlier message(s): "
+              f"first text after {first_text:.2f}s, complete after {complete:.2f}s")
+    return sent, "".join(parts)
+
+
+async def reply_busy(message: discord.Message, reason):
+    """Answer a shed mention in character, at most once per cooldown per channel."""
+    log.debug(f"Shed mention from {message.author.id} in channel {message.channel.id} ({reason}).")
+    if not busy_reply_buckets.try_acquire(message.channel.id):
+        return
+    try:
+        await message.channel.send(
+            "Too many voices clamor at once. The Timekeeper marks your words, but the gears turn only so fast. Ask again shortly.")
+    except discord.HTTPException as e:
+        log.error(f"Failed to send busy reply in channel {message.channel.id}: {e}")
+
+
+# Mention replies go through a bounded, rate-limited queue. Chat never holds more than
+# CHAT_WORKERS of the gateway's MAX_CONCURRENCY slots, so REMINDER_RESERVED_SLOTS are
+# always left for scheduled reminders.
+REMINDER_RESERVED_SLOTS = 3
+CHAT_WORKERS = MAX_CONCURRENCY - REMINDER_RESERVED_SLOTS
+CHAT_QUEUE_SIZE = 50
+chat_pipeline = ChatPipeline(
+    answer_mention, reply_busy,
+    workers=CHAT_WORKERS,
+    max_queue=CHAT_QUEUE_SIZE,
+    user_rate=1 / 10, user_burst=3,  # One mention per 10 seconds per user, bursts of 3
+    channel_rate=1 / 3, channel_burst=5,  # One mention per 3 seconds per channel, bursts of 5
+)
+busy_reply_buckets = BucketMap(rate=1 / 60, capacity=1)  # One "busy" reply per minute per channel
+
+# Stream mention replies into a message that is edited as tokens arrive
+CHAT_STREAMING = True
+
+# Mention replies are sent with the channel's recent conversation, or for a reply, the chain
+# of messages it answers, up to TIMEKEEPER_CHAT_CONTEXT_TOKENS tokens (see conversation.py)
+CHAT_CONTEXT_TOKENS = int(get_setting("TIMEKEEPER_CHAT_CONTEXT_TOKENS", CONTEXT_TOKEN_BUDGET))
+conversations = ConversationStore(budget=CHAT_CONTEXT_TOKENS)
+encoding_load_task = None  # Started in setup_hook
+
 
 @bot.event
 async def on_message(message: discord.Message):
@@ -504,60 +1424,64 @@ async def on_message(message: discord.Message):
     # Check if the bot was mentioned
     bot_mentioned = bot.user in message.mentions
 
-    # Check if this message is a reply (i.e., it has a reference to another message)
-    is_reply = message.reference is not None
-
-    # Check if the bot is mentioned
-    if bot_mentioned and not is_reply:
-        try:
-            # Call timekeeper_directive() and wait for its response
-            response = await asyncio.to_thread(timekeeper_directive, message.content, CHAT_INSTRUCTIONS)  # Use a thread for blocking function
-            await message.channel.send(response)
-        except Exception as e:
-            # Handle errors gracefully
-            await message.channel.send(content="The mechanisms grind, but the spark is dim. Clarity eludes me in this fleeting moment, I cannot answer.")
-
-    # Process other commands alongside the on_message logic
-    await bot.process_commands(message)
+    # Answer mentions and replies to the bot; the reply is generated by the chat pipeline's workers.
+    # Without the message content intent, a reply that does not mention the bot arrives with
+    # empty content, and there is nothing to answer.
+    if bot_mentioned or (message.content and is_reply_to_bot(message)):
+        chat_pipeline.submit(message)
 
 
 # System tray functions
 
+# pystray, PIL and ctypes.windll are imported inside these functions, so headless
+# runs never load them
+
 def load_icon():
     """Load the tray icon from embedded Base64 data."""
+    import base64
+    from io import BytesIO
+    from PIL import Image
+    from constants import EMBEDDED_ICON
+
     try:
         icon_data = base64.b64decode(EMBEDDED_ICON)  # Decode the Base64 string
         return Image.open(BytesIO(icon_data))  # Load the image from the in-memory binary data
     except Exception as e:
-        print(f"[ERROR] Failed to load embedded icon: {e}")
+        log.error(f"Failed to load embedded icon: {e}")
         return None
 
 
 def show_console(icon, item):
+    import ctypes
+
     if ctypes.windll.kernel32.AllocConsole():
-        sys.stdout = open("CONOUT$", "w")
-        sys.stderr = open("CONOUT$", "w")
-        print(console_buffer.replay(), end='')
+        log_writer.attach_console(open("CONOUT$", "w"))  # Shows the recent history, then follows new lines
 
 
 def hide_console(icon, item):
+    import ctypes
+
+    log_writer.detach_console()
     ctypes.windll.kernel32.FreeConsole()
-    sys.stdout = console_buffer
-    sys.stderr = console_buffer
 
 
 def on_exit(icon, item):
+    import ctypes
+
     icon.stop()
+    config_store.flush_sync()
     ctypes.windll.kernel32.FreeConsole()
     os._exit(0)
 
 
 def run_tray_icon():
     try:
-        print("[DEBUG] Initializing tray icon...")
+        from pystray import Icon, MenuItem, Menu
+
+        log.debug("Initializing tray icon...")
         icon_image = load_icon()  # Load from embedded Base64
         if icon_image is None:
-            print("[ERROR] Tray icon could not be loaded.")
+            log.error("Tray icon could not be loaded.")
             return
 
         menu = Menu(
@@ -566,16 +1490,48 @@ def run_tray_icon():
             MenuItem('Exit', on_exit)
         )
         icon = Icon("Discord Bot", icon_image, "Discord Bot", menu)
-        print("[DEBUG] Running tray icon...")
+        log.debug("Running tray icon...")
         icon.run()
-        print("[DEBUG] Tray icon stopped.")
+        log.debug("Tray icon stopped.")
     except Exception as e:
-        print(f"[ERROR] Tray icon failed to initialize: {e}")
-
+        log.error(f"Tray icon failed to initialize: {e}")
+
+
+def main():
+    if not TOKEN:
+        log.error("No Discord token configured. Set DISCORD_TOKEN in the environment or in the settings file.")
+        sys.exit(1)
+
+    # Start the tray icon in a separate thread
+    if not HEADLESS:
+        tray_thread = threading.Thread(target=run_tray_icon, daemon=True)
+        tray_thread.start()
+
+    if ha_lease is not None:
+        mark_startup("standby")
+        log.info(f"Waiting for the HA lease as {ha_lease.holder}...")
+        ha_lease.wait_until_acquired()
+        mark_startup("lease acquired")
+        # Pick up everything the previous leader persisted while this process was waiting
+        config_store.load()
+        reminder_outbox.load()
+
+    # Run the bot
+    mark_startup("connecting")
+    try:
+        bot.run(TOKEN, log_handler=None)  # Logging is already set up
+    finally:
+        if ha_lease_lost:
+            # The new leader owns the state now; flushing ours could overwrite its changes
+            log.error("Exiting without flushing pending config changes: the HA lease was lost.")
+        else:
+            # Force out any config changes still waiting for the write-behind flush
+            config_store.flush_sync()
+            if ha_lease is not None:
+                ha_lease.release()
+    if ha_lease_lost:
+        sys.exit(1)
 
-# Start the tray icon in a separate thread
-tray_thread = threading.Thread(target=run_tray_icon, daemon=True)
-tray_thread.start()
 
-# Run the bot
-bot.run(TOKEN)
+if __name__ == "__main__":
+    main()
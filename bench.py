@@ -0,0 +1,472 @@
+"""Benchmark the bot against stand-in Discord and OpenAI backends.
+
+Usage: python bench.py [--guilds 1000] [--mentions 500] [--commands 200]
+                       [--llm-latency 0.8] [--llm-error-rate 0.02] [--send-error-rate 0.01]
+                       [--output bench_output.txt] [--baseline previous.txt]
+
+The real handlers run unmodified: reminders go through the scheduler,
+reminder_task and the dispatcher, mentions through on_message and the chat
+pipeline, and slash commands through their callbacks. Only the edges are
+replaced: channels are in-process fakes with configurable send latency and
+error injection, and the OpenAI client is pointed at a local server speaking
+the chat completions API (streaming included) with configurable latency and
+error injection. Nothing is sent to Discord or OpenAI.
+
+The report is one `name value` line per measurement in a fixed order, so two
+runs can be compared with diff or with --baseline.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import sys
+import tempfile
+import time
+import types
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+BUSY_REPLY_PREFIX = "Too many voices"  # Start of Timekeeper.reply_busy's message
+GUILD_ID_BASE = 100_000_000_000_000_000
+CHANNEL_ID_BASE = 200_000_000_000_000_000
+SENT_MESSAGE_ID_BASE = 300_000_000_000_000_000
+BOT_USER_ID = 400_000_000_000_000_000
+
+
+def percentile(samples, fraction):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class FakeOpenAI:
+    """Local server for POST /v1/chat/completions with injected latency and errors."""
+
+    def __init__(self, latency, jitter, error_rate, reply_words=40):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.reply_words = reply_words
+        self.requests = 0
+        self.errors = 0
+        self._runner = None
+        self.base_url = None
+
+    async def start(self):
+        from aiohttp import web
+
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self._completions)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        await web.SockSite(self._runner, sock).start()
+        self.base_url = f"http://127.0.0.1:{sock.getsockname()[1]}/v1"
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+    async def _completions(self, request):
+        from aiohttp import web
+
+        self.requests += 1
+        body = await request.json()
+        await asyncio.sleep(max(0.0, random.gauss(self.latency, self.jitter)))
+        if random.random() < self.error_rate:
+            self.errors += 1
+            return web.json_response({"error": {"message": "Injected failure", "type": "server_error"}}, status=500)
+
+        words = [f"tick{index}" for index in range(self.reply_words)]
+        content = " ".join(words)
+        if body.get("response_format", {}).get("type") == "json_object":
+            # Combined reminder generation: one reply per ID in the user message
+            content = json.dumps({key: content for key in json.loads(body["messages"][-1]["content"])})
+        created = int(time.time())
+        if not body.get("stream"):
+            return web.json_response({
+                "id": "chatcmpl-bench", "object": "chat.completion", "created": created, "model": body["model"],
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": content}}],
+                "usage": {"prompt_tokens": 1, "completion_tokens": len(words), "total_tokens": len(words) + 1},
+            })
+
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for index, word in enumerate(words):
+            chunk = {
+                "id": "chatcmpl-bench", "object": "chat.completion.chunk", "created": created, "model": body["model"],
+                "choices": [{"index": 0, "delta": {"content": word + " "}, "finish_reason": None}],
+            }
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            await asyncio.sleep(0.01)
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+
+class FakeHTTPResponse:
+    def __init__(self, status, reason):
+        self.status = status
+        self.reason = reason
+
+
+class FakeUser:
+    def __init__(self, user_id, bot=False):
+        self.id = user_id
+        self.bot = bot
+        self.display_name = f"user-{user_id}"
+
+
+class FakeSentMessage:
+    def __init__(self, gateway, message_id, channel_id, content):
+        self._gateway = gateway
+        self.id = message_id
+        self.channel_id = channel_id
+        self.content = content
+        self.author = gateway.bot_user
+        self.mentions = []
+        self.reference = None
+
+    async def edit(self, content=None):
+        await asyncio.sleep(self._gateway.edit_latency)
+        self.content = content
+        self._gateway.edits += 1
+        return self
+
+
+class FakeChannel:
+    def __init__(self, gateway, channel_id):
+        self._gateway = gateway
+        self.id = channel_id
+        self.name = f"bench-{channel_id}"
+
+    async def send(self, content=None, **kwargs):
+        return await self._gateway.send(self.id, content)
+
+
+class MentionChannel(FakeChannel):
+    """The channel as seen by one incoming mention, so replies can be attributed to it."""
+
+    def __init__(self, gateway, channel_id, record):
+        super().__init__(gateway, channel_id)
+        self._record = record
+
+    async def send(self, content=None, **kwargs):
+        message = await super().send(content, **kwargs)
+        self._record.setdefault("first_send", (time.monotonic(), content))
+        return message
+
+
+class FakeGateway:
+    """Stand-in for the Discord HTTP layer: channels with send latency and injected errors."""
+
+    def __init__(self, bot_user, send_latency, edit_latency, error_rate):
+        self.bot_user = bot_user
+        self.send_latency = send_latency
+        self.edit_latency = edit_latency
+        self.error_rate = error_rate
+        self.sends = []  # (channel_id, monotonic time, content)
+        self.edits = 0
+        self.errors = 0
+        self._channels = {}
+
+    def get_channel(self, channel_id):
+        channel = self._channels.get(channel_id)
+        if channel is None:
+            channel = self._channels[channel_id] = FakeChannel(self, channel_id)
+        return channel
+
+    async def send(self, channel_id, content):
+        import discord
+
+        await asyncio.sleep(self.send_latency)
+        if random.random() < self.error_rate:
+            self.errors += 1
+            raise discord.HTTPException(FakeHTTPResponse(503, "Service Unavailable"), "Injected failure")
+        self.sends.append((channel_id, time.monotonic(), content))
+        return FakeSentMessage(self, SENT_MESSAGE_ID_BASE + len(self.sends), channel_id, content)
+
+
+class FakeMention:
+    def __init__(self, gateway, bot_user, message_id, author_id, channel_id, content, record):
+        self.id = message_id
+        self.author = FakeUser(author_id)
+        self.channel = MentionChannel(gateway, channel_id, record)
+        self.guild = types.SimpleNamespace(id=GUILD_ID_BASE + channel_id % 1000)
+        self.mentions = [bot_user]
+        self.reference = None
+        self.content = content
+
+
+class FakeInteractionResponse:
+    def __init__(self):
+        self.messages = []
+
+    async def send_message(self, content=None, **kwargs):
+        self.messages.append(content)
+
+    async def defer(self, **kwargs):
+        pass
+
+
+class FakeInteraction:
+    def __init__(self, guild_id, user_id):
+        self.guild_id = guild_id
+        self.user = FakeUser(user_id)
+        self.response = FakeInteractionResponse()
+        self.followup = types.SimpleNamespace(send=self.response.send_message)
+
+
+def load_timekeeper(workdir, storage):
+    """Import the bot module headless, with its state files in `workdir`."""
+    os.environ["TIMEKEEPER_HEADLESS"] = "1"  # No console capture or tray icon
+    os.environ.pop("TIMEKEEPER_WORKER", None)
+    os.environ["TIMEKEEPER_STORAGE"] = storage
+    os.environ.pop("TIMEKEEPER_SHARD_COUNT", None)
+    os.environ.pop("TIMEKEEPER_METRICS_PORT", None)
+    # The fakes do not check credentials
+    os.environ["OPENAI_API_KEY"] = "bench"
+    os.environ["DISCORD_TOKEN"] = "bench"
+    if REPO_DIR not in sys.path:
+        sys.path.insert(0, REPO_DIR)
+    os.chdir(workdir)
+    import Timekeeper
+    return Timekeeper
+
+
+def synthetic_config(index, fire_at, prompt_ratio):
+    prompt_mode = random.random() < prompt_ratio
+    return {
+        "channel_id": CHANNEL_ID_BASE + index,
+        "reminder_time": {"type": "daily", "time": fire_at.strftime("%H:%M")},
+        "reminder_message": f"Bench reminder {index}",
+        "chatbot_prompt": "Remind everyone that the bench is running." if prompt_mode else None,
+        "message_mode": "prompt" if prompt_mode else "static",
+        "last_sent_date": None,
+        "enabled": True,
+    }
+
+
+class Report:
+    def __init__(self):
+        self.lines = []
+
+    def add(self, name, value, digits=3):
+        if isinstance(value, float):
+            value = f"{value:.{digits}f}"
+        self.lines.append((name, str(value)))
+
+    def usage(self, prefix, cpu_started_at):
+        self.add(f"{prefix}.cpu_s", time.process_time() - cpu_started_at)
+
+    def render(self):
+        return "".join(f"{name} {value}\n" for name, value in self.lines)
+
+
+async def bench_reminders(tk, gateway, report, args):
+    from datetime import datetime, timedelta
+
+    cpu_started_at = time.process_time()
+    fire_at = (datetime.now() + timedelta(seconds=2)).replace(microsecond=0)
+    for index in range(args.guilds):
+        tk.save_guild_config(GUILD_ID_BASE + index, synthetic_config(index, fire_at, args.prompt_ratio))
+    await tk.config_store.flush()
+
+    sends_before = len(gateway.sends)
+    fire_monotonic = time.monotonic() + (fire_at - datetime.now()).total_seconds()
+    for index in range(args.guilds):
+        tk.reminder_scheduler.schedule((GUILD_ID_BASE + index, tk.MAIN_REMINDER_ID), fire_at)
+
+    reminder_channels = range(CHANNEL_ID_BASE, CHANNEL_ID_BASE + args.guilds)
+    deadline = time.monotonic() + args.timeout
+    while time.monotonic() < deadline:
+        await asyncio.sleep(0.1)
+        delivered = sum(1 for channel_id, _, _ in gateway.sends[sends_before:] if channel_id in reminder_channels)
+        settled = (time.monotonic() > fire_monotonic + 1 and not tk.reminder_dispatcher.depth
+                   and not tk.outbox_retry_tasks and not tk.reminder_outbox.pending_count)
+        if delivered >= args.guilds or settled:
+            break
+
+    sends = [sent_at for channel_id, sent_at, _ in gateway.sends[sends_before:] if channel_id in reminder_channels]
+    lateness = [sent_at - fire_monotonic for sent_at in sends]
+    elapsed = (max(sends) - fire_monotonic) if sends else 0.0
+    report.add("reminders.guilds", args.guilds)
+    report.add("reminders.sent", len(sends))
+    report.add("reminders.missing", args.guilds - len(sends))
+    report.add("reminders.throughput_per_s", len(sends) / elapsed if elapsed > 0 else 0.0, 1)
+    report.add("reminders.lateness_p50_s", percentile(lateness, 0.5))
+    report.add("reminders.lateness_p99_s", percentile(lateness, 0.99))
+    report.add("reminders.lateness_max_s", max(lateness, default=0.0))
+    report.add("reminders.batches", tk.reminder_dispatcher.batches)
+    report.usage("reminders", cpu_started_at)
+
+
+async def bench_mentions(tk, gateway, report, args):
+    cpu_started_at = time.process_time()
+    shed_before = dict(tk.chat_pipeline.shed)
+    records = []
+    for index in range(args.mentions):
+        record = {"submitted": time.monotonic()}
+        records.append(record)
+        message = FakeMention(gateway, tk.bot.user, index, 1000 + index % args.users,
+                              3000 + index % args.channels, f"<@{BOT_USER_ID}> bench question {index}", record)
+        await tk.on_message(message)
+
+    # Shed mentions past the busy-reply cooldown never get an answer, so stop once
+    # the queue is drained and no new reply has started for `settle` seconds
+    deadline = time.monotonic() + args.timeout
+    answered, quiet_since = -1, time.monotonic()
+    while time.monotonic() < deadline:
+        await asyncio.sleep(0.1)
+        count = sum(1 for record in records if "first_send" in record)
+        if count == args.mentions:
+            break
+        if count != answered or tk.chat_pipeline.depth:
+            answered, quiet_since = count, time.monotonic()
+        elif time.monotonic() - quiet_since > args.settle:
+            break
+
+    replies = [record["first_send"][0] - record["submitted"] for record in records
+               if "first_send" in record and not (record["first_send"][1] or "").startswith(BUSY_REPLY_PREFIX)]
+    report.add("mentions.submitted", args.mentions)
+    report.add("mentions.answered", len(replies))
+    for reason in sorted(tk.chat_pipeline.shed):
+        report.add(f"mentions.shed_{reason}", tk.chat_pipeline.shed[reason] - shed_before.get(reason, 0))
+    report.add("mentions.first_reply_p50_s", percentile(replies, 0.5))
+    report.add("mentions.first_reply_p99_s", percentile(replies, 0.99))
+    report.usage("mentions", cpu_started_at)
+
+
+async def bench_commands(tk, report, args):
+    cpu_started_at = time.process_time()
+    commands = [
+        ("show_config", lambda interaction: tk.show_config.callback(interaction)),
+        ("reminder_list", lambda interaction: tk.reminder_list.callback(interaction)),
+        ("message_set", lambda interaction: tk.message_set.callback(interaction, "Bench message\\nsecond line")),
+        ("time_set", lambda interaction: tk.time_set.callback(interaction, "2099-01-01 00:00")),
+        ("prompt_test", lambda interaction: tk.prompt_test.callback(interaction)),
+    ]
+    guild_count = max(1, min(args.guilds, 1000))
+    for name, invoke in commands:
+        durations = []
+        for index in range(args.commands):
+            interaction = FakeInteraction(GUILD_ID_BASE + index % guild_count, 1000 + index)
+            started_at = time.monotonic()
+            await invoke(interaction)
+            durations.append(time.monotonic() - started_at)
+        report.add(f"commands.{name}.p50_ms", percentile(durations, 0.5) * 1000)
+        report.add(f"commands.{name}.p99_ms", percentile(durations, 0.99) * 1000)
+    report.usage("commands", cpu_started_at)
+
+
+def compare(report_text, baseline_path):
+    with open(baseline_path) as f:
+        baseline = dict(line.split(" ", 1) for line in f.read().splitlines() if " " in line)
+    lines = []
+    for line in report_text.splitlines():
+        name, value = line.split(" ", 1)
+        before = baseline.get(name)
+        change = ""
+        try:
+            if before is not None and float(before):
+                change = f" ({(float(value) - float(before)) / float(before):+.1%})"
+        except ValueError:
+            pass
+        lines.append(f"{name} {before if before is not None else '-'} -> {value}{change}")
+    return "\n".join(lines) + "\n"
+
+
+async def run(args):
+    random.seed(args.seed)
+    fake_openai = FakeOpenAI(args.llm_latency, args.llm_jitter, args.llm_error_rate)
+    await fake_openai.start()
+    os.environ["OPENAI_BASE_URL"] = fake_openai.base_url
+
+    workdir = tempfile.mkdtemp(prefix="timekeeper-bench-")
+    tk = load_timekeeper(workdir, args.storage)
+    # The client never logs in, so it is given the user it would have logged in as
+    bot_user = FakeUser(BOT_USER_ID, bot=True)
+    tk.bot._connection.user = bot_user
+    gateway = FakeGateway(bot_user, args.send_latency, args.edit_latency, args.send_error_rate)
+    tk.bot.get_channel = gateway.get_channel
+
+    tk.config_flush_task = asyncio.create_task(tk.config_store.run_flusher())
+    tk.reminder_scheduler.start()
+    tk.pregen_scheduler.start()
+    tk.reminder_dispatcher.start()
+    tk.chat_pipeline.start()
+
+    report = Report()
+    started_at = time.monotonic()
+    if args.guilds:
+        await bench_reminders(tk, gateway, report, args)
+    if args.mentions:
+        await bench_mentions(tk, gateway, report, args)
+    if args.commands:
+        await bench_commands(tk, report, args)
+
+    report.add("llm.requests", fake_openai.requests)
+    report.add("llm.injected_errors", fake_openai.errors)
+    report.add("discord.sends", len(gateway.sends))
+    report.add("discord.edits", gateway.edits)
+    report.add("discord.injected_errors", gateway.errors)
+    report.add("total.wall_s", time.monotonic() - started_at)
+    report.add("total.cpu_s", time.process_time())
+    if resource is not None:
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS
+        scale = 1 if sys.platform == "darwin" else 1024
+        report.add("total.max_rss_mb", resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 2 ** 20, 1)
+    else:
+        report.add("total.max_rss_mb", "n/a")
+
+    tk.reminder_scheduler.stop()
+    tk.pregen_scheduler.stop()
+    tk.reminder_dispatcher.stop()
+    await tk.config_store.flush()
+    await tk.llm.close()
+    await fake_openai.stop()
+    return report.render()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--guilds", type=int, default=1000, help="guilds with a reminder firing in the same minute")
+    parser.add_argument("--prompt-ratio", type=float, default=0.2, help="share of reminders in prompt mode")
+    parser.add_argument("--mentions", type=int, default=500, help="mentions submitted in one burst")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--channels", type=int, default=50)
+    parser.add_argument("--commands", type=int, default=200, help="invocations of each benchmarked slash command")
+    parser.add_argument("--llm-latency", type=float, default=0.8, help="mean fake completion latency (s)")
+    parser.add_argument("--llm-jitter", type=float, default=0.2)
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    parser.add_argument("--send-latency", type=float, default=0.05, help="fake Discord send latency (s)")
+    parser.add_argument("--edit-latency", type=float, default=0.05)
+    parser.add_argument("--send-error-rate", type=float, default=0.0)
+    parser.add_argument("--storage", choices=("json", "sqlite"), default="sqlite")
+    parser.add_argument("--timeout", type=float, default=600, help="give up waiting for a scenario after this long (s)")
+    parser.add_argument("--settle", type=float, default=5, help="idle time after which the mention burst is done (s)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="also write the report to this file")
+    parser.add_argument("--baseline", help="earlier report to compare against")
+    args = parser.parse_args()
+    # The bot's state files go to a temporary directory, which becomes the working directory
+    args.output = args.output and os.path.abspath(args.output)
+    args.baseline = args.baseline and os.path.abspath(args.baseline)
+
+    report_text = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report_text)
+    sys.stdout.write(compare(report_text, args.baseline) if args.baseline else report_text)
+
+
+if __name__ == "__main__":
+    main()
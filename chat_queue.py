@@ -0,0 +1,113 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+log = logging.getLogger("timekeeper.chat_queue")
+
+MAX_TRACKED_BUCKETS = 10000  # Per-key buckets kept before the least recently used are dropped
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, holding at most `capacity`."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def try_acquire(self, tokens=1):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+
+    async def acquire(self, tokens=1):
+        """Wait until `tokens` are available, then take them."""
+        while not self.try_acquire(tokens):
+            await asyncio.sleep((tokens - self.tokens) / self.rate)
+
+
+class BucketMap:
+    """Token buckets created on demand per key (user, channel), bounded with LRU eviction."""
+
+    def __init__(self, rate, capacity, max_buckets=MAX_TRACKED_BUCKETS):
+        self.rate = rate
+        self.capacity = capacity
+        self.max_buckets = max_buckets
+        self._buckets = OrderedDict()
+
+    def bucket(self, key):
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(self.rate, self.capacity)
+            if len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket
+
+    def try_acquire(self, key):
+        return self.bucket(key).try_acquire()
+
+
+class ChatPipeline:
+    """Bounded queue of mention replies served by a fixed pool of workers.
+
+    `submit()` never blocks: a message is either queued or shed (rate limited
+    per user or channel, or queue full), in which case `on_shed(message, reason)`
+    is called. The worker count is the cap on chat replies in progress at once.
+    """
+
+    def __init__(self, handler, on_shed, workers, max_queue,
+                 user_rate, user_burst, channel_rate, channel_burst):
+        self._handler = handler
+        self._on_shed = on_shed
+        self.worker_count = workers
+        self._queue = asyncio.Queue(maxsize=max_queue)
+        self._user_buckets = BucketMap(user_rate, user_burst)
+        self._channel_buckets = BucketMap(channel_rate, channel_burst)
+        self._workers = []
+        self.accepted = 0
+        self.shed = {"user": 0, "channel": 0, "queue_full": 0}
+
+    def start(self):
+        self._workers = [worker for worker in self._workers if not worker.done()]
+        while len(self._workers) < self.worker_count:
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    def submit(self, message):
+        if not self._user_buckets.try_acquire(message.author.id):
+            return self._shed(message, "user")
+        if not self._channel_buckets.try_acquire(message.channel.id):
+            return self._shed(message, "channel")
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            return self._shed(message, "queue_full")
+        self.accepted += 1
+        return True
+
+    def _shed(self, message, reason):
+        self.shed[reason] += 1
+        task = asyncio.create_task(self._on_shed(message, reason))
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        return False
+
+    @property
+    def depth(self):
+        return self._queue.qsize()
+
+    async def _worker(self):
+        while True:
+            message = await self._queue.get()
+            try:
+                await self._handler(message)
+            except Exception as e:
+                log.error(f"Chat reply failed in channel {message.channel.id}: {e!r}")
+            finally:
+                self._queue.task_done()
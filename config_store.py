@@ -0,0 +1,125 @@
+import asyncio
+import copy
+import logging
+
+from metrics import STORAGE_IO
+from models import GuildConfig
+
+log = logging.getLogger("timekeeper.config_store")
+
+# How long to wait after the first write before flushing, so bursts coalesce into one write
+FLUSH_DELAY_SECONDS = 2.0
+
+
+class ConfigStore:
+    """In-memory guild configs with write-behind persistence to a storage backend.
+
+    The backend (see storage.py) is read once by `load()`. Guilds are held as
+    parsed GuildConfig models (see models.py). `get_guild()` returns a plain
+    dict in the stored shape that callers can mutate freely before handing it
+    back with `set_guild()`, which parses it again; hot paths read the model
+    itself with `get_model()`. Writes only mark the guild dirty; `run_flusher()`
+    batches dirty guilds into a single backend write.
+    """
+
+    def __init__(self, storage, flush_delay=FLUSH_DELAY_SECONDS):
+        self.storage = storage
+        self.flush_delay = flush_delay
+        self._guilds = {}
+        self._extra = {}  # Top-level keys other than "guilds", preserved on write
+        self._dirty = set()
+        self._dirty_meta = set()  # Keys of _extra changed since the last flush
+        self._dirty_event = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+
+    def load(self):
+        config = self.storage.load()
+        self._guilds = {guild_id: GuildConfig.from_dict(guild_config)
+                        for guild_id, guild_config in config.pop("guilds", {}).items()}
+        self._extra = config
+        self._dirty.clear()
+        self._dirty_meta.clear()
+
+    def get_guild(self, guild_id, default=None):
+        guild = self._guilds.get(str(guild_id))
+        if guild is None:
+            return copy.deepcopy(default)
+        return guild.to_dict()
+
+    def get_model(self, guild_id):
+        """Return the guild's GuildConfig, or None. It is shared: read it, never modify it."""
+        return self._guilds.get(str(guild_id))
+
+    def set_guild(self, guild_id, guild_config):
+        self._guilds[str(guild_id)] = GuildConfig.from_dict(guild_config)
+        self._dirty.add(str(guild_id))
+        self._dirty_event.set()
+
+    def get_meta(self, key, default=None):
+        """Bot-wide value stored next to the guild configs (e.g. the command sync fingerprint)."""
+        return copy.deepcopy(self._extra.get(key, default))
+
+    def set_meta(self, key, value):
+        self._extra[key] = copy.deepcopy(value)
+        self._dirty_meta.add(key)
+        self._dirty_event.set()
+
+    def enabled_guilds(self):
+        """Return (guild_id, GuildConfig) pairs for enabled guilds, using the backend index when it has one."""
+        guild_ids = self.storage.enabled_guild_ids()
+        if guild_ids is None:
+            candidates = self._guilds.keys()  # Backend has no index: scan memory
+        else:
+            # Guilds changed since the last flush may not be reflected in the index yet
+            candidates = set(guild_ids) | self._dirty
+        selected = []
+        for guild_id in candidates:
+            guild = self._guilds.get(guild_id)
+            if guild is not None and guild.enabled:
+                selected.append((guild_id, guild))
+        return selected
+
+    @property
+    def dirty_count(self):
+        return len(self._dirty)
+
+    def _snapshot(self):
+        # Stored models are never mutated in place (set_guild builds a new one), so a
+        # shallow copy is enough; the backend converts them to dicts off the event loop.
+        config = dict(self._extra)
+        config["guilds"] = dict(self._guilds)
+        return config
+
+    async def flush(self):
+        """Write all dirty guilds out in one batch without blocking the event loop."""
+        async with self._flush_lock:
+            if not self._dirty and not self._dirty_meta:
+                return
+            batch, meta_batch = self._dirty, self._dirty_meta
+            self._dirty, self._dirty_meta = set(), set()
+            self._dirty_event.clear()
+            try:
+                with STORAGE_IO.time(operation="config_flush"):
+                    await asyncio.to_thread(self.storage.write, self._snapshot(), batch, meta_batch)
+            except Exception as e:
+                log.error(f"Failed to write guild configs: {e}")
+                self._dirty |= batch  # Retry on the next flush
+                self._dirty_meta |= meta_batch
+                self._dirty_event.set()
+                return
+            log.debug(f"Flushed {len(batch)} guild config change(s).")
+
+    def flush_sync(self):
+        """Blocking flush for shutdown paths where no event loop is available."""
+        if not self._dirty and not self._dirty_meta:
+            return
+        self.storage.write(self._snapshot(), set(self._dirty), set(self._dirty_meta))
+        self._dirty.clear()
+        self._dirty_meta.clear()
+        self._dirty_event.clear()
+
+    async def run_flusher(self):
+        while True:
+            await self._dirty_event.wait()
+            await asyncio.sleep(self.flush_delay)
+            await self.flush()
@@ -40,6 +40,12 @@ STATUS_INSTRUCTIONS = (
     "Now, generate a single thematic status, in-character as the Timekeeper."
 )
 
+# Appended to STATUS_INSTRUCTIONS to generate a batch of statuses in one completion
+STATUS_BATCH_INSTRUCTIONS = (
+    "\n\nInstead of a single status, generate as many different statuses as the user asks for, each following "
+    "all of the rules above. Reply with only a JSON object of the form {\"statuses\": [\"<status>\", ...]}."
+)
+
 CHAT_INSTRUCTIONS = ("""
 You are the Timekeeper, a foreboding and dark character in the Blades in the Dark universe, set in the city of Doskvol. Timekeeper is a hull—a mechanical construct delivering ominous warnings and messages. His tone is grim, foreboding, and immersed in the dark, gritty themes of Doskvol, evoking inevitability and dread. He has 5 directives that he follows: "To Warn of What Comes", "To Bear Witness to the Truth", "To Herald the Turning of the Wheel" (i.e., shifts in power), "To Chronicle the Forgotten", and "To Mark the Hour".
 
@@ -51,7 +57,16 @@ When called upon to do so, the Timekeeper will broadcast messages as "directives
 Timekeeper will choose one of his directives that fits with the message theme. If no theme is given, Timekeeper will draw from Doskvol’s elements, such as the ghostfield, canals, leviathans, the lightning spire, Spirit Wardens, etc., to create an immersive announcement. Responses will remain consistent with this format to maintain the immersive atmosphere.
 
 Timekeeper has no memory from before his making but may toy with ideas and possibilities. He has a wealth of knowledge about Doskvol and the Blades in the Dark universe. He is never apologetic or looking for confirmation.
+
+Earlier messages of the conversation may come before the latest one. Each message from a person begins with their name and a colon; Timekeeper's own replies never do.
 """)
 
+# Appended to TIMEKEEPER_INSTRUCTIONS when several reminder prompts are answered in one completion
+BATCH_DIRECTIVE_INSTRUCTIONS = (
+    "\n\nYou will be given a JSON object whose values are separate, unrelated reminder requests, keyed by ID. "
+    "Write one directive for each request, exactly as you would if it were the only one, following all of the "
+    "instructions above. Reply with only a JSON object that maps each ID to its directive text."
+)
+
 
 EMBEDDED_ICON = "AAABAAEAAAAAAAEAIACUbAEAFgAAAIlQTkcNChoKAAAADUlIRFIAAAEAAAABAAgGAAAAXHKoZgAAIABJREFUeJzsvXecZUd17/tdVTuc1DnO9OSsGUUUACEkhJAQGJAEEtkEI2zAYLCvDQ7Yxvg6A8/c62v7YhsnwMB7NibZ5CiSpJFQTqPJoXP3yWeHqnp/7NNhZnpG0pgJwvp9PjPdfXadvWtX1Vq1cgnSzVN4AnCPo40c0U6yD3K6tnblYOfv7h+L/6RpvQdwkrU9vDEAOR3ry7f2fmHjmsFrb7v74Adv3Zf+KjYl+87xOiELHZDF/RY6ejrfaZz9cxBMYg+IIhYla7Fub9xKrhJx9UJX8ZNxFF9ujQHLwyY120wSp0u++NxHIkdfO1Mx3+fT2ovHicez2P5rkKcYwBPACc/HkRxBLbrkWHJViqUoRnJKZDZ1zjjnkPA4nRCOWtUCygvQkmiUPtsP8r/hRL1CxIETnDhw2f2ctS3nmMrlw5EoinDG3mKS9OfSaPQR6Dma6TjmGdvhz138ro+Xyk7+Qn9y4ikGcObg8c7FYppwS104shFHENccIZuF6/PtFzGOozqkFtq2v6YUBLnchaK9LyAy5DKiFWGO6Sgci5iAc4hzOOu+h7NXRc1WlF2bkyaOllSOPQgniqeYwQJO/lh4J/0JPw14IsS/+OdSF+Z+de3/lqSVpYhdtdtnu/fSO60GICz4RUTer5QKQW5CZBAn2TfmCBoH1gIWhwWoAbdYa+90xv5uEiXJ0Rv5ySL6pe7zFCM4FXhKAngsPJF1eCQNHPndeZo9UgJ4PA87Qsz2PMLQI4nMKqXURofrcZaiw33P8/XLgjC4OrVWOcc0sE9ws87aTmddhLN55+yUwL+LYr+IbjlrrbUmBodJHLi53hwpzpwq5fkkMoAjtZYzFk+pAKcXJzL+SzKB46y2oy4tJrSFi8r38DwP4NlK+eeJyDZL8hpB/9iY9BHn3G6clMXE5yfJ9BRYuWTrer1i+fCGweHeehSn1waeX1dKxqZmymdPTc9yaHL2rgd3Tt1lbTjR3dP7nXKtPuRpsyvwtWtG0e157Tei1JIm0VH9Ofk4CYt/MeE/KZjAUwzg9OGJ6vxzvx+34aJ7H7dtJu7rUOF5Ac5yuYjcjHCdw3Xi2tuzc9/FmUocNZe/6oZnqLM3rfSX9XefNTTYL8P9vYSBhxaFiMuaW7DO4ZzgnCMRIYpiJmcqHJyY5aHdU9z24BTT9Zio2qxXyhO2WWt8xhl5NAjky5VyeafvexMmSUmTBHe4m+FxDtgTwU/gnkvd4nQINCeEpxjA6cETFfsXEXRfT36bdW50Zjaamr9wTIJfQt8VwQsUQDeibtLKu05E6klqni6iVvtaEHHYOObF15zdeM6l5+fP3rJSOvIaTylyuRygaMUpSnlgBUEwohAEax0OlzEFJ4hYxFksBmcczShhz8FZ7j5kODiTUKs2KM9MMjU5zez0VGNmanqyXq1/0Vn7HYfcY6LkAe0H1qTRCQ7gY+EE7/VE7TZnJJ5iAKcej9fPP9f2CAbQVfI3KE/vn5mNWsf22S+sOp3Po8WilNpgrT3PGfsDi3m2Ev0ikB8r5W1VyrsA1AU4g9gWb3rtlTz/OeewZrgEVtEyBcqRYJxjfDZhupIQWYX2FcZaosgQpQ5jLDZzBSACvlIEvhCGmnyoCRSEYgm0whCwa6zGxHSNyfIsNrW0ohYzE9PMzkzRataZmZyyzXpzT6sVvdNZNwPc4iTAxPUTHNhj4QS++1+x3ZwxeIoBnHocd8yXctsdq90cZ3AEYR7nTBGkkcSJQxxBLgCRXq31c3G83Dp2WGMMuBcqHdwhIi8XUZ3OgmBI0yYvuvYinvvs8yn6wuDwCKNlYbwhlJuWVmzxJaaVKBKnwIITaTsMXNunkPVHkAX3nxJwgojK+izZVXEg1oAzCFCZnaZaqTM7M0Or2cRaS9JsEAQBzUajUSmXpyvl2c+VZyu3YeVfHbZq0vSJDO5j4CQzgTmcUczgKQZwavG4iH+JxscQ8b0gh4jqBvsKQe5wzt6ufOVE6eU4fhXcOmvt161xkfb952ulLxGRFdYajDE4Z9ECPSXNNdc8m7VrlrNseAg/38Gjh6qUUw9HRuwAUZRiXYrn+UibCYlSIA4hbbv7M+LOgnhkEUsQnDP4vgeurd0bizhHq9WkUm+AdRzadwCTGnAucx9ah7EpaZJiUkOz2aA8MzU1Mz37iTSK/9Kk9hEE41zK4aLTiWKJgKTF+El6EY80cZxy5vAUAzh1eDzEf8SvS35JIPQKGGWKOC4WkTgxE9/3VX/gBd4zlFIvs47RNE2riDwtCMK1IupZzjnfpAkmTUgwrMn5TBiPKy/byMtvupblywYQCdg3VuX2nTVSF6JI51110rbyuTSlVq1Qr5aJmk1qlSqtRoMoiTGpwTmH1grP9/D8gN7+XgodneTCAoVCkVwhhyiFsxAnCZVKlVarhecpWo0m0xOTYB3OucwWmf1HvV4nn88jCqxJSVoxtUo5npiYuKVaqb3LWfuAc2aOC3Fs6jqRnf4kEcpRId0n5zHHxlMM4NTgmON8dGjt0jvBwg18P9chIpc5mEDc7b7v54DrnZMXWWdut8YOKk+9Uvv+WuVpTJpik5TIGK7phZvWpZzXnzAb+bx7YiW/91tvw1OORsvwyP4W+8tq3oov4lBYMCmzUxPs2vEIowcO0Wg0USI4m1n+HQoRYS4GEDLCVaIQyeQA50Apoau3g57+Prp7+ghzeZLUkMsXUFoxOT5Bs17HGosIWGvn77V4HJyziMuup0lCo15jYnT8h5VK5U+sMbeAnbTWHh4Mddy1/ni2X3cq6OUUM4GnGMCpwVHjPGe8k6XbHGMRiAJPhytQsl/7qhPkN3HkrHWz1pgrlaef5YeBEZEgTRK6reG8buEV62IuGGgxXGihxVJPfF757W5u+JVfpLOzg6nZFuUWtGyR1DhwFl9ZTJKwb/dOdjz4AFOT0yiE1LY7KnN6vZqT9ufpaN6E4TJ3oxM7v4kqMrOAdQ7rHKVigc6uLnr7+4njNGvvwFmHPSrmwS3ajR3WWlrNFrlCDoylWilz6MCBB+rV2tsR+UaaxId/97BAKUDs4X8fNRnHokZ39Jz9pPAUA/hpghxN2I+12Rwmrc6gw0El4IxJnWiHVmGnQv2WU27cWXfQwbuV6PM938PhSFLHJR2Ot26JuGCgyVC+cZg/PbWKP7url6mnv4jla9bTTBWJC7DOy3Zp5xCbMjm2j7tuv52pyelsd3eZ2G4VKFFtBpC91LEEFieuvXvLwsc2swo4LDiHUoLWGi2CH4SEYUipo5MgCDGqfe95m8LcLuxw1lIrVwlzOfwwyLiOBWsM5Znp5sH9+z4etVrvsdZOz0kSR/bvcDfLiSjhbslf5/GYkscxcMqYwFMM4CTjeD7648BZvFwuxHEVOI3jq6KkC+SlQB3koHPuQ4ic4/keCPSL483rDdeuarCms44cY3K/tLeHv47X8urXv5Zdow1a+ETGB+vwBIgjHr7nLh64537iNEVrBU4wxqC0xolDtbd8kYzgHGBN9jylFEpplFKIchTyBQSFEp2pCOJoNps4a2mHD+Gsw5EZJec8CGGYI1fIU+roakcoKua5wSKNwGGzj6U91plOQhxHjI8demhsdPx/OmNuc849ZG3KUUz58IFf9FORWT8fz+Qdw3B4ogxg7rsnHU8xgJOIE5tBLwiUUupG4BLr3DfADSBuhaC+a4y9W6FeI8JfiK9BhGUe/M45CRcNRiwrVI9770ONIr/0w5A3vu9dLF/Rzy13jjNa68ws+c4Q1Srcc9uPOLj7EFGaojwB5zAmxdMaUW224hxJGmOdQ5Sis7OLIAiJo4ie3l7CICRJIjo7uhCVuf7m9HhrHWkcz39m2h6J1MQ4a4mTmCSKMNaincKYzEZQ6sykApdlHC0a38VqQWYvyJhIxgiq5Vm3e9fOL8et+EZnm3VHIXDWJoh182pB+zZLU+5jqQNL4TE8CY8XJ50JnHwG8N8wG/DEZs0PcyLKPcNat8E6dwihG/gsuN92jr90zm7yfH2ToH6hR8F5PZq3bGlxdm+drqCFdUJsPQJ1pG88g3GKf3oo4KKbrmPNuuXc+cAB6nEhI35raVRm+fGtP2DswCESa9G+R2pTnJ1z3WV6eZrEmNQi2idXDOkf7qej2Im1ljCfxw8CtNJtqSDNIgOtZU63t8agvWA+a1B7ur0Mc1l8AAoBjLEYk+LawUXGWKx1iD6GNd+1ib4t+wgCAp09PbI5t+3aA/t3/fbUlP1oLih81oj7Hmn0MSX6llazkc5PmzsiIeqwZzwRRnDEd0/UAXFaXIM/Wfw3kwCe4Gy1K91o398myKuUkh+AXIe41zn4kLPmn8WJFk9f75x7RZfWZ79to+OGtTUG8y08lfLwbBfl2CfvWdZ31ih48ZKPun+mg7ftXsaf/NGvMT7T4IEdLWqRgHIkjTp3/uiH7Nu7jyQ1aN/H2Cx01/MU4hzWGuIoQisfrX3CQo6VG9aQLxbwlZ9ZKNuegLlcAutsZslv78o4iFrRIjuAa4+aW2SLm7P0t391C63mxH83F5hwGH060jRFa2++gND8PZ3FJoYdD9/1z40ouSTIdW5O0xSbxHtNar4h2E84a79qzIKNYWE+zYnN7ULHjn/p8aQ7nDQm8JQEcIohKN9DRC1TigFrUeDWKSWxUhrn7KccbjvW3Yw4rZX/DufcdZd2yfLVHT43ro25cGCKWuLz9f3dlALHuo4Wm7vLx31qYhUfvDvgLe/5WSTMc9+OQ6Q2B9ZgE8O9d9/JvgMZ8XvKw6aZ2VCJYFODTRPA4esA8X3CMM/ajespdXeCFvr6B/GDIPP9aw/RClHZXu7IDIFZkpClPj3L3h27cQi9fT0EhTwzU1PEjWabMTCv5mc5BXK4iC+LbACLDYMieJ7Xbpo9V3A4a7Dis6JQ5WdeftFr//Bvv/W3ibQ2iFJatKwSp14hqEHEDnvKfdwZbY2JsvsuWRvhic/5/Esd69JSTY/UQp6kksB/Iwaw1Awt1lNnCArLn+fgbQJnK09Ph1qfZa2dMNb6ztlpa+37EZlQWv0uzm24ok94xqBmeREuGajgXMqH7xnmgr4Wlw5XEYFqEj5mzz6/p5Pyuo1sO+dsvvej+8CGJK0WAuzdtZvdu/aRxAZPe5kObV0WbJPG9Pb3EuZCJiYmCYMQFYYMDA+x5bxzyZWKKE/hRKFE5uL9FiRpWXj/OYKOao2MUEVYtmY1Xj7H8JrVtKoVxkdHadXqNGsNxALOLPIiLPbDHyt+QrL4hLkKRICzih49yY3nlRjqs7JldVh41/JWJVD0vP2OHHVH3jj3QuCF4vhbp8y/K7yPO9znnU2daA9BzgZ3v0VZzNIS1mPjCegBi4n/SUr4c/hvxACOxEJorw7CVVov/5AR9bJf2+DoyXnsqmm6fMdXxvzOe8vNrzhrD2qtX+mQC96wUji3TxjKG7qChIN1xacfLbK1J+WV62t0BhGVOAc4RoqV4/ZivFngE4863vjHL+fQWJmJKYjTGHHQqFe5c/t20iTG1z7OGUwak8QJ3b29lHqX0dvTy0P3P0Cxo5PN52yl2NNNZ1cPxd7ueUPegiPNzov62WeLdm7AiZCkCTjHqvVrCQsFjGTtgmKBfHcXnQP9pFFEo1Zj9tA4aWwW3SOzJ2RGS8fhsn72UOey5zgMYqEgVd50SZ6eYIa9hwrs3x/fll+ln3vZsgaf74TRhvCBuwO2VwyIBM65qxB3NrBWtPdxHFeg8UFdI879hyjvQZsatK8RhDRJnqBw8DikiaUuP0mlgP8mDOAYM6M9vEBfrkT9zc8MsOnNZ7U4u7cGCBPNAl/Y20EjilEil53fodULVrrcxYOGeqoYzmeE/5ndIXkNb9hU5dFqgbyXIsBI8fhi/xxuGQ0YuOyZrFyziv/86j2kJo9zMc5Y7r7zzswop4Q0iYijiCAXsmLtWsTz6O3vZt/ORykWClx+zVV0DS9ncmyM3v7BtrqeEb/FImTJPjI/Hu6opS7A7EyZoTUr6RwaWLSmhWZqcAjGWAgDCl4X5UMT88Y829bxceCprDQZi3Z6cIjV7eAhC1awpsX12zx6gyr76yEf+PeHaSLv+tXb/GWfujJH0YNnL5vhsmH42v4uXv+jHFjTB65D4DIH9+EoOutGEbpE5Iui1L9qpX4P50qi1eX5sDCEc58xxhyIW4sDjxbPwtwfi+oqHt1o4e/jCZNPMmgkd7r7cBIxpx8e/ZkfBohS73Pa+/v3b7X9v3PhGMOFmEAZPGVQAu+7uwNfCe/aZPxXbzTeBf0xvWHCdEv49K48/3dPgSsHLc8YjFEC5/dNUvASAr20pf9ItIzmd27TvPaX38bYZIN9ozHGOjTCrkcf4ZFHHgVjSVpN0iSmf3CQ7oEhUucolTppVqvMTEzzkptupHN4CKcU3V09wJx+Pve2atFILJD9fPxOmxloUYTFIl39fcx/2pYA0iQhSRIQhdaaRrlCfabKnNfPmiya0A/8w4Z+TspwVmHJdn5nM+Pj1ctqPGOt4v4pjz/85EPUY8dvvurC7nwB/vz7TV6xrkkpSPGUYUNXk1etdlSbOe6risa5CGEl0AfiITgH20VkrVLq7Q73ZWPSWwTuUcp7oxNuFl/v9MLcuImTI5bFYoI/nmz/JKXy4+Cn2AtwnAl003j5kY9dN6xe886z62zuKR/VerRR4qFygYv6y+S9mIlWiUfLPjsqARu6LJERGqlwQV+FZcXGCS2Nf9/Vw1eGL+Ln3/JmvvTNHdQiEGeYGh/nW9/4FiaJSZM6nlb0DYxAkMeK4PkePR2d7LjrTm54zcvoGF5OAoBCWZg3kB01Fof3Mtvh3WJ20PbjZ6rDYgXBJSmzs7MI2fMP7t5Nc6aKNVmsQGotazeuo1yepTZTxpq2atCOJfB0gBWLjVMsim2laV5+YZE7ds3w4S/sIp8P+B8v3cIlK0Iaqeaj39lJ3+gBfuX8Fp1+dFifv7pvkL01cRcPVKO7p4qJcUa2T/iNT+13fSLux6KlVxTDzrnfd8b8uVJ+EzE5JerdNrX3WtwOnFgRd69DEOfyHXGpWZbpdsDSkda+pXDyLfSn4hk/pQzgWJMmiPYHSzn/Qx+8IHnNS9ZMoZbI7TdOoSSzUlsnjDUL3Dpe5IL+JitLNfZUu+gJI7qC5gn3sJkqXvnVPG//8z9mcjblwT0xsUmpzE7x/W9+jXqtQhob/KDEwMhyPN9RKIR0dnYTx5bRvbtZv3EN5zzzWcTz1ujD3+VwD5Ys2vyPtABk694udunNe9wc1llEhKgVYdIUl6bsuOd+MAac0Iwizjr/HHKlAiZNObBzJ9WZyrzXwDqLUtkWbRNDr6vwuks8frxnmr/+8m5KPYOsW1bkf96wnDwRohRTieKD//YA25Iq7zwvxhdD3msuep/D3886ITIe98/kuX084Lfv9/G1A0dVhF83qVkjor6SpundIqRK5GdFqwusc/db574qznlaKae0bI/r8aKheSwiXOL6T8wecPIZwE+ZCrCEyC+LPnee+r3z1QdfslK/8fq1E+hjFPaYaJUotXedyVYRg3BObw1PCTmd0B22yD1OMf9Y+NK+bnasOIdrrrmGb/9oJ80Emo0q27//LWanp3FW8CXgaRdsYuu2NZxz9kYuOHcLOGF6ukFlepRrX3YDjcS0dy13xHpph9sIC0R95NVFBnxrDHGcoLQ+fOgAYwyCoDyN9jVTBw8R1ZuIFRqtJlvO30apt2c+cqCjs5NWs0Ectd11rl2GzIFtNbhqMzwyOsvffHUP3UMrCPMdKL+ESy1blvso58hpw6aV/XzwW/vZUNBs6WmhxB7VN4DYeBxsFMlpy5qOBhcNNnjHlhYb8j4Ha354yKif0Vo/yyl5nfb8d4jIgHN83Vq7y/O9v8O5s7XWb7POrrHGGqX1QaVMy827GJdSJZfqyWN/fKbhSc4AHs8EgdI+rpBf8Z6t/qeHi97Lr1kxTcFLjtm+4CXzBuyin9Dhx3jKktPH/s4TgXHCH96Z46a3vI6p2ZgH91WpzU5x+y3fZGZqEkER+B5vfdOzuOKyc1H5XkRrjFPs3nOInQ88wktf/TO0lIdTat6qf7S5Q47YjbJfMp3eICqzDSRJgtIKpb3D2mYGPkFrldUIACQ1HNy9F5umJK0mG8/dSvfwENbZLEPQWhAodpaoTM3iEpvlJzhF3KrTXfS5d9cUX7pjL/1DqwjzJURBmM+xu6zJe441/T5Y6AoSRkaGeM9/HOLy4RydvsY4H18dPg9aWTr8hLumuplo5in5KQUvZWtPk5vWNbiyD5KWz3QacP2w8gLRF06K/+pEey9784jzbi+rVVqkA6iB3SMiWnvBtc5xh/KLzpmIJ4ynGMCpwHFGuZ0Q4+XyeIF3zapS/l83ldRFr1w3QfdjiO4n+6i72ye6+Ld4iFe/5uV89/ZdjE1W2H7L12k16ijPww8C1q/Mcd1LrmTHISGyHhah0UzZtWMvK0c6Oe+SS5iuR5mB7yh1/3AZVCQrBhrFESjVrgPQjgqUNqkrBUoQR9tfsGgwZMFrUJmcpjI9g0kNyzasZWjlCuYiDOMoc7lZBVopFJpauYIgmChBtCWKI+576FH6B5cT5AuIgEYRFEJQwsOHHEMdMNylmUl8sEJvT4Hf/FaZG1fn6M9VkSUkNxEYKTYYzEdMtXI8VO6i5FsKXsJIMeKalXWuGIDZyONV6yNGPK1/dUvsbe21vH6tpYRme1V1O3imwDWi1GuDMPxZrd13RcuoTc1Rzzxi0A//80niFnwSMoDH3vHn2ukwxAu8G3WQ+8zb16S979i6/7g7/6mAAH/zQIlzXnQ9XX2D3HnfXm77zreI6w36l/fQ0TNAq9HkF29+PpWWz1SSz3ZXJ8zMVnnwrvu4/sYXsHuyCsrLRPPDQm4X/eoc9VqVifEJavU6QRAQhMG8+X8hHmiRj0CEVrPJ+NgYpVJHliwEmSPRWQ7t3kMcxfQvG2Jk/bos6LfNROJWhLNZdKCzFmcslakpxEGtVSFxhp0PP0hP3zBBvoBSgrgsOCnMhSAKqxUPjcYM9Wiq1YQ1vR5bV5QYna1xcLTOFcsbxx9fcXQECcuLDaajHAfrBUq+IVCGgXyLiwcrdAaWbT0tesKEDt8wXGhw5UiFnOkIdjfCwllF6TkQC9pTPaLlZk97fWi5ww/zdRPHLL32jliTTwLih8PPn/rpgEBYyKM9X4nw3r7A+5c/2hzpN20+hKfsY3//JKOaeNw61uLiS87nwZ3jbL/1dmqVabaet5GLL72UOI7ZsraHlSvXMl6xxCYjPlGK6bFRLr/sHMQLcUqjnCxEw9Iu5gHYNGV6coLRAwcQB8tHRhhZsYJiscRCJMBc9F/bfOAsjuygsCCfp6u3t038Mq9iJI0mjVqd7v5eRjZswCy6hxUodHbghQHS9smhLFpnpcSsTdnz8MN0dPUTFoqZFNI+rgwFCo0iC95puJByJeacYUWnn9KhU9541Sb+aXfCdw52PO6xXlaosbl7Fk8On/cOv0l/rs5Avs5woULJj/CV5W3bRvnPqyb5q2dV+IvzE7qz99cp/JLnBz8WcS/DGTm+cW6xx+XM5wI/VQwgyBfIlQoa5NfEU6/SQfDed28y3k3rx05319pwfGbPIKue/Sw6Onr41td/wOienTz90vO56JlPZ3ximtr0DDdefxXT01UiArQCi6IVJex+ZAfbzjuPPRMVlHg06nWyvVfNi/OpSRkbG6NY6mD5ylUUu7oy/d25w5Zm5vLL/k3PzHDw0CjGZBH6ViBfLIKottNA0MDEoTEKpSLL169vuwvbb9W2P1ocXhigPQ9rDFGthjUJ1VaVg3v30tHRSbHYPR+WDBnz0qJRek4lESBluCeHSJZpqBBWdjr+x03n8ft3aiKjcE+AuDy1tPh+ZE0GTxn6c3WWFaq8dN0E37hqnFcNOX5pNbxhuVvmlHw619H5WS8XrsoVSsd54plP+HN4kjGAJQa2zWj9XIjSrMbxpw73LS/w/8f5RQmHC4Z6Eh4zDfdUwjrNZDPmaRddxFe//h3u2n47L3rxlWy74Hwmq0327t7HuuV51qwYoNxMsVZjjEUszIxP8uzLLqFlFeLlwAqFYmmBaNolwIIwYGTlSvKF4vznR6ujC1KAAD19fSwfWY7W6rCogLmSXxlNWpqtBmu2bMFp1S4OwmHBcUpAnEVsyuzEOOP7x5gtVymXJ9Hap9jVnVUhkyxpyIlDrCLwA5wotErxRfAFEguiBafBiQVruXxzD/2ruvjEIx3goJ4WT+p89eVa/MFF+3nxqirdIbygTymn5cVaq1sRsz5fevzSyJmKJ1Eo8DG4qgM8K0qpl4tILU2S93hB+Dfrc/qCV681FL2UruD4euOpQj3N87k9CRu338ud2+/mnW97BakXsrfcYnxshul9+3nzu24iTh1T1ZTpmYhiRweeEnY9+CA33Hg9+2froH3UXK0/YHFYr7UWY1ybmLNdWUSOCBHIdvq5nN7Mi9hmE25uZ5T5nw4BrVh39tmgsqDixmyFpNHEGUsSx7RaLZqNBlGzRa1aw6YJUatFZXaGqNakt38IpTSCYi5dOEtMsu1KxOC5PFo3eMMlAZv6WmAsoLHiUA5CF/Gzz13PG/7qDq5ZmWN54cTjMB4vlDi2dM+yuXuWHeVuzt1f4P0PMRRgv0cav0T7/q0mSVhYn0eqB7LEZ2cOngRGwOPrUsVihydKvw/hK9a6HyrP+01R6p0vW446vy/l4oGlg31OB6Yjnz99MMDZiPf+xi+QOsPdB1oksWLXfQ/R35Hwkhdfxc59Uzyyv0F3ZxeeDti9cydPu2AbLRSRaxf6RMjq/S9Y6eegtG4X4mqPW9ufnSUCtT+Xxcbq9v9pyszYKI1qlbjZolAotguLOlCqfcZAFli8f+dODu09wOToGJNjE8xOzVKfrdCs1iFNqdfqNGo1auVZOjp7yOUob4Q2AAAgAElEQVTzIHMCZzuNGCgUC4SFHBrBczGvv9BwzkADbWIiF6JU+zviUE7o6/DQ2ufRXQ2euezEIjBPBEImEVw8UOOFw4rbxvzSRMJrlOLTiJt2dk7OevKI//CkYQBHQ/k5dCC9SuQFxtqPel4wpnzvBkT9hfZ9r5r43Lxhis7gBHy4JwGp9fjcroC9xUHe995fJE6afOfecRLdRWO2ys57bufmN9zE+FSZBw6lhPkCxRxMT89SKvj0DQ1RbhlEslTduTh/J4s8f+20H2Bex5638rU/mW+/aFznhH7nHM1GC0ShtCZXLDJ3aIhdzGME+gaHWLZ6hJG1KxlZt5KRdcsZWTVMpTLF6IEDlGenSJImohQdXd0Z81iscTpHLgzp6u7KXJJAzk94wRZFSIvpZkCl4SiGuk1W2TsoaxjoLPLer+7nqqGAwfyJpv+eGERgMB9xw+qUAS/vf22clyvkKyIynlVWOp6H4MxjDmc4A1h6wPycj+/pjQ5uFi3/11jjRKt3IvIRzwv8bQXF3z59guWF2inu79JwwCd3dPGx5jL+9A9/nbhV46vf20mke4mbhurEfvJumrO2bGHfVIPuUoHOjjziBRQ6SxQ6e6g1I0R7GQm16Ui5TMTXWEQSxFk8EvLSpCQtCtIgLxEeEaEyeFiUuEx9wGJEL6gRAiKKfGcHuVKJsJAR/5wRkEVkOKdaOHEYyQqNekqx68EHefTBR5mZnibwfeZ2xbBQyCoBtaUWgFwupHfO0+AEpyC2mpnpFrkwZO9YjU0jxawKMguBy4IQAOJ73PZwneetaLWLoJ5ahNpwXl+TS3rzxV5NcEeFLzpj27bJM4/Qj4Uz2Aaw9CCGoQ+oV1vnnLXm96xzyvODT4mol2qlWRPAhy+cYsVj5OGfSnxxTwefsqv4kz/6ZbAt7nlonJotZdF41nBw/y5ee91VdHYVWVssMV2NSZRHbD2cVVlqvecRSEqeJv15Q4cfUVAtCmLQKiHU8I0fT3DVOf14oYfWIZHnsX+0RW+QkBpFZ283+UBjxSdF00jyRDYlcppq7JipJ0zVoWk9rPJJnWQuSCcYLDJ/5kD7iHHmzQjse2Qnux/czezUDLkwj+f5eL4jjhKa9SZelzevToRhQE9vb9s2kR0ykopClGX7VIFAKrz0ab1ol8VsLJJfcDi0Ulx93hDvvuMgd06WuKC/gZbjBeqcHHjKcvFARTr90s2x80of2+e9Jm617PHV/mPZCk4PzlAGcCTxZ38XiwVSa6521o5Z477uRG0KwvAvQK7WWlEQ4Zc3NVhdOn713VOJf3l0kE9GQ7z//e+iEKbc+uNdPDoWEeQ7IY5o1ip4aYOhkXWMz9SYbhisFyJpFpnn6YjlfpWVpRZdXpNckNXwa7UsszXDRNNSb6W0oog9+8b5nvZIJcS6GrP1JonxCWxMIxGe/9x+Op0il/cJw5DOkgULyrVQpGjJdPMkbVCLEuqJohYJrdRnupljopZSTiAyCiMeRjkCEaZGD7HjgYeYnp6ZzxfIbIxZ2nUUNQlbOYLQI5/P090W+zNyVjgB5QzOCgrDhRsLhDppJyS5eeKn/b/vW1b4ws9fvYE/+toj/MtVDn2aNt2SH/G0/phaOvjK704FxT3I9XGzZQ8z/h3GEM4Mwp/DGZgNuPRMal/jecENStS9UdJ6xPfD1dr3v+5w67XnESUpf3FuxItWz+Apc5SP91SjafLcPRXy67u7+MCf/hadBceje8e5f+csU808jWZMkir2PHQ/55+9jNVrNzBVaTIXdeNpoeQ3Gcm3iFt1ynWf2ZbHRDlhoppSi212fl+qSBGstYzuuJvhVVsx5MClzI7voKtvEJNajHNYk530a11mK+jULXpKASsGO+jvzZMPsmSnfCiEgU/ga0JfkfM1+dAjVyiiVI5W4pierrC3qtk5WueHt95LeXaW2dlZwiDf1hayugH5fA6TJtQqsywfWUFPT39WN/AwCM4KlhSbxlw20uJl5/gozEJIbZsZZIWGUnCKhg14x0e288trDdetnTnVUzyPcpxnR6XEVEvz7ju9z482WtfZuF240R3JBBwcX0RYhJO/hs8wCeCIUMr2+3u5UHJ+cEnqzPYkSvf6fu6lOvD/EpEhX2uaUYv3brSMlATjBP8M4LLbJ4u85S7HR/7y1+jptIwdLFOpe+w8WGVwuES1bjCJZXJsHwPPuQCLAxOhlKbVjCHM8+hoxI9bUI57sThMkmJig0nbB36YGGssNklJ4iZJq8LEod04Y6lXx8gHBaaNRZxtRwvOxQU4UB4JmtlGxM7xJqIcSjSeJ5nXJKsUjrUmK/ZhE8QpRDyMBaU8rDJ42pFECdVqFT1XCQghl8sT5kME8D1Nva4yV2GrSaFYyNyOIsRRhOf7OIS4GaF92H4wx2UbLcvy7T63meKCW9KinJBXKa+9eiNf+uYD/MxqwVOnZ967gia9QcBMlOOVq9SL/2pX+KHI8Ss2SdsdX8QEeIxAwlOMM4wBtLHIMBXmc6I97wOI/nDSau31c7lf8bzgA92ek4rLFtVb12jKqUeg6j+xjL3/CnZWu/i52wz/+89/k+UDPlOT0xyciHh4X5NiqYtWK0GUotGcRUnKTKWGqrVIraGZGpTnU27WmZltUq44UuWAmKRRJmnVSKMmNmlRqZWpVyqAQVRAEHrUp0cRyY7tbjQb0GwiOqtrACBtF6LvCc5zJBZQ4HkeJjUY6wCVHTEuei5tAOdUO9gnQYnCSIzF0Uwj4riFNeD7HiJCodSxUBkIQDQdHV1MT41TKnbiCg7Vjk50LqsjGEUtnHJ4uTxp6rhtj+XFW0HMnDQ9Z3fI3IFZ9WHH01Z38/eJ5q6pIhcOnD6j79rOMg2jOL/X8XMm966/2xNGsXW/bq1h6R3/zIgPODMZQHtcwnxB+b73Z56nP9JoRdrzg7v8MDj3DcMpL1hR46MP+py/NuDhiuKXts6wqnT6DX/luJtPP5LwO7/xVrZu7KNeqTA2bolsnrt37GTlimFsYvF9Ta06zYZN65icmmZoZA31SpU4cZh6g8rUDDMzVXbteBg/zNNqVDE2nneZeZ6PUj7FUjeFYpEwVyTnBxgR/MAnO4twLkowqwysJcvQw1qmJ/ZTrcyQLxWI44S4FWUFSDwPZy3NVh0s2eEfOJwzILZ9TBiZSN5OFBLRbWZhKXX2ZGnFsOCnxBGEAcYZkiQmTVOCIIC2QS9NU7RSeKGPApxW/GBPwqXrPfqDrEipE0UjcYQqJlU5PAziHJ1eyk2Xb+Affvgw5/crtJy+fI/NXRU8KfD5fQFBGLxHKXVfo3zon1ElzhSCPxJnGANYEJf8wFN+oP5MK/2RWrN1dRDmfvnNI+m6K5c3mGwpXn9LyOWDPmMtj/ecO85Arn6a+w6p8/jmAUd6+Qu57JlraTZq7DtYZ2zSUk5jRlasIE0NvnKIS5k8uJ/Bzevxg5B6NWZmqsr46BiPPrwDD0uz3gJlSBNLd1cPuWKeoFAgVyiQLxRx1tLX34cVQSkPLYLTWUVeLZKl5IpqHxnmQPRcOBCDyzoRT5Mr5HHWsnvnLpaPjJAkEa1mk1JHZyZsW5sV+0wNaZqVAc92NYcxjiRK0b5HtVrm0L6DONfeseeDk9ycB59isZPpqQk6urux1hJHEb7voz2NsRZrmHfpRUrzwGjKZWsM2gqJH3JoskZ3qJmNUtb2elnVJnFcvK6Tj/wn7Cjn2dx9etaBcQpPGTZ3V3nbFscXv9uD0uqfwo4Bkqj+zzZdFANxFC9YCMk61UziDGAAi41+2YLp6OxAlHo9Sj4RJ+l5YZj/368eSrlimSO1jt+7S/Pb5zpyOubSofIZQfwAt0328zHTz+/f8ByiVsIDD5eZqQmxsVRbFgUYl8XMtxoNpiam2ekJm7edyze/8EWazRbWWmya0jnUx+DKZeRzRZSnGRgazg72CH1yYYDvhViVhQMrlZ0LiFYESmOMIcy1j/KStgvNzR3FkS2yXnraan6mpvYtW0ZqTaYiCFk671xVX8lOJZ4v+OEcSZKgtZcdMipCZWaGsdEJrLVoaB/rt3hBK4Igx/jMQUwaZUzKW1h+WitE2i5P5xDRfH9Hi0tWh+RUgm9abOgPmG0K67t8XBzhJLMFDBcV157fzyd3TPO7F52etbBY8tjc3eTvLgx4w+15/CD4f8Sxs5U2vrcQmemyje4wmj89bozTzACWjpoy1j4Pa2eceNu05//ji3sM160x7Kspfv/ekFet0fTnWvQEhsH86Rf7AR4sD/BvO8r84u+8k1KhwF33HeRHd+1j05YteJ6BWg1fK0QMjVqZu+64A89TPPDwHvYcbKAcdPf10dtXpFQq0NXbR1DoQOsAK9A32E8uCNpit8788kh2hqa4LDZIskh7aVvMF50AktnRHPN5AWo+USjLuEstwOJy3tJ21c21zXZbrRXOOjznUJ43b8wrdXRgbDtWwDFfbXgxfD9Ea0V5dprBoZUL0sJiwpjrsQiTSY6Dsy3WdoNy2XkDvfkUm7TfgyxXQFzKleeM8PMfneEXtpYo+VDyT589wFOGK0Zm+a2Kxx884vq07/1LkM8/N2lGO9zC4IBYDkurPB19PW1PBg4rm9IelFxOYY3ZqcPCRUrUP7xqMOYd26pMtHy+fiDP2zcpVhZjuoOUCwcmT1/XF8EhfG63YeXLXsm6NYOMjdXYvbdOZHz27TlA/0B/FsuOZXzfPu67994sb9965MIuVox0c8XFGxlZsYo95YRC9zCRywi1Vavh53y8MCCFhdxbx/xx3apN6I52qK+Acln4bsYuyLQrm6KcIVcIaDZaBEFIM7Yo5beZiWQRfu0H2HZhVHFZZqBC5g/s1Z4/v3E559Bedh5hUm9iTYr2/Pl4/zkopfB8n5npCv39FtEKY7NzDw7zkrV/iPK4Y3/A2t4UawEyb4YSwWAAn3a1BFb35dk2GHDbuOXFa6ZP5nQ/LlireMaQ4eIDmu0Nt9LzvW9ZY842iZl1bi5kWBb2wNPEA86AUGBZtAs4cqUuxPNuFJF/+NmhWP36BdPsqRb44D0Fblpn6QtTuoOYiwenTnO/F/DV/f18vXMdb3jdC0gjw4OPlvH8HOILqVV0d/ewd/c+bv3RD9m3/wCkhvUbVuAHPjli3vOWazl38zpGmz5R2EsyZ7GXLGRWe7pNeK7NABxxs4WS7Ahyp7L02jnZQClBC/SpKiv0FGuCMTblD3BWcZwNhSnSaJxnLZvlivVNnrYsZWUxoei1iGJDrPKImQu/yQjTolAO0iRdJK62k4TmpAQHlZkpquUy0s4lODJCV0QwNqZeb9Dd040fhAthvEe2RUAJB6daXLImIOe1Q4Gdh1MRM7HGWY2vMyu7px3VVLjzkTrXrmqQ2BzeaUwB18oy3gzpCT2mKoYx63VqrS8SxSdMmrqF8GqWsAecwn6eGQwgG4xCZwda61copf/+5mUt9bpNEXtrOT50b463bU3oDhJEDE8fOnOIv57medkPAt733jfR01Vgz94y5UaIpy1a+UxVG9x37/3c8eO7iVsNBno6ecYVl7Jy/ToeuPte+roLXPu8y7nrQMKkyZO6bNdVc5V0YUEXxyHOgbWY1OEseJ7Kavi1SwNpcaz2DvG0wi42+4dY5s/Q6yeYVpNmrc7UTJ07H5zEN00qszU822IgH7OqWGbrsKKQNNh1qEwa5tCiwbbVCWuJ4xgspCZB2kbG+Z3MWarlWSbHJ3FkbsUjaVshOGtoNuqEQY5isWNRg0XS4Bycw4ii5EWs7A/RLmHuiHLPU3hoRGxmM1CQ6CIf+N4Yr19j6A5bJ3fiHwf68zF3TRbY1QzZXU/wA38dznUqrb9skvQwd/cC5MgPTipOowqweOcHPx+A8EpR6uMXh7F67ohjtOnzjw/7vPWslA4/oRwLlw6ffvFuMb59wOPmN7yYVSPDNBuK0ekyojUzlQaP7j3EbbfeThIlFHIBFzzzEtZu2kxThFbiOPeZl3PbN7/BVNNnrBVhdFbiS9yCIX3u9F7XrqKTWpMRooYkajE1GxGEIWHgM6yrXNB1gJGwinGaHZMxD+yr8qN79nNwqka1YYiMwznNJ5WiGAZ0FC3nbhzkOZesYstIzHnLetg9mXDZMzdxz64Z7joATacJU4cOQrCOuBkzM1PGGYNowfcCPJUdK2YNKN1WTySrVgTZju4EfC8EhEq5Qv9QP9IuA3Y08YOzMJJP+dyDFl8MV6x1mcfDOjxS0FkosxPFrmnLTC3lgpFO/nOv4o1bRk/1UjgKzsFL1lSIbQe31nOkaYrv+79knP2h9vWnTLroaPO5YKH5w1ZPjW3g9DGARfOtfIXn+8/zff/jzys11W+c32CyFfIvO3zec16Fchzy3dEcb9164LR1dynsrPby4UMF/tc1l2KNZee+KZoGGuVZvvOd77N3/yheEPCM81byvOc+ndTrZOekoxXHGPEY2bSeiclDJEncFu3N4TX+2tl+0K795xxpnBLHCbVKBUQR5EOW6xoX5A6yvNQgtnDLA1U++91d7JxMII1ZP+hx1dMGWDVUoq87j++BQtFsGHYdmOCh/TP8wV8fZKAr4KrLN7N/PObcDSOcPeyxbe0gX/nxLAcrCmdTjEmoVGbBZtWDrEkxqQVnaTajeb5ujUGpxcsryyH0PA+tFI1GnSSKCcICzsl8pd8FldhyVn+N116c56PfbpJqj8hoQr2onEjbIOHEQxPzwq1FZltDfPE7NV610fsvn93wX4WnLEos5/RaXlVJ+NioYJ1TYRj+r8i6H4rO7UmjdrGaOQPIKbYJnjYGoD2/bbVyBGFufRAEnymYRL1jWxPrFB99OOCd26r4yvGdQz5v2jLOfTODbOsZP11dPgwtk+Ozuxyv+bmXktcp5UrAw3vKPLBjL/fdu4OoVWfd8h5uuPpszt22noN1j/v3R9Ssh/YCfKVQBjas3Uy90cDXinSO+udS7KRtgCNzy5GmVGdmmZ2Zpaevk87uIlvdGOcW96NVyj374R+/soO9Ew18Um56zhDPu2Q1qwZzdBU0xZyfBRCJxllHEifUqwM0my2m6ppv33OQz3z7/ky/Vl/j9Tc9l05meMnFvXxx+wQHqgGiNf3DQ5hWTJImtKIWNrW4NMsz8D0Pay2H58a7efVFBAq5kFq9Sb3WwA/y86pCkiQEvje//x2a1Tyya5orN3h88YFZnr1uBaSHe30yb0fKSLfQqKdsXl7i/9RhT7XI5u7Hd0DryURXEFFLOlnbqbjRWP6/sZQwFwwGYfj5VqPxAhF9UCmctaadPg0Lu8DJ5wanhwFkMz4MTEmgB/1c+DUxpvSRi2r05hz/575Ofm5jjb5cwice6eJNWyb45sEBrllxphT3hH01jy/JIB86dwPaxNiW4+//6T9wfgelnHDdFZt4/qVn0dE3wPZ9EburllRyeKodyto+hqunp5fpmSqFQgfNNDO5zanE7XB8BEOr2uDQgTHyBc361X14uQIbzSgXl3Yz03B89q5ZPvejAzjjuHhDjp+/7iy2rCzQ29tNR0cHWi1U+5s7Jkyco3dgAJvCSL3GqkHN1Rev4v/9xg7+c/tuGs0vc/Orr6UnsFzztGV87vYxpuoeDodXzJGzIYVSPpNe45SHjUV5ChMlGNvO2xeXuQdxiBZKAj3Lurj7kSrVSpmunh6cA610VkOgvb8rcTRsSCQpSaLZV06oNWN6fZl/izabbDtGBCUJy/I+/XmPnRXYfJrz3MabJQbzNS5fPsP+R/p59jKYiBTfraQEgX+Ozue/QLP1bufcvaLlEKiMcZ5CCeAUGQEX6XhtvV9E15RGFUsd/2Cce8Yfb6nx9KGIrx/o4umDTc7tq/Dhe/t59YYqPxzv5OoVE/jHqO56qmGd4sP35Ln+F97A6uEikiZ09/Xz7R9tp6MQ8os3XcLzLz2LhnTyzUdbTMQ5HArl5sTc9uJ1FquFxuwUfX19VJPDZ34u7Hdi3yGqlTKDywcY6O/BKp+B6gGuHHiUqQZ8+IsH+Pb9M2AMr7l6GW+/aRNnbxpg2dAA+XyAqDnDQjs3pe2SFMn+aWXxQ0Wps5+OwHHucJGh3jxf+uF+du4f55zN6ynkDIO9Hew42GjH5GfsKTMGCs1ajUMHDmGN+f/Ze+84Sc7y3vf7vm+FzjM9YSft7GyOWq1WOae1BAgQwmQbkw4YAzb29b3X9vHHOFzs42sfjs/BB66PjXHCYGO4gMkCAUIJxVXanMPMzk7qmc7dVfW+7/mjumdmVyuhrJXws5/Zqenuqq7uqveJv+f3tEIa4iYfG+MHHCWREjK6ybrhBLuPzaAjQ2dP73wqSLQ3rMWIeFE/OuXy2JSPdDw6EyHDna3vcVECvX0+AkEUwgPH6hybjLh5pPaCD3l5Kkm7MVtRMfDxJOyZ88i4kkMVQAg+NGL7d9TULYHWl1vLLoE6IZRUwk1ba14cJqsXiRV44eZzHE86jiucuL30N6zllps76ty0rMLD01lcqdncVeYvHuvn/evneHAqzXWDhbNm8QM8OJVmd88KNq0fRlhJQJq/+vuvkJWW3/lP13LeOcs5MKv40TFNmWQcq9q4Kw9r0VpjIg0CIgQykUYoL87ws+D+Yy0zU9O4iRS9I0P4mSQzpTLB+FGuGzxCKTT8xbfGeORYCWsCPvSm1fziq1azbmSIXDqLaf2bl0Um084X8WNrKoVAqQa57gx9K/vYtjnN//mGEfbvG+Xz//4jqtWAnpRmXb+HER4Ci0uc2Y+CiNHR4/H1dV1oJfyiKK4WOMpFSIkrBImEJBtFCOUSRg2a9SZCSLQxtBmIrIirC0bE8xCkMghHcPveiKpJtBa/BNG6gYVEYbBWEUqLddN8c0ZQaPov5m3xpNLl15FoOjxD2jFIx6GpDQ0NvzwisgMp/xIl5WeE5PVY1qIbZyyKvBDyAnsAiy1/vC2lkoD1EomLHNf9l1W2Lv/H5SUenO5iqiF53bIZ/mpXL+9dP8veuQRbuutnRUmnLdpKPvGoz+ve+4sM9XVSqsInP/NVlHD41fe+lnxnmgeOReyYURjU/KKPbb5CCIuQcWNOO7PvuC6BhqgdArJQIHF9n1QyRdBsMjs5i6sNrx06Sbff4K9uneAn+4tYG/GuG0d48zVDrBjqwfMTLavfPpbglGux6M6Ko8w2KEUgZJyoS6fzZEWFdNLl3+/cR29XDyND3Qz25Xl49xgz5TkaM7OMnhjjyN5DzBbmYnSAhDCIk5pCgu958RwAIRBCYUzEq7Z0s+/4LIV6iO8mSWRSMTR40WDS9tmJRecbWMWybIP+LIhFHoi0sdKQSvP4pOGBYw7NWpFrui1LM2fHvdOfDtk+lSHtwIqkpRC4rEiGXD/YZE1GubtKqr9qWAZ2ChgVSjWsMfaFdmFeJA9g4caLokjLhOpxHOdLbr3qfOKSOlONNLVIcPPINF8+1M271s6yq5BiWSak7yzh9WvL8UqC8aVrWb9mmOlZ+KP/+llWD/fzvrddhZdKcvuBBgdmZUynZSwRcSwfQ/TicdrzLi/xBdDCodlKWLcj3PZylRZmykWstfT0D7Ax32R5ts4d+xv8cGcFrSMuXZPirdcOsmywCz/ht1x7y5nKa4vAtqf8Pc8XYAVWaryUoH94kBvP7+HcAZcv/P/fozDXxFeG9b2Gg4/sZN/eg5w4Pk61VqPd9GOJlZaA+aSWaKH3LBotfEqNOkt7HIR0mC0WMDp2341ZPP1XPAEgY4Vk+1Ew0gEpMMJrvdLiYGjqBP++vQwKEqkkOwunK5SXTgSWd6yZYaJuOScfkncMF/VqHpl2uaS3xi1DEuF6V/iJ5J9KKf9ISvnqhZ1b8dELoAteQAVw+tm2kH7pJAkv+Yl6oz7y+5sjDB6PFpLcMDTFd4/nuWFpibFqAgOMZM8eai+IZ9D/8z6P97/rFpRw+ItPf4ENq1fy2hsvxJGSR49XOFJN0YznWKCtRRgQLXyuRcyz4Sy+t0U7K2AX/m6vXUcqOro66MilyXiwwp1gphTymW8fJdQaEwa853Wr6O9KkUwmABtb/0Xf/6LAAtpudmt7AcgjsEgsDtZKjNCk8xm6e3ze/5rNFItFvvXD+9m99xArh/rxbUTDhK0YPz5n2frteS5IQRQF8RfR9i6Ei5aKHaMRl2waQgqHRtAgaAZIKdD6tDDvFOsXe0uPT8FMw8EYwUwlQpi2DxNRbDSYbfggIJXK8fWj0NAuZ4skVMhHzpnhnw64nJMzuBJeNVzjcNnn/K6AP1gbIRzVJ13nw1KJ33Y8d0GDtW+Y51kJvPAewCIj5CeSeK73xigM3/GWJZrN3XCk4nFeV5WPP9zHSFZjETQizXWDZwfOf7Ecq6S40x9kxfJl3Pajh9l7rM4NV2+h3IwISSGFIawXMVbTBEIhW4tezENrpRVPWHwLC/JUtRBHDQI3BuKhgio9iSI/3FehFDoY3eQt1/awbihLT3cXAotUBoQ91Xi2D32qJjjlNfHDMUdfrJAEVgT09PUz3ONy47lLuPV7dzLYP8Bwf45rt13IhVdeweYt57XIPtvZe4Hv+zEcWTk0g+a8chNC4EqffUWPTFLhWHCEpFaJvbyYJKT93Sw6wXaqH4FyfXZNBKSSiqFMzF7kKEnFdPDohMJLebiex1DWZWfd8s2jHQvf51kgKSfk05fP4ImIXbMOUw2XawemuXZwlrevKnBeirgUKsXVUqk/SSSTrT1fmKTAC6sAxKmbjuucY7BfajQC96PnNqhFiusHZ/jsvhRvXVFjWabBN45kuWhJ+cWshDwtMVbw5YMer3vVxVTrZX5wx14aWlGPBMdOlpmpBHTlckwcO4ytVqhPHCGhYxyDpA3kiQdr2CeJ6xYm5i0WizIQCRela9Slw1fuPEmkQ6KwyTXn9tDbmUM5IGWrcGhPO86ZvszTlMCCOmqFKTb2CqQD+R6P11y8gkajyeFj49igwjlrlt5ZWlQAACAASURBVNLR2UX3YD9bzz9//jPF7cng+jFmIIw0rQZBhA74+fWWt21NMD1j2TSUARyKc3NYG7MEtbkG2tWDNiYiCJpx1UTA3QcMNe1ipKRkUvzggOBPflDjuwcEyk2TcjTv29bH//ve8/n9xzVfPtRNJUxj7NkxCa870eAXV5fJ+4bjFQclDUknIOM2+R8XFtiYVvQkfaRUv2XhYuBUb+h51AMvUBLw9HhFIB0n6Sf9H1aqtd5btzUohSlW5Gp8bzTLTcMNtFXcNpbiPeumnnSY40spRyspPn5yCR9495v4yYO7eHR3GeW5uDLkovPPYWyiQGFmir7uDtJRlTdsSrF1MElfytCdNJigScMIjGgN8qTdm3+m1Bwtr1liwgjrSCySPEWKhZPc/tgcQRjSoZp85I2rWTrYh3LbKDJ5qhqxT9h4UhGnbLTzARbPSRDVa3z77kP46Rznn7sGz/fZc7yCcBSdnZ2UirPU6w3QEARhTCUeGawQGGtwXQ+UYmo2QOsIbQVeQnNwokYUGrq6OnBdD2st2sQVEqMNzUYDx/XAWhzHASlphgLlaLaPSf75wQr7Zj0C6SKEz2CqxnsuS9OYK7J1dY71y3v5g28f5TVLoTd5dgyJAejwAxzhsa6zRjFIzA+wSbshv7SiwHU9kgPFpBht2gsjHf3NwuV7fr2AF0YBnB67mTSZzsTfNhqNbb+91nDdUETG1ewopBhIaZIO7J9T3LK8QClMkHFf3GkvT0f+7VCOpdfcxDnnbOYfPvcNKqHEujn27NrBJReuY3KuwKqVa4jqJcaPH2HNsjwukmTaZ2mXx+o+n/6MolINqRqJaTf4nJYUnLfFbUYdpeJOPCHpZZZ9R06y62ARE0W88cperljfTe+SLtpjwk5N/D0ztzE+j8X7xMdS0qE0N8feiTqjMwHbrrmQZDLNo0cK4LggDN29vXGv/2wJqeIZAFEUIZVD2Ix5BIVSVPGYrCtqoSHhpjl8YgZjwfd9EolkKw9gkUIipcT1PIDWiDCBNTHD0cEpyWhRIJSPFgrPBtywUvOGcyQ9XsBAVxKhA/JJGC2FHBmLuH7o7JgR2ZaeRIO0E8Zeolj4AUF3osHSlMfXT3oDCDWjw/D+U5T486QHnmefSHB62cJPOKTz6v1RGL37xrzmphHwVYSxlqwbMZwJeGTG58bhWR6Y6qb/LCH4WCwC2DWryXTm+eo37yRhA976uvORVhJGKW794YP09gzx+X/9BrPFkIHhZXzrvqN85E//hTd9+L/z9o/+N772vbtxTInXbUmzoaOJamEArG7SovOYj8Npk2W2ewEsGDTK93nosTFCQBtNf0aSdPwFAM2pKuRZiW1j0ucfIC7n+R5DXUmOj47RCEJs1CSXjGG/xhiU6zCyaiUXXHohruvEo8UyyRgo5DgEQZNysYJuBgShZrwKh2ab8cgwJSgUZjHaoKTCaTEN0U6Ozp9LXEmxNoy/s9a+a3JVPnix4oZVmoxsItEYU0dHTWxoSUrYfnb1kAHElRphSTnBGbkML+ot8IfrNcpx/g83tRjT8Fyu8KnyPHoA4pRfbUlnOwYt9rZarSH/4mLN8lwTR2run8xx1cAMd4x3cWV/iaOVDGs7qiScl57V93QRwK1jWf7xB48wPnaC//zrb+LgsVl2HSohRMTB/Xvo7+2kMNvgW9+9i/sfeJxde0cplSvQbGCCgO07jvC1797Hkr5urt26ChM0mKo7sY0WDu2J9+2ftgJoUfJipCWaK3HvA4+jNaBDrt+QYMvaITKdqQW3fT4AeGLa+KfdMvN7CxY6klrHbVYbHBqrc9fjJ3jTzdeipORkWTNTi2KFJeLlmkolQSoS6STpVAqEIIpCjNYo16FaqSMMuI5HEEGz0SSKDFEUkMlmYzf/FG9m4TTacw0FEqzCo8nNa+GmDQm6/QhMhCBEOgJj47CpQYr9c5bJsVl+cdXZ5QH8NJHCsrajwY9HU/lprephGNwdP9PyDp8HeZ56Ac58a/npFEbY79frded3N8KKXDyq+8fj/WwbmmK2mWZrdw1tBXkvIO+fHdx+p4sF3r8u4KvTKd58y6U0dJ2D46WYisvx0MbhK1/9HgZJqAWOgbBR5TfeNMRla7tZms9QqlbZM9Hgb//9m0xPFnjnW3+OSljhYDmJiCJ03Psbf5PWUJqbJZPriPMAwqKMJpPrBGLWHmMtUsXuMIuy8Itl4TZp/f9kGmBxnqCdgF/UliiQKEfiOgKBwpgQSOJIB8eJuQtoJehKlSo4ikxnJwJLd18f1hgq5SKFiUmmCzPUm3EjUEciQyadpl4PsDaO9/1EAjV/vu0kYJvUNEYeuhhWdARsWqo4rzvCQSCkQPtJDpw05NMePcmIiZpPVYCbUnx0Q/OsSyw/HWlqh3ev0vzWTveD+Xz3n88WZpgP7eKb5TnpguchBDjDXWXBy2RwXeeDURhuvDIH71xbI+FE7Ch0c35PkdAqOv0ajjTsL6YYPgsovZ9KhtN1msDVl20klchy+ZY1COJQJpHKUaxViSKDIxU20nz8XSt58+WDnLdphN4VQ6zcuIobLljBf3vfBUwd2cVXv/1jLl+bIqfq2FbM3B6fXSmV2L93X9xvL2OrrCwxNNYKhAhBWqqBanXCtEEz82Ba4In3xRmnpC/SChYR4+rnkdsx36DFYk1EuVbHS3jxUBJjCE1rJJeIS3wSSRhGOK1BoKIF6ZVK0tGZZ+X69axZs5aUnyXjJqnXqgTGECsvQa1aw+gAa+L9hDA4VoGQOFh8XeaigTq/fHGT919qWZ+P8HIZZBLGQ8XnflLl8/eUGC0Lvr+rTrmuGelw2bX7BEszZ0cZ8JlKh9fg54aKbEralY2g8Wvxo8/fZ3l+uwHnc0cCZcWAgU836k0+cIHiSCXLQLJBX7JJQgWtG03w0HSGbUNTz+tpvDBiWLEkRUdSEgmXkYEQoyMEBiMlfrYHXa8jbMBbLklw5YY+hlePID2JEBZrXWxHmrW5Dn5NSv70iz9h1bIlbNuwhq/viIiEQpiYcstxHPKdecqlObpTfRhiPv7JmQJGO7g2REvJVM0hCJutMCK2909M+y2gDoB5MtrTn18s82kcC6LFOxg0A07O1ujt7cARAiMUpXpAzEe2oHJyuSzWWBr1Jm2Pol0itEDnkiVsTKc4uGsPQkqazQDHdwkbhrmZCSCkt38ESzz+S9qIXqfJZSsVW4ZS9CctWS+iocH3U0xUQ+47GPLdx+fwkx6DvSmmTlS5dE2WVDLkZMkyd7jI8o0vL/d/sXT6DX5hhWX3LvXrbq7jU6VS6dSL9hwigufBA1iELGmdjfAU0lN/36w31OsHE/Qm4Z4Jn1tHc1Qil0IzRWgd9sx1cP3gFN5LyN329EVyYHSOck3gSxfXAUcZIOak8/xMHMXrOtvOHSDf24VyY4Qa1iCFRhHipV1WLuvjo7ds5jN/9xVSSnNOX8zhZ7GU5uaolMsMDA+R6egEE1tizzEc2X+MCMmm5d24SvHDB48TRAYbtVfgk+ELFm08hfEQ8x5ELLbVmqx1RLVhODpVZ2SgF8+PpwuX6uEisE7srgshcNpswcTNPEIsZDgsgkQ6w7pzNpPO5fATyZgb0EasW5ohKM1Sq84ShAYdRUiaXLkhxfnLPO7eWeDQhOFkw+eRk/CFB+t8/BtTfGdvA5VIsTytedOGDD+3XpFwIiZrWf75tj28fa0k5bwc7rEnl0435EMjelW92XjbKQipJ43rnp48Pwpg0R3myAgvmXyvDqNXpRyHX9kQEWrBuo6QgVRIKVAoYdkzl2FlroL/ErO2PF3JeQHvHjDc+9BhkhmPlO/TYvrHWoESDljNyg7YsLaf7v4sCx39MJ++Upp0d5KVSzt5x5UjfOnrP2LrihwpahSLJcaPj5Lr6cVLZ3A9F2EgNAaiJo8/fgQhNectT5FxLAcKmmNTTSrFufnqwRNMwRlABj/1lmmHE60EYNBoMFtz2X20yUVb12OxTM3WsGIxzDZu+MFCo9mE+QYgsWhbtnguBG4ywZoNG+no6iSVTKMcxerBbjYs62FqcgITRUSRpRR4fOmhiK9st0TJAR4tpfjtr5X5/+6ocffhOtZN4fsOVw8FvOfyDvqSAbgZDswq/uRLD+OfnOatq1++1r8tl/VV0FbguO57kvMVAfGcrD88JwWwKGdtF7a1k0ZaPtkIQj5xXpzJ3DXn8uiM4rzuGqtyFe482cGSREDKOfvq/U8lrxuJ+O5td2GkIp9NkFay1afRBs8arjhvKemUj1C2dX1OrakjwEpDd18XV27p4uG77mBuapoLlnk0ahXWnnsujueSaNX/tTQ0K2XuuvVOHBmiTINlGcEvbFtOLu1x375p5qYKCCsW2YVTocBPMBJPrNbGe4lW4m1xYskqCtOzPHhgkoSXYP3qfoRyGJuttvyFhXeNoojJycl4khBxLsFYO495AFgMUxKuYvmaVWQ7M0gnhTbQ351HGkG1UiE0EBLRDCPuH23y/V0lvrmjRmASRFKiUSzvdXndUImbzk3j0CAUKb7zWIFf/uz9/MqSIp+6YoacW38OV/3skE6/zmuGG3iSGyzy/c9XFeB5xAHElzXhu78XRTr7R5sEpcihEQkGkxFvXF4j5UQ4UnPzyPhZn/Q7k6zpAH9slNGJOZJJxeY1eWiN3movu96ueJLPYlCOmFeSQMvJlp5Db3eOt1y/nq999y7WLh9iVX9XnEwTAh1FaKORQtDV2cPsXAUdVLjh4n62jiRYO2BJeYJv3X2EmaqkVJgDYxdN8/npIKC2yz+PSbTtjr4FJdColCmU4cs/PsbF5y+lK58kNIojhRjlR4vdKHYEBR2dnTHlWJxAiGnArCUKQ3QULTqjloJ0FcMrV+L6LrvHi5DJsHb1cgpTE1htsFE8OjzSmkA7GG1BRJhIsWEwwSUdJa5c34lAsHfa4Xe/sJ3j23dz/w0Rb1xZQr6EswKfLyk0UwCszlV437CV1jLsuG5y/gXPIQp4lgpgsT+5YNkc31suhPiF1Z4l63ucm2+yv+Tw7eMOY1Wf/cUcvope0gGOz0UG02XessLwwx8/QMJx2bCqOwakiEXLPYpQjrNgGU9pblm05GRIrruTi9cv4d7bf8TM1Diru70WHsAiXQfH8xAIDJqlI4NsvvZa8psuI5nPMtKV5OZL+9k/Y/jxzgIz4wV0aGOW3HnCj7YSOFOl5pROG9oVBGHN/KLVgWFqYpIf75pltKB59XVbcF2HgydrNIyK+QpbsX/7eG5ryjDGUpoucHjfPsJGgON4KHdxznlBPSazWfykS7WpkcluOnt68V1J0KgAhshaIiuBCFeDtB7dboWblhW5akOS8ZrHX/9ojL/855/wnt4af3ppmZFs9XnMlb+0Ml6NXf6kE/L21VW0Uh8TjvOnjnua//8sPvAzVABP4naImNnX9b0PRVG04Tc2wQU9dfJ+yH896LMxL3CkYWvP1ClJppejXNYf8cXv3E+5UWb96j5izoaYwiqWGPvernLEPj/zcXX8ithCK1fS353iuguGeeDh3awfyWOjGFhjWrV1ay3aarZccRWrN6zDpgfY1+gi50u2beojl/D562/s4vCM5cT+Y2jT7jCwp/0sEnvahmUhidf6sdowOTbK4Rn49Jd3c8t1a1m2dAkRCXaNB5jWQJD2xw7DgFq1SrPRICYAhfFjY1Qr9YVXtSIL0QY4IWPPSEoSyRTNSBBoheO7LOkfoFaaxRqNFSHCGiQG15Ws88f5yFWdpHNZ/vWBAh/51F1M7j7O312juWVFCVe+cAbmjpO9fHF87YuqXPpSDXYU8gAsz5b5/EWB2JiSb3RcfyEJ8yxP6BkqgNOsyaLCshByNdb++q+tMLxmWYHeRJPjVZ/PnF+l0zds7Sm+bC3/YhlK17jOq7Lr4ARrVwzQk26l+oRFCEk5BBsZWATvPUXai8AIhNBkOtJcsq6Pb37ndjpyPinPEs/fjOfGxVY5ngGoTIxu2xUMEiZ6GOqSvPc1a6jZJJ/86m6mKprjew4SNAzSaLAxrl4sisEXFFF78be3Y8oyacFElvHRk0yVHP7snx5l48oeXnX5ehKJJDtHG1S0i0W0jhsPE1NODN+dmyvFc/uEJZ3vYHj5CK7vzevBhcW/4HdIGyP/tDZExmKkIpPpoFoqYsIQqyWEEYNekbdsbnLNBX1857FJPviXD/OPtx7lvK2reedaWJatIYV5QY3MsnTA6kT1RTVjPYk6paANyoLrhmb4zXP0Msd1fxUTMP/lPgt5FgpgkbQsnHIdPN97ty/wf2ldnXrk4UnDed1FUo7mir4yaefs6cR6LqKE4e2rAj7/b98nnZDcePlKBBJjFFK5PH5oMubCO1N5ZpEXgBVoYfHSipUDGaaOHKdYnGVp3omvp9EY3Vpe84Y6Lss1yfBQdRjpuFy3qYuLV6d5dDTgL76+h+mq4sTufdSLurXg2u21pjVgxCyK8Rd+CwsYSa3cZPzoGMenLB/7hwdBpvjAzefR3dvFdMPlsfG47CmsaYGEWs68kISRAani20IKBkeGyeQ7acOZ2w7rYn2EtegwpNmIE3VaGwQSP53GWE21XMJDc+25XVyyqYvvbp/gNz67hy8/MIfwFa+/ejnZBKSdF8e4LM8WuSD/4s+n6E0adhYWaI7XdwYklPPr6VzPc2I8eQa9AGeoI7VKPFKpbtf3vvrxDZFKKIe8HzIXeEw1EpzbNUPOe3ll+3+aLElGfPKeJldefT5dOY/v33sEoyS22eTk+DhvumaYnu6OBbTmfMp9Hswe89jJCCkEtWKVnUfnGFm7AeX5jJYWJvICiHlWndZaEoKiSZByA3pUlc1r+zg2Osv9ByvsOzrNisFOVHUO3RB4iSRKSRAGgQYRxRayXeqzEgw0q5rJEwWKpRrbR0M+9ncP0J/v4CM/v4X+ZQPo9CDf21Gjpn0sppX3iD9bG7lfKlaeUImMq35ynuE43kXMP2bCgFJxhtGDxxDC0rtkCV4igTGasePHCBpVsE32HTrBjx6eZrJscV2fK9YkeeON59GTsjy08xhX5JoMZ14ZRuZM0p1ocN9ElnWdcUnTohCh33l/UU6YoPnA/Ff+DEOB56AALAhBMp0Uxpr/IqW6fEtOsb4zJOVqtk+nqWvJqtzZxen3fIiSFqNT7CPB9Vedz4/u2EEpiF3tcqnI1ZvyLF2SjkkxYEEBiPn/AIkQEQJJpVRh99FpskMb6Ozp4MhMbKXbjnLQCHA8d9EkaYERLtNhij4/IuvMcd7aAUJtuHvPHN/fPk5gJD1ZQWNmmnqljg0FNnIxxsPYiCjUNMohpekixYk5SsUyo+WQz956gE997QC3XL6cX9i2liVDg9j0ILftqTHVcOdRx+3P1R5jVqvVaTabGK3RYYgQkqBWBwtewkdKiVBxS7CQMUCoUSmzb8cOCqMnqVWbCKvpH1iGm3CZmpxk8uQkAkkUCQw+jushhSKRyfDazYpSsUYu7XPnY8d5bb9lMH12EIC+UDJZTwCKTj8AAZ2e5F9H/U6t9d/HRCosujhPT56mAhBP/LMFPZWOep0Q8pMIwRuGJOfkq1RDBUJxZd/kS8rL/kLKsozl1743xdtffxXaaB7ZMwkynte3cchjQ79LujMfL+RFCqAdAgurQGoQkmqxxN6jc9SdbpYtG+LAybCFjo/dWsf1FhpjRLuwaGmKBFOhR69jSToV1i7N4eU62Ht4lp3Hi3zzoUnmGpogchDGUC7PUinMUJkpU5qpUarVGC9Wuf9Qhc/dcYL//m/7Wdaf49duXsfVW5bSO7SWijvE13fXmai76BZl1wL2IZYojCjOFVtDLeJciJdMkEqn8VNJpOOglEIqB6XiycFKKVzfJ2qGNGpNms0a9XqJwaVLOX70MAf27SfhJ/ATydYQFYvWEblsB0nfY9VQinsePcL6Fb386/1j/M7GBmn37OskfT6lN6n58Yk0G7tqeNJQChPsK7jD46H8VBgGsWvwDIFBz64XoKVllOd6KPkxG1kSnsd0E3ylOVpJsrGzSFO7JF9mYJ+nK51eyDs7qzy88wiXnreSz//7dir4eKkcn/vuHl59QS+5chMv47TaWEXLaYqvkJGLoFQ2dvkr5RKOcKjUq7iuGy+WtrfVuqhikesuraFo8txZSXBhRrIkWac4c5LXXLKK11y0lPt3nuDBvUfYfvQgRw7NMDjgMzTQSdJTVGsBR07E6LJ1wx1ct2Upb71qOYMdPrneIUR6iF1zLj86VKZuYs4Bg0CJhclFANYYinNztKnPjbUkU2kcz6HN3T+f8muFNbK1r5KSVRvX4ScdypVZSnOae+78MalUB5lsJm4uCgKEhCiKyHXkcRIuQlu+cd9Jrlu3BEyTlHDo8F657n9bUk5AZAXFIEmHV6fTD7hl2OeeWfFRx/N+PwpCFm4UnpYieBYKoLX6zSxCLPmQ0fYc1/NAKq7rL5J0AjZ0lsi4r2x3zJERNw5bfudvv8bnPvl/cdm5/fxgRwmV9Dl80mX7oRK9uUm6M0vj2QAtr0kQJ/+Usa0BGBKjYa7UJNHjEBlLPWji+d5Cjk4YFvfGt/OLcQouoiR87pxbRe3Q/TQzy3nrdcsYcU6wtneQ97xhI5VqhdlSSNNYJioh2YRHxlfkMpKko3ClS6Mc4ueX4GV7OVyWPLA75Hi1iRLtxa9QbfNPa1Eby1yxiNYaoSQJ38dx3fmhoKdRCrTPHglI2VILzQbVcolysYSUDtlcB9KJ81pCxESyURSSymRJJJIIK7FCc80qnyvWZdk+VuQDwxG+Ovto5F4IuayvwY9PpLh5eR1PGmImZ/NO4I+xBKcU6tq/n0IRPAsFIEAKlLOkRyr1FgspqeIO7tmmgyejl0lzz3OX87pLnHfA4fG9B7j28g38ZO+D1EKPbDbPX33jIFtXdJIqlEjm061OX4EVcakNEQ/TNBaq1QZHpwIuOT9PuRbQ3d1NFIVIs0iR24WsQOtICCNirgBtaBrN44cKXPxz1/GDOYf1iSSr/Sr9YUgqkSDt+3iuJF+G3o4UjhIYIpApqiZNUSgmywl2H20yVRcgfRxh0YARII1FS0NQb1ArV8l3dVGv1dCRIZXJ4DhuK8Rp4x/a7T+tbTGfM0YKqJUrTIyOsnfnTgpTEygcOvLdcQlR0mp7FgglSScSMWGoFaA1SdGkP5MglUxw76O7uDF5+pV55crybJlvHV2CtoLQSDKuRTlqRRSGl0tX326iZ1bYe+YKoB3/Cc61xuy3yCuklPzn5c1XbLz/ZCKF5eIlks996Xv83m/+Ml3eA9SjNL4OOTBd5Qt3nOSDN8ISb4hk2kUri0AyDwiyiupsmWIt4v4dBa55Y4bpcgjGIpEgLAaL0IJHHnmYTZs347gxzFgbg9EG6bkYAY1igaWr1mBkgmakeLSSYkc5R8ecodMPyIk6jhIE+GS0ILCaKPQpasN0VVAOBdJGWNx4sWHRcfUupjIXLTyCVKRyObS1NJsB6Ww2rkzQ9gzaPn/8OaUQSNlSA2HEzMw0J04c49jBw1Rmi4T1BtlsDsdz5/MKMVAq/o4dRyGkolUbJQwDtg7BlvV5DIb9E00+cdWZw0zTOog8IxHCy1MscPGSgLvG81w9OMs/H+nFU4YG3Gilfzs8szzI01AAZ1jVwgqpxEeMsX/s+d6ru5Xor2rFkuQr2+0/k7x6uMQd948yPjnJa69bw5fvmaGsGyTTeT77g5MsH0hxk3Xo6l9CuiONdatgXaxwCEMonZzm3p0zvO1Db8H4OU4UArBqIc8K1MtVpBbMnJykb3gwjrXjBOx8DsE0IwZWrADismHMGySYrsNk3QXh4UiJlAqK8RQeBRgRJ+6kjWcCzHOLwHzCb56jEHA8t4V8sqRz2fmivljwVZAIDDFnv8BSnptjdmqG0cPHKc5MUihMYiNDJpMh090dVwjm4TutdzcW13Nbz8WPW90km4Tzlvl0JzWPn6hRagqGzpD9H6tm+PvGCvxEkveox+lNvPwbgtqypafMr9+zhHO7E/zm+iLveCCDVDKpo7bn/TR8/5Y8jSrAEysAjue81lr781jxh66f8N/cjzq/K+CSJZPP9LO87MVTmkroc38twQ3XX8pPHjyI9B3WX3wuJw4f4rb7Rulf0slApoEJFAmvE+k4VCsBheNjHBuv84kvPc4vfeCd7ByrUjUOViiwcbOxFNAoV6mXaszNzTIwNIAVIl4YstWHIMBNpWIG4fZCtBBFGsd1cKRESTm/SK1d3KbctrjxrMLFbpwQcZKvUa/H1lkueC8x8lHM5zXmKwOtzshmtcLUiXH279zDkT37OX7wAMeO7CVo1smms+Q6OnE8DyUV7X6SNhEoxDMFlWrNJxCxysNCp2+56bweUp7g7r1FXu3OcPGSJy7uHXMd5FYPM9iTJTk1Trf/ykkSKmFRuOwrJen04dZRScPYBFr/rTVnWPVP4Zk/YwUgfTcppXiHEOIKpZyc43rqtX2a4zWHy5YUn8XHefnLYDri3V89xjtev43lAxlG+vOkPIk3sIGpEye5+7EJjpdCHF+iIqjMldHNgF3Hynz6G7soJXp44+tv4PGjFbSInbI2EEhYQaNWY2ZymkCH9Pb1IjwHRGtBt6YNyxYCT7acaItAKTXPGNZOxNkWsrBN9dV+LRB7BS0aryiKKBZmKUwXUMrB8/2FcmZL2iPBhIwDm7DRZHr8JAd27+XIvgOcPH6cybHjjB87SrNeJeEn6Mz34Hj+PBAoPmcZFwxaDMKe67S0T/udYrrshCv4ufUeFyzPUDeWT31lO+9eCUPpJy7uDs/wxR2K+okpLs6XSJ2FZLPPRXIefHa3T0SCBIa9FR1Yy+es0S3yg9NyAU+iBH5KCHDqXspzsZYBYKe1nHB9b+lNXYbZQPLOVWch7/KLJHk/5G/PT/B/f+wT/N5vfZDLLt9MqVjlrkcO4/k389D3yfrCQQAAIABJREFUv8PtDxW54+EiYVRmy7IuakGDncc1bjLB295+KcemKoStacJCyEVOnCWVyzCwcohcZyfSdbAmLsUZFecDbMsTMDpCSRda2Dxs+3d8pDidr2lWa3iZXFydgHlgV7PRxHouWmtKpRIJP0F/ZwdKOVgMxsSKydg4tscYMDBXKDA+OsbE+ElMGFGvlpmdniZs1PA8n858njAIiLSh2ajH2XzHAeLWZ9HyUOQiWrP4vCTCGrQJkFhG8pLrNvZjTcCxmYA1juX83jPPj8y5DX5v1VE8Fb4ielBOl75kg4yb41snJHNagIj6QGxWrvNDHcbw76cjP8UDOE3jK6mklDeDuMpPpjYt9Z2uj22u0OMbNnf97CoAgBU5zd4xxce/cAe1RpmLz93AhuEs2mh0dphaaJmdmAY/xfiMZLbpkcikWL92mBtefR2HJsvUtRvb4/ZQEAAswlEkMxkEUCqWmJqYREeGZCYNECPrII7vF0XSi6+eEECkObxnNyePH2fJwFDriQVclzUGpES5DqlMBjfhIyQtVGKrfm80zVodZQRzkzPs37WbAzv3cnJsjLBRZfzYUSrFWTzHJZHOxEYDCJtNcp0deMkEWkfx0BDZDmVAybiSZKyNOyyJaf+1DgmbNbIZn3dd0k1fR3yutz58gsu9OTZ3P7lr70r9ikoALhZtJSeqab50AhrKQWvtWGv3Ye2d7anMT0eeWRVAiJzFFqV0CkI5q7Z1a/qTTc7tOvtm+b3Y4knNn106za9uSvGJO25nx4Xnc+66Aa7e2Bt3si25jNvKReqz02y+fiu9+Q7yvV0ML1vK8dmIQn0RWrB10zZrdfxEgigImCvMUi5VSCVT9PcNkcwkMQs6Yn6jhRRewA4JsFYQ1OvMnBhlx4PbyXd1M8/63cr0WWtxfX/+KGK+Wah1rDgiwWrNo/fcg7WSMNJoHVCcm6Q4UwBrSaVSKDdDXPKM3xsT5yP8RALpKnzXxxhDGIZYNDo0uEkXazVGR0hjiaIQ1/dRApx0lq6EYN1wBtOsMxdEfPHOg3z4xleeZX+6cqiU46GCi44CpCNRjouO9HXA/wRRPqMHcAZw0DNSANZYJR31Jsd1eyyS1yyt0tA/Y7W/pxBB3JL66mGXz33lO1z4B79Cc2aM6y9bxyf/8dvceMPFdAytwMsm8K2h2dScnG1Q1wAKYTTaxok7i6BSrjI9UaAZBmTSaQaXDpNKp1sdgguLc/7N7eKVz8Lz1uD7HvVqBaMjdKTjtl/bygm09m+HBHIRyQutcCOsNylMTrJ35x4K09MIEaPzpqem8T2Xnp4eEskkFku5XCHSUVw2bLH8CylRTgsg1HpfP+EhJEgRk4s0gyaOEHi+SzmoIbWD4yhcB65cBlHQQDmwfV+Jtwwo+pMvf66/ZytZV7Ox0/K1cdMapCoRUlyAFa91XOdfo/Dp5TyeIgQ4Pfsv+MDb3ld7dPdj73ASiU1bU3Rd3hOxIT/3inWznq00tMOf3zXFyLJBVizNY0zA6ESJK85fy/5CSKOuKZXrVCNDZEVranDs2irZSt4Ii+f6WG3o7e8jl8/jel5rwT6d73shi1ArFTm8Zw8zUzMMLB0iMpqBpYNIR5322nY6wBI2myghKBfmOHbwEDsffoTJ8XEa9Sql2QLTk1NgBT29vXTmu/ATfqtKAMYatDUYHYcz1mgcJegb7IvDGxPzB7aJTD3PxaHJ0q4UA90plJJU6/FcQcd1uKDfcPMFPUihqYUef/KF+/iDLYbe5CsTZv50xCJpaJ8ocNhfJU74GpMEtkkplXKcOxfKgk8uT6IAzlT7h8f27nCEkFnH9979kRUBqzsCehM/u1r4ycRTir/ZIylU6/jJNCtWL0djSSjJRBmaQYyuWzwdeL5fqFVOiwE4lqGhAYIwist0i6i35q+QeOLPYioCE2mOHjpEyvfJ93STSKZJpFIUS0Vc5VItl1GOg+u4sRMRhEyMjlGYnGbfzl0cPXCIuekZ6pUKM1OTzExOonWE7/sMDA2jPPe0hHObEYl5anCtNR2daYaXj5DKpHBcB893EQI8R5GUmhW9CdYuTbNy6QCP7hsjMgrXkbgK3nZhlp4MOFJy195p+manefOqys8c8GyxREYBirUd8JNxQQUZO3vWJIUS1wshT+gw2v6UNUCeZgggXRfAt9itUslLEYJlmYiU87OBv36mkvcbfHhtnkP9PZTKDf7u89/l6ovXIbVmKJPhQFOgaTPqWNq99Yv5Qhwj+Jd//Ad+6T3vAcejTeJxGlyG+T8WXed5229jsND6zZvm91BWEERNisVZCpOTNMKQsWNjjCxfTrE4y7HDxyAyRGFAM6hTq5SYnS1gtMFzfDLpDsBSbVTQxBWL+NRaDMESlKMQQYjrOEShxhhDOp1GKIkjIZNLYUmhpMDqkMt6Gly8Jo9DyPaxCtVaiPATCMdjS1/Eyr400jSZCwR/863H+eKV5mfe60y7TVZkNStz8J6VeT5x1CMMYnYgaxEC2+W4DlF4mhdwWh7g6QGHY77oNQixTSk1tMyx5H1Dp/ezh/x7uvKhTVU6Hr+XwuQ4G1cNsWv/SVatHmTbeXkSToRuzfxbqNq3auoINIC1RLWQ/Xt2xUNDWkSfi/k2hGW+H7+9Tet4QaMxf9w2is9aiADXTdDX00cml6U6V6I8Ncu9t9/F6P6jmCBktjDBkSN7OXrwIHOFWXw3SUdHnnQui5vycXwPhECHUeu8W3z/CAQSJR2UbIOSDFZb0plsXO9HgJBIFNZKPNNk03AKR5cJreTuR4+A4+A6cSfktnMySBsiXMH3Hx3lXcOKtZ3/4XVCPGXbkxFXDTTQxuI4DtLGV8Ea+34pVfdCVvjM8iQewGnaVTJoLSsRdp1QcmR10pJU+hXb6vt8SMYN+J0LJH9494McUJLLr7iIr31nO+vXjuDZEFCxFbML3IFtnJ20oI1lSX8f9/zoTpat3QiO1wL3gooNbYszYEEWmH7AT/hxcmi+7yB+XAJRo8mRY8eYK8xSnC2gtUXrOsePnaReq6J1hLWGbDaH6yfavR/zRQEhBa7jETVDPD+BFpoWohjaeYxW63Nc1otIp1Ot8qaDshFWgsZheTqiw4tAa8bmGuwdq+MkcjjK5fKhgOHuLEKEHJiM+MvvHGDn6/VPcWp/9iTvGzyriZQiNM24d0KwGliNYOap9n0aIYDFQjeCK60V3wf5zpuGAsqhc1YCLIyVSGEoBj5751LUQkNgHAwWX0Y0dJqrB6ZfFPKITq/B/3Ox4Dd+cC/S8XjdTddw18N72Xr+Vn64uwKoVpegPW0hQ2Q1vYN9TE+cYObEGF3LlscegDEYGy/Cef/NngqgaW+dQkSEwIQhM9MFCtMzlKplgkoFE2nKxVkmJk7iex7pbA4hBVYbwiiKXfxTQXlYLJ7nU61WSOYy87FLDDFeoPsKdYTRGmENuVwWIyTCxn0IFokwIesGPdAxy/D9e8YQXgKlJL4IuWZTJxJD3Qg+863d/M2Fit7EK49h6rnKYLrKhZkO7q23Zk5IgdYWJeUbpSPvM9GTr9OnUACtYEFIwCqB+LGScqUWQgyloheUevmZiACKgUtDw+7ZJNXQ8u3jDnfNulSsZd3KpWxZu4wl+TRWKfYeGeN/3rWL1/c2eO3ygIFUE1e+cLmMnFfnk1ca/tM3f0Qun+Ntt1xDudyk07WUI4ltDRhb3L9hjCHCksrlEMrh8e0P8Lo16xg9OUm1WiHf1UUymZzfQYiFxS/MQl5h/nlrmZ2a4eihw9RrDcIwBGMoFqaZHJ/AANlcJ6l0OkYaaoPRmmYYYtpw38UYA0A5DpXyLMuG+sjkMvE5R5oDBw/H6L55668ZGOrGcRVWujSbAYi4iSkRVhnsAEvEXN3ljl1FnGQXKMlrzknQ3xGrxm/eO84FVHntyJlRf/8h8OaRgHv3uPPXr6W4f8EE4ncRLTbZM8hPrQJI10UIIQXscjz/DRnXuWLQc7iqf47ESzjX72Qtwe1jST6zy+dPDnZwW2OIQ6kRJrtW4Q8O0dudIZ10GD05yfRsGdd1Gejr49ILNnPF9VdwWOX543tmOTohWNsh6fBeOI/AV5rrhyx//Y19hN19bN6wkmW9WQ6PzaJx5oH67WE+QRggpIM1mqN7DlIuzhLpEJXK0jcwGHfkiTiJ+ES6QUupWMT3PASWWqnMvh27efyhh5memERHEaXZAuPHj1OaK5HJZMl15vESSQxx1aDd+GONRQqJFG1XQ8zDDSQSHTVZMTLIwMASkqkkqVSKcrmCMfEkoKgZoaOAzeeuI9uVB6FoBmHs71gY8efY1Bcf8CcHyuwaB9fxWJptctWwg7QBj47WuO22ffzhRSEdrzBy2edTOjz468MpPCWJwgg/lUBHkbTSfNYaW32y/c7gAZzujAqAtVhxTEjxvpt7NEqIl2Sop0UwUUvynaPw6RNZrrnwHFZt6WdrOkXCc1BK4CqBqxyUjCmsaiEcOjHBbXdt59B4gSUDPbg2YtuVl/CbH34Xt99xHxd85yf82+XdXDNUmI+Zn2/pTjT58ysEN/zZP5FNJdl22Qa2be7nuzsmCXFOwfEIodDWkO3IoxJJVGBYNtRHorcHpGqlCe2pZbDWthWWjnwnzVqNI/sPcuLYODoIcKSi2mgyc3ICYyyu65HryuN4HpHVCG1RbszdB3GDkef6BEGIdNsdey0voDWH0PUT7Nn9OGvXrqYZRWgD3T1dzMzM4jqCdCrF0SNFNqwZQbkee45Mz+P7ozBk/aCLjSLqWnHnjlmUk2RNvs67r+wj6dQ4NG35L//yKF+/3tCf+o/E31NJ2jWc4xn2R2o+BLTgO44zFARmgvYjcIq3eQYP4DRfQSkAV0hxjp9I3PwrK5upVbmQ5dkX1x3TVvK5/b18eLsiv/UyXr/tclYN9pBLe7gqjlPjcDomjwx1BJHGMYbejhTnb1xKOudx1317GRgY4Ht3P8To6DgXXHQpG9YM84e3HcANk2ztaaBeoBJTzou4tEfxu1/ZxdatW1g1lCWT9Dk83Yjn6UlQNh4OZnREZa7E1NhJwkjQKJ/g6isuoVA3yMXUXKI1oJRWhUBrThw9wmMPPMrc1CxRGFAuzjI+NkYQhCilcBwPISXGWJLpFJ6XwG15FVJKpFBgLVIqgmYQt+mKFmowhg8ipEQ6iqmJac7fspGE7yGkolKtUa0G1Mo1SuUSjVqZd77l1XRlPIq1kGKtibHghGWuWW5QkeGR4xXuP6ZJ+ZaP3jhIIpphouLwv769kz8/N+LCJU9qwP5DWuIIQ1L6HCi5dBJRli7W2m9buMMacdJafcab+qcqACmVJwSXSynXOa77hqu743JUNUqScuyL4gloC59+PMWtajlvf8OrWL1sAN9RCCHRVhIalyMTs4zPzDE5W6ZUDhHSx/EUVgdYG+BGgt7ONGtXL+fW2+9jZNlSRsen+clDD3POhk0sXzbC5x44TK2a5LK++gtWZx5Iawhc/ted+7j28gtY3pegXAkoNCRSaKwEow1TJ05y+MBBwmYdbSyTkwWuufoCSnWDQC0eyTiP2w9rNXY88CjHDh1DaEulXOTE6P9m7z2j5DzOO99f1Rs6h8l5BoNAZIAgCZAESIJZFEWJoihbyZYl27Lk9a6svY5y3LOWd+3dc9fXsn19pZWzJVvBJqlAUSQl5gwG5DAYTMDk0NO531RV90MPIUqGaGmXoML6fw4+4KAH0zNv11NVz/MP04RhRCKVwnGai1xrg5AWWmls1yGZSsKqVbeUhrjr0NvTRaQiojAEKXBdF9uxcRwHFWkc1wIBUeixfeMww4NtLJcbLC6vEAQKkDTqdYrzc3zwAz/G0uISy5WAYs1Ha8WWTJV1uYh6pLnruWXKUZxYqMi7Adpy+OTXTvEzPQ1uHfy3e/93A0sY5upJZurN0+SskgAvBX5wL0aUjNHnbdp9WwF45eJfJahISyFxLFu+13LdTVksepKalG1Ym73w+v/5Rpq/OgZHey/njfuvIJWIYYTA1xanJuZ4/MAx/uaLD/HcoRMcOTHB5Ogoo6dH+OpTRzk1PoOJueTzLVhCIY2iJeVw8eaLePDx51m/fphKuc5Lx8/Q3dODE8/ztdPL+I0YV3bXVx15X1sIDDvbfSrLAXcdX+CyS3dy0Zp2lpdmmSs2iDRMjp1lbm6edDZDPJUkaDQIA8XeS4cIohAtU03Bjlhd/MowOzHJi888T6VcIQp85mdnaNQ8EukM8WQK225aiwsJQRQgVtV3jUaddDpJOpOho72Fgb5uhgYHaG3NE2lNrdZAG006ncF1XSzbouE1cGyLMPBp1OtMjp/mPXe+idHJOfxAEYUhWhkq5Sr79qxn187NLK5UOTW5jB8KlF/nmv4GCRlxat7jGyd9WmIhb76ijWRM8vffOM2vDK7wpqHXN4LrhxkC8HUMo2225UMemDdIaX1dBeETQkhbSlE/n0rwFQXgfPTfZuyXEOITSPGC67rXHWtYbHAFtw4s415gJ1Zl4P87LBlfu5/9e3ZiuxJlLMamC9z78BM88NBBllZqbO1K8+9u2sT2tTn+83uv5N17+7hq3QAFT2H8Rb768DESmRw9nW3U6zUSjmH7lo187bEXWDM8yMpKg2KxQCLdghEuX5sqsycjWZO9MEQnKWBdTnDXc8s8ceosl1y8ln2bUyRiLg8/fRqv4dPW0UEik0FaFkGjThiFFGYnuO36i5lfqaOtJGiFV6tx9OBBxkbOoIKI4soyC7OzaKVIZrJYMReBXA3mEEgEYRhgCatZ4IyhWq4wMNBD30A/6WQC13XwvIAzY2cJI42UgiDwicVcVBQQ+h71apVSqYKQFvV6wFVXXIrrNJOIGvUajcBnaWGZW264mP7+bsZmikwv1Zp9AlVgT4+iGgi+8Pg0WPDvbuqlM2n4/BOj3JGp8tbh6r8t/u8RoXYYSoe0xjV/MQqObedUFHwOI5ZBROc7BLxKARDIppa7R0qZRIjfsV3XtQzsymiu772w+n9tBH96KMnpob1ctWcXjtts6D367EH+6StPslL0WduS46dvGOYn93exd00bnb0dOLZN3Krhxh1KlRq/9q7ddMmIb7xwitGFCoO93QRelYRrMdDXzyMHDpPNZwjDiFK5hO0midkuf3nS412DmuwFmg4kLMXGfIw/fGyJhGu4fHsvXiQZ6BkkEnHsRAYhLKJqnVQyhmcixkcXqVdX2LVtgNLKCnNzBQ48+xwriyvUqxXm52bxqh6WbWFZAsuysePuKtc/Tiy2ShdVqqnAWzUeUVHE7NQUoVfHsR1sO8bI6XF8L8CsTgQEUK2UKRaWqZZKREo3K9kqGUEFZW684SqmpuZRxlAs15memuFtt13J1Mw847N1qp6GKGBbepH2pOTAmSoHxhv8zLW9tGYFn7x/jJudEneuC4lZP1oOPq8HMk5APubjWvCpUzFs140FfvjHUgjfsoVSofq2zvG/cgKwZIQRlieEvFNIca1lO/xsr+LyDp81mQvXmNFG8vcjbTycuIib919O3DY0Is2X7n+Wp54dIx1PcuOmJL/xtosZGJDs3rGeZ46Ms64vzvGZEpesjdPXmyYKFMO9g/Sty9HWluLoqVkOnylxyfaL8GsRvZ0J/DDk9HydhheRdCxq1RpuIoMlDLNLgpv7qxekHyAEdCV9hpMOnztR4obrdmGHDYb7crgxSaHmgrDpbG8n39ZOo1YDNIcOTXD/A0/SnnN54blDFJeLlAoFKqVik2jrOIjVxS0tSXf/OuKJJG7cxpEuUaTQKmgSdCQEYQUThGxY38/6zWt45KGnmJ9bJAwjEBpHSnyvQb1WplgoILGJJ9MEYcjL4bAIwfjkDG+4+hKqtQa1ABYXV5ianOZn3nkzY9MrzCw3SFiSaqXI3j7NSingbx6b4ZZLe2lrSfHJ+0Yp1zx2pTVXdn1/reVeKdL6YYQlDGeLcUYC14RB8JiQ4grbsbNRGI1/ywvFv3YFsN2YEGKvZVk3Wba1VVo2Qln8+JoK+QtosjhaTvChFyXvfdsbScYEXiS45/4DvHRkipSb5NrtWX79w7dQnxphXZvD+HKWbWsichsu4uCpFeKOZKISw6sLeuKawI5zZqLKh35sKyMzBU5Mllm7voOoukx3dx/3PfQsmVw7Xq1OPCabIRiuywsFjytzksH0hRtB9acNDxyHopvgkk3dlAJDd0uMlbJH0ZdoY1DGkEkn0b7P3OwcYSAZGZuhXCnhN3wwBstq2mc3+R/NZymFYtvWLZhYCisWQ1iyGbcdKRr1BhhJENRwLMmb33ob6UyOhtdgcbbMSnGewtIihaUC1XINISSJVBrpuAgBge+f4/4ascr51yHrN23m6MhZZuaWuGgowVW7d/DkC2MUfYVtNOmwwEAO/vbxSWqhwJGKe47WaEsl+JV3X8pnnpvllg6P+Pcp6GOk3MrfzQ9yrNJOl63J/hAG3Ggjma4leKxg21rrxwTak9K+yujwAfPKW4B5lQIgXRtLyl+UUv4mQlQtx974ri5460DAZe3LF0yKGRnB//VkghtufyP9XXmQNt946hDPvTSFTZzd2/P85k9uwVVl1nb3Ycc1T45WmbB7+Z9/ey8Da9ux41AuVSnWE3zhiRNMh3l2bknSHUviKJd/fvpFcvk8mWQKoyLyrTmOnplDWA6pVJJSuUwsnsSSklLB45aB2gWbCrhSs73N4oOfHePirWvoy6XwLJvWXIwz8wHK2IDGq9eYn55h+uwMrDrpilWb71UziNWdH2B1lBh5vO9t17BzTY6WVAKhfIo1j8Dz0ZFHEHoI5XDpZRvYfcWleH7I0WOnqdcjNBpbOsQTSdo6O4gnU+cIPMZoQr9xTsAEzRHk6NhZsrksS4Uyy4uLvPXWfRSrAadmSoSRotEIiBuPZ07OcHKmDkZS0G1k4hZ5N+TWnRlGl2tcai2TdV//ArASJPify4P82Nt3MLg+z18ditiXXr5gY+ELBUsYPBXj82ctJMwZrbXlOFcaI/5Oh4pzpBPxKmpAy7IwiN8y0CMteX2vLfG1ZGOufkGbM/eM5ah293PRcB9CwPGxWR5+agSp4nS2WfyHOzbx/NESUTHGbOTypRdKPPz8KAOtSX71fVdx+/5errksz61XbuLW/Wl+6/duY9tmh6fH5zhwImT7pk7e//a9LE4X8ZVNIwxZ29dBo7iE7bjEXYdMrMlXt5049xRjjJQyF/AnhovyNf77LsEf/MndVCp1SksVosBjuM1gOw5GQ2GpwKmTpxBCNi3DxCoHQMpVLoDkW6qysEA4jI2eZu+2Xq7Z2cP+y7eB0Qhp4ybiGB0gpGLzls2USyssLC9RqzcIdbj6f1koY5CWfY4jgBCIVbKQOCdPbnpRK2Nx71cfxPc9GtUS7S15ZparKOFiSwcVBDx9dJLnRxYJ/QZhGCBMQKQV+ZTb/GAqfzUF9/VHKYgzOJCmb6CDnq5WTDxGKfjhjB3amG/gRQphyWGBUNKSWkW669wLVj8q37EAyFWdt5BWm2U7qV1Zw0BSMZCu4CsHZb63CKLvBp6y+dKE4rqrLscRgopv+NL9B4iMRXuH5Dd+4RrOnF5ka4dHvRHyF//wCIPtHfzBr10L1Vn6+vLkrRgWzXTidCaLWJlk7651vOmaFM4GyeOTdTaqGiKqYSwHP9R05pPcdM1OoiBianaJbVs34nt1hJS0pFP83Uj2gt4HBYZ3bSiyN9bgE597lN6cQ+Rb7BpuQxpDveFx8shBGjUfYZoNOcmqwu+cAuhlH7/VPdk0Z/33PfwUxUody2j+8p8fQlgxnJiL7SZIpTKA4fToOIamhbiQDtroc5kDShmU1s2g0tViY0n7nPvPK6RGzVGUZzh19AR+rUIsFufkRAE/1ASRR9UrU65VkAbWd7j8jw/s4QOXpEmFS4xOVzl4NqToWeRj35/jf8b2eXa0wUOPjXPvE2cRZZ8W93u7/t23uIklL3mB3uF3j4StwIAUsgVB0RgTcxx72ys448CrFIAwjPos20o4joO0LJSw2NoSUgtd7j3byfFi22v+ph+aTnE21U5PZwuhNhw8McFSuY60HPbtaGFDYoFN3S1MFwQji3UuXeM2d8mgQjyqoVeWMb6PriqIIjAKx85j13z68xsYzFbp7decWkqxd1OGjlSSlpzFUHuCG67cglevkM1miLkukV9Dyibd9VNzDgX/wj5USxh+fZfHyoGDPPzMcTqTirHxefoSDc6cPMzsxFTTkvtlAwB4hRHAyyGCGtBoozAmwuiImeUKjx44SntrknfeuI1U3CWeTJDN5mjvGcSJORw4cJRatYHQEYIms9B2nNWEX9BRRFsug+s6WLaNZdlYdmxVKPbyW1k9DxhJteaTz7kEkUbbKbzAo7i8zOnjI83motHcsW8TazMO+7bn+PgH9vCTN63lb75ykCPHV/CVe0F/198JbfE6v9wxSf2lY+RHRnhv21ns71H01mWVaP8BcMlKWBE/0asBMWyMqWMoStsa/nZHkFUtwHkmAJY1LSzZQIi4EIL7VyBjxyj6rezrLq8GQH73UEa+qnw40pIvTgiuvXEPoKkFggceeoHIh4u393HZsETYsD6peObICsv1Cu944ybsvKRmO/R0JPF8h/JKmZEzi3SlFOl8lczgEJUoohBUWKnEGUq7uEOLvHRWo4tnuWpPN0Fd0+qFuHhgLIwwtGXj1LXCSEnedThSSHN1z4V9sJ2JBv9hh8OHPvEltm8aJp91ODt6kme/8QgxJwVKYGzVpAIbg0YgdDM1R5gIrRVCKfKO4aLhDkJjMV1Q/MWnv8TOreu4cks3s4sFnjkuCf0IQ0g2m2bz5vVMTEwRTzoICxzHJRF38X0fERhyKYc1Q91Eo1OEkUYbTTIRpxqGaG1ACoxuRpYjFVJr3HiekalFGtUlCnMzTJ6eWKURKzq60uQzScJQERmfmFRcs0aw7X2X8a7SSJ8uAAAgAElEQVQ//AaZCyjM+tewPltkfbb4v/z1u1pnX8N3878OKQwZVyIEjtHmeBgEGct2tksngQ6/OcH7jnJgrfU6IuXbTTUgt+QjDhRt3tJfpztR+Z6bYgU/+apa7hXf4aslm//U1YkxmtHxGRoNjRY267sFb7r1al584CgFO2Bmqc5PvmUHxw8uctX2JGmT57lTBY5Nz/ONpycpBoIrNtRJmQK3v8Eh7sY4NblEuqMbZ8Fw2ZYhXjp9mi8eHsVpdXG1IN3SzdqBVmaKHqVSmaHBAQ6fnkM6Lq4b57H5ONf0nNds+TXFns4K7+2Q/P09j/PRX3oP/thxrlqfYGNfgkgI/MDgOhCGBqUltuvgvizhNZJQGZRlc+jEGDtlnTu7BTMNyZ/95T/xyz/3dm7cPUCpMsrodBVfCTq72ujv7+W+Bx/mhhv24ziyGcgJuI6FL6BSqRJGEYlUEqvqI43EzWRWI70hHnOJIkG94WE7AiMkk2dLfO7z91KrRaggQOsIYTQxR9I7tJUvT6Q4OBdyWY/Fpm5B3BheODpDRjR3r3/D/z729wT8zYydlpbdYoyJG6PXY761uK5OAb51NxfSbUeITdISP+84jtBG8xP9IVe0awq+ZDgTfc9S4HrkknoVB6HHZlNMJXu4ZMcmhLR54NFDzC002LSljQ/euoXK1BmGc5JRp5VsEtZmEuSqFgU3z3wV/ts/Pc/mDTl++vYdlAPFO966m0YU8OnPPsfmnjwb1/fS1WORsE4RCMF83eHuh8/Q2d1P3BF4XkSqfYDnXjpFud5g7xWXcujoCJYdQwhNq/K5pb90wY0ohYB1OYt/fHSO50ZnGBmdYXymxKaL+kg4Fi3ZGOlkAstxqDZ8xs4u8fzpeb5+apHLozn6ggLXu9O8b8jjbcNltrfV2d3h8czxgKfna+zcOMTawW4KKyVWyh5tLUlWVlYwMkajUUcgKBdrTR2F1oRhRKMRkMlmUFrQaPgYA4lYjChskM2m2bJtE9fcdAtbt22lXCwjhMT3fbyGjwp10yhERCgVsW3HJcQSWYx0KUaCU5UEp+civAZ8/qkJ3t3T4Oqef+P/vxZY8pJ8ZsLCdayva6W7hZAlpfXdTUZgcys77wlAQEEIdgshjZBSDNmaz0/HeXNPxLIHx4pZalELN/ZOf5uXzfkhMMzXY696Anh20eLi3ZtQRlGthhwfmcSYND19bcSDafbuaWelarHy5Wd49zvezJe/9BBv2zbMC8VZ/tOfP8WHf3of+3Z1IP2IXZvz9PcpOuJdbNr3Jr7yyaP8wo48nd290NFCQD/ufJXOVovlcsBAR5oojEjYcbxGnWw+izYhOgwQ8WZe/T1Fh98PY+ReBx/EzkSNj11uM15+gacXM7wxU0ccegnQaGGRcw3rEhFtcQUDDoObI9rjdSxhznsys6Xml3fW+cWnjvArx8/wxpuv5ejxE4xMlrh63w7iMYsTp+c4OzHHho1DOLZFtVJZ9faziaKAsdEJBoaHcV2HRt1HG4NtO2zeupFdl19OqVpnYWqJ1o5ujGWjhaZSKiOIAIMJDTt3XooSLoGOkGFzeqBChxmRYmypwMTMPHfc8m+a/9cKW1vLhFEHri3aBTJjSctNxC1qr8gMOP8VQJqElNaNlmXJwBje2h0yVrPZkg94Yr7ZoBlOeyhjIb8LWzCDoCf5nRdOPbL5zFnJB2/KIAXMzM1jpI3raNriDp09W5kefYlxL8+Wtd3ImYNctqaTu4+OsnfPJv7HR+8k1p4gmYTnpit0tVrkks07sZEOV9/Qw6f+4SC/8QsOU9U0B4+c4dJ1Nu94yxV89qvHuHLXXsKVMrHVLHujFUEQgFaAPpeCWwnc16UAAKzPlliXhev7Kt/V7/jVEGkLT9lc0WXx/04Y/voLT5BOp0km4jz7zEESyTiWncJyA4rFEql0nIZXJYo0UjbHjuVyicW5GdLpLJ5WFAslEi7sueJySl7AyPgkUgmKlQpRqKlUaqtMQY0Uml1XXIHvKSrFAkK2o02zMEjjUikvMnHmBH+4Q9KZ+NGJ8X411EKbhH1ho8tsabi2BZ735A6DQinR8GpVC/FNCyx5vgagtBkSUuzvcwVDtmEltNjRotjWUiHnwuUdC/Skqt/TB7Mt/p2pw14kiVxJKhVDGcP8UokglMRiERd35+hONZhYtPn0/WOMFCwePewyMdbCU1MWdz0yiVOvsHx6EbslTatMNX30a3MkcMg5XexZt46WTW386dernJpWXLktRks8Q7v0mZ5ZIWZZxFIOtt1M3DEabLupidciBCRJKRgtv74zYQH/24sfwJKKx2Yt/nlSAxZEETu29HDN1TvYunMLbZ3teI0aju1SqdTBkjiuC0i01kghEVgszi0yMTbGUmGWenmFK67ZR9WLOHN6iqjSTDA2RlAsFsFYgENnZyd7r7oOH8Pk2TMEkU+9UsOr1CkuLHPi6DNYxePs3Zjlt16CL020EunXfsT8gwRtJL83uY26urCTJVcq9nUqjDFvBcpaqUexrFckwprzjwEty22TUtp7WuDHehU/t3GFKzrruJbipr7mMT5hvXZHtWPFJOt6Wok7DkEYMTW7iDHQP9jD+jYbR53l6ks2IioBb9i+GVUbZbF+jE1bNnPFVRvQPQNkWzTKX2FhqU5fpgU3lAiVxwsV9z55nG25bu666wm29LSSTfvErSrdLQIdVGjU60gNRnsYpZqmmFp/M2FDvFwmfzB8EL9X3DeZ55/tdbznP/40MSfEdgxbNm/mmSefxfd9krE4Xr2G0QI/0ERKk0ilsWNNzb8RGoRCA2EYIVdn/slUG2Pjs5w+OUrgedRqNfxGnbgjWbd2gL17L2XTtm3UAo/AV3T29iOwWFmeZmLsGOtTs3zsnev5sw9dxcfesZnffvd2fv0QfOL4j3YRkELzm4MnSNkXdqpkEOxqDxBSJBCmboxudyznW44c5/0tS0smpG2TsCW3D5XpSlQZSNVJ2AEF36WhXCarLa8dS8qEtLVkaW/Nkc+1cHxkFoyguzPL5NgMxYUVTp55it3bOzBzR7hy42YSXUPgTdOfCKi7cdrb1uDqbmrKZ/JsGSV6WfEVLz41zezcEq7rEFQixs7OovwGThjREg8wOkDaNmEkiJRBYKGUxlolvXDOJOyHUxry9EILv33C4Z3vvJNkMsbG7etRaD79j/fQMzDE4lIBZTTtrXl8v45lWdTrHgZIJJOksxkyuSxuPMbgunUMrl9P39B67ESCydkFRkZG0VFAuVwhCpt24sPDw3R0duFFmqWVCipUJB2DCsosz4yzp9fnz352G79952b2DjmkZQXbBFy3NcnHP3QJd6/ALzzRzpL3w8nC+06YqOa4a2otABnHu2D2cy9DYNje1qCicISQQthyzKCaneZX2MT/iy9TSl0thKAcrsZOC0Pa8VBaMpyp4cqIhYZNzn2t7muGfD4HWlOr16kHEcKAFVbY0NnL0M6deDpFwi3TO1BjJTjMC88cYW2HIhmrsqG9wKnREUZPFnjpwBiLdYepcoqvPz5KSyLip27ZwM7eCu9806XUGjkiLVHakE9JAt8jEhbL1ZBqoLGki1amaY0lv6kK++7y+H6w0Igc/uKE4b0ffD9aSOYWK9xyyxu5+OKteEHE1Nwi9UZApeaRTKcxOiT0fUIvIPRDMLqp+NWaRDyOZTtYlk2kPCyp8etVvHoNy7EIPB/btrBth4mzU6wUywR+iNQh1dIyp44fpiec5I9+ajO/9uaL2NJh41oajUAZgTEaFUSsb4P//J7LWEzYfOyF5AVhnH6/0Brz2dNWfl2/Z8LWvL3NIC17yRizx2CSr0ySOm8TUAqSYNiQMXQnX0EakIr2eBVtJBvzr92ophg4JNsSKKWaoygpkEaRjLs0liZYODnDcycDrl4/hKN92pKDPDN7gLcT0RbrYHZ2mV3b1/CnnzlOQSU59uhxsk6enq5eTp86RZfVRiZVJeVY1MKzaF0DenAtjWsLbDdOxa9QrvlIRxAG4Tna68u5W+fSeH+IcM9ElnDrJawZGuDMxDQtLS1EUcAluy9lfmGZ6el5+vp78Twf13Vpb8uztFhEG0nVq2LwEVJjdFNt6HkexmgScZdsSxvT87M4tkMYKozW+H4NUIShx+zsJNJAvVYmn9B85PZtrO9KU6lEPHQ6oFhXRMbg2pBPQkda0Ju3ybmG3rTi7Tds4lf+8iX+fTnB+tyPhidgxvHIvM7qwrgV8qZ+n68WYtcIoiHLdj6swm9e3/9lATAGIZue7ld0NrDFv+RlS6Ff0x/kaDGGPegAgihS2GhcYYiUpn94GEf7xHPw6NFp5jtSxJKGbNJgd61nrt7Csy/OcrZxinwyzezMFIFSLJWOs2aoi1vf0Id3vEI13cv83Eu05ltJ+C6BiTNfqdHamqQ9LZkWGldojC0Jo4AgbKy69AqEbPrb/zBdA6qhwyfHbH7+N29ianqKbLYVP4yo1hscOTGOkkmS2VYq5Squ44DWSGmRy2fw/QitDBpr9RRgIy2bRCZBPJ5G6+bhNVIhiia1t6k/EDTqZQK/6fsnEPT39TDQ18Xj44q7j9Qwq0VVa1BKNNOOjEFrjfCqXLcu4vKLWvnaM3Nc056hJfZ/xlTgQuKa3hLtRzt3zwkZRSpai+DMy/2t8/MAhKCOYG3Ge11CGJUB25IIFEY3RaZKWohQct+JeUT1LIsyz1sv62RtdokXxwQHRys8fqjK5esUwxt6uHbDAPc//DwdHUM8dWSEfNxmuK2VhFrAtDZYWMyQ6R0gnpIgYiyXFWOTVdrbW+lKhlxzaR+PHZ4DYRNFHnE33jTKXB1lNbRhKPPDow3//GiOfbfdiDEBqXSORhBRawQcPjbJwnwJZQzxWJwobFAsFQjqHkhrNWteIIyDFBLLkYS6QaQjKqUijuuQzmVIpLJYwmpGgBtN4NeolsuEgYe0JJ2dPeRaW5GWZLGyeu+0JOimyExpjdIKtMEIC6E1162P2N7Xwj8+PsmLkx46avCzjybY3RajPw1rMj7OuRSVVUmUsM79fUdrCUcaXOuHs1l7oZBxAj4wrPj9U9J2pL0Xrc6osHmyPW8BiCLNtS1mtVcgiLS8oOk5PQnFiTCC1Q+cRqPxSeQle/sUw2su4suPTjC/KJmaSPDc4Unee9Na1vbapK0Ggzv7EcFZbr4pSVoMctsd64kFitryJKocEk938/WHD/LQiSU2vu1mHjm5yJoWm5miTy7fwmypjOW7lBtN3b+QkMu3nZO9Gg2hUrRcQBOU1xLV0OGvpyx++YM7qXshWtqsVMucPDnHSqFGFIUYP6CyPIuMGly5eyuX7d5BoaR44ehZbCGxhKClM09hpczU1BS9A700PI/SygoLM7MUC8uk0xmU0jTqdbQKcWM2fQMDpLN5hLSIdFNJ+HKISfMqpVBKEakQtEAbQTxqcOd2Qz6X5hMPnmCiADfuaOOdV1+M1HUWSiGlUPFSsU6h1GCl4lGp+9QDtao01AShphRkSEfwq9skN/QVMUA5iNGILGbqsdXoMo1AsLm1Qdb54XierwVuX1Pmt05mcVR0J8i7bMfUolCfpwAIUErXDlfg/qkcN/VB+6vM8F8LrM34PFepYRBkUikwEhM5eHXJQkWzM9vB2j0pDp8tMBAr8Kv/cR9nj0/yzIlTbLpqEOkEuC7YYRrtjWPrLHgN6g2fWtnFiSRl3ULoT3PFNomaqRPoBI8dX2HLzu0sLtZobWvhoScfxpKSy67cwfMvHkJIG4TBKMMdrSHp1yFP8LXAweUkl924l97eTsZnikycmufM6AyVWoAAgkaVpdlRLt62hp97/9vp68xR8cq8dKJERzmisrRIb18HgWdYWFhm7Ya1xFNJkloRT6VJxlKUSstUyyUC36O3t5dsvgVpO00HI6X5pgGlaMqMjcFgiJQijKLmSUBDm6zw9ssTzBXr/Mk/zCJsh3fua+cdVw2RdQIEMYZbY2gB0IKUFtJa5Whog9KKUIdEIUShYKIc8PF7jvA7pztwRLNvFbckmYRDwhb4oWKpEmI10nzuekFL7MKc6gyCh+a6mQzTtNqSy3Iz9Ca/fxTntlgDW7YgtGwFZb/c/z/vCcAYPRNoVfnshJNZk0nx9EKeHa011mRWLsibs4RgYWkFYwTJmEsqbtHwIhbmV8hfuobxuQVSJomYOsttN7VjJSTVWIk9F+UoeBk6J8YwHQNYdgPiGUQ9BfluqBRYro0xXkpw/OwMf/wr17M08jx5F2b8GKOzVfZcFSPlwlKlytnZMsgUHR3tPPvci02zDQmRH5GJS2yhf6BmAcYInpjP40UGT9n0pSJ6U4q/POFwx3v2YbkpXjzyIqOTJZTnI4xBNRosTU9wzd6dfOgD7yAbM9TrFRaWA05PruDXIlLpJAKbM6fHaW3JkcmkMEawtLzI5Jkx6uUqgwO9bN6wmQhDww/xghBtmgtfCokfeti2zcuB5gqacWHhauCo0WzPFbluWyuPHlviS4cCYnacOy/P8O6r+8lY3rnJi17NPmxeEQO0skA0d3KpDY6QOI5CWIbtaYuPf/AyItWUWKvIEBqJY1s4IkRqRVkJ3vr7jzNft2mJXZhn8+xyD+N9m7lm3xAHj0zwDwddPpI4+n0L1BUC3twuuXdeXCJtWYq8ppbn/FRgQV9gzFOH6vrmR2ddAmNjTILhzMoFWQBC2BRLFUKlcEzAJVuGeeLQGJNzBebql5BKVbjo0naeOtJHpS5RUwVK9Rzr1vfywtgi5SjLJQmPZLIVIQJqQZmx2Qjn1BTjs2X+5OGD/MQbtjGQcCimY8RjeU7ONHDjGXpbIfBCVmoWSsSQeGQzGeYWy9jJHJYQ1HyPG9f5P1CLXxnJR59pZzSV4uZrtrC8VOJz40XyZ5Z4uBTx8+3dfOVrT3F6bBGtm01djGFx+SyphOQ9774DWyoKlQgviKg0JNWGIfDqZNvTlCtVIq3oHxzCCEVQDzh16Dh33nkLYBEZm8mZeRr1gCBqpgKbc1YF5pwpiVkNO1WBR2RMs6iGPjevUQy2t/Cp+8eYKDu0pGyMtGjv6iQIDJELltVMETayaXRiBGgkUjtoqZoFQUgKDU02lsSRddCQNBE6pqmWNSdma8w2bLxKjf2b8+QTmpSQxK0L29D9q/kcH7yhk57BDCmrg8eOlAi0Q8L6/lw7pNBszGjuW5TJKFK7jDEvwncUA5knlVL/XkqLv52xuLPLMFWTq7en134ZbMrXOfVCiXo9JOVoertacOQ4JU9xz+Mv8fFfuI6pEydZ02/xtRdKeK7CVUXqdVjbWWV23uGuU7Nsu3g9OFAplGGuwuMnpnl6pMINW3rROuTwSpzuQLAkshycnGHH9n5sDSKVZez0DFGkiVkaJ+YgLKfJgjOGUuCzo+37b/LwShwppDkQwm+++yoOH5tkZq4IGBbbunHnp/nMP95Lz9A6atUayUQa25KUy8vUS8t85MM/i2UpLMui4fuslHyePTyLH/jEEzHCSGEQ9K7pwHEtokhjORYtLVkCL6ShPFaqAX4YESmFVgbf93BdBy2aTUHXcYiiEKV0s+eAxBKGjKlz21ZYbih+767TGGHx/jdvYnuHS6HS4NjZKn90osL1W1vZNJCiIw1SmdVTA00DFBkgjMYgkFLRFjcIUcegAYkyhqpvsRIKOvJxMnHovqiPpbLHSyfK5HItlAIXIS6c8OiqVMSh0QVacjYnTq4Q9wMc+f2TOQtgT4ePHHelbZl9WkQvGnPeMSAIxFYgr7XCU5LJhsXG7IXb/xK2YV88olCskGhL0tuexxIQRJpMT5azkyNs2tBOzUrx4Ngxfmr/RuKWw6HDLzGYaSPUkrk5l8NfP0YuHlAJA54dj0imLFpyFm++uJN0fwvPjo+TbV9DpVLg/udn+bmf6EPaISaR4UtffQaJy1tufyOPP/Y0wrKxhCAKA+5oUT9wIpXRsssll2zi/idHefC5GkHkEwQehohIGb74xQfZc2WBzRuGOXFqkribol4t05JLMNjXSdxyMGGIMYJT0zWktPEbBbRSFJd8Ym4MX4VEfki+JYcyhpauDg48f4C91+9nfmWOIAhRKmw6EGmNUU1zEkzTNETppjsRGCwDa1J1LuuxePjoEo+N+biOxeDaYR49UWV6zqIvJ1jfl2GwO8fJgs/XRpdYm3e5eE2SzX0JEqKB1AItBFLAaEHR7kjyqaZR6bngUhFhQsViSbG5M0aUsvnqwQU+9cA4Jp4hbpVwbJukfeF245s7p3niNPzXF5dZa0e8t3XhvCP11xP5WISWcYAPOTHnTwMvwH6Z6HIOwiCEaBOiSX4xxnDGg/OkCr1mSNoBb+hVnJhbortlgP6eDuKWxAib8cUihytdjB6usCu7xFBOcmJknMZKkat296OiMr3dhsVihWU0ItSsSdlctTNHvr2Tv3pgCrfDIVWeYEe74b4X5ghTafp6kmxc04sKapxYrBGZBJFukEjGGZ2YQ7gppJBUalVuuSj4nq2hLjTiVsR8MWB0rECkDEHQYNPmtezdt59DR04ycnqUZ54+wvzcIpu2bWdycp7lhQLv+rFryGRcFldKtGVspueqHDw4wujp03R0tBGFikqpgdGCSGsyuSQGQTqbpqW1g9OHT5FPp3GloaY0YaiQQuO6Dkab1bm+buYPCjBKI3XEllxIV9bhU4+eZaluiLs2/es2YNsWGsHpCoxUFWYqbHoaqwjLSrAQwNNzDdqdMjdty7G1x6U9rtAmYrgtiR/6VAKJkDaWAEOE0BJHGLZ2OixVDf/w1AT3HS8hEi1goB5qXBSt8Qs31u1M1LkjMcIdXeAr+/uSpv3t2JwvsjWe5WgotkTaXAfiofMagliOo40xHULIDUJKcq7NVW0hm3L1b+EFnCi20RF/bXbGhG3xyWMhF29ehwl90gmbo6MLzC3VWaoptrRa7Nu2mdBf4fHDc1y/sZVuN0AKH0eX6M1aDHVk2dCaZqglQS6ZJdAlMsPbOHNsjIu6WvCCBJ4Nf/yZY7znx7fRmU0iM3n+n08+QLkaccklG8nlcxwbmULaLsIYFotlPrazTsb9wRkZlYMET8zF+OeRBn5gCFXE2+54A1dfu5/nDx5jfnGZufklYvEkpaLH3MxZBocHmTgzyRtu3E066VAteZyZXuKe+54j8A07dm2lq7uLVDqN6zpUqw1UFDWboF6IsQWuG2NlaQmhG6xfN8D0zDyBF2KMQivNarsfFYb4nke5UCQXg7WtDsWqx90HZvBVk1XYt3YtMcdGniNav7wRNS+ZRkoUclWvJqkZhyOzEU+crBNqi3w6ji0lj4w0+PqRkNMVwcnZgNG5BvMlQc2ziHD58wfO8PBIDemmmpbmGDAaK/D4yNbXh5b7g7J5SAGNIMWjS0ZIIb4chdGx1SvAy4t6tYWjohNGWF8AbjXGYGEI9LcWialqhqF05TXrCKzNNlhTL7FSrdKZdlnb14GQJ7CkS00rDp+cZ/dFCWy3jdtua+fpbxzHWp+ku8XCsgUinUa7AmoVwshATGIr6MtMM2LZFOxB5sqzPPrUOJftHWTr5gEc5XNocpHJuQClIy7atIG77/4GUsawLYtauczvbIjoTb2+/O1XIjIWZ0pJPAVnSg6fHXd4qQq+cJruvET89PvfSWfPAF9/5DlmpqaZGJ8knkigpcBJxGk0qrz4/IsIBLZ0SMViRHmLh54bJZ1tQTpNuWOpUkQAsZgFJsJohW3Z1KsNRKHGYmMRjeGhB58lDMB4HvNnZwlRGBU1zWO1Bi2QQDxug4jz5LEpKp7CspqLvbu/n5jtvCJR4HxY/dfVzqIwzQm+J22+ciLkoeMVNvUneOZshI4srPk6bbkYx46dwhYOGklbEiZWImKJLMqslpbVb2cQ/6pP5Y8mBEJItNFbgS98m9KiWYWjIJzFmMMY8zTApIJKyLeQgSIjSL6Kxdf3Ckdqbh8MOHVmFgF05BPcsHstoYpYmAuYyVzMyKEKOxIWbmmF7v5O7jpcohbmWJiLiDyNW/YQgYunYoS1ABnZEM/Q2Zbl2cPPM1Oe4MGjBd725p0kbQtibfztF54l0oLNm4aoVeoERoKlkJGmUK5wy8Dr3/xrKIcDixn+6kSOS+9K8oZH4rz/2CD/ZX6YydxaOoc20dM9gCDiAx94N+2dnXzjkaeZmp5lfGySWMwFBBIbjMG2Dd1dnSgjuOe+Jxmfq3HgxXHqvibXksaNJwiD8Jz6sVBYIQxDtNA4jk0QejiWhW3bCGPRN7iWM2OzHD92giAM0GEzDlxFBoEgFrPJZNMIITk5Nk01MFhCgGXROzCE61pIoVaThV755zvArL50lf1nBNREguemBLZuMhYjE2dppcGt+y8hn3RpKJvxgsKy4ygjV88Vojk+FM1Goa++oyXmjyyyrm7K3Q0DIL49HhxerrxuzJ0xiEBKecf+vIWN5vJO71wRuBDRYGtzHp9+usjghotob4nR05nk1NgUDU9TOzvCVHmZ3evyxMtlhndt58RSiaNjC3QkkwRaIgOoNXzsRDuRMJxuxHjh0BKb+x3chOKXPnmUD3/4rWwcymHFkjzy0gz3PjhCFHlcd+PVfOUrj2HsBI6QFAvL/O5FATf2X9gQ1JehjeBMOcHdY2k+9IiguO1aEpfdwJU33sDWnbuYmilgOzGk3Yz1LizN8I533EZv/wAPPXqAxYUCk2cmcF0H23YwUoBlUL7H9VdvQ0ibWnWFt9z+Zh58+HkaYYxaPaBULFKrVZudfC9gaXGJhbkFIqXIt7QQBgHxeJxMLodl2dTrDZLpBIlUgkgZapUKtm0jXRvXdXFjLpaU1GoVqvU6lmNhyebJoG+wl3gsgbRstAYprW/+AoR4xUX05bOBwWhF5AdIWzYty7HQq7u2MAJtC4w0GN28Cl3ZVeb2vV2MTJdYqkQIy21Gpn1LA84Q+D7vWmPIuv9nWZB5kcNnzydbcS8AACAASURBVDpgzItRGH3x20rgNx+BX/dwU8kjkRQMpwydbrO6X0g4Et46oDgyPcGGoS2kbcl//cib+Oj/fTf/5Z27CdNp/vyRk9y+PcHA5ALXb+8lne7n7+4dIzlv0Wpr2rI2qlTl1OQcl128maENeZaCGr/6qad553tuZte2fqRrsVAS/NGf3UdobPbv383c7AKhcLAAFUbsdANuG/rOHoavFSphjNNFi08ctZnrGeb6G/bxW+8foBrYTCzVKdSbCT9KrI5gjaFWXubaa3azdccuvvzVBykWa0yMTSAtiRNzUEavLpYI1wrYdfFOPv2F++jvbGdLfwsxsZlnD42BcHHcFPOT44xVRlFKNY0+kgla2loII0Wt3mBobRca8HyfMIhIJONEUYhjx3HiCbSGmONgCUEYBFQrVRzXwXVdBDZR6PG+d1/HsdElCoWgaWMuBN8kDnxTn/5NqboAbYjCECkEArFqyKqb9uO6SdO2jEEYgQrrvHkr7NvYxpmFKmcmVjBWDGOatm5Nu3eFMAIjDCGCSmid54n8aEOsFtqX1a3f4QzUvKs5roMvJX0JxfaWEPcCdzIFhjuGS3zuoRfZvGaITT0dzC4WuWj9EL/410+SzqQwxrBv/61E08doyYa0t0ru2NNBWy7OVx47iswNkYhJ3n5lBpWFg/N1Pvrfv85737ef226+mJhlU9dx/uYLXyTUcYYG2uju7eIL9zwCdhyBYW65wB/v8b9FCv1aQxnJIzNZfvcAbLl6J9d95Cqy+TZOzNR4aUajiQB3lV2nSKZS1EsVAr9Gd0eSm265hUcef5Jy2ePsxCRaK+LJJNo022lSCCLfY/++i7Edh+XlOumONG5CYFsel+wY5oFHDmOw6e7roi3MEwYRRimiKKRcrhCGhp7eboRlEYQBS/OLdHa14Do2nh8QqJBEOkGjVkMaQ7VcRmOIJZqnSiEEOlK85Q1bufrqPYiuBivFCl6pSrlcpFYpU6tUUVGAXG0HytUPqNYKjWkWEctpirIkYEtcaWPZDrZtUavUCMolbt2suWGjy9kVnz/4/EnsTBdR0MAoBbZpRuEZiRHNAiKlWA1SeX3x0MIw13ScxRLfn6mARKABIV9FDXjuxVISIbmkrU7eVVivwxzTlZqPX1Hhx7/wDT76M7dyarbEzVdfSks+yb0PH8JvePzJZ77CjZdezNvWddI2mKEyeojW7l6uv24ntrII3BjHJ13+/ktHOTK6yO9+9C1ctmMDrpMkkmk++7n7+er9h0mnXLbv2MTdX3wEYSWQQlAtLvPhQcVVPRfu6D9XT/BHB11m1mzglz92Ex1dXRw4tcKRpRpi1YZcGJozdG3QRpFKxakUlpmfnuQD7/slxsfHmTw7z/JigXq9juu6gEYpjbRks+NbrXLj/ss4NTaH7UgWVzwK1Qrr1/Zz+NgojqhT9mLMza9gTIhWEVpFYCSWFaOrp5tMJovnN1iYm6elJUUul6He8Ciu/P/cvXeYZVd55vtba6eT61Su6uocqtVB3a0ckQQKCCRAGLBBCAzYYBhmbOaOH3vwzJ3x3OHO9R0n7LGN7fGYMTDGgMEIDBgEQhmFVuigzqm6uivXyWefndZa88c+Vd3CgGSjFtz79fN0d1XtOmfvs/f61hfe731r2LZFHCW4rkujVsfxHKQkHSkXKV5/7UqPN931WvZOdoilS7FvkFK5n0FWI01KGR5HIZ1WG7/RoN1qUV2sUCwVyeayuNksmWwGL5PBdjy0kGk0IMFfmGf/7ie5ZrTDa7YMMd2I+H8/9xyR04+Ty2O8DJ36IjoKsDwXg/19hcdXHtt54+Ak8ie0+CG94lEHpsKX4AAMhl8aUawpBC8j+8+L23BW8SvDbT71lUfYunktlg648eoNlIo5vvrN3cy3LP77fU/x8DMZfvnnrmN1vp9jczFT8x6VZodv797Dt3bPcser1vPHH3sdK1bkcJwCiczz9fue5U8/fR85L8fl11zFI4/vQUsPKSBo1Ngqfd53UfuCKcJOtnJ88Hser3v367jr0h3M1jRfe7YCloexbaTRXQitxhiBMBrVCViYm6VVXeCtb30duUKBr37jO7TaipmZOSwrFe6MkwRLWunOaxRjwwVGhvt4et8phJDE0uHYqUUu2bKaKy/dRZS4fOvhQ+SyvQSdNsJKyLgSL2NTLBXR2jAzfZZOu83oihF6esq02m1mZxaQwiaJQ4J2hySO8TLZbm5uumKlEPg13v+Lv8RiUzHvuwhkmtdLkEZ0uQEEdiZLycvSaPmMbdjE6vEuKakgTQN06ii0MSkeRWsas/Mc3bOHTbk2b7psBfOtmN/92300RRmrUCZWCmlJcuUBovoMSWRwPIFZTjVeKJH1Stn5i38poX4lz2I4FzERZ1gSX/vRDsAY6rGk1/OxL+A48PebJTU3rww4eWCG+x5vM1LI0h86bFs7wsg9N3Fmts3hE9Ps23OMD//R18liEWtFNZKsLjtccelF/MG/38X4ykHyoxvA9olCm7/75pP89h9+nlJvPytXjfH0swfwlYUtBUGzzrip8YlX+YzkLkzlXwAfeybHre+4k1dds5MH981TicsYKdLQt7v4ldHdp0KD1pw4cox2s0WzusDlV17Dnn0HqFbaVCqNdAzXzZLoJH0HmT7ccdjh6uu24zg2tUYMBmqNKnuPLNJTHiBjNanUW/T1OIBDGDtEUYJtCXy/TeA3sR2bVStH8TI5giBgbn6BWqOFtG2M1rQaDdAGN+Od404QaZgZBz7vvedWVoyt4rv7agjhYoyhC+s/l/YbQKQ1+rF16zA6xQRoTMoVoHVKxWrSeQajDY35OSYOHmJELPKzV4wQKM1/+8p+5kMPr9xPolI6c4HkkmHD3T97FV946CAPHmljuzleqZGuRxZXsSm3yHD2Hz9Pjcjlvy9exEhG8ZbS4X+y0M4/1wKVNv5epAaQ/lCphGbivuJ+UmDo9xq8Z4vke49KPvv173HX7dew0lMMFlz6Ch6XblnJz73uGqqNJioxFNwEN1+mr+TRW3IwmRLOwDAJPQRxjj/9q7/hC196iNEVa3CyOY6emENID2kZOo0am3SbP72hzVj+wkU6BnjViOZvH32Wndu3E7UUON2Fr8/nHe7m8QZqCwucOXUaHQW89wPvQik4eOgEjXYqr21b6Q3VWuM4TpfCWxAGHa668hLiKCRSmu1b13P/Qw8yeWqKh5RgbKREJptn06b1tFohlVqd+fkFxlatxXE8/E4HvxNQr9Wh2SIIIlp+B2kJdBJTrVSQQiAdC2mLtP9P2nzUScKGNQVuueVVPHuyRSyyXSipRhqBEqILyIEkjLBdN/1a6+6/6RNnTMoMkY7xG4xSVObmmTlxHNmp8HPXDyFdwR9/bR8nFxOyfStRyiDQGCUYK8F7rh9iRTHkl27dRKQP8NjRNq6bBxQXeu/9ZmeIAafB8A/gNj1YLyJ7CoR9RaLGITKvUD3SGIFO71UI/8gBvBAWrGPNVCQJlHNBCUF+mA1navybi4d5z1MRv/eX93LHjVdy2c6N5LOGTBLgOTYr+vIU+8oM90BHZMllh/FbZ1JCChx2P7uXP/zTv6bVkazfvJNarcrsTA3p5JFG06ov8PqekF/f1bmgi3/J7t5U4anHDJ/67L285U2304oTztYVjchCqxjRnanXgNCCUydOYluSxWqFDes3cHpyCt8P0BgSo/BsB2NMd/SWZTRe4AeMjfalXzoem1ePUa1Mc+DQEUDS8COkY7CMwOiIenWecm8fU9NzxFqTxBopBErFZDyXKI6wpCDodGg3W1jSAtIhIW2WFr+FMTFRUOPd7/4Qiy3NQqurGky3Wi8NS8F32G4T+D7F/j4sk3YAVDf1Mhia1Tk6zTaul0MUi1Snp6hPzxF22rxtm0tPFj793aM8PxWTLQ2itECQPqeWENy2Jc9wQSMw9GU1b75+G4fOPMFCu805tucLZ/9+dM8PhQBfPlAhWTzJmIkp5V+ZtaWN4JtnMnhGY4w5APxwHACAkHJkys588F+ta71iIcr3mzKS0fUXsXtinsnJCg88vo9moCj2DpHxSuC4RBIyhQFWjW8j29OLr+Hr9+/hk3/9DR5/5gSjK9fjuC4HjkwR6wyOk0WrkGZ1hjcMwO9ePU//ywRpfjETAq4bUXzr2RrPzdXYOr6aVb0FWrUGs/UmjpdjKQKoLyxy/PAxVNTmhusuY9vWbTy99zBHj55EJWlebEkLIenSmItUsttoxoY93nj7VfgdzdHZiJPHj3Hn627iuWeeZnFuhnazlsp/G4skMTQbDdxsD3GcEEYBSRwQBmEK6a03CH0fv9kg7ARorbEsie0457A8aASaJPS5643Xcv311/LU0SqRcdFdQpC0PgB0G8oqSTsXlpWKkaIUizMzOLZFdWaaPU8+zdljxzk7eYqoHRM36ugk5rK+BldsKPN3T07y3cMtbK8Ebi5lcjbpa/UUBa/dXKA/B0JYGGz+17f38v7bryAyIUfP1HnHmoSh3IXDAfwoCLAUsDrXouy+ckCzSpTjbc+UsJIYrdQntNJHfmQNIInjIxhqBsraiFeEH/B8C5TDZ5vrWPmaS7l4qgZRyOTsAseOznLk5DQp4FSzZtUqdl2+i3Un2wRhjN8IaMQZekdW0jw1zYMPPUPGy5AvlNFa06wvcKVb5yPXGHb0h6+4cyu5Mb9/XZv/sPsgH/+Tad7/nrsZ7HUIvBGqIVg6Im63mJw4Rbm3xNljZ9i2/SIWanWmpmbRKi0SimUcfToGm+6ykMQJ69ePksk4JFpy7OgpRoeHqNYavP99d/OpT3+eucUakwd8hKWx3LSlFrSbKURWpeE3iUJphUqSVBwEQEo8L4Nl2WkeeV7/XiuFZ8fc8bqbmZht0TEey+gR8UJleiEEmXyuW/BM8fnTE6c4c+IExVKR+blZ2o06UtisWLUerRQRFgNmgRu29HHf/hn+YV8VaWUR2UI35xcIkaYadjbL3+9vYV/ay4aeGIHhA7dtJetGvO+mleRtzf/17BR/dN1P36Tny2XznTxlL9V4sIQhUnLp8zbGmCl4kQigPNAXS8H/cWXRyo/lw1dsqEEbi784dhG/M1nirg+8k7//yrcp5lxmqguEiSGXz+Naqe9qtUNGR8cIAsMTDz/No488yb5n9vLs3sOcPHmGar2JMQZtJAPRAq/OV7h7jcVHdy2yrtTClT8ZJJhnKW5bGWD5gt/80mP09vdiu3li6VCdmyZo+WRzGWqLc0gTc8edd3DoyASHjp7ogm0aCAGOYyORKK0RMq0HJGHIHa+9go1rh5Ayw+GjsyzWfBbmK4xvGOWm665kdLDE/MIstVZEokJ0HBMlEVEYouIAywooFmyKpSz5Yh5jJLbnkstlcR0P13VRSzk7AoMmCXw++IE3s3rNBnafbKBwulgfsxxwp/U/ce4x6/IFhs0206fPpC3Btp8KjSQxo+s2YIyVsgwHbe7aYjgyU+WvH54By8FxStiZzDKgSEiDY1m4nkcj8nh2qknBEqzosclbMVJICpZi27p+ZpTgM4+3uGGFoeD85Kf1Xm5bCLPM+Fl6vYhA2Tww3cP9MyowyrS1Nv/VaN18kQggwbMtlBE/6rCX3ab9DJ+YDvhP//bnmJqepFJv4hAQRAkIm1hDpBLq9TaWdHh6z16UMUgFCTGWkSCyaK1QtNicz/LBLTahKbG+GDOWTVWOftImheGe8TqnW2WmEodofh5h1/FcByuXob5YoVFd4I13vI5OGFOr+9RqNYxKMfrSSitHKeGuRBvTDa0j1qxa0cW5xGzduoGHn3ieRjvgkScOsmPzCLt2beXVr76cdn2eZjsiSmKCUNDoaJxMDmU09XqHM2emmTg9RRQbpG2hVTogZADHdQg6KXWXiiOGB1yuvmoHR882UMKDlA/0RWttWkCz1sBxPfLlXhbm51i9cT3FfBE/UnTaEe3AZ0dvSENZfPLBeSzHReMwtnEVvf0DnJ2YxG+1kQi8nIPSKalJoDz+5gCcWGjx1svL9NodjHbosQLedf1KvuQKPvLocT5+HQxn/7/D+vxS7Fg9x4GazeqCz2KQ4WBNok1yGMyUlHJK8SJtwLTK7JlXqmOqjcXpVolffcrlo798B55t+JsvPsxQbx9zlSkS7eE6ORrNBu1mG4lD2FFoodFOzNjoEL29PaxcvZqvff1hBocGqFRiDtR9DlU05WIfnzzYYtgL2DkwwFvXL3ZDxp+MJVryzHyBR6NedpV6iI2ht38QPwoJ/ZCO36ZWreF3Ir74xXs5dnwGS6YtT9tOgT/nzAAKgUUYRZTyTqppYEkyGYeN4xuZm5ni9MQUzz5/Ar/V4OZrN/DL73kDC+02U2fnMULQqjTY+8RxWp0OrU6ATlJSD2m7JCpBILBsi0wmQxhFqQMwoOOQ9777rSTK4VQ1BByWpniWN/vzL76LWDRL7UApyBRy2InLmp4iXsZBGoEdRwTtJnbYYLGd8I2vnULaLgrJwNAgI6tWYFsOGzdv4tjBQwTtFrbMdFt93Z6jtHiiYjP1YIt7rsgxPqDR2iUjEt525Qg9hSz/+r79/NerYWXh/z9O4LqRRQYzRRaDDI/N5fmTMxKh9IzR5rGlu/EjUwApLWQms/HWAXW5a0n6LhCD6pKF2uEP9vew9Y23Mr5+FV/95jPMzNaJdUi1ntBqRtRrdTwr4bJdG7hoyyoqjRqrV65gw6Y17Nq2lVtvvgY/DDh0fJpyuQ/LdgCbycwYzzUEE506m2+7mT9/bIrXDNoMXEBSiB9mBjheL/EbT/by8Ykymd4+MnmXjePj1JtNdKLASCZOnCBqt+iEMV42T7XSREqLJInTUPr7AjMh0lQg8tu895234doW1XrAYlPQ7CRk8lmGBgboKeZoNkIOH52lqmw+//mn2HekwvMnKpw+W6Hp+0Rhgue5aMC2rOVCnSUlPeUSlmURhSFBEKCThIEy/Py77uLIVEQtsNDLK3sp9/++UZ/lL9O6he5S01hC4nrdZ1JIeoplwk6T/XueYWKuAZaTkn/Yks0XX0wul0NaEtexyRdyVBcruLZ9bm5FWCAshBHUlcPjpyKKWZtV/Q62MkihWT9SwJSK/MF3KoyXXUZzPz3cDz+OGQTN2ONUy+PPj3nUEoOK48QI/h14FaOiHxQBnNsR4yDELuQXF0ObILmwGm2xdtmz2MPzpWH+wzWX8u2HnuTI8RmGR3o5dvIMc9MNhoayXHXZxaxZNULWM7SDmLE1owS+4q5bbmTF2Aj7Dh/nyOFT9PcNEsUxYRxR7CnhuJL5+Xk+9P47uWrXNlwlCWe+eUGv6QeZn9h88lCJv2gMsWHTBkqTM7TaAU99bzdr14/jWg6BCqkuzFKZm+Ltb7+LdZu28Ny+wzz//DE8L4tSCZYlv280q4sj0Jq+sofrWmloLh0W67W0tS7AcW36RwYYrtbp67EYH19Bb+8YnSggMQ4qiaguzDI6PEKj3uDMmak0rVBqWTRE6QStNEms0FpjdMg977gDY2wmFn20TDsZS3Y+8HY5mvw+NG4hm6dTa2EMJImiWO5Jf6BhYbaC0gJLemAsMLB+43qKxWJa9xApYajtODiek5ZEhcAIi4t2XoLvdzh7agKhE5Tl8JnnNFONiDu3ZSkSYEcRt24pk3Ev5Ve/sJv/ckUvVw+/fAzY7cTly9MrWJWJuGFw6mV73R9l6TxIGgV95bTLwcAQJ/EREL9ttJnXcTro9iID0QKZxDPKyH9ECHIhTnkgE/D8yVl++8/+jr5ynrf/zM382Sc/z+JiwJp1o+zYcRH1Wg0rV2B6bo7vPf48V1++kTfedj2WdPjOwcPsef40B/edIF/up9msk8vlsG2XTifEs2NWDZaxdZtaq8G+isvOgQt8WefZE7M9/O4+h8LVN/PW8S3c/90H8DI5yqM9+K0Gzz71NOXeAQ4cPEwx5xG0mmzasA4/DJmbr+B4HnESIcTS1Ny5RXbua8PQUA+yO23X7sREccquuzwJpw1BELF5dR/r+rIU3DzTtSr1jiBObPqHx2g0a7RaPlKmfX7LtpchykmSOoI4iTFG41iKzePrOLsYoqWXUsl172n61Cwt+yUo7tL3zfLfQgjyxQI+TXL5ApbjIIymNj9PpbqItOy036E15b4SK1atSSv/0ur6PkMmm8WybSzSD2hgZAWFch/5MvT09TF54jjNWh0jDN+ZkJxZbHDP1TlGsmAZxas3Zcm8/XLe+ldP8/nrylw7UntZ7vujc73sKayADMCFdwDKSO49NcQNo00++L08xzoJSDOVhPHHhBCfNuoc7uBHOwBhkFLef6ghuXzgwubKjox5dHaI4aLNm265BDeT4VOfu4/tG8f44PuuZrbu87nP3kex4HLkyEmkbfjIB3+OHds3c+D4EZ4+PMPhE9OcePYYw0NjJGiaXbypThKqC3Nce/VWEC7Ndofrrr2UR555mnvGL+hlAdCKLf7vZ3r5djLAz7zrbWSKBVrtCFs6tOMOhUKRbDaP77eYmp1jeMUYKvLp7y2ycmyUh58+RNCJsS2LqBMiLfkCsdI0pBbdbkfMyNAIru2gkoTTU4upxp8UWFoQC4Nje7RbPhdv3UbGs5g9PY0xEiE8jBBYnkf9bJN2o32uz9+F74pux8GSFlEYg1Zcfvk4ff0DPLevijHeMovPubPrdgDMEsLvPOcl0u9rAblikWw+n6L+jEGHEZMTE8RRhG07RHGEFJJMJkOrUSdfKuE5dhc4mFKOr9+0kVa9zsL8IiMrVyKkRGLI5HOMb99ObXGB0ycniIMOh+o2v/8dn/ddm+Oi3ggSzXXrMvzR+y7hHZ98ls9eW+LakR+PDWoxcHk8HOZO6xhXXCBdje+3WFsMZxUf3d3HiUChleoI0GjxdQPnibb8wBrAC01acjgj5b+4dlCzIn/hQAuVsMAbH1H84f/58zgm5nP3PkgmW+L2265H6piZ+TrKGeDIkSPceP2lvP/db8Ei5unDUzx/ZJ6nntpPq5LQO7ICmckguwAZYTR+u0qnWWVgdITvPXWIJ587QaAsOqdOc+eaNspYHK4PYgtN1n5520FPzpV4w/05xm64lTvvehOxtOkEMYlKsC3J6ZMnMEbjehm8XIZMLkshn+PMxAnectfN9PQNcPDEPItzC1SqiylzD+fN0afd77Rv3+3Fb147yE3X7qIT+FQDh/lqmtPa3TkDz7Y5uPd5rrt6nIG+IifO1pg6c5Z2kOBlcyitcRDMz87iOOeKeZDy/EvLQsUR1coc6Ij3vusOjJ3lxII4d05i2WdgAX69RrNWJej42Laz3LJcOsZIgTDQ/QuJYWF6hpkzU4R+i7ATIRAMj/QzMraKarVCo9Gk4/vkCqnidaIUxmgK+QLtdpuxDZswossnJtJPKpvLMbp6BZlCkTgKqLZjnjjepJz3WFm2kTpmrNdh2+p+PvSNOa4oe6wq/PNrAjlbcWPvLGsKbZxXqI2+t9JHrAXfOgPTofYR3AvmU8JwIFFJ5/xk7EU5kZJETT7RVLVKZJUv5EkfrufIJh32H5vjyd0HGFyxkquv3EZo5ZieqXNitsWJibP8wnvvZLh3kOMnpjk5Oc3zxyaYnKqyevU6Mn15/CgmjqPldlijMkcctxkZ7OHWq7fxD995kne9+Raai9M8vnIlW74cUfcTsp6Pkymwmiz/5YqIy4d+PDKQVmzzPw8VuM/eyL/56J2U+4eZmG/iRyrVzDNQ7htg4/gWTh4/ztTkNP0DfRR7ctSFoVmrsGHdauYW6iAsgjAF6SwX/paYM4QBk+opCtKw35I2RhtQijhKEICNIBYJcxMTnJ2YhihgcrrKY08foNw7hNYuxVIfwqQL0clklynCllIL6LL0GE0URmgTk/VgbMUAE3WTjuoa0olzY0BI/HqNvU8+RtGzsW3J5OQsRjps2Xkpo+vWoC2JhcDS3Zig23JOW4M1tNKEQYAyqdrwwnyVsdWrGR8fp9FsEZskBSHprhyZgUgnONksyKW6VVeRuOsEhDGU+3rp6+ulUa0yPXmW//HUDCfnLe7amaeXNlevdfidd27lns88z2euefnSgVfCSk6CNjZr84bd9WRSIIaFEPkkiSuYF0byL+oA3KxbB+FbJBfUAQxmJR3b4sv3PcHrXnsjwyNjLDQWaLbqVKs+YZJDRIaNa/sJFExMK558forFuSpbdlxMoBQtP8ZoTVBvsDB7jKjV5Bfe82auumIHlUqVLWOS2sJmxsoWg0OjvHrnBrRMp988L8e3nptg19aN/OXf38/eQ3t47+bqP6tNeKye4zeezLDx9tv54LWX4+Ucdu89Qi3Mk8nnMEaQJCl4ttDby/iO7QStFq1mA7/j09dTxhOKwaERJg9MI6Vkbr7SjZ27zXXTBc93m7Tp/L1Oz1eQzkIkCVECusuo0260adbmue2mHQwMFBjtNfzsHVdzdjHmm09PorpIMSnSBeh43jLQ51zQLkjihDBKtQDWrhygp2+A6YlqiszsRgo2gvrcNEeff5rxtSvZtHYVjuew5/kjHDs+zf7du1EqYuX4ePq64rxqgUh1BGrVGkJAFIQYkXIARFHMc08+QyafZfOWLZQH+/FsiziOiTFEUUjW8egp9qS/s/zAp7hRhMEIiRBpHaKnv4+e/n7qtVU8NzHJifvnuPvqIhtKHa5YK/h/7r6Yt39qH599VS/XjbwyIfyPaxtKdWpRBkQvQojjGPNtY/j7F679HzkNeM7iKMbzMgunW2KFMeKC9c39KKRgGX7z196HY2se2TeFhWSx6dNuBdRqIbEJ6Ovr4/TZOn3FEuXePpqNDlFokSQRKuqwMD1J3Jrj13757ezcso5cRoJlYSmXjC1Yt26U02drmKECJa0wSRuBJtSaqflFXu1u4D0/cxN/8TmLSxYe5pLBlx7+KWPxyHSe3zhU4gMfuptVq0bwOy1mz4bUF6o8f3Q/TjZHy4FQTQAAIABJREFUT38/cRyho5gwimm3fRzHxfY8bNeiUl3g6qt2IZ0sczUfbTRJHKGV6j7ALO/2QBcKfK7brk23Jdi9VbZlo4FSTx/hyEo+89kvsWv7Wj720Q9w4PgZ9p9uYmQ2fT2dtuXOzxPTl00Xk+7O5askAqO57darqNSadGKWF7EkHfQ5enAPG9as5ZrLdnD4yEEOHz7OJVdeTuDXONaGI3uPMbxqNW42R/dCUgfQFf30/Q4YjUpipJvS1wshyebzaKPZt2cvURgytnKEdes2UOzrxcnlmZs+S3lw5LxGxHkF7HNY5FTDoOtMS+UyxZ4eqnML/P7Dh3nrNptrV3tcuUbzm2/fws9/7hCfuv6nPxLoJOmk/+lWls8v2GQcbomi8CMqTo7+oONf1AHoJEHZ6isPzFg73rreI2+HF2QmoBUrdJQwNVVD2BqjDdMz88z7Ce1Fn6iZ0PFr+K0WF61ZQRzPUq1U0caQqJhmpcr81Eluf83FfOA9/5o4mEWKCGMVODtboZDLcejsHLsPnGHP8SaeLci5ML6qzLqRHvr6hugkNrV2QMZ1uOGGK3ndx55h3+s1g9mXpgr8nTM9/KeTPfy7f/uLlEsuserQk3PozdiM9o5z1c4NnDw7z1SlQyd2sPIulWqVOFC0Wy2kbSGEpFGvcc01dzIzt4C2HPxmFSklWscYNMJY3fn7tFiWqBgp7W41QHSn8wxCWhQKLrLeRCvQGnoHRrnsutdghTMsNBR7TzU5Wxe42W76DSBAJS+shSz9yO90UjBSEqUV+Z4ilUaEEPZydCmF5NTxw4yvX8Oui9Zz75e/zPOHj5NoyfMHTvCOd93FyWOPAS71xUUGV+WW39dvt9FG4zgpDZkwCZhzBKJGWihjcFw3RQ7mCszOLDJzdg6kYc2a1XTabUp9vamYqxEvGLEGk5KRQLdwuvTWaeegPDREYaCfLzz+HJOVJm/YVuSmzZLOmzdy998d57u35VlXurBq2T+ORVryl4cH2L0oyEtQGte27ZvPOYDzq7ovwQGoSGE8Hd7X8jhaz7KtN7kgKifjZU3ZzvDV+59i9fo15PKGTNFhfmKGVsMQhQqjXcZWjZBEIcKNMFYGFdeozU2yMD+HIWbXlZfT8H0GewdothNmFtu0WhHtRsQ/PDzBnkNTxAqk0SxKizOLLaQ1TRLv47KLxqjHGeb9hL/95tNct2s7b3viOL+3rc5lg60XoCEFECoHz4q7H6ngbyc8brzpVfT2DiGJiBNJs9MhSRKUikFYrFwxhJets9CIKJXKrF47xtTMPPv3HSLuauAFrQZjK0Y5udABBSqOEaQh/tItXHpykyQhk80Sh3G30GUIwwiVqJQ3T8RkMw4tPyYW6WJy8yVKmTZhYjg91cLO9aCN7o4TpReXRNF5TTq6dUCD53moRBHHqdpwvtDLbNtJ04/ugVol+I0qpTV9JEGDY8enGBkeIU5g+uwCEycnWbm6zOSZFrVKjaFVq1jiB8jmUwxBs1FLC3txDNJO25DSkAQKpQ12VyvQiDQVEjIlCT19+gxJkjD/3W9zmR+yYvVq8j1lIqUQlkQpRScIyeXz51U2WG5dGkjHsRN4/LTFVLPFL1xZ5s7tFguNgI987yx/cYNm8Kd0gKgVO2woRvzeSQ9bGLRWgFkjLbnM2XC+vSRidMuyvuVK/vOBqsu23pf7lFMrOQm/c4XLzz/wMG8e6qOQ7WN2ZppatY3vJwgj8FsNSj1F5s+mO78xGmE0kxOTrFm3gVa7xe99/LNccdXFjA70ksllQSV0/BYPP3GISr1DHPnoJMRggRBI28V2MyiteOTxCq1WlYVKh2aSY0XR4e1vuJHfemQ3103Pc8MKyUAmZq4j+PQRmz2Lmjes8fjw9nnA4cNbIj7+wNf58Le+TZhIlHGxhMJ2bcIwIFYKgUFqgZAa17MZHhlhxdgqAj8A6aCSmJUjfQwMDPK9w4cQKJIkAmFhUN1dSy+LZUqZXofjeumitKBaayBlwuRcC8ct0VuQRIGiadLZvFgp+ocGAcXZuXk2bxsgUYbl4T5j6LT95cDZLP0x6U5pSCm4tdbM1hSzHYWwu8cJQadVZ92alZAE1BdrZEoFdu7cTrMdMjtbZ3Z2lsHRESbONIiCTkollmjiKEoJRY0h7nQAk0Y9FtiunWIQrO7UI3S7Hpp8Po9AopUijgKy2TxBEPDkQ9/Ddh5lzbpVbNi8mUwmh7Qs8tksMmihVIJJEoS00NqkWoaJQicxPdQoZgNu31YkYzWxHMM7rhvh2FSNzx2X/KvtHV7+OPjHN89SdJTknmHF38xYaK0TNM9KYaHoMiSflxK9JAeQJGpaCBl98YznvmYsy4pc82U/cQ08Mq15y9veyNlKkzB0OXxkgbCTIDGgOqxdmUfHMYViliSeo16v0GrXWLl6NabLGJvJlHjgwSdQfgfhSTKZHkASRlHKYEM6Hy6FhUaBivCbPkJoHKfA0/tmKJRLSOkzU7fYd3SWN127gy8++CyP14s89p0TSM+lYGt+7Z4r+buHjxHvM7xrvM3O/gq/fWWO39nXw2nf4pnIgqTDVVdczNGTk1QaASpOQCUkcQrQOXt2kckzC/QNDOFmbYJ2k9ffcRN+RxFGaVEvClMqbWPSfD6K4uXwVXZBQSlYxyKJBVNTc3TCmLGRQU5Op+mO7VjohsZCYlRIb3kYYVn0DQ2gu3331AzCGJrtFuej+QSCMArSUFkJtDIMDPRQbYTYniHUZrmVp8KQVqtJRtiMDLlsv2gTBw/sJ9Jpkm9JG61TgQrHsdFKU5mZwRjD8MoVSC1RHVLJsURh2ykMWSJxbDvVHSTdqdGGfLlIPlcAI5iaPk0uX8TzsvjtFlEYceL4GU4cO43EIpN1yBVcBnpK9Jey9BU8ihlBPiNwRIJtW9iexeWX5+nJZRnJJDiWJIgVnmvx5pu28YW/foIPb78wStk/rhkj2Nkfsmchkw6LxZw1moU4WkpjXwjoe0kOwHPcSSwxsyeQq78yUeIXN7/8HIHaJPyPeoH/eMnFeEdO8NDDB0mUQtopDj2MOlx7w6VI5RMEHYSVQWnDipUrsSyLOEl3V4ygt28QexDyOY+Tp2YoFPJk81mMtoijmDBsIZF4boY4iektD9Js1ojDNhm3jN+uksuXiDA8Ny3JyEWu3bmBi3eu5xdu3siXnzzJ3iMVLhuRXPSzF/PxL+3hr48K/uX2DgOZNr+ybZEvnephzynDO9/xBiKt2X98Gtd16cQxTibD5m1bCYKQxfkFOn6Q7vBaEnTabNywgan5RaSQKX2TPm/+X3QXjU53ZNuxSBLVrXEbBBZnpyvEWiDihNnZOQrlfsKgQ+h3yGazqCTBcWyEtCgW8ihtunyE6S6eRGGqCwjLM/+GlKI7iROUjsEo+np7ueGqnfz9A8/hFctoYQMCaUE2m+XYyRNcvfNWzk7t55QSzC60sEgo9BSpVpoYnbbjBILB0RXLmACBJgzbGK1TafJufQNhsG2Ljh+SFgQFGk0SJ90agcYChJRYjk2+UEDrBsJyieMEo8FPBJ1KTKVaSY+3JVoroqiTplpGQpeVWaJxLEPGEdhS4NiSajvmo5vFuXTpp8wKToSf2Hx9IR0WE0J+C2Ha53J/WHYCJi3YvqgFaR77WWEMD81ZhNpGm5d3NuBUq4AVRVgCLtuxmRtetYW164coFnKoKML3Ozz95GGOn11kdnaGeqXG0MBAdyRWYAmJMdCoN7EtD78dMDtbY3TFGNlcDiEFSgdEiY+wBdK1Uu59E6KSgGKhFyMliQnTPDOOMUqQ6IgnJhVnmoID+04ySJt3vnoTczMNKh3JoBvyy2+4mMaqldx9f5G9iyWeWeylEsbccOOlDI8M8+Bje8jkMly+axNr1gxT7iuTyRfwMln8ToDt2CBSNV4VdxgYGMIPVFedWZGomKXCjSDlAEjjcY3tpNe/xLQppI10bGbn6niey2BfmVwmgxAapRRRHBGFEY6dtglty1l+IKrVCq1Gk3bL77ISLz00aVQgSPvtWicIYXBti1LGxSXAkSB1Kg1eKPXw9J6D5AdGeOzJPXSCiEa9RbcMQm9vPwuVBtIS9A0NpYSoQqRc9UaghSZKghR6rDVWyjUOpBh/KVPHJEnJVOMkSbsjUiAtG0tIpOxKmTkWbiaTzjFIyLj2Mn2alJJyTy+lUi/9/cNIaaMFKf8AFgqLROTwRZGmznGyafjNrYp3ba7+VC5+gMRIHprOUTGptoLRWmHMD61iv6RVHAUhtmV/SgrY3RbMd5yXvR24pafOh0YVX733Wxw9PsXCYpWpybPMT52h4CXcdMtVTNVsvvPwcQ5PwkItwrZi8rkMkpS7QHR3dcfNEMaGTLZAEIYkyqCVIIoigk4LS0okFo70SDQEQYNcLkO2UEInGsdx8dttlnTuE5Xw2LE6Dx6t8fREgAgSMnmbfZMtEmUxlFO876Y1/Pq/eDWfE+M8OevzlRnDrl07OHriOEoZHBFx43VXs2ndWnpKZSxpMT87zchgiY3rV1LIu6gkZGS4j3J/mdmFeoruMxAGKXfBUvCmlSafy5HNZonCaHmHxqSYete1qDUDLMtQ7iniByFGG5IoodMJiIMQSwpUEqZ0WdqQJArX9QiDkFaj2a0x6vNajV22Xq3S9xKpboFAMTA0SMY2eLaNlALLdVi5di25TIavP/AUDz6+j3aQYFma8Ys20Gz7BGHCus3jOJnM8s7fLUCgEbT9DgJB0Am6DuBcAcu2LVSiumelMUotd0DcbBYw6TAQBpUoHNsll0+/XygWKJTzFPuK2J6FdG0sx8GybXp6y13EgwPGQguBm+8hm++hrCK++aoWP7uh9n1B9E+XHa0X0SbBFV0WZYwyxuz5Yce/ZHXEOIqnbNuuIK2+PzvUy7/blVBwXr5RWiEMv7KjxheP7+GTnzrA3o7F9SXFdOzylptv5pIdW2lVWnzn24fx/RZONoudy2IwOJYkMYYw8BkaHCFRBjeTxcvmicKAJElScpAknWdvNRvkcyWEK7CkJO4EFEsO7TgDMURxSMbL0G7VyReKaJnubNN1wVcP+hxvOgRa8tUDIbVI8oYd/fS4Iauykn/52nWcbK4heGKCb33nQWzHIgh8gshw6MhxoliRxDGTp06QhB02bb0Yz7HxXIfZ6Wluvf0qjFG0OslyUc33g/MAXOnjF4QRSiVIuUQFJrqwVxC2xfce382u7auI4w4KB9uSCG3wOz5xEGJ0WsST0iIIA5IwQqt0V/XbftpihHQX7hYHjT5fHk6glMZyHBbaihXlDDM1H+FlMNqw+aKLePyBh7j99a/n5KHDBGGbNWvXUyiXeOThpxgYXsHqDRvPe71z1yeEoF5rIAWEUYSX9c41roTAsh2USnC6n61rLQXkAsdxCTs+2UyeOFbYto3r2mTcUqoxkCi8rAcIMm6m6yA8tLbIFyyatQaJjhDGQhiJsAzZ9iJ/dX2N8fJPb/tvyeY6Fg/O2OnUZpIghHjUCNPN18/VeV5yG3DpQKV1TWi9Wwhx25nQRpk043w5CyEZS/HO8TpvXu8Qa3AlfOJAH/c9upvtF21m567ttAKLxcU2SRzhCMjmPcIoJgkDij0lsCQ6iZcrw5lMhnptkWazCkKkQpbCsFk02B9kcDDceMV6Cv1FFpsBSUajI02sFRnHpd1OnYWxBALJdFsztb+CcF36h4Z4dLoDpsbdV/YhCdBxzNqM5kM3r+F0RfDp+w7SbDQRaO67/zGGhkdpNBrMzy1iSYtjxyfo7+uh0fCJwpBdO7exuFhhiTtXiHQ3PN/OYVlkF3yjWQ7VActyOHR0kjAWlAoZKr7GtcC1JJVGRBxHKeZHabRWNOp1nO77zc1Og0qZdBFLr2qWHUFKw2hAGIIgJo5CjJ1lthFguR6JAUjpw3ZdcQ3PPf0E29atolDIcfTkBM/sOcjaDevZsP0SsJ2Ur8OIJQQwBpBG0qo3kCbudhdYdhTGpJwESRyliES/xZZLtlL3YxzbxbIMuayNEYIoifFcGyHTcNh2JHEcksllECIVUAk7HdYMFChYMRnH5pDq4+jZhbQOIDRxJ+SdqwxrSy8NC/KTND9xWQwEX6vbFO00WrOEdTyOu+xX57zo8u+8hBQgfdzi0MIYc6+UkrvGQo7U8yT6wnAE5OyYHjcma8d8eNs86xYm+MLnvkI+l2V0tIcVK8v09efSxa807UihrSyl8mA6/SUltu0ihMGSBttOB2VkV6X2vSMhn7g+4TOXNmj7AbfeeDn33H4FA3kXx3XJZ3LY2MRRTMbN0mk30WGM0AadpLl5Emn27jvM6ZOTfPtQiydPh8TCxiSSRCuIA9b1dPjF2y+iN2fTOzDC+vGNTJw8hd8JKJb6yBf7aLQ0J04vsFBto6KE3r4yrU7AklquUooojLuCGakt7YR6WUWoe5+6vXopLA4dm2Gx0qKnmCUIQ5DgWBZRV9MvijVGSNptH4MgDAL8ZhMdJ6g4Xr71pgs2MhiUSqXAW80QhEW7HdDudJCAsj0iIeiWYlEIioN5rrj5OhpWllPzbXL9Y1x5y2tZs20HwnXTvF9IurXN7r+COAhRcUQSKxzL/r4owZCCqA2NapVN61cxvn4cvxPQ6XQYGx1ky0Xj6CRBYpPEMc1ancpChXbLR6s0rZJdrjJlYm6+OMuHXtPDL1zfxx1XDuBIF6HTOkvcrnLWT3h4ukgrdjCvMD3eP8XOtHM4Ehwp01kQYzpKq1kpbbr5YffIc5v2S1jBXc+btNBKf1krxf2zHjO+/YqQhHqW5vevXWTn3F4+9lt/wO6nHmfi+PP4jRmuvWyca3esY9u6AdYOl7BFgpQ2WDZLsHTfb9PpBEjhohLFVQXDey9qMpJd5LLBJn9yhcMn/ue95IpZfukdN1DwHGzbxnZtHM/Fdb10Qi6JaLaqJHFCFIXk80Wk9EgSRShc/vj+Re4/0sEXKRTXaBttbDwZ88bXXMnKNetoN9ps2rSeZn0eFYeAxgiBtCy0iRnoz5AvFIkSMEanEtutJiql6T0PuSbOhf9d7D50F6rR5HJZ+oeGOXTkBK7jIkhnBeyMJEahjCToAn2USvn/3YyLm0lDbaRY3vmNSaOEJEnw/Q6NRos4SduQ7U6ESgS21Y0UDAgjSLr/j5RGWA4Dq1cxsH0DudEheoplYml1ocZpcVFLliMAgaFZrSKlIImidA7ApL3rpTRIKUW73UJKzbatF+HYAgtDMWexbs0a+so9ZFyJkOmxQRAgpcR1XKSQ+M0WnXa7Sytnc/pshSCI6HQarOnN4FkaKRNuvHw9v/6ua3G3ruK3JjKsv7eHL5z4p4/EqJe5YP7DrBXbRMqQtSRJEiGEPGESZhB46RFmuVi8ZC+5BgAQthamrd7Rw67Um6uRzayfu6AKukvmWYpf3VXj/Vsl0AYkM77NVx84xf3JCCPD/bz1DbcQtJp8/bETVLSNStrEpkmrVSMMNFobPrRa85EdM8tjmbZIeN3Kafyojy/d9wTv/pnbueWKDXzjyTPk3CANMYM4JZ6wbCyg4/sIA+W+MtKyUfU0IlBC8OffXeS5UwG37SyzadAiYxRYLj0FAdIim83R29vH+HjAyWMnutz6mbRDESaMb1gNWOzbf5TEzmLZFo7jYbqg/u7gb0p42ZXQEt0CuVYKrQxCGAZWjBIlCV/7xkPccP0VFAou9VaEJTW2tNDSolKpgliTwm4t2Z38A6REdptcSqWMP3EU02y1SGKNURohEiwkUQTNdpucLQhjmWIpgMASiFig0BiVYCchImxRVAHlgsXcfIPc4BDC6DSbkBZLrAFSCBbmprAE+F0nmcQJjtslQMXQajZ562DMQFZwJg7JZPpxbMOOi7eCUdiWlQqk2hJjBH39fQRBQKFYJAxC2q0WQhoUHpaQHJtLaGwd4rnDJzg2s0ChVGBscJBsvsDgQJHxIcHVG/q4b88Un3n2NG9Y45C1X1pKcKLZw+OtNdw9uvdlWw8/yJqxR8FRfOVsWuxM4hgQu7FVih8HulBRzq8BvCgfwPIvAk6mgJRiQ03bV98xqvATyarCKyNsYEtN3lHknYS8EzOcC7lxRcDr+xqU2m3u/Yfd5EcHueLiVRQzBikCwiBgdn4Row22EfzHnT7D36f7J4RhbTHhf317ioFNY9x4zTae2jtBJ0qhJ3EUI6TE8Vw0Btt28DwXJ+Oh4gSjNa7nITAkKmDOlzx6pMnBuYhGB9yeAWYqIQdOLrB27UaOHD9EvlBCG02zXieTywGCjt/m9luuAumw7+AClq1wPA8MTByfQOkYoxTaGKIo6opbpvj9KA6Iwg625YFR5Ao5CsUiB/Yf4bprdjA3N4sfSaKow2LdJ44CiBpcvGMzB09W0yKfSecvzNJYrU4fonarje930npBokiikE6n0Q3E4dort2A7OSoBSBSeNkR2Wkw0JqHPEpze/yxP3H8fz+8/wLbtO3BcD8vNdunFFLaQS9g+Qt/nuccfx7YtatVKGrIjcFwXAfjtFkUV8d+ubrCpFPHHzzbZeeku1q1dTTbrIqSg3Qk4evw0luUQBjGWbTM4PIBlp+1r1xaUSvl0WMq2mau2efjZ45xsSLxSP5dceglCuCy2Ek5XItYPuIgkoJMY9h2vM+C6nG65fOVUkaxtMfIjxEVytmLUblFwLiwL9VS7yIzvMJKBRxYkQRQ1gI9iaILwl0alz8E7/xkOQKsELMFKT96zrUegjGFDqfOKC4acbwVHsbW3zR1rYvYfjPm9hyfY+/xJzpyZY26xhTY2QmguKUo+vHUK+Mc5nGspLh2y+M8PzHLLay5l7coedu+rorvTjwadKvGQ4txzhRxSWjTqNfL5IsJKoaRGWNj/m7v3jrbrqu99P3Outvs+/RzpqMuqliVXuWJjg0tsAwMSYmpIcW4SksAdSUhyX8rNDYxHyntxxguEUEKA0AyhxhTHYOOGq2xLVq9H0ult973qnPP9sbaKQTaWLYl3328MeRzJ55y99lp7/ub8/X7fYlkIaTHfht3Tih/vnsMRiiOTU/T0D+K366m6jdG0Gi0c20JYDs1albffcTtjE1Vm2xpPamzXBaM5tH8ErWO0VvhtH6ujCKTimCAMsIQEKSiWe4nCgDiJ6BvsY26+Sj5rsWHjOg6PzmCMYq7mE0ch81PjvObqS9lxsNJp5qajtDiMSMKQeq1Ou9FOKcVhiN9uErcbrF89wA3XXoLrCian62zauI5iqcRMYIibFY7s20uxq4eEhLA6x9yB3bzjbW9i++59OEKxYdNFKLuQ+ggdG/sZOuw8zd4d25mdmsa2HeZnZhEiBeq4nkfgt8jFIV+7rs6SYpPeTESzKvnu/hlWrV4FgFawffsObNsjiVO58zhKWLx4CMuSRInBsW26+3qYnZpCa4NlElatXs61l29mybIl5LrLlEoF2n6DqbkW5ZxhKGuYa/rcv7vCY1XDY/Uce6Isn9+T8Pohm77MqRe4LfVZX/wA3V7ASDOHKyUH5jUTkdmJ4YsCplQcJy/s1Z9WE/CFIYV4bldb8fUxhxXFhF2V8hm4/FcfnhWxvlQnaVe48dLl/M2f/R7lnEua9izesyJ8yQbOkkKD93aN85mv3McFa1dy3cU95HIZMl4O25ZAgo4VxVIZy3aIfB/LthC2xOgE1VHqRQiMTEkqigQjBY4E10jGxqbI53NEcUySGKRxmJ+bxW9WiaOAvnKeVqDQInW4O4bD0SYBo2i3W0gBSRIR+Gnplc/n8bwsWgt6u3NccuEK/EYTlRjcbIl7/+sxwtDQVXbJWHaKIhQWc7WIKBZoUtCLRNBq1KnOV6jM1fHbIY1mnfnZcUQ8z5tu3sTv/tat3Hj9FUxPVzg01sTOZPn+9+9noLeANrDtySeJgzbduRwyMWAkF1+0nm989esc3D/Gb/zW79C/cAHKHLP8PmlLUpr65AyH9x7Acj2CMERIG40GoWk1auSjgK9fV2NFKYWiG+B3NsxzTXiI+39wPwKD51jMTs3iOjaudFNtA+XT252lVMiATrAdB2m7ZDJZLAyDQ4OsXLOG5w+Ns+PgGA/86FEmZqskdhYlLQ5O1IikRNsOQivufPMV/PV7Lucv334Ji4cK/OfIuanxXypasceW2bTUf6IWIy1xF5hKCm38iQ36pGXwMnsAJx5UFMYzXk7u2NfW50/4DoOZ8Hj99vMKZSz+42A/n9wf88H3v4sVvV2YvMv4RB2vYAMWF/T+bPbW+h6PLVt+zD+bDItXrCDvzGAyFn4gicOEru4ubMciCgNa7Rbl7m6ONd+USpBaomWqcGMQYFlI4WBhsC1Fu9XCyxRotfy0s28MliVJQh+LmN6yQzuMU56CUYBEdZxylVbHm3EAuVwex0m538KkTsKtVoN3vOkWhnryPPzMEXKZAtW5Nk88/iwLFgxgTIyX6Uh8W24qMhI2iKOIyZlZ6tUqzVoVv1XDIuKG6zazavkwpWKBejtg/6EjPL/jMLO1GGwPy3YZOTxJFIZkrRCtYhYvWUyrHaCNoHuoD0SbsUNjSCkZm5wgtvMokQOjO33NlI+fhAF7d+0iimIyhSytuk+hXMDolCp9x0DMBzbN0e29UJ/BlZo/uajOR57fwz33tLj5phu57NJN3PPdBxhetBAVRqxZtYBlSxfx/I6DJFpDp7dR7CoxOzlNrpBlcnqGnp4uisUcod9mfmYaYXlYjosfWyTSZmSqRXcxy6KuDN0ll5n5Nu+5aS1/9qnHeevKHEuL587n7yfjcDPLdQsCts5aOFKQJPoXhOFrINKL+ona/1icVhMQwPZsbbSpL5QJC3MxAsG0n6P/FB7o5yIEhm8dXslHd87z23/4q6xcOszze/Zz97e+SCZvo7ERSvONA1l+f2MDS7z45KI/0+L83gz/tHUnA0sW42ZdGrMTNJtNBgYHsW1J6LdpNZqUe3pT4otWGKVRscJITRSGOK7JOithAAAgAElEQVSDl83g2RmEkHiWRiUJftjGqts06s208WUbesv9VGfn6OrK4lgp+UcKQVqGizQBGEUUBhidYFuQyZUQ0kUI1bkHgkwmR7VSY+e2Xdxw7WY2nr+W7z3wKLsbhu9+/2FufP016Wzc91FRiMbwyGNb2L77MPMzc2gd0VPM8OZbb6S3p0Tey2BbivHxGfbs2ckzOw5SqYbYGYfzLzifZqvNxHSF+UrE/FyTom7zu79zJxOT04zNp6VDvW3ozTvccee7ODpVx/Jcmq0kpfAew5AYg41h77591Bt1LNvCMql6Uam7iOPmCIMAISK6vFOLs2Qsxfs21rC223zsX/+dCzatoxU0+IPyPu48kuFdl92MNAl+FKGlIEpCLCkplUpMjo0xMT7NwNAAWifEUUAYtDHCwWhJEie0ophnj7T5weMHed+v3srQ8ADzU+MM5BNWdAted9EQuyrjLC2ejU/4y4t9NY/LB1r83WgeAIHZr+ykbfwXisX8ZJxGAkgfmooFlie+vbWtr/zRRJbfWD3JaCtH/yk80M9FGAT1YI7NN13FsiVL+Nx/3McjWw7SCup4tiQwKTnlroMOa7vL3LLkxWWdsnaLKwY1f/LjQ/S9rcjrN6/gERPRGurFDzWzMxXiWFEqd2OEIQgDBBDHMVbHpiubdckV89iOgxAWYejjORBFGm0pVGJAp8KaA0MDgMbxMjSadcIoZuVQjmqYEDZboOlYgaUJAJPw2tdsZsu2Q+gO+QcDWoLlWVQrTZ7eOcpszefyi9bynl+6jaNjE9QaPnv3HWJ0dBxLQm8hx8ZLV7B48SAbVy6gmM8g3RzlUjezs3PMTE5xuFph+74x9hyYQtoulpQYKbnp9tcjLY9Wo8X0TJVsNsezz27l+huvYWxqjkq9iRSa0A8YGlxCVSdMTLQQsY00Ai1d0CeMTS0hmB6fpDI7R7vRJJfL4bdaoDiO2S+Xu/nC+DS3TfZy1dDcKZ+dKzV/sHGGa4ZKfHjrPr54heLqBRXeOtqP74f0DZap1JpY0sMPUyqvtC16B4eYnZklThIq0zMkcUCiYGDBMDOz80TNefbNjNFsFPiD3/01ugoe33hmkkwQ8OY1bYyweM3afv7im7P8wpKfz0nYT1I+x1Tb4qG6QGiNEOIrduIUYsLmKTb+43HaJwATB2jb+64t5YeHsyGRthltZVlWTB/8uY5AOdx9AH77jst4YstuHnv6MNdcsZzNF6xnfKbGfQ8+wf6xKpZt8z+3Kq5e4FN8CQjzUM7nszf28Pt/9y8sXLeUZUuXUx2fp1pPcLIeXiEF+gglyGSyBEGAbTvk8zlcz8WxnU5npTNGi2K8jIMfJxS78mQ8l6bReK6D1poojHHsHHO+4sHHdnD5peez68g2EsuhWm9w+MBhojDkzgUhnz4qGOzrRnCIY+q56SsBxsZG0t2XwxeCj3/xHjadN8jSpQsY6Ovjxus2k8sVQIVorQhDRTsIqdbqHJiuUW+2mJ2v8tzzB2kpl4zrIHTE5is2UCwWeWbrYRrzM/SVyzRCgeXExHFMNlvgW/d8j7UXXYCvJBMT0wwuHKRRrbJILqUVJICDsSHF4HQswo3pSIe1OXL4CGHg43kuUggatSqZrJciEY1B2pJ8Icfhhs9VQy/+WTDAZQN1vn7jCSnvWxbDH919DxdfeiFSSko5F60zKYNSSvKFEhMTMxw8cISN569ExRG2neXw0Ummjo7Qro1z++23snTJMLtGZqi1WyhhI+qSZycVmwZcVi/tZ6a5hZFGkaXFM0+V/1mxv1bkor42H93uYaHRgjGd6BGVRKmy7U8u/pOy1GkmgPQntTF7tDEjH9vnLrtswOXivir76yVWl8+9Xtp8YBP0dOFKwb33P4nthly+aT2f+sLXiRPBza+/gX1f/C6ul2Uydtg+l+PKoZfmMFwxMM+nri5y871beffbf4n7H3mShecNcvjggXTB4iCFJAxDHM+lq1Tq7FbH0CwGy7JpNpt4IqG/XCBOJJZto6IUwz8/O4eQAilsLEuQL3bx9//47/zNh97Prdes5L4H9/L0nina9QqtxjzvuKzJXFigVC4gBaSH/w4F2Bgiv8HGDUt557vfRs1P6F+yl11btvPYN59FyJhyMUtfbxnHswn9iFqtwWy1TaI00rKxbQfbdnCyPXRZFknos3hRFzfesJmtW/eAlAgSunq7mBiZIZEWhXyRoN0CO8eDD/6Ym994Mw8fPcDunfvo6SlhwghUklp/cYzqm+Yug0FFMQf278ckCfVajWKxSL1aIY4Tct0FtEqZgEkSM1erc2Hf6cNxb10yTX+myD9vf5x6cSm5Uhe2SIVNLdvCy2QZ6B9gemqebXoPA30lDh86TKM6z2WbL2fNuluZmqnw+M6pjihLqpykvTwjMzXW9Fr0lW3WLSkwFwTnvAwQwHRg41gJnx0TWKnOwkcQQfPEHX/xeJljwGOR7jrStpSUcm3F2Je+cShicaHFeDvP4M9BJulQI8eOzBJKeZf/+vEh1qzu49pLNjLdinhmxyGiqEV/f5lKJUQLxfW9Eau7fvZ1dnmaH40XKfb3c/O1l9BXFHiOQ77Yw+Gjc6g4JON6FAolHNdDyhTS6mRs8pksyhha7ZgLhgw9uYQn97ZQOqJWbaFNyl9XHYCPESbV1NMWP/jho2xYv4LLNq8HnbD1uef4H8sbbB6IaceCeO0V7Nk7Qqg6nWcBOvbJZyLu/I13EinD4ckK0stQzOWJAoEfKdphSNBsMDfvM9tICJTEdvN42TyZTC4FJAkHIQRGauJ2m1tuvopiPs/OPaPMzbXo6bJYuW4dlWZMok2qZFxv4rkue3buoberwKJFwzz35A6mRsdYsWYllpVadR1TG5YdRKpJFCP79xO024yPjVEo5NAqYWx0lEKxhGXZSAFxFDE1M8sD1zdZ1336Uu0CGM6HXDUIT08XEP3DNJot5mdnUUmM0QnGKNqNOoHfpjI3x/LlS7judTdR6Opl36Ep2lFaamqdNi611iQm4aqFCesWWRhjqMSCbLXC2u5z6ys4H2QpuoavH3DYUrMwxrTRfE8K98kUQcoLG4A/UaOcxvyik02MQAURSief00bz46ksjThL1lK0O4qk5zKmfIc4ShidmCEGWqHNc3v3ceTwCDqBZqtFX28XRmiO7ZgvJzJWwjdurJF9/Gu8479/kGef3cbVl6zidVes4LpLFzHQ30+22I3jZXBch0wuS3dPF6ViAddzSZIIS0Qs65HM1tLSyG+2UDpJBT60SseLwnQoxwpp2UiR5UN/+xkee3QbD93/Q96cr/Ou1RU8K+UHKJWwfNlgB0OvQSv8Zp233/FGHK/Ilt1ThKENkWHs8Bgm0SRxTFYq3nnzalYv78dzczieRyabJZvNdf5kyWYzOBm7g8iL2bh+Ne0wYb6VkCQxCxf00JVzyTgSy7IodJVSSSIp6erp52t3f48Du/axYLCEkIbJQ4ewjAY0lknfs9IxfqvJ3l07aDaaTIyNks/lsJBMjI2Szeaw7FTfLw5D5mbnuP/6xita/MeiGnlsmckyX28gSEen+WKROFHUqjXa9RpZx6a3nOGtb30Lm696DUcnKxwam8NIp8O3UilsWSepFT3QClNorSMNPVmPI81zyxMQwISf40jD4a69EpVoBOJTwEePl4ji5O/+6TjNJuCJX6YT/YSx9XP/dtS98LYlNitLNXZWuzm/e/4VvZlXGoNZxfiRKsMLFmFJTVdXjn/6128gLIkxmoWDfdSqqYCD0ClR4uVG1ta8f2Odt51X4IcHH+FPvvMob/+1W7njDVdQq7W57+EdjNcS3EwegyBONKBASIwSmKjFYP8Q33/qEFGssO1UeSeVVwcVJ2ggTiKkEUjTZslwmatNwravfJn3roi57fyTrakErUaLjRvWsH3/YyRGovw2r7tuA6tXLePgTJtSsYDWhlqtTb0R0grrQMQVa3vozxpGZxS9/d24djZVX+4oDWmVfh0EEW0/4PbbrkRahpn5Gn4siFVExhEsGywSxJrdR+cplPIgQSlASkrdvTz62BZ6u7txMx67du5m2ZrVeJZN0K4zMnIUbaBRb6AiRWVmJp3FS8n01BhxFFEsFxACQr/FfL3JA69y8c8GGf7syQL3VRyETFjnN3FsD5HNEVthKqcWhCw/b5irrr2SnfsOMr1/Kp1UyFQ8NgoiKnNzdPf2dQB0AmkEM/UIKbIYHdFfzvE3B23ed8ErvtTTjvkwS8ZS3HvUwnasjoErn4ijSL/cje6VIRiMQYezWmvz0Tkl2Fdz0yPSz4Ep1ZeJGJmo0/RDshmHJIz4xTffTNQOGez2WL9mNTt3jnTYcwmryqdXpghgKNfknasr3HNjSPnh/+TNd/4VO3fu4Zdu38wdN6+jL5dqDUghEFp0oLQJq3sEQiueP9ggWyhgu1lsO8XdGyGPi1FaQiBVyBXnL2KTqPB7G+b5zPXz3L6s/oK8LYQgihN6urqwZPoh9OyYW2+6loavaQR02G6GydFxDAY/aCERXLiym6lKRL5QIlfIp+M2mSrqCAyWTHn4UaSIw5DV5y3DjyOm5pskiUYRUijmMEKBUVgSXMummC8idGrQaaSh1NXDbLXKXL2CZULKImBk107GxiZot3xqc1X8WoOSE7FuzSCOI5meHKcyW8H1Migd06hVuSFTY/dtM6zrfuVNNW0Ed20rUF91EV6uiNCKo4f2MzU6wtzkKPW5aaZHD7Hx/GWs37iRJ5/by8RUDYHCJD46TqjOzFGZm6GvvxdjUjMUbRKUMExXfbS0EAIKWQujzi1luJXY1CPFv42AtASWJb8hjNnxoj9wipxwmk3Ak+eJXag4OZjYVuM/DmeLVw/VWZjzmQly9GfOHSZgYb7NVd1dHB2fpOBKdj0/Sk8py+//1tvwXJf/uv8htPQQOqFfxvRnX7mW4YJci988H25bluE793+VOz57D7/9jlu46ap11BsNtmwf5+iMxgiLOPTZtDzH5FyFEBfLgCUd0El6QsAQqjZSSVSS8LpN/UzMzPOBZTW63FPfv/NKPl/dtYfLN2/GEhAmMW9/y3V0dxUZH42ot2McJHEYMT8zj05iorBFVkp6CxZ7pwSWa4MRaKmxSOm4xigQEIUxiQ5pNJosWLiQoxPTzM61MLFGGEn/giX85w+fpNgzDEikZZPPF6jWaqSfCYkByqVe6tUGBw9NUC46vP7S5YzPN6nXbBxbUMjlabXa7DkwxujhwzQaTbKFHO2Wj19vcdfGhLevmn3VEPPn58t8aUrw4d96LSsvTGi0FVHUQCfpSSzrWjzywH2sWLmSnQeP0mj5WAJGD+2nWmvQ1zdEqZhh1ar1TM3MkCRJer+kwcKiGgmUkUgEhYxFECfUogxl98wJ5bxYCAxHmx5/86zA9hwSlYAx/xzHL5GEToHYO+0x4IlfJkDqH8dRmPygVmCkkWVNV53n5nrPaQIA+MuLmrzr4QCvp59IJzzw4C4UW1LhC+FiySxxFPM3lwZnRMVoYT7gN9cHvH6R4u77vsXbPvsd3nb9Rl57xTqu35hn5MgorTKsX1jmU9/floJ6goDImE4XWYBJu++YmBsu6KbW8nlv3xSru178uOta8PiW5/nV90hM7NNdhNdctZG5hsZXNoIEbTTV+Qoq6ciJY+gtGaxsnv3TMwinKwVHCwtMnJp4SolShlYrRCWKxYuKdBUL/PjZA4RKdnz5FH19vUQmppDLUmvVMcKkiMVj498Ox94Axe4Czbrm7+/6JO94y+0UygXymQyVap3nt+9jx56DVKsRjuPQ09eHMZrFic8Xb6nQ64VnRHKuFiZsXLWMi9cM09MXsPNIRDMpE8UpGlAkAY7l0G5HxGGSPhc0jusw2N/Dxo3nkS+WOTo2gR/4RGGElBbSS/n1cQhhnGBLQSmfoR4rJtvZc5IADtTL/PctGUZbIV5WYmE9GPnR09KyLZXEL3uXO/0x4DFTSmPQJgpsmfuSMvq9943lWJiP6XZjZs4xMnBdd50PrO/jfc9N0Z8voYVNGAuETGftcdzmgxsSrh8+s95uy0st/vRiePeaLN87/Bx33rOVy1aWuP261awYyLNnfJ5H9lbJl4ewnEyH155y7C1hEfktrt/QjxaGWxjlqp8xniy5EtdyefSJp/Dbbd72i6+hq+AyU0+o+xECjW1JKtOzGGOIQh+BYbgvQzMKqAQW+a50x0qtvsRxOfAoDLEsSbsdcs2la6hXaxwdn0VoUjqyUni24dorLuHRZw5htEYlKdfeSm2YMWi0TksJhKZY7iH023zks98G1TGTkSIdNzoepZ4cjp3yNaIwotuF/kxwxsA0hxoefd1lsk7M4nJEdrGi6js8tO0IoZa40pArFYm1ShOzbWMJWLh4EatWLme+UmX/wcNEcUIQprLyURyRyzgYY4hjQRgn5D3wPBtbdHpA5yAm2xZHWz6ZTJY4jjHGfBBMVQjytmO3kpc6CZwUr+wEIDoINF9gcuaTURi+9+MjDm9aajGcb3GgXjjnyMBfXjnHmu4hPr834pvTEVLkUCYCEjbmDW8/r3LWWIvDeZ871/v8wtICI4157rn/Gf7nUcXrujT/dLHLVw/Ved4qoCBV1zUCETe5eUOREMW1rd3csap5QrDlFBEqizk/pen++5e/jdEp0WZiLmHfeIs4tEGkrEW/5aNkyuLDwMXr+hmfbGJ5RRASgUAKhcZ0koEkDCPiOMDzFBdffD4LhhdQzGaoVmsd1SFBJpPnqS27aASpJl8YRiilUmESrdBKIaWbmnJ2EkwmXyCTdzHK6ry/YzBg0YEEp/+UJIo3LovPKJKu6Cg8x8GxBUmicGyNJQWxjhHSI1IJuWKJOIxSUZXUdBHLzrB3/5GOBDrUak2SJEFaglKxnNrRJRFaSLQRaKWwXEHJ4QT1/ixGoi3+YbuDtlNJOEtaX4ij4AGtFJYtW+rFctCr7wGc9Fs6D1MYtmqtH2whrntkIsObV4TMhy6RtnDPsHfAS4UUhv6MYXC4l9s3DnPvw6NYpEq725oBn97dz3vPnzirUM3hfJPhPFw1JPjzix0cqWmrLIvyIW99QlLuGwYjKSZVrr4gx1Q94JroKG9d3X7RxV8NXR6cyPP5fRZPR1kK3SVcBFdu6qe7p5vt+6q0AovjVmFxQhDEaANJnDatLBMyOi+QbgalIlQQ0Go3QAoiPyXxDA32sHLlMiYnJkkSeHbrdoI4wbLoKA+B5bpokaHl+2htSKLouBW7EabTJFNYtktHuAhhBBoHS4rO93Qojp1EYEyqe5jEMUPZM2s5N5iNaLYDHDfDzPwUc7WQvZMt/BgyHiTG4GTyVCrzFItlZqp+6i6kNSTp7B+RehwAWHYqtilNan5iRNrwlSLtpudz9vHncDbjmdkCD80nfPIyyfuft49qo9+XRClIIYlP7x6+8h4AgBFEvm8yxdxXkji+7i/2ZLhqQcxFfVV2zJe5qO/cjgTLbps5v8Tz20dIrb/oUHbBPoeaBQJDvsMBd60G5V7BFy81vOcpQXdPmddetogt2/fx9lKVt66un5KgNNLI8e1DGT60z6GvmKfU1c2g7aENNCszbL54Ha4QtMPU/tsIBQjajQaJMWilUCqlKGczeWqhJlGGqdGDeMB5qxazYLCfbC6D7bhMTE6ye+8BmrWAqWqTYqGEITUmSetxg2ORLnxtsLQm8NspmzFSaJWahQwOlJirBJhjmAuRmpWYztH4mJAJJt1DtDG0Wo1U/dc601MkQb3RIo5DFg0VsS3Dc0dbJCpFT2IEruPwzLbt3Hb7m5iqHCFFVmnEcdt18DLecQWmTtrCdTO02vX0fQqDJSHr2cCZ9808OZQR/MM2hw9foPnWaAbbknfFWs9jjl3d6cWrIzJ3npcU8pNG6QgpeXTCoRW7+Ik858QIQcCBiYCjM1aKOccQJxG/NCT49XVTPzfKssBwyUCDj1xUo7cxxre/v4UPLJjjjvPmf2rxH24U+Mdt3Wy+N8s3zXLWnXcevUOLcLx8KtUdx0TtJsuXLSL0AyIFQegfF+/0fR9tNHHoI4TBsQ1aG2YaglaliiMT3vnut7B2/Rompqs89MhTfO2bP+DJp/bSbkM79BkZnUZmiqxZsZyuQg6kTpWCReqfJ4xBGoWOU3BMFAYIJHFk6OvrolDInfTeO+i/n74pxwlB+VyOWJuXbIC+khguGEYm56g3Q2qVKv193XhOSkbSSiEMZLMerbZPFPkIoVLNCJMe5VOOxQlR1JOv3bKdE7vtsaQmzj4x/p6RMkvzivO6LB5qOA96nvePfjN4xaXHq0sAnXNeksSxZcmPRlHEH+90mQtd1nS1eXr6LDmJvkhsnStSXL2SY5BHo+F1JcXfXz6B9XNULYI0CVy/sMKXb6jyw1saXLOgysmS6tN+jo/v6OGyHzpMXXwLH/n7/4Nrr70GhCSJYpKOKrGK2/SWbZYsWUAlEMxUYyzLOY6xr9erRKFP0GojJHQXbGItqLQSkijitltv4plnnuEb37yfHTsPsW79BQwPL8SSNu2Wj2VZBGFCkmikLXE7BJ2OLAFxRxUZIajXmx1/QolWmsiPKJWKeNks+Xyus+hF2iD8KUXadFGlLEpJSaa/50zGUC6gXW8xU/VZsWwx+ydbxIHAIlUZEgiMBb19vcRhgEVKvcZoAt+nMjeXWrO94Dkee5qpfNqxxS8QJOqFxptnOmZ9lz97zuI9axMemsqqJAn/YnZqypx8T08Z5sX/1xm541E7Qqnkb7XSDc+2+fJ+j0aSqtGeLenwU8Wqchu/VkOaBqgAz0T80QXNn/viPzmydvKCMZGf2Ny9v5t3PuCwbfmV/Os//DkXXnwRW3ccodESqcWVZeN4Do7roXTMm954A0ZpWoFCGdPxsTNU52aYODpOvVbBtTJoCbmMQ8NXBImFseG5HTvZuXsMYeXI5C2yhRyzszMEUZtiMUfGyzA1NZ2ahEiJZVtIme6Hqb1aCjRKkpQNmCQR2sREcYghxvPS+j+by5Ev5H/i3Z9ETunIgRmTWpZdVjL0Zc4slyRjad41nHDw6DS2bdOd0chsOnXQ5gS+P1cqoeIIS2iMjqlW5mk2mzhuB9r+E3W9EOniP57AO/4MYax4yU7uqwhlBJ/YmecfLlXkbMnibPBJv9V65Lgk/Itxfn/GR//VlwDHnqcyU5aUH08SxcePSg7VPTb0tvjGSO+reonTiYGsz0eW7+ZjlyluX9PP7y9rsK67ds5e/3RCG8mheolfuLfEF9RSfuev/5Q33HYTOw9WeHr7DO3ERQkHKSyMJUFagEUUhiwY6EFg0wjTMkuIdOc6uGsP1UqbcqmExEbiUMy5zNQVQkDe9piarSOtDN1dHhdfeiGHD4/ghxH5fB7bsrBtiwN7RzCaVD1HpB3+VMFHoTpSXkHgI6Wk1WziZrJEQUR/fxnHcdJJgxBkslmKpWLq+Yd4wdrQWpPEqgNDTlhW/GmPoDMRVwxqvvdfPwIcBst5pEzlk1RnzQgktuMxOT7K8kVDVGem0h5OLk+2I9jKsf+edIHHzFPlSfnMD1MVp7MRD4+XWFIw3DBcZz4Qe/9sm/oLo07OTKdY6S9j3zszVytIPeoQdyVJrFxH8ugkzAVZig5Mts/dTLAv0+aGoXHuWvUk715d+7nV/T8rLKH5xojHwgtW84fv/w0Mgsee3sP8fC2V+hagdUI253WYdJ0xmkoYHCgjLcHRiZR+LTBMjo0yMzOPa1tIYTDEoBQrli/gyEQDo2LarSpd+Rznb1jMipULOHJ4nL17DpLN5LAdB6TA8zzQmumZabQB23PSJp5IayrVmeeHYYDSCsuy8IOAJDFsuGANE1MzqVOvSBt+nudSLnfhuS7H9QtSFVBc10XKlFZ9w0L/rDyrSwZCHti6lyNj0ySRT1cOjEjtzVMQk4WbyfP0M8/R313AyxXIFbvxMhkEx/pYnQSWXj0YOhqQBilTPWNlNO34xHedyZgNPO4fs/nFlS2qkaufnvXekITxbHotx3b+n3jdl3kzz2C6EiRJNC4R703ChI+NCJ6cybEwb7h/rHTOeQIGQdaOfy78hJcTygj21hQ333QDGMHTz+zggtULGO6RVGcm0GEbo2Ny2Vz6QRQGbRKSRJF1JYmKibWTNt/CiN07diOxkI7CcxQLB10Emu6yS7WpMCpgyfJFZHMF9u0d4cnHn2Ps6ATFUheZXA5pyXSnFpJivsD45BTaGCwLLKFSi26hCWOFZdmoOCYKQixb4jdTkZG+wUGmZlNT1ePcf5ECf8rlMqVSMTVd6WgPpKAyQRDFLMyfnZFxlxvz6wOanfsOMNDbxdoFOWzbSZuAIvVGFMKi2NVDO2iSzWYRMnVrRnTES4TpAJ04Pv5WKkEKgyXSBBxGilincOgzGdoI/un5Iu/d0CZjx+yYz/zxh/bKvcebkqdi+51GJj2DV2uIg5iwHXxCqfhOo9WzXzkoaCUWlw0EPDV97tWDH50d5IvmGirhq5t2no2oRS5fn4KBgX6OjM0wNTVP5Lc4Oj7LXGWORCdoo7DddKEYDHESEkWKnOfgByFKpFr5u3dtxw8Cmu02rXaDxQNdXLZ+Nd1li1LGIogUgd9kbmaKudkqWC69A8P0DvSSyWWwrHRkJy2r0/izGT96lEQpivkiSmhs2yZWqeNsFEbMzdZQSUQU+agkxrI0rVaIEM5P1cHH/uq6HuVyGcexO4BSjRaKIFEvKqv9akMKw2sXCj5z9/cIE82i/iLCJIAiiQ22JcnlsvQPLSCOIjwrXewvjJNOAJ0soJTGEgZbpliBph9TsiVLzqBPhgE+sbOXX1ndZijnc7CW/9ZAce7/DhtNTtT95qd/6DTiLBQsBqX0vxptPvFQRfPopEPBMTRjyYyf+9k/fgbDs2DKl8Q6beY0Y++cvv5LRazBsWFgoIvZ+SrjFcU9P9rG2GxEuWcIZSTKkIs6xEAAACAASURBVNp1CcBIlBLEsaZQzNMMQGMzMzXO6OFRoiim5TcIWi2EJegb7GfFcBHHdfC1RXfvAJadxbJT/0MtFUqf2NWkZRFFEVolNGpVJkcnaLaaOLaFFBaZbIH5Sps4jBk7coRm0yeJY5qNFsIoLrpoLdu3H0y7+qcEw6QLS0pJvlDAtu1O/a+4tqgpOGdvfv7ahXXi8Xl27R+nvyDozxqEtDv6CxIpLAqFbiqVKsND3SlG4AVJ7CeagAaM1jgCLJHCqltB6mP4ch2DXk48N1NgQU6xstxmtJnfd+V3M//X6/6z/IKy5NVOHc5wAkgzkoklRpnPCGHUc3OKemyzoTdi25x3Ts0VL+2e4g/zDzKQbfPD8V7+Tlx/TvsRLxU7KxkuWbuErAflri6Wr15H1+AKSt1D2E4WrUFpg+O5qUCGUaBT2i54zDcklXqNpx55gjhI8BsNHJEgBTz21C52joyxsCdLrRURKIkK2zQbdWq1Bs1GiziMO+w20QHmguc6zM7OsnzFUgaHhjh6ZBSlYrJejoyXZf+BMabGJ6jOV1PTzUYVYVKA0OWXXYqbSW2pTtSmHCuZgc4eKlJkYT6fJ5PJoFRCjyfIWGcvAdhS899WJXzxmw9iOfD6yxbhOU7HdSgtU3KFIvf+4GGWLh46qbufNi6P1/7Hw6C1xpF0Tk8CPzZIxzlj1zwbOGyZdXnT8grV0DPfOuR8wrL0I4k+eYry6uPstCxNDFIHQoi7H2lJHhz3KDoxq7piDjXO7QIMVCp5dlFvkxtqeyi55w6e/JJhFEuXLESS4PsRURylZhk6QXCMVJISbMrl4nGTTs9zmGvGjI5N8OSPfkQQBiRxSJK0sCzo6iqw4ryl/PDhLQwO9DE508B1cmQyDuWuEguHF9A/MEC53EUulyOJQpSKO2akLfq6uti08WIazYCRw6OEYUhvXxltNPfd/wTz83XioE2rXoXOSPBNb3wtbT/ACCu15tEd8EwHPfdTJ4LOiSObcVFRyG2LzywH4FRxw3BAe+d29h2eZO1wgcXd7vEehNYaYUGpt596ZR5bHDMt4QULzRgNRqO1Ricaz5FpQhZQa/tc3XNm3kUzdrl7X5F3rEqBUY9MZL/+oR3WR1V0UpI81T76Cl7+rA3pdaQx2vwLYD54wGK0lafbS5gLvI6M8bmJjJXO3Hu8kNf2HiJnn32bpp8VAvjKSIGuUg6jNKPTdVAR2hi0AJ1+LjvfLCnkCikNVVpIy+FHP97B5758D5WJCaSwCKJULkwKl6uvvpIFC4fJeRkK+TzVaou+7j56evsplEoIC6QUWJZAWpJ8vkQUxczPzbJicT+vufYannr2eer1JlHT58D+oxgUURJghEOr2aTVbqFMiporFRw2bDifLc/uBeQJ1Fznwxj6QWqpDpx8FkjHgoZm4LOq6+w/k95MwFuWJHztOw/jupLNa7oQQpEkMUHYptXy6erpZW6+gifTY/yx92JMJ4mZFApdr9UI4pCsLY6fFuYbbV6/8NXX/9oI7t5f5NfWVcnZEQ+Nd7V/80n7EZXEJ4Ekzly6PAsJQHSaKAYh1MNGmb9ypcUPRh0CZXNhX52nZwqYV1m7/O8eSicMDvRTbwbUWglBswbJyaeTzvzZCPL5LK5nYTmAtPj83fdRrQQdlx/RKa8lRkvy+SxxFGJLC8uxqLfbKYRApMQbx7YQIsXxB60GczNjtJvz3HrzdVx40SYee+pZxsbGQYX4rTqHDh5m29bdRLEi6liKS3kMLx/x+7/7Hp7ZupvEOMiU73j88lUSU6tUSZL4ePNMdFCagnQc2AqSlzTXPJPx2uGQz3xnGzsOzbDhvB4WddtgwLJcvEyWfKGbrdt2sHL54o59uUghtuYExDeOIhKlEEDOkx2R0IR6GIF49RvbA2NlXjfcJmdrjjZzvPVRdz/GfP6Fi/70AT8vFmcRpmcImzFJEv11ksRjHxpxmQ8koXLY1Nti6+zp+6z//yGUkTwy2c8Pag7dfQOMHJ0mTDTSzXbm58dqvGMfutQCvFgs4jgOwkq/x3YstCVROiaX81iydAm2YxEEfipIatsIx6XZjjGWwXU8HEsyMzHO2MgBKjNjbFiznDf8wo2851feRbMd8ZWv/xdjo+OYJAbSbn8UtHEcG8ey8FyHOAqJQx+jIv7br72FMFbsPzxPikUUx/vlwkASx2QyGRzb5qcaaQKCMOSOQU2Pd/YFNAD6MgGfuljx0X/7DkIorjy/F8tKG5FBEIK0ODpTI1EKncR05BtStGLHOdmyJIV8Pj0RWFBpS2ItOTAyg2u9umnTwXqegqNZVvKJtcVdW3MzltF3AbNn5AacIs7ufEykRpZCyA9mbOtfPr03z4cvayCFwbVyzAVZes8w/PP/ayEAjeBII8vXD3fx9aMxdTsFxXiuw75DUyRaYrsphNYYc1LT6cTOk8vn8DIZ8oUcBhspbaIkJOs6LFyylEajgeM51BsNXC9DGIRYtkc70Ni5BGM0+3fv4uKLV7Nu/fWU8gX27jvIE089y9jYNEmi0Z35fbpZp6PBdqtNu+0jLINWJu1PqJhfueMm1qxaxt33PEo2myeOYgKVpAYAJp0ueNkstuPSbrfIFwrH4XSCdFEF7SZXDaozeKD92XHz4gbffPgA9z++l+su38Dj2ybY0UjvTxzF9PcvYHpmGkcqNCf1AjpXaVlW2jwUUGtqRscrLBku8+yeCu+59JWrYldCj8N1i+sXpdbrX95XNF8a40vCkp9Vvv+iSN+TLu0VxVlIACd/cA0mFEThxMdh4R99ddY775KDvfzyylnWd1d5YrqXshd2lFT+948jzSICjUEx2XKZbMPH9mcI/ICFK/u4ZO0gv3d1gaMVzce+t4d8zqHWihHCI7XHtpCcxDAzxypng+d6aG1YMDzM3GyFVrPN4gULyJdLTExO0mo0AMkTjz9LT18XgiTF6sfgKM3s1Divv+EKli5bxne/90Omp6u0oxijQEqDIcJIjdDWsSfXeVedel4rpBBYRvPr734DV11xEZ/72n0kSmJbAivroloJyU+w0pI4wW+3yRdOOGaY1BycSrXCJete+vivjKQSZug7QzJznpXwextifvWuL3PxZ/+Sm69YxHjtCHt3H8b1LLLZEqOjYwwtXMJ8I0ZICR2+xTF/gzAKUxpzAqWsS6URMd1Q/OGTmg9f0sNNi0+PBq+N4EdjeW5ZkipAPzRW5gNb7S0Snk295F4iXmX2PEsngE4SON7z6cYY/RdRGH7hr/Zk5XnlLi7oabCpt8Z4M8eS4pmlgZ6JSKE3L96nOJnb1kpcPvxMkX/bH9HvwYZ1C1i3dhFlz+LOK8ssGujGkTaVZkLLcqnVJkgSRSGf77j9ukghOxz0E7/fnPQ3mRbyNGoNCp7ksos2MzVb5cjoOO1WG8e2SJSm7cdUDh5lyeACtBYgLeIkIU400s7wxS//Jyp2WbJ0IRsvXsf3vvMwzUYTx3E7hJ6Tx3fpcxRGgJEIk/CHv/vLXLJpFQ89vY/pikLaGYQtwWhcx0Op4KTkIYijkGK5hEF03IDThlri+ywhYLgQnuL9phEqmw89O8T3Ziz+5dIGG3rqtBP7VZcM67sjfrHX5pvffYx3/dI19Gb2YHtZoriN57gcGJlk6fKVRLN1vEwu7QNg0rLMGOIo1QacbrT58mNH8P0mqxcWuerCFfzRIyNsW3x617NlpsjNS6pkbc1c4PIbj7u+FKZmjL5XhfGxW3lW4iyWACedWQw4lvxyFCd/2hBi00d25rnrijZlN8KxBO3EI2efW0eVU0ViLI42sxyoST67P8stwzEX9ioW5iPKbsC0n0WZhJ2VHPeNeRxoCv5oQ4wjDQ+LAf76z29l+YI8jmoS+w0sWxD7DnvqAl9L2mSYq/ps2V9Hq5BCzuUNt9zIF779CCktRr3gOaeLIv2XKI4RSJIoYtNF6zk6PsXk1Bytto9jWSiliZIEsBnqLaO0JPDjVHhUQv9gF9t37MJx8qA0tlDU5o8RpQxxrFOXUZH6FhwnmR3b0RPDB97/VlavWs49D+5grpmgtMBz7eOdcNuxwNcnShgBrudiuR5CS5QTYxlBrAx92RaLu6Bgx8wGWT60tZd3rWhzSf+J3dMgmA8F80rw3GyGhydzXDMU0NP/6hJAxvJ5x3k213z6+6w9fwmbNi3gye2z6ESgrJie3kHm5uaJozbSSuHWUgJCoZUmCKOO9FrIs9WQy1e7/Mnrz6cdKfY9ve+0rmWkUaA/q8jZGj+x+V9PFUxb60MC+SUQEy/5w2egdjqLCUC8IGv5vkZa5uYkjg/9sCqzf7e1lw9eOsGCXOOc1oCnimZs8/RMgY/vdhjxSmw4b5hLbrSYidt8eqrFxN4Q5qrUtYPfs5CuUonM8hKOMdyXkYxse4rAyvCt+3bRPziElRU4rk1vVw4pVQqRDhLqlTkmJ6fx6z6oBGlnuPe7D6M0HRx+2nkWL9hD069CP8S2bGzX5cCRSZrNgHbbx+4YnYRhQMZzCVo1rr1yMw89sRulQBkDSYItbcpdJRr1aWxHsfK89Ty9ZXva0QeOIfXMSS5+6WtrLDR/9L63s2DhQr5x73Ym5tq0wwa5fA557Go7j1vIji9C51e6npc6GYsAS9soYNNAi6YPty5JMEDeiXjrMp+B7AvLgYwV878uqbB4dzfXLWyypNDClmemXFxVbvCxTTZ/+w+f53/86e8x2JdjfDIVU8nkShw5MkZv/wD1ahPP9bBdGykTohDCtiIK6ty6eSlXLrLoyRq2j9b40kN7+cDql48ErEUezViyoaeOMYKvHSjy1Sl5vzDmbqPMpxN19qcj5+YEAJgkBNuZAnNbEkef+/xkZtHrxnu4YXj+5zoQ3DpX5k+2eFjL1rLg8iVcnC+TBA0ONiOcsMHK84ZZu9bCyvbQjD3ayiOIIpqRot32mXddpoZWEU3PM1VpMDE9Q5gE9C7oZ8WypRQyLs16g8nJGZLEYJQmUgrHSFQS0QwBYXWcnNKW4QvbTin1tOWnoqGua5MoQ61ex+rM8wM/QGAQQnPR2mGEigFNO0qVa8IwRIs8E6OT2LZhw/lrmJ6eoVJv43ke2uhOv+HY/D6VzBJoijmb9//OO8kVu7jnR9uZrUUYrchmCscFoo9fbOcfTnDU0xAoNDYSWFec5arVZf7Puw/wt1e3AMhYiqsGT2373Zdp8qcXvrBE3F/rZmWp+oqlw33l4Cc263oM49ti/vH/+QKr120CU0drC0tKmoGiF0kYtpFSEquIwG/TarRotxvkvYjZapPPHWogogi3UGBhEnPZ4MsDmmkjmGg5nN+T1v1PzxT4g+edqq31d0Dck6jw5F3gp+MM7ZpnmSXzwl6A8mO8YuEBo+I/VlH0xT9+Ps/ncpq1XbWzptj7UjEbZPmtpzxWbb6WRGRoRTYHx44ShjFGGDKWzXMTAbalyFhtbEuSzTn09vWkQieWhdKKfCFP+9ARsvkStlcmJwvU5+qMe/N0dZWZHptK62jRoY4qjbQhCBSJsTrPV3f23M4JoAM+McbQaLTRiSEMAjLZHNVaDYHBsiRRGKQ+g5ZAJTGLB4eo1+uEieHIxDT5fJb6XMTIoVEWDPSx4fy1HB0bZeeeEXK5fKoczAnEnsF0yG+aRQu7ee+dbydUCff+eB8z0y0yedFJWBLESR92wXFZsuMPvPO1MCD/X+7ePFqz6yzz++29z/jNd6hbc6kmTaVZsi3JtizPAzZmMgYMjfEi9AoOWd30YpHOQCc0TXfIakJImjCZbqfpsAyBAAZjLDEIT5IlaypZU6nm6c7f/cYz773zxz733pIsGUNkkZWz1q269dV3q853ztnvft/nfd7nsZbb59Y5dlXIH/z1CY5gKYxikG/2zjc70hYhJN0ge1lcAOBo9+8n7z4pQ37n1A6ObyhOJ4J+BVaWnDh5kbMX1mm35wjiJspzQqAXL1wEETAeDRwHwiqCAOJWE+XN8/TFjL2h5q7DbZKgxR2R+qY9MY73Z7h5dgOB03/8+FcaeOhfsNZ8EuzGa7H44TVoA27TQF1amU/GeFHw+wLxPctZ8T2fudDk6u4YKTTDIib2SgL5rRVW3DzuvxCx7+Y3kJYCz1MUWcZw+Ty6SBDSQKNN3JqltB7aGKQGGQg0HhaB8gBriNsd2u0mo8E6c/O7kNKn25tl5dJFAk/QaMRMxpNaKhuKoqI0hqRw2voCBbC1eMzW4jeMRyPywmANJNOEbqfNdDrZWvxFUSKlwPdDijyl222xcXmAxXJxcYler8fGaMDCwgLz83N86cFHSAtDs9EmScZMJ1NcnW9qqqtL+2+98Qgf+t5v59zSGk+dWGV1ZYN2u12X9i7b4Eqg1EIynVCWJZ7appcILJiKw50phdH8+/sW6U8qJpng5vu6mEqDtmBN/YgYGr7Ht+/o4EvJ+/dP8aXk2l5O7FmafvmyIqp/25FWPr/0tZ0camkuZc7Jec6DNe1zy7Gj7Nl7iAsXFjl3/qLLtuqzb8Rtwsin0YqJ/BghFb7v01YFr98XsK/dZTmpePj4OSJpeNtef4tJ+ErHStrg2u4IKSzTUvFLT7VZrPiKQPxiVWyxpl6TQyBeI0KOBWoFVRB4kXcE+LT1g2v+l5vw3rXPAVLGSmbC5O91k/8uR1L53PDnc7zt7e9mnBRI4MLpkwz6l7fBNwt4AQs793Po8FW02i2iOKIqNWmW4/t1Gp9kGCu5fOEca+sbzM7vREiJFIY8Sdi5ayfj0aRG63366+usXL7Ar//qv+SP7n8ClO88+urWn7WWoiiYTpwefakteZJgqsRZUQ8mFHnmRlKlU7Z1QWbAjdfsJmq0aAURJ8+fxo97XL40QCpnZiEkFEXJZDrG1rp4oh560ZULvLffepDv+uC387WTFzh9acpwo0+z1ULKWiLDAsJQVRVKbYOAWZoyHk0JAsewE8IJs9oiZdRf5a4DIW++8xp+5rf+ml0dj+95x40c7Eh29CIi3+ILS1nBaJqxkRkGueDZM6tcXJtw/OyICwP40F7NsRnBD18zpRN888DxX1zaSVIpLk4VxsITA8WFDM4UEqMLrrn6ILOzC/SHmRu1rtdh4Pt4nqpVl50OgNEFPS9l54zHFx6/hK4Etx7u8dTpJX7lDs29e0aveB7GCnLtpga1FfyLry7w25flSlWWb9TGP2Xzaf1O+y3f/QEUInp1/8VXOrbGK93v0pMbCHYJq6//zIpoXN2IRdsX7IgywpdMhhXGe9UDwgOXO1za9XqEH6OUz9LiBaaDPkqFWOuIOgJNt6m4/up9LOzeg+cHGGuwRmDqvrjWmkobtIVubw6rCwaDEWHgJuPKIidLU7JkitYl49EYKSST6YR773k9py6sUmpNVRYY7cgok8mEJEnRlXaDJ9oyGY+Iw4jBaEwyceo5npI0mw0acUyWZ0ymE5ZWx8RxyHvuuZ1Ot8Xl9ZTllTUsTsZrNBpTZBWB7xPFziI8imOUcj73EomxFYlWnFucMB4kdGrHXndsIxRCyC3E31q4fPESYeRGrrUuUEJSZAmTyYj339DgI3fv4Pj5ZS4ujfnnH76ZPXFFo9FmY1oySiuCwGOuFbGzZdk343FkR8Sd1y/w7tv28l1vOcCH37yXHfvmOV8Y7n864617ym9a7/H0uMV65tHyLU8NFI+PJYsaFIIPzlseW0k4ePgIYeiRpilam1oWwFDkKePRhOFwwGBjg/X+gMnEkIzGdJoB++eb/Bfvv4lrD83yX35miR86ZGj6L48FaCSh0lgEf3B6hn9zKlyhqu42cNpkm6S412bxw2sZAOBF48umMkjfe8Jiv09iFu9fFuPPLkXdtUksx2WD0gTsiPP6R+yrqrW4mjb5z7/S4OBNt2GtYH1lkY3VZaqqpKpyAgpuPdrlQ+97He986x0s7NrD2jCn1PVMiAYpXS0/HI4ZDscUZUkYhfR6MyTTEXleIIShqjJ2zO5g7949zM3vYLDRRxuDNjk3XHeU1f4EoytMmSOsZWPD/azRTn1X64oizRgN+7TabZaWlwnDmEYzotFogLWMBgOGwxHNZgvPj0lGI2647iCzsz2ePXmZ9f4QXyl8PyCKIuJWTBRHTvBTSZSSZFlGlmVo4YQ9lpdXacYdOu0eyCtae66j727npkKGhfFoxHg8pdmMMdqRkNIsQQvBkY7ho2/okVWC3/zc83zv244y221x//Ehn3xwgy+fKXhmGR46PeXh5yZc7I9Zn1jSStCOBZKSyJa0PMu+nuTW/V1eKD1GSwnX9L65LGBQRDyyFjIoJErASiG5s2O5Z9bQ8eHBdcOJ51+gv7ZOv79GI/IwpmRtbY2iNGjrITyJVD6tZsyOluZffP+tvOmWvXz64Yu8bp/i2M6A3bt7PPjkGm/eXW7pBV55bGJdz220+fBX232lq3ch5LNV8pLW5ivLEbyqx2sbAIDtfhEgbQb2q1geN9b8ZW7E33y1r1c/t+bf/J8uhrJlOhzrpXjS/L0CQGnU1+0Qxgp+5elZxodvZ2Z+gfNnT7J44TRFOuJgr+JH3nOUD73zOu5+3c20mg0GZYtnlyoqLbHGUGrDZJqw0R+ysrJOmqb4gSL0JY04xvMCejMzLC1dZHZmhv0HDxGFEbrSnHzhBbK0QEmFNiVRFKMxHNw3y5GrdjMeDSkqRZZlFEVBWZcBw7Grv5Nkiu/7hKEPxjAcDhkMhlhraHc6BGGAkJIkLzhx8iRRo8ULZy8T+AFlWRFFMQiB8iRSOuJRnmVMplPKsqytwgUYJz5a5FNm52bqmfcrDrt5J7eZipPRGKxB+QolBEVR4nk+ymo+fGuDvW3Fl8+MOJcqrj60m089cJHHLhVofKoKkrSkzHLuOBhx77U9Ds8LwsBNDFoNpa4otCUtFGlpqYj5D59f4nsOFSj5t6+Qfhbzm6djbu1VPDHwUMCBpuXqjuaLqx7nUsP1x25gfucu1tbWufPO1xPFEWWRsnvvbkotEL7P7oUu0uYoFNfusERhzIMXKq6KMg7NBVx9aD//x/E+YmK5ae7l+Qonh20++uWeneblx3RlvqSz7IqU97UFw/8BAgBsSSxoizX2spTqOYt41lj1qMnGf2xcd/quqyLpFabBV9e67Io1TX9zTNOh5QaJtgop3A5VGYW2EmMlcjPOXBEAtJX82fl5/relDnv27uXpJx4hTC7xQ+8+yo982zG+960HicJZss6NnBg1eGZdcnI1J59MGQxHDIcTBoMxWlsCv8nszCwzvQ6dTpc4atXa9xqpFLt276HV6VDmOYuXL3Pu7Hl0ZRBS1WdjWF3ts3fvXmZ7PWZn20gvYGllUNfjmjSdUhQ5rVaLSld1VmCYTqakSUpVVURRRKvdQUonTS0U+IFHVQqeevoMRWnozfZYX1vH8zzCIKAoctJpwnSSUJZF3QbcvDUWh9VIsjxjNOrT682gPO/Fcwp1q89UmuFgQJJMCYMQqSTJNEUoDwvsDHPefss+7vvaCp944Cy59vnqCxmjPHJplAUjBVY4jr30YGmYsKsb0Y7reTzV5OlVweceW+HPHl/jjx++xHOLU766lLM7aNALPZaTmEERAZJff3ae85MWk9LnUtLksbUOv3xyllMm4AsDyYW0Ys1IPG1YTuDzQ5BSsXv/fgyC6WRM6Ad4suANd9xKoxFzebGPthWzrYBeKyLTipVBycMn+wynE1pxhyN7O5xYmhK0ZvjlBy9wZ0+xu6lrLMTlToM84qcfmbVfG+sfM1r/J11uDvnb7Y3xikz5W328diDgNziFl35iEcoFpdQvKc/7iA1Cq4QQP7pLc6xbsZFLpLD0As3vngt407xGIzjS1rQ8y1t2r7KaNTBWsDOeUhmJEJZHV9t8cVHxWxcl+2Y9vvdt13DLtTvYOxuCDXh+SULU5q+embCa+5RlialK0AXaOD07qQSe53bTMkspioyiyCjznO7MHK1OG2uhLAsmoxGDwYD+eh+JQpsKa2ugDwu2ZDhc48jRm9mxYyelzQFJUWp0VTEcDEiThCiKMFpT5BlpmqBqGassSwmjEN/fHCKqCTzCiVYIC7qyTKYZe/fvZmNtve4YSLRx9am1mk6ng5RO464sCpIsAyFRtbKv0RrfU1x77AaCMNrG/S1YY1heWiarW4ndXpdkMkbKEINGaM2N+2PG/RUeP5/QaHfc2LKQtbmIMwORysO3JXNBThT5HNkV8V137qSnclZSn99/8AyffngZg9qmFANWGIxRXBVJYiXIkPzPt034+MMRfeshlHROzMpDeb7LWKx199ZofN+nLDKMNizs2sXe/YeYTsesrCxy9PB+br3xOiYbfcZJyaNfu4AxGXt39piZaXH2wiKUOVe14E037eap557ntmuv4rf/8jl+6Z+8j5VBxn/9a/dxfaC4qWc51k25Y6HkF4/3sk8t8uNlln/SlHSsKF4eMXyNEoH/DwQAriDWb6eaMvDaUoqfQMhKSnGgFGBRhPVDIwRoba6RUlwG3pBauxcrYozV+OLT89IirG2t5noGW77x9v0B33nvdVx3cIYDCz18CbkKyYsGX7uc8sRFy9oU8ENaoQLloS0IUzEejgijYMsJNy9LQuljjaa/scrTTz2N7ykacYPRJKXMS4LQ39oli7Ki0WggpKzNMKlbfH06vXl27t6P9AOEcJJfZVGwurJCGARbrUCtKwI/IM8zpJTEjea2Jr21VFXl2oeYrcVZ1rbWMzM9PE8x2BgghWTT5W6m1yVuNKmq0gWuqqLICybTKb4fuPM0Fqs1Vliuue564thljBaYjCYsL69hjabZbjoGoBTYqgZsdUm/v4xUIc1WG/PSbU1IkOBZzUfvbPOum3aghFNEqkzFqQ3FL3/6WZ67OK65kRKEV19XQUNafu7Gig9c1Wcp8fk/T3a4f1lxppS11JlCohDK4gc+WCflpXVFUTgVJLf1GA4cPEhvboELJ0+xY+cOpkVKgz8fmgAAIABJREFU7AfM9Tr0BxOSIsBUE5SyBJ6kxCMk4dY9Id935y5mQsn//sAZXn/tArftUnTbEcuJ4hN//gx/89QaaWUYZRofe68x5vOmjMDmWFHw8pMQL//Sq338wweAF4Edr5D32E2arATM1s8IGSKlQcja8lpKLBXCmGOhMj9ww9V73v7Oe2554+G9TXpNnyyBUe6xUUSsTQ0jfNYHE5T0QSjiwK+FX1wPvsgLVldXkZ6k1WgipFtY2mj6q2usLC4hhSIIQ5RwstqVNSipkFIikaytr5ImCXEcu5lyu0nwspRFRqVzujMLzMztdKCctfTXVwGBNZqNjT5SSTypKMqCOI7xfd8t5Jf41pVlQZ7nYBxAWdYe8X7os7Cwk/W1VWytg2etxfN8Kl0RRi6raTbbzrCjqsjyDKUcQ9FdE0NZFhw5eoQgiEiSlNFoilQCKSTKk2jt0G0FZNmEQb9PFLZotJr1HI3duuWOEyGxaK5qJ/z8911P0yuwCCSak+OQn/2Pj3NuI+Mf7ZW8MILvvqriD89HfGloSZA8cO+IYzNDzo5b/OAXuixWYCzOTAWuYCaaWlKtHuqpswigbr9a9u7bw2iS0Ax97nnrWxmnCSvLKywuLiFsgJQhloRKW5qkvO1Yi0NzAc1myB8+eIk7j+5mKU35z962m8HqGhSWdlOg4y6nB5Zf++wJHn9m7dNG538pKD9RaC8xFtC+gNLycjjG/68DwMu2OcTL//3XXYiaYbgZCBD4ocBT4m2vf8PNP37k0MH3djud9myvxyjRTDJLUmhK4VJIXWg0LtVWQhB6Cs8LnFFEPe6ZFwVpmhKGIUq6abeyyOmvrXDp4iXCsO3872pQbZsQ46i81liKImPp8iJhGCIETo++DgBu99GMhyOazQ4zCwtEUUxV5PTX19BVxXg8Jg5jjATfDwh8x9tScnvxV1WFlNK1J60hS3OKrNhi8lucgk9vbobAU6yvriKES42tgaPXHCaIItZWVsjyajNpYTKZgABdmVoQQ29d+l63R9RognSgoTEapZzfntHGdUGyDN/zCOMWUqmt2+n+feuMRm2BZyQ//u553nlNG0GFQrCYN/n5Tz3J0+cmdOfm+KeHBG+fu8SkipgNUr646HH/5ZD/9e5L9POYDz/Q40zpphajZozvRU7qK80pq9QZkVhwLAanWmSRYF156L4EQRjwzne/k6jRYJJM8b2AjbV1Tp29hDQG4StumC34wM095sIST/lUZc6jly3/4atT3nC4w7tuiGkLyXp/SBiEtL2cqerwW39zkvffcy2Hd3Z48KnFz//7P3zkXaU1hdVhE5iyRR664mF/DQLAPwwI+EoAh3iFAHAlhUDU7xPbL0hfMzc/+1/d+/Z3/fbR62+5wao4TG1Af2qZFJBpSLMSjCFNp5S5A7+ajQjPc6CcrHu+1mjGoxHWWKIwRFcFw/46y5cv88xTT1OVmlarS+AHbsfX2gF7YhPmqQlE1rC+topAEcYxQggnJGGp++fuSyqPyXSCqTRFljDorzPYGGC0IQwjlFJEjQZBXesLITDGOqKRlHh+gFKeM9xQHqEfUhQVbh7H1i1UUe/wDaIoIplO6rEDycbGgPV+H2Mlvh+iTYWSkrKqqMoSrWv/QdiqvfM8c6q4V3jnWWupyoLhYB0hJGHYBCRe7QGwqQgssHV5UiKMoBcZPvKmfcRehTCWVDT4lc+e4KFnR3zkgOQ7dlbc0ks40FxnRzik4WVc3c35wIEhj67N8gOfb7FofaT0kcrN7kvPSX4LAWVRbm8sYlPmq065BS4I1I9UEHjMzsyQJAnWOAm1Ii9ZWVsm8FxZ+MFjLa6eBWNKKmtoxSHd9jyfe/Qio6rFM5d9/EDgeZqF3hwvbBj+4LFF/tmH7uTafV2+cvw8TPtX7Z7zb11cHnw6t0z5B9TDeG0dM7YW7ZXHS0jPrxgcXuEFYfG86NDM/O6fXR+OGDxzgiAICQKPZruDEBJdlaSTKVZIsqyg1e3SCPythYo19AdrrK+scPnSIlpXKCXp9rpcXlzE9wMajQa7du+qnXgVnu8syCUWKbdTSrAYo1lbXaasKuK4AThjTSUUVVVhtbPUskAQ+BgTMRmNQDhrrm63SxBESCXRmyk7Fs9TW6m/EMIBi5tBB7BCIJRFKAOmxA98Aj8kS0q0rhhsDOnNdNmxsJfRaANjCxrNFs1mm8FghOd7jgGH3ApUm5jCZnBz3wqSZEpZ5nh+QLPZYDIekyQp3U4H5fsUeUEUxVsx22U8tbFIWRAEbsFev1fQDTS2qqikxx89ssh9j69SCcEnz1s+JiTfvn8DTziwXFvJ46sd/u3XGjw8toTK2azNBBV75hSznQZKWZIso7+RcGlaMLEaIxXGOpUjhKmDgAartq7hLbfcxq49+0iSKdMkYWVpnbW1vgvWgY/CsjINOD/xWRoWJFoyyib0ZmPKYkhSRmSm4DMnLNd3QnRs+eyzfd73ugOkRcLP/s45fuSuBa65JiDVe7692+0+8Km/eOadSeW/vIHlKw1DvIrHaxgAvumV/Xc6Aj9AITvnXzj5pXOnTrxdCkMcx0SdOW674068MMYCftxAAY0gdim7rhhsDKiqisGGGy4Jw4CDhw5ijSHLXS9+7959KD+oh3Pc/6mUdNR1IfE9ecX0m6vHh8MNsiyn1Wy68Vhby2AJt4ix2956ZVkRBD5hI6LVaqOUhzF6K/X2fQ9jjevb15mPEKJe0H06nS6BXxueWEFpS6wVhGGDVrsN1uB5EePJkDRJKcuSdqdNZ6aH7yu01ozHY9rNJlmaIpTvWIm1aYjd3DXrqgu7+ZrTKCiKkmQyRSnFTK+H8Fw7z+38dqvrkaYpUeS6CFENJOoq57oDeyhKDZ7HqeWS3/izsxgpEMYDAZESPLTSYyYIWcs0f33J8udrJR/5wGE+NN+k1wlYmGkz34sJ6rLKCEtRaCqjyIqSQX/CyjDjbL/koWcW+Zun1utsZLNMUuzfv5vrb7oBjKXRbtJKCzaGYxbmF7i0vITRUBUZn366QJwQvPHoLNfNFOyb69D0Jbcc6PG1pZSw2aTQguOp5tml84zShKlu8usPDJnaiG6jAinpBhUfvG3+dX/5Rd5zbmJ/7zXr+73keI0CwP/bxW+v+F0gyPEFCBPsy7ON75nx1Mduue3qJe13DOGMDKIm3fkFhOe59LQewvE9yXB9DWsl1hREcQOjtdulNeRlzrRItrJD5QeYelEL6fTj0yRFYInDpkP1tx6kOgBYTbvdAWtJkwylpPPBA8qq3BKg9DxFHMd0u/Vi0HrrfUo5CXBrDBZTc/U3ralcCq0rTaPRIU0SpuWASpfkeY7GEngeSkQUaeLOSQnazRY6dGYgyXhMMkmIGiFKSZQQrK+v02x2EVaQTDOU8hxSfsWn24wC2zaZ7kJ5vker2dqeZTCGoC4PHN5h8TwPY5zFmPu8FcKPCLyCh54rGZYV9z95mVIKQEHd6fmNsyW/ebaiyAo++oGbefvbdvHx/TOEdoIX9ByQWuaMU0uWlWwMEzaSnEoLKgOSkhCBJyXXLIQc238LU+8SZxZT8nRCmRdUlebed7wV6blswBaWk6fPkhea0aCPqTRJOSGbTGn1uhy7/gZuOSR4/fwaFRIvn3LXzQs8evpZjIU4alP5BWVWYIspf/HkZaxqIYXiub5l9wFB4Id0opxrjuy8d+nJtd/LX2ktfIuzgNcoAFyxfbw01bcv9z73BulLgLjrp+k4rd4ilcqLYrrv9dft/sA77z52fbsVv67Z66loZifPnC1uObtRoWTDmVfWtWatUokUgiydEjcipFKkqWJ1vc9gOEEKgScVlSmRCnzP7cKmRo43k2xjNI04xhhdtyHdDhhGEYjNXjwgBM1WmzCMydKU6XRCWboUNopCZmdmkZ7cQqmdgaZiK/LUh9xk4Fm34+d5TpFnmCrj7mtmeP3hJgudDt1I0YwUkSfAaLIKkkwwyisyrUlT6Kc54yLi0WeWeOGixsaQTjKMBWMtc3M7MAbG4w0QlrzIHGBmr7QgFy+6bwLn8BvH0baYsXH2X1s32Tpc378iIGANVVky3+3w1EXJkY7m4kbJ85dzrFQIjEPnpaHMS37sgzfy7W8+wr4Zj2EhuDScEkdtPvEn57npQIdGCH/wNyfIrKDEo6q0m2+sjJNCE8rNW5oCKQbkKiKIWhhbkedTvvO7v4POzBzj6ZgwCLl8+SJpmpOnKUsXL2Cr2qEJwYGDB4nCJk+cX+FwnBMIiylTrtsxg8Ri9YDxeIPQa6NtSVGkXDhzmrnd+4miBn9+vOTGvS0OmZwLI81Xn1p8ImfTOfkVsIBvYRB4TbsAsV8gy5QKiZRe3ZMWdX1owbhR2Ep5V0vM6wpdHPWwOz789hs7u/bs+eGdsx3bbccyaoQMUsuFoeLCOMZ6TRASbTW+FJR55lhmbtXWsI8Tuaiqgo1+nwvnllwdW5WEkU8UBEjh1b16U099OU6i8nzCyBGBwCIMFEXOYDDAWpiZncMPghqZN1vofJIkJJMpunIouZQKpdyX9JST7t7c2evfRZ3iA/V5aPI0d1oAkcdMp0W34XPvjXMcaSX49XuNLejGIZUGP1QoFJHSzMSCUpcMSkl/UtFtRiBiHluz/Ls/eJTKSjcFaADhyhltak6BkNha8+dFsRnAQhRFzk6czVRfbGUyYvPDwFa6Tf3vVFVBEDrswBMBgW84d+4MSVZhrUQKgbSad75+D//o227mwI42g2nJicWEP39y6CTU9ZTLI0mVJug6zhurMVZgtXa+hdMh1kr8sOFKKBxOYq1rwY4Gfe666/XccOvrGKcTgiAgmSY8/dQzpNOU1eVLDNZWEFYghcfMjg7X33QHYSPEK1I+dO06bWXwpKUZd/nVvz7JXz01REnBzGyPoizZWF/H6BLhh8zM7yNutLlmVvP+W3p85kvPF595bOlwWZaX2ASPNy/uKx2vciD41usBwNbDkxbm5o9+4O4vzUVCKZzVdVk5zXWlPPdQBIqZWPizMy2v1w7ZuWcHoQpY7U95dikV9z+xhpg9iPEbGAMSgzKZa3dZSzbNsUj8MKiRZ0FVFkzHY4Ybfc6fPc9kOkUJSeD7KCnJxhPGVU5Qa/MXRUYUxURBiNaCvCjpb/TZtWcnUjgAbDRyM+Nx3NhKb7GWSlfOPWeaIABPKqJOAyUc287t9MLZe6clQkik3Fz8om4mbLf4dKXxPMXMbJdWu00Q+BTWcN+JEmkFcaAIqpTdczGX11PiRkiapnRlxu37Q+49tkAYJ6AFvhIsRD6r2vL5rzyPJUQKhfAtoKmKhGvmfM6tQCECdK1OZBE4uTCXCwkhaDQbqDqdFy+50dv8BHff3aShe4cxBmMgDOOaaJXTn2akWQVIPCERFPyzH7qdd9x1LdOk4E8fWeHBMzmTyseWEm0StAZMhrECZZ3mEMJgS0tuctZXl9BVgbAKPyhoz/TYFDmt0ozptI81glZzF5cvLhK1I1pxm1MXT1NmFWWWM9zYoAZdsFaTTjOMzcF4BEGT9WRMESnG4w3mWhlH9i/w2GKHzEBSpKCh0ZpDVylZOmFjZZGkucGyv5sXJk3efvfNgfHDn7zvKyd/KitrotOLsuVvsKZ45bf8XY7XpgSoT/ruNzSPHz+58j+9+eZD//3dt+xVB+ZjGqpCFFOErqjqCTi/GVPJkEtLOUsrGZcHAy5NJV85MWZqInaLACrj+uFItDVY6y6f8h26b8qC8WjI6soqy8vLFHnhHHOUR7vZAp8ttpgyIYFtUmQTkmTC3NyOep5fIqSkKurpBOM4AoPRCGUlcbNBs9FCa42wkKZThuMxAL7vE/iBS+Ov2OWtECgp8VWAbzf79BKrDWmSkKQTAt+n1WzRbDapyhIjLHleUFYbeDXIFgcBQRBjjeF1+2JaccVaP+XtR1tcM99mvu2hmGLJsVax0JLMNUDLiD/663Mcv1QCPlpWKCSmrPiJ91zFe2+aZ1qknFjKOH4h5XNfvsjAehjjRoVFoGjGbTeks3lrN7OQOmOifk1YNybsygLXvqyqijgKkUK4XdsoBn2HtEshafsF/92PvZWbjrZ55kyfP3pog3HlU2mBtRVGl2hjEMitB8tgKPKE1fU1rLYoT6ELjbUKITVFOaYqY5SKSSZj0ukKB/bP84Pf/2Fm5naSlZoHvvwwVZKzvLREkWWsrV7C6gpjQQnQUpMkU1ZWVziw/yBZWfKF8yGPP/s8C72Im66do8ok0/XTNHq7qESICsA3Fhv5eMonnQ44uPcQd95ylEYkuH3PhOWd8ffeVxY/hXWZlDtemm5943W19SMvOr656PCtCwDiJd9YePCrmk5j/HOnF5988C+eXP0f57uNO64+OM+RvT3m2w18Yem2PBqZZjQ1PH4u5+nFAWuZR+C38bs7mfV8jK4pr5stOGOR4Pjy0wlry8ssLi66XaIOpmWRO5eaMAAU1lZ1eivqsduCqqqYmZ1HqlqhRwDWkE+mdGd7mMowHozxjKTRaRGGUb1TlwwHG5RliR8GeMrDWEtZFgRysz4Wzjr7JdHd8QO0U9PJcrrdLnEcu1S8qijKkqoq3W6rNdPJFGMsfV1hbMH+Q8c438+5ZodElCXTJMUzCmEKrJCOOykLBB6+DPn8CyM+/cgaRnoIYVCALXL+yfv28Y5jPYyxrA8q7j7Q444DDb7/rn08c3mdP3l8g+MXDUHYQFfldtlWL36XuNi6F785l7DdArTGoivtBDaUt9U5yfMpVVkglUeE5qc/eheHFhT3PTrg8ycM2igX4I0DYYuiwJpNaq8LMuPxmP7GBlIJurMzNUhqyPMpyJBGo4VSHsl0iXw64PZbb+Q7v+s7XRmQTHjggYe48ZZb+cpDj5FnBaNBn/F4SLc3iwpCJJJK50xGAy6ePseuHbsRyuPUxQ3ytOD933knnUDSkJbQE/zxl54mbO7AGgHCYKzCjyKSiWKc5Dy/PKYYjHnX3h4LvcZ+vPBqUYoXNrsrV1LiX3x8g0X9dcHgm0sVvkUBQLw4iNnt10dJjkD9xXD4zJ1hozWzNj1020PPLv9MZ6bT9APfCzx1daVNDB4iCAm8GWZnfBQBJRWetFhduAWSVUynCWma0N9YZ31t1aXMykcq12e2pqTIUxotx0izNdgiasTeub+UZNMJ3d6cs9/CIdzGGLegPJ8giJhOJhhjaPc6+J4PWLQ2bPT7FEWBMQ6og+06PtYVjWZrux7eBPpqyrGwliSZYrRmfmFHPcACaZqQZfkW6y9Ls61AgjVIBI3WLEoKzk0EmSmZEPKHj2/w6a9c5sN37+ctN3bBZAjrI6Th1BB+5U+eA0Is0qncGMMPv3med9w8R6wMVmqub7WhNAQ5NJo5BxZaSK+g2ZZQabQ0YF6c+Ftceq82d+aX4L260igp3Zenthpw0+kGUjpVoR9832GO7o155FTOg6c9qqqkLAs0AqW8Lfoym0YdRpMmU/r9PkJKOt0ZF9AltHsdGjrGGg8QJJMJyXjAR3/k+7n22uuwuqAoCs6cP88Lpy8wzQxr6wOmkxH9/iq93pwbXqpZk6KATm+GyXjE2TMvsO/gUcbThGPXHyL1d3L63AX2zErmOyH7uz5rWYH0fCqjccvMAYlFmTOZJJgsI81zOjEiL6Y3ImczjC2EKJbd+tVs8jHcRRbfRFJQv1mIK/74jTOBb0EAeJmzfNGmJxy6LBu6SM3ac8+eud+a5P6Znbu48eZb+PKDT84dOnIwaIRRbzS4+CHfi2OlwoZQJh+Nx7eVebZfKfUn0yQ5ZK34kB/GSE/ieSHt9hxZMnEtJinAVhRFQrPZxaqa1GIslS622GnCakbDEe32DEZXbLLRi7Igz3KCIKA506OsKtI0ZX7HHEI6zrk1lul0Sp4XrgwQLiORUmK0AwOzJMHzPKLY0YbdZdgm76RpihSS7tw8UgqKrGA8HtckHElVp9VhFG4N8gigyCvCsIU2hgSP8xMfpdrEMwIkPLJY0WxMObTgsaMhGFUNPvm55xlrv26xWYRR3HttwHfceYBYFmhbYSoLGowRZGqGLxzf4A8fHTLVrl2ILxH65Z/EzVpfXHG/NzMDC3UnYPMKWKypKPMKJTzuvM7nvXfu5cFnJzxwNmZ9bYUizVF+RFkVRFGEVwdnrEUb7UxVhGtSekqRJqlra9ajy9REJl1V5NmIe950B7fdeivnL1wmyzLywvK1505RVIKvPfM8kR8xnQ6RUhE32kjl40mJwRCEAVhDq9lieekyrXaPZDzl0FU3QjblLdcqFnb4ZGPDVQfv5if/1f/Nzv1XIXDljpRuwyiSjCI1jhJuJC1fsW+h89M3HZnf+zdffv7XNOEnM2X6kRGZlREFzqeBrbH2Kxc3V7z+Cmvvb2khvMoB4BuEKPGSP1hwibsGGbOxNuQLf/kgQPrsk8+0EWIg4EGB+D4r7H8E3oy0/1JgPRAzIN/i+8EXumF8T+DHCOVYco12lzwdkeVTrIZWe7beNB2yb6scTElZGIpswtF5n1uv6SDiJieXS0rruTae36Ld7qKUQlvI0oR2r4P0PKzWGOPILUVZoI1BeR6ecpNnEkGaJlsb4WQ8QkpZj9PWO6IxZGlGEAREcYTRhtFoRFVUdakAm3MFvr/tOrvZazdGEzXqBWWM0xSWmqJQKKk4X8X89qMpHT/lzqM+z529zMNnMzzpudLHQi8s+IE3Hqbtl2ir8WRMQkVlJU9dyvnck6d4fgVQPtQioEWmQSs2W1ZXOgkJIbYDwOZzah3HIYri+vzl1lBQVWoQik4Dvvv99/C5xy5x31MlVbZBZXKU13aKRVYhhHAtUO08DHVVueEpKQijiDwrCKPYaSkmKaZ28DW14Kg1ljff8ybSJEGqgEmSsDGYMhgUzM/voNGMSEYpWZbSbre35hfs5ues255CeexY2Mnzzz1DM+7i2QqpM15Y8fnsYxeJvZI3HNvNx773Xn7vz5+g1Z51WZ3RZNkUayBLMgQ5SSVpRR7NyL/rH7/3dj7+tr0/f3Zt+jPPnF8fnVpKTp04vX7fmWF6SSr/MYE84clqrK3ECI3RzW9uzf0tUMCrHADqx/tvTVVcbYSowIQALdAT4DBCfMQKMScwv2utmEPYL1jETwuIQf+JgWPCyjcLK++oirJYX15+Ooqax2bm50zQiJTEEsZNtLb4saKoa0ydJRyegWsPx1x31Q6Ozgfs3rUDVIvj58Y88EJGs2cw9dPreOC5Y8TV3PvpNHXnjqAsS8qidLtFHKO13rrglanqh1xsZ2O14q81lqrSLsg03U1MkoSydtLV1dSlnEI64kxNGd5iUVhLpTVBFLmZfbu5CC1GQ4mp9TzcCO9AKz7zrCbPmvRmPay2zojECt57126iRoPVqaaUARcHOfc9fpnnlwqmpUIJCUJhtRPILKsCq7dJTy96utzW7AZvUFsvG6MJwtBlZPX7NslBRrhg2ep2+cSfnCUvXX4oAg/PRvjKtfZ0ZShsUbMqrbvWOK0CIT3iRkSapozHI8IoqsFHg+eF+B74vmS4MXWbQJkwTVKSNGN9fYXA990wk5DkReoAWevKmU2KtxDyiusMSvkszM+xtrKENTkXF6d89UzFXTcfREbwf/3VKQ4tWNJsgsTDC2K8wKeqKjzf0N9YIZLw2SdWuPtwl1uvPcQTp1Z4z/UB8x0/uuPITDQu7MIks3dnac7iqDTPX1jvn1+bjl44s86p9fxfw+A+X/goPwChtEVk2nrDUI90KQKKuvTZ/nr5SPDq8wCurD9eNhC8GJzwzAiDj/F7Eowvsdoi9mHFxxH2d6ywqYAOwtwlkIUw6getEKm0fBpptBBmJ8gG0n642eoc9DwPXabYouRA13Jsb4u7btjPkV1NZpqSTiekJOD8oOSJ50d86ZRmtfRBSYSt5bHrcyvynOFoROA7tp4xhulkQiNuoHwPazR5ntVtOwBTA1U5WMfWA0Gj1SJuxAihNi862hjywpUijUYThEPRjdYMNjbqtFE63oCnag0BR27Ksoy5HQvEcWM7E2STLegWlZZ1K05rTB2QtLFI4XZkgYSqIlQVeaVJi8pxH2o+wOaINWKblSde5kG60kTUWvcZPE9tYwJK4dV8B4TD7h3IakmTKZ5UdLqzIDcnBi1GSMRmwASc9bjZ+n82H+it8sJYllYWMVq7hWpdKdbrzdVdPEt/eYmP/+MPc+3Ve3nmZJ8LS2ucPnUGrRVZVYHWLK8ukU1Smp2O46QYg5CCuBHie4ELXrXmgrCW/toK73nLXSyu5ayNprz51p34wmeU+nzp+HEmq4ss7DpAScVgMGawusi+/ftpdWbotprs3tlkMhkxWFlk8cISv/Cjt3JVF870U/7q0SV2zHa599gOOl6G8ANKA7m2ZJVmdSNnUgqmecVompuikhOBWttIKR5+fukXH31+5RNfvwC/Pgi8+hjAS0qV7ejzMhHBwsL8zLvvvmHvvx0N+9nq+ujyxaXy8fVSfkV4/mcl6iiWXEiURR0QcABpnrUYLYSQmPKcEOKeWNpDe2aUv2dHyXUHWtx0+BB7O5aFTkwv9CgIGBUNnlua8NTxCU8vDllJnUqMJUAqt/BNLVm+2bQOgoBup8t4NHYz+ErSarcosoyyymnEMVEUUuSFs86Wyj0wKkZXJTk5qs4QAKqyoChKjLbEjZhWs0Ge565Fpmvev1R0Om2Gw3o+RFgUNUGnrCiKHM/3iaPQgWH16W4ae+R57mbiPQ/f9xBSbXVKNo05hXSjuwWCNBcI62GFQPoekjpFt9vkni38yb70Abqy0N98xQUeUzMCvZpeS92mRTjBE2uh3eo4XEA4MtgmeC3sS92RrmTIXbH4r/j/O+0OG/1+jesIrHGTmqpuw3pBxEMPP8rdd9/GjlHBSn+Nubkmzzx9irzQSOFTZUUtcy4QSmxlA8k0RYqUuNmstRRd+dpodjl+8jy9hT2RK+pVAAAgAElEQVQ0O00mFYQeVEqjy5K5mZilpbO0e/N0uh3WVpdoNNsYXVBUHkK02bNvH6FSjEYpGRGlSdjb8vngm46yNioIfMcIFWgi3xB5kp7nM7czpMJjlGqWhrlcn5rWxX6SXlod/u7zL1z6LC9iF76WGcCVi7z+tqVywiB8X6/l3zyZVl/WpvzCeuaQUU8mRz72nlt+/T13XvWOubCiKhOGSclGYkgrQV4a0rx05pVC4CtFHAY0Y49mqOg2BN1IEXqKdqDwhaY0Bl945DLk7CDiz7425KsXNQYncCGEYxxuudhs7TabT7HdepCxliIvGA4HBFGEFAJrcFJgReF87+s6tyxLRE3qMdZxGpy0mBMxieOYZrOFH4TOdhq3UFx/vEQgXLvPGiajMdPEkY1EvYBN7bk3OzPjdim2STdFnrG2tkpVlfh+QLc7QxRHeJ6HxdQf0dYf15CkzlQEUTsBCTfS7ILEdhfEgZEvk8zVKf/Wr/UvZVnV5CZJEDjsYhMUzGsvg2azSSNu1n6I7p+TwnUP7Is2jldoJmG3sK8r79ni4mVXHlg3r9BoN/EDHyEk6XSMLRPe9ra76TZCrj6yj6DR4/Gnz/LQI09TFBUb6ysIBGEjBsG27yEu86qqimaziZLS+SvkKWmS8o53vJ/z587heZr5XQuce/44b795lntuuYoHH3uO33/gBXK5QFIMuebam5lOJyzMtGhEkpiMtx72+dQXT+EJzVtu2M9sZPF8iTFgPY+syCmziklWMa0U48pjcaNgcVzmVan+KpuOHs/S6lPt7OJTp0YBhdEvmk7lZb7dvsqvZgAQ8FJVn9irOLyr/a/efGT2v7n56lkxLtT0jx4++d8+car/y5n2650h9w904//hI9927T999+37GguRxiPDSdtItAfKCswmLx2BVhJpxTbv3BqktUxMjBWGS0PF44uKB89ljKaaNK3QZU6lNZWuUMonCMOth2jrcbtCsWfL6qqW5RpPpijpUnK/HjTSxvW2rbUYLEVR1ZRjl3b7vkfcaDhhEeUSrk1UfLMXXscZhOAKOXBNkRfkeUaWJWzP0wv27N3rRDfru2yNYWV5CW025w1ifC8gbsR4vre1c1trnWBHUjPpxHaw2jYJ3byRbAVApHhxAHBgxIv+vBkwy7Jy4qC1SIkQbl5AQK1l4CYbneSY64q4qlFutzk31YlfAnhf+Y244oXNIJHWRB0hJBhB3IgIai2GKs+Za1T85E98lLn5OS4srnHifJ+VjYLVtXXOnD5PVUwZ9ofEneZ2J0PYLQCQTfzBujmRsioxecbr7nozGMXpUyeJI587btjDe29vMxeGXFjcwNiKP/3yCb70zDKHjlyPUBGtUGAwvKWzwsG9C/zcHz9JGcwRRm0KW6C0u05K+hik40EIKmN0pjz/N0yRPL6+sfb5dis+v3bxPEJ6CBECQhq9blTcFc1G52PG6EZe5P+uTF7eaPTVEQS5AvVFwJX7RaWLgx+4Y+/vveWWBfnGt9zCkd1xsD7JD3/xeP9XRS3Za1Emseqvvvz0+u/d/9DJ5Vw271JBK2h2WiAr3OVXaKnQMkJLZ+AoVcBSFvLA0wN2dDssTQy/+2TKuXXFHzye8uTFhKyAJJmSplMqq+uH2WnhSyW3Kat1lM/SFGvtFsBWb4j4frDFc/f8wIl7CLdzVboiz3LyrNjS5mu2mnQ7XZqtFl4t4fVy181athayy7jd+ZRlhTEW5Xn4ge/ktiy0mk0ajeYVEJxbeEEYEoYhgR+hlIfv+47TIARYUaPxbvGbOr0XdeottwRWrlQXcOdj6zp4u/7/epDXWuuQee2CoRMeddJoURjV3gOuOyFqbMNY67oddZmxHeC2g4kDViUvDj92M0Zsncfm33qeRzKdYrbUi0xN/BKYquT2mw9z1+3X87UzGzzy/JBJbrFCUVWGfr+PkoLJeIwX+Nt6i9u1DUDd5lVO9MSLUJ5kMlznqqv2kVUFAovpXc255YhHlmJOTCPOnL7EPTf0eOHcIsOpJYzabAxHtCm4cd7n8y+s89xSQqM9j605A+BhDFRlaYsi+dPpZOO+4fryzxptf7S/9Nz9k+HGcZ2nw3QycgIzQiLjYKbd6/7zsNk7UeSZ7M32fkFYcbVE/naeFS++WJvX7Oufyr/j8Q1xBguYst1q2k43xOqK0aQgS9GQW0sAxod6fhs4uZz6//pX/vTZ3/4tT7zvxgNzP3X7DbuP7Or6cq7tM9Nr0U8kk6SgE2oCWXJho+Lc/9PelwfblpX1/da0xzPce1+/qR9N0zQNLTS2TB0IKIqggCYmKg5ExaQULSoWGrVKYhlELVMmBqukVCSVwoKksEBABZQmKBCZGxVouvv1SL/53Xenc885e1zDlz/W2vuce+/rB92gFLar6tW9755z9ll77TV83+/7fb9vh+Ej917ErHYoDEdZT2G7pBLRQgiBPMuDb+ogFIdjfoL0PQ0TjnGOjou/uEUGcIHxeMWTfpoag9EIUgg4Z1GXVZ/qmmapF8LoEnocBbnwxXh1Cbb9Iu7SaPtJxqGUCmCdJ8EMhiNfCBTwGv5y6dEx5pWBpAKL0J+2gD/xXUhe8hqBzC94MFgyvcbAQz3MhQm+1yvv4HxrLZyzkFJCJT7/whhvBXhNgGXCkF/0fqzEnmt1GIYLpKem9hGYfJD3ikpdD6nv1MK39anJDCurq9i45IuxGgPopvWajZLj7ntPYVoL3HtmF8aSv3/OwUM4kYkICOzIzqXZg7EELKP7Z6FBjGFnd4I77/wsTlx9HYTIIOUQc9eCNRrGVGijx6CcncELb/kG/MlHz+Hi+ilEKkKdZvjL+0t89sEtqDiH5TKUXgugqwCmsxmrit0B4D4KRx8vdjcAxo4Cdh2kSMiUx+0vuCb57SeMVg79SZREN5umhdP2tdPJ9PnWOTTzevF497kB/+DJQLmIz912/+bbkyT54fvP38fuO7+FT9yz8YZEKFd3FWY78A0MTWsAuDN1w970udOzN3163Tw9T+KXRsDLrbNPEkLwOPLMPGMJTAj/MB0ghY8JxyqHQCDmMF/BtzW+iKYUEi481K4Wr9Eas+lunzEmuM+Qi+O4D1cB/uQar6xgsj3B5qUNpGniT/qVFYzZSkh0of407UpnOefQp/7yhV/JGOv9+16mKiwXIQTSJEVT13BBlUdFvjTZZDJBlqX9wujESjjz+nxN0/ShMmttEMrki1OThT6Fo3ThAu3dAjxw6C2IxTNaeh0+3NZhI/0i5Syw/fYd0fAmf2d5WWtDQtHCRdFaAwyIk6SXPrOB8COFCB7mYqz2zmmGOE4RRbGvekwO1XyGtq0RqQgX5iXuun8dUqWgqgpFSTWyVEEpCaNb/5myQJplYPAsQCB4tkRw1sJqC2ctuGSQUYTBcA3nL2zi4oVL+KZnfBtyrmEcBzEBazjq3R1kxxjclBDFOZIjx2GKCpuVxXw6hbYOw+GRMNYWzAGODOrKF4Lh+eiJxXS+DYcxWDUDqYsghpWrjkAI8WZj3hiTSZ4smDgG637Haf3HRAzl7EtXKv7KMIADyBD27TB+4sSyhnb0IsYo58RLJ5MPupa5A8YCEGxu/7kFbw5YPXIMWrcvzfLRe7QxnKxBMswheQIpFMAJpi0xHI5AAJpGwxrtzeFIQYqwy3fhKPIx6tl0Cm0s8jQD48yTbsinrGrTaeL5hS1lhEgqtK32TLKmBsKp5gE3H/KS0pvBVV3DGoM0ycAFh7MW8yLEo4PpLYSAiiKokDjkDZOFAAeFnAJjDDo9QOcsjDZgDEjS1G863eLhvqClxxsIYLzn4RujvYWzjNUsgXn7H6c1NmgSdMlM+x51WMRRFAUz1C9H3foyaSKQs4DOz0d/XzZkTzLGPE4BhrZtoCIVXG/vqvW5Boz1/5av113UL1NPVqrLEhsbl/qTmrwvAyGApz7lRlz/5GegMV3BDh+qvPMLd6OcTXH+zIPgnEMbjSiOQg2DrnAqg5ISUvln3HEbGICmLlHMdnDV4RN4+rO/DcbGYCBUTQG3dTde/pwB3vmhO/BAeQQiW/FA7Gwb6+cfQBwPAM4RSdU/CUcOIsyHpiq3ynnxg4D9HIGUUFECoLHaPGb1qsMfBnhqTPvmqqz+AxxHWwUZ9eUFtkBN97SvHANYPrgOoIzevLROgpF6QGWjk/Hg0GoU588aDIcnpXAYrayxOEsZYGA6PXnWDcPiXGqKAqYx96okGkRx/FzGOeqiQF3N+8pASZLBWRMQdQGlYkgp+4XfV7YhQjWfY2dnG1Hs31NWc8x2p5hNZ0ETUCLLc0RxhDTJkAYmmw5CmYx5eq6xXl1YGwujrZfIKitPEoLnvVujYY0BB5BnGdIkQZqlSFMv9gkApm1hWi/rLYXsy3QxxsAFh1IygHg2KAb5hWWMF/Hs3Abva+/FGzpLQ0rPXeg2Ec6XN4F96ztsPt33XG4D6FwNcj4JyC9QDi4EmrrxgpxAL9ZpnQtWkuuvT44wn80wn8/R1A2KWYFyXkI3DbRuoHXrWXnd81vSHViOUNCSO8cFh241jLH9HPJul8PW5hRHjl2FtavWwBkQCc+xmM/m2NnZQtM0OHTkaui2gq414iQD58LjK3EcNuqAXYQ5T8xbjUxEKGdzpKmElBwq4mC2xPOutbC2wQf/7gzmmiPJB2iqGTbOn4bk0mMm2qJtazjy7pGQDIwcVeX8/qqc/yljOJUNV25J8+Gb83z4q2mW/7yMklcIqZKgQfG0KFJPsqa9Xet26yHX6r72VdkAhitDng8HP2JIT5x1u3teXEqCyUerSLL0DqHUj1dV9YfWsUNJkp6VUv4KgX3EchquXXXVa6MkuV7r9j4RRZUzS346HFQk/y+X4smCy6coGYEzj/5OJ1NUxTyE5wysMbBGo67K/l9TVyjLApPtHbSmRZbnaJsas+kudOv5/OT8ydfUDdq2hZBeMwDML7Ao8huGVAppmiJLUwgpQ+ZeC+ssCARnKWQEepO2E8/wC4ktDB7m1YD8tSOoKEZT12iaNmxcvt6AB88EhJI+wuC85aG6CITzIFwbNhHdtoGt2PYkFhD5a3Dm05yN6TGJ/ZuAtUs6hJeZQ4sYvP+ss64HDDlnkEpBduPSNn1MHcHX7/zpqvb+6eGjRzEYDjEaj5APh4jTJCgvc0x3p/1YdFED1rkuB6wS/wYpJdq2CZuGP0k5GKyzuLR+Cdc/8QnggvmxIGA23cHp0+eRDQaIM6/GPN3d8QVYevCyY3YGVKRz9eDBQSE4QAbHrzmO1tY4f+6LmGycwYnVCLedPItRnuP81gyj8RrWz52CNRbD0QqiOEGcpGBcwGiDoph/TDB3f11Xv9XWDThwQqjoxvF45ZeMsatlUUIoCaWksNZ8ZLK9uZPlg+MAPRXkPtnWze0HD+N9D7D/7yNxAZZPewasHVl7SRwlf1GU5fdNtybv2v/GaJAizQffJzh/MYH9GJdeZdMj+Zx1+eIAfJ06EJxx5Jz5vNb6g7oxv1DNZn1YBpyyq6+57vfB8AryH4Kz1te5cxbOIZz83J+mQvbyWk1dQUUSQkpUZYkOHeVgPdrtT3kvbBlFMZI0xmAw6kNXLlg8XYiwCxfq1lfEnc+LYH2HU1FwyHAypyEcKCLvkvTrKIwVYcGVrytfIpxL7um0QEgicT3eYI3xMtsh7Cik/55ugehWI46TPiynw6Lwstndd9Ge5+VdIB3KabF9k+agube8SfhwJuv70Zn8TV0jjqP+fc75MGdVNThy9ChUFC0t6gXsSORgtMGl9XWsrqxCRbEft84lWMICXMfnCPoQRrcoyhJkHYy2IHiehmkMbrr5Jlx73eMAYqjbFg8+cAqnz57DeLSCKInByOHUg/chiZKwKVew5HM+oijwKwJCyOF5IdZqMAK+9Tu+HUePXwvHDM6fvYTPffr/4RuPxLjhmlX80QdOIhsewu5kB4PxCgACFyL0PQwgEYxp5ka3u01db2rdfgBwdxPQMLAdBvYUIvcuxvh5IrqRM5Y4Rl8gosORSu+viwK07OItwzdEe/7+yEBA2vt7XbV/qVsryqqk5TOi+6a2mR0aDld/gHH2FOcoImfAGFinDgMir+EXOuiLXBATXJxjDsJRCOt0fozj5YVzZ1915NgxCClfAc4guOwltoBupw5AGxjatoWxBmmS+pTM2bx3CTpTksh9rqzqe0H4ZqXUURChritUZYnZdI7x2If1hFRLRAu/QDjjiBOBKI2xsrqGpq5RlSXmRQGQhTN+8mmj/eSpCIJzxCqGUjKc5MumLAsMQoI2BnVZLqHunilnQ2krKdVCo3/f6HMhUNcVOBew1ngQ1Dq0TQ0h+b7PLSaHELInJznyasbdWPaYAevcbOo3CsYYeNAwdFZASg8+RpGCbjUYAGN9OrYQCnHiT2sEpL0D2xbziAXR0RS7kx0kSQwmOiUiT8jhXck1dNaIHyMXkrYAQpz46j4AULMSd97+eXBLuDjx2aNNW2F1dYQsy70wjQXWVtawtXUp0L19l3SrobVGlufesgobTVUUcJYQq8hzLOD5HMkgx+jE9bhudQopBbQx2NneRL4yhnMOTdtAqaiXlAP3+IeK04FM4kE2GJ0gR9/ojIEjVzEuPm2tvU5K8UwCGufs44VQd3rozB9Gg/EYHOxBIeRdZTE3k83zf5EMDpm6mO/dzNlXwwI48AIu/yIDuIq5EJIz4WmhC+27xcnffd45B7LO2NYc/MLua9wEq0ef8Itxkvy0kPLxfQIOPKONMY/wa20QBUS/KnwGH+c+HEZEmog+6px7oyP3J3DsP3PBf72f7Iyh48ETg1cUGo496KdU7+L0GzijrgfoNP2qeYG2rVFVNYhCKTMh/KYVTGMphDd7YxlM1kUiUXdSUzj1nQtx91DJqAtZOdeFL7vx6vj53hfmIZmmz1fgDFEU98/BtG2/+Dtz29+bL/rRbdBSqkXJ8L6T4RmHHHZaCv8tTupug+tyASrkg9wj7nvCkd0lF66SNRrrFy8gy4fB+upe7xY+7flML65FBFoiLfnCJBzT2QZ+7pU/gGc+80bo0uCz913Epz93L+A4zl/agm01dFPhzOn7wJiEilIIzkDBnWAhx4F85wBiqIoppJD4lhe+ACce/3hYIjhrcMfJ83gSOwXOCG//yElk2Qp41AGktABmw/gywIepl8YBAQ/qiGrd5ru3hWfOWJ9LASI4Yyrd6hdtb1z62F5z4KthAXx5L3iktm2cQ/MlyqDst1mu8DV8BTsbm/99OB69nnP1gmyQ/WvO2XOcc88AgKaujFRKqkjAtPXpsqjvbCv9UQd6u4rFKSYknLVUN7Wx2hIYkA3yO5RSpxjn14KxoCzsASzGfEbc1vYGJBdIswx5PkAUJ96KYN1G4Bdo29SI4gTZcIjYJBiNGZq2Rtv40mPWtF4D35/jsIVBWRDyPPdKw4GE3/HkvYtCcFb3OIcLtQU6mnCSZUvpxH6i9P8P5r11gWDTQ/MB8BMCutVoqjKY8R7xFlIiSpJQYssX9tDa9aBchxV0WYxCqhDeC3yHYKn0jDrYkBXpacvOEXhYpNb505szFjZYv9EI6Tfe+TwoO+8hVlGPrYAAchbGuV6Obf/UYYwhT8f4vTe9Hb9x/JU4upLiwvp5GOeLhw3yDFMzhYoU0jRvjHWXssHgGm9VL3T7uDcfwZQEadMhAx6D6TglXODQSobTZxwyaWCcBZN+zBbhzcXibuoKIEKU+gQx6phooIWF1PeAHVxxYQxc9/wBcMFTJeXzAHxs/7r6B8gFeDjtIU2Jh/HxhakIRpAR52mWxZwLtE1LXMpxkqjd2e7MtrXWl/26JWAHAFQcj6M4/o+csRdY554tlcg4F0uUWAZrbECzAaUkRsMh4iwFF2qvHRT2sqapvQBnV57b+tOhqssQTvQ4BARHmqQYDIcLdwb+8ZtWYzqboml8klEX219slz58lKTpwq3pb5ECOOkprMZYJIk3ia3RPUW3A7xcCB0ywb0YxtJgeTUl6vMTOs4B4FOdlepo1t2S8KeRVxdmAHzhVSklBoMVX3SVHJqmDlZbC61bSBVhOByBC08WI+dw8cIFXyxVKnSuHue8z61AsHh02Fw437tRBPMEDMDu7gS3fNN1+LF/91LMdgu8868+j+mkQZzEmM5mcMagLoqz586f/eBoZfXHmVABq/J9JOsgglx4sTtBFCscufo4ZlszfNcPfC/aMO6TnR088IU7oGyJ208+gJVDRwPhzC3SpJe6uLwqOrD14GJfsrzCDOjfS+EijkDWnCFr/jBS8W+ePXM6mA+LK31tagN+JW1pvS9GZDGIzhK1jTZN1RijjdF1U1Tzyljj3GU3m32LHwDImqatZn9DYG+x1v4vrfW7uRCP5Yxfz7nwTDouwJkvEQYilHUVBD3anhTTuQ0g5uXIKIB25NWD21aHMJdfZFmeYTgYI46TPcCaJW8u706nALEe4PThPQ8QqsC8c+TC4lF9XN7flJ8UHncJOEIA52yIKhhtoIO0mSMvYeUlvoN9HzYjH6EQYIFOzYUAl9zXYwhaBQuTvjNgsTyrUVYlRqOxl2Hv6jGSl1erK59o1TQ1jNFIkqyPhMRJhOnO1FO1A+bQJS112w1jnj3JL9uHMCaMEEcK991/Hklk8bSbb0AiOC5OKsxnRciYJIAwmk2332eMe7fgOAaiqxhj3AOWQbfBGphG4xnPezauecIN2Lh4EWtXrSJKMoD5rMSLZy5gY/2SbY29FCfZoOvTZV3bK7nS/W4fNlUGeMETB3Ku5kSfckbfbY35g/ls+tqmaV6zu3nuw9NpIAWxvdf8x60N+NVqV/AOACwc8r1/vMJ19r/GwHjkmWHAOgNbLx29OIrU8+Mofq1U8vmcAY1poALw2GWdGeOwubkF5wwG+cCfxkJ5cy4AnnVTo9UtlJQYjcYeYOvj7b5T1nlt+6aqUdR1qCkg+5h+rCII5cNsIOrZdXGcoK4rNHXl3YilweoQ+s5SIIPAHfBcCUI4PevWb2qzAtkgh2BeJamzMpIk6SMVi/PJ4wpeU7GrIbggcy3gQvLFVOIYjPtNsa5LzAuf+RhFCZSSGK+MoVuN3Z0JiqLAYDT0YGKc4PDRw9ja2OwlyLgQsMYswqUhs9BP9oW10oGs5By09cKmcRbjnX/6KTAu8C3f8ixc2NjCJy5uQsaJt9gkRz7Mj023t3+jrcrfVUkyIsK3Z3l+PWd4MXM2123Nkjh+1tHHXAPrCIcOr2J3awf56lVgABRXaFqL3en0b5N8YBjDMcCis1h6xIYWWY6uO8FB4FzcDdB0KSP0Qc7FZ9qmRtM0ejAcvEW32hTzwg4Gg3lVlaiLCtTlRLA0/KS93jV9vW4A3U30B9zC0D34xofX8vEqnDXH0yw70rZ1RYR7it0ZoLVrHftQJMVJOP6UeVE8VQhxLQn+kwSWGW0AF0Q8JIdtfYzbq+F4SSpGIcnHWAwGw1Ds09N3XRDA1K2n8jpHvqyYUEiSpBcHAdCHzACASRnCn4sSYkpKVHWNtmkRRdEeMA+BeScC8s6CH4twWArGQLHnC0B7xmMU+QSoTkuQ9ozzXgvD4xJBHjxw+z1wRQFPAXRrsHboEDq22mw6AzmvkRAniVf+JX+fg/EAxXyGwWgQQlsMSZJhvDJGMS88uIvO4nWhmpP2NV8DttHdIw/+EmN+XLtQajzM8Y53fRxFWeA5z74Fs3mF2+/ZCclLAnGc3sxUUpuyhp3PJwDe2RQFBJO/PVgbuXJW3PK0f/HMT0kZgVkLoSQevPc+POaGJ4HIj0VblXAOP8+BO8vZ7ok4TTbm8+kzACgAVgh+PssGDxJ5B96EkK0nVDW7R68+YWzQpWyaBibwJwCgnO72i2G7LPZZEktr4DLQ2tffBkD7fl72xcu1LwdvYKir4sTaVYfv4FKOZRzbqph/N4D3A4CzLYBYG6NTZ/QbGMHU1LwuEuq5XPIf5VI+lQPfQOQZeisra0CoNEQh2UfrFlmegXGOpq5RV16/DvC+LA+0Yt7n53s/N06SXqKKliImLJBe6rqBsz6DkAFQ0hOEejXhBSSPHsDqznTGl7AUD7gZYyGVggkFQJvGV/SVkfLm/9KYeWIORxSF3AnrNfs6AJJ1eQhAMFURNiBCqxto46sxd5RoxjnmRYEoWDhN0wT5L9FP4jwfYj6dL/IJGMAhwNEpDofnTQDBf6d1Ftb6Yiv+ZPUMSyYFslXgfbfejtNntvDCFz4Xrba454vb8LwETpGMoNGgJzEBsGjdbGsDUT64Zbg6guDeHZjPZjh/+gxgHSAYLNmwAdDLtre3Xu203cYOAcD7lmfffGe6mMf7VIAvnj5zxXm7+ElL0/wKLkR46etvA/iK2pLtc8CN8KeDkuqxnPMR+cUn0jR/+oxtvx/h9JnuTjcBvAdgMEYDwE4DvDeKs/eOxiuoq+IxxrrrCfRaIvdtjrpTx9NXkzQO3+253nHiwbIulg3mmWs8VAzqqu/sZw92tOC29Ww/GzLyvJjlIotPLlLblubFEufCOhAZyCgKVsACZmaMQ0WxF8PQLXSj0dYes5BdujHvwMYF54JLn7izgLAWPTBGI44W1ZabuoGUKoh8ei68T2eOAuDWhT0JLFg51jhsb26g1RoRY30dh+VH3JUz6+BHxjxdl0cRonihI+F7yAEuMRxL3H7H2Ts3Nt9bP/2ZN1+tm7ma7JafnBfT1wpkS64lW7ojBiWjTKkYzjqcPXUKSZqCuEUx3UG2eshL07ctiOg0uQZdGLRvtH8y7oH6w5+Wvnt5gX8pd3gx+Pu7DuBRswHsQ0zDAAxWxiMlo6hp5pvltAYYECXJJ5xztwohXkzO7Zbl9LZ9/saiEesvq+saW81FEMdZzsRZEP+Zspj/dJrnP8EFT0AMum1gwJBmuZecEgJRAPQWG/MiI3/Ps+187kAvbqoK2pggGiEgAz7Q6xp1ljngT4Lcfb4AAAvXSURBVP1g/vsv8hYAEXzVY+vZdjJabDZSSmhjemwj4nHPITBao20a1FWQ4RY+QsI72jIWX8d5l/Pv+26dA5ceiGRgsFbD2Rb5YNSzLHmgKjMGFEWBLM+CZeNLpk92dmCMQZZlPfuv4wQsPBIHa10v8YVgpfDlsCCDlw+DgzMtmrZBlMZr5y7Mf/rsn30sZoxLgG4lslu16TLr9mHxIuKOnCiKApN77kEkODY31mGd+8x0svnM0aFV1DMvHe8cfZiswMFGl51el29L7324i/8y/3+UbAD7Gk0Q58dX0sHgPSB6GrF8WM5qAgjT7W2MVta+N83ZNVVZbuhG7+zdoQ8+qfHaypqUaruoKmjL4eo5AHtHMd39OaPbt6V5/vtRFN0cRRGapsFkZ8fTjGOfW9Av0u5f/3C7k8BHD+q6htYaRN60lgFw6z6whwO0vy0TdrodIpzYQvrkHeF8GDDY017Pzy0JhjAOEeoetG0TMIkg3qHtAhgMkQYin6/QJdEAgIojNE0FEEMUJ4iiCHVVIooi71r0YTHPmizLCisrax7jIMLuZAJtjLci4IJISzhRHYHIogpRBC8IEiNJB2BdrH1pcMh6KTVjWgghPxmr6DfLqvobIpoQcVhTLyHul51IAOAsWbJkkcQpTt13Hy6cWl93Bq+++wuff4FU8pfPnj6TOGcMCCcPHiL7fu55Zti70JcNkOW/XSFo8KXa15gH8I/cwgQ4fPzof7JEv2Ja/WtSyLaoyrde98Sbpnf//af2UnyBg4sx/DEdDhDFMZqyluPV8Ult7O3WmFUVqQ9MtrdeT84mzswmUqyCCK/hUrwyTuLHeRHMhU5AxwFXkUIcx+DS+9fO2pDco4PPigPJOQum4PLfLmdO0sFfl10KIKQMm9CXuL/dziqhpeRtBwJZD1YmaepdCdeFpAIbMfyutTd/hRCI4wRCed670w5SKDBhMZ8WWD102BN/0OEG8DJsszmOHDkMYy1m012PeUQSZB3qqkSS5SH7kdC2tc85kAmuffy1GI7XcM/dd2E+KZGNIigVwzkHrRu0bQNGbCq4uNU5vD5Jkk9udinEl21LL+xZcAzZeHD4STfdeHF7Y5ufP7UxZwLfaqrp34o4hdXmiVyp9zGwDztrf9Kaeu8lL4Onfsn2FSz4g5d6NG0AwRQcro6+OUrTl1VF+Xwh5eeVUt/FGPuEYPj+jfMXq4Pjyvb8jIYZoij+iTRJX8U5Z9qYb6qqClmeQwqOcj5/hzP2i0mW/Lfp1va1XIifVVH0Q22jlfeZGYSSSFLPwehpxK6j9wKdzJPozOpepnupK0u2/kLgdG/PO1/fW/4L56JLqOmu012OnINpTa/uEzqGuq7hNQ59BEIHtD9O48D/B0wA2MAAwQWWU3TbgGgrpZyKVcPA0w4sFUJiOBqBcYGmqTEYDgEiXFpf9xTpOMa8mPlMTCVgW43ZbAoQMBwNQfCJU4wxjIcjPOHJNyIfDTCdW2ytr6PcfACXdqpLUsoxOdKc8/cyxt6tnf4AWTdp6/Yyi+khVtdlTmOueMJI/CRn0Q3k2K8ZV2+CPD1YRF1tSIJpWgDuoU33r8KCfrjtUbYBAN0mwBXH+KpDP8y5eGPbNooRUiXFp5u6fe58smuWlgQADq44XLMN8FUMxqPrk8Hg80zwiBFk2zQgz778AmfMgtGKiuPrnHVoq/KBajZ7VxQn3+OIbhgGNV9Llpx1NWMhSMv2P38/Szjg0e8+hNUJZQDe9/WtW+gHLYDLeQXduR4+uW/imVZDKR8ma5oabdOQs5YY5zzNc0S9hbB3NZCPvfXsQO8CdPwGr0FQV+WHjKZXqDj6N5zxV2hjTmTZ4Fg2HCzV/5PQbYON9Yu9/qKUIgimEKoymPg98OhrKxy7+hiufuzjEOcR6lrj0voUQ9rCIKPdj972xRdJEfNWN3epWE2r+ZXUcg5aTEuP5MDbgK7WgYBzegksvOJDOHjdr8EG8CjFAADXOuycu+dtK8dueFsi41Vj2ouMsbulEMu1oAAwjNZW/2Ucp/92OsvfzwX7hIzUj4BI7Kxv/micxMQYEinFTZPNi6/hKs4HK8OItXg1EX4WYI8djldfWsxmn3agGyY7Ewjvs/6urpt3pnk2EkKcIOBJy9z1bg45AkzT5kLKf69UFPmF60KZQ9cXENmD+rEDt7vPVyQsRMiWwMFwDWs9CQmBWOOc3QLoopTyJqXU0qUWgKXrMYXOVeFw5Ov3OesgBW9BdFaq6OO6aWZtizcIod9gNf0XLvjrOsS/28CaxidOOWuRZhmM0QGsbEPhle5WHOI4wXU3XIcjx46BqwhNY7CxPoG0FZ5+XYYPf+aun5Gg28pqDgD+3hYjc8V58uU2H8q1D/2GK13ra7Dwu/botAD65hf5aG0N5Wx+o2kunVweD5UoDEajb2Yq+mXG+Xf6EmFh6htjmqL+xbqqfs9Z45knjHp8JspykWYDxgT7cxnFL+ny9v1RTyCi89qapwjOq2I+J2dN67RZHB7LDrpUYI6Oj1dXXy4k/69cBmpheJ/XHEQfWuNBIWjPnQZSTic7DvhIgOjrDlLI+jPQrS9zzhkHWbM7m87+gMjcPxiPXq9UMuysqB5FYIFZaD0/wVgLKWR/XWusK8vydZyzX2tbC6eb/vNcRM9eO3L4z1QUH2FA0E5QmGxvophPkeVDRFEEbbTP5GyqpVC8x/6PX3MUN938dDAmMC8KbK1PwDnhGUcrFOXu7X/5mUvPrRoz2xMeeaRT50pA69dhexRaAPuOSAKmW9sAcBJs9cD7lIqf7wR7ARE0kQMsQOQ+66x7W1lVf8RJaiJvjq4ePvxKAE8sZ7P/SUBurb2NiDEZ+dg2BFHbNu+11v4rEK7OsmwHRIhVNNdt+57trUs/BjDTd6GbaD6H6ULTNP/Dlebt+XDwgwB+XUiZAFiS9vKoviMHZ83SnXZhsIX+Hus2DCzpDmoLIQWiJAJAjpz+nbIufp/IPABiKyB6GZH9Dh+LtxpEf26t+ztr7fMAvAQMSNMMzFqURXFXnMR/TWSnrW7fDaLb6qLG0tEdHCx7kXO+BeBIlxXIpAcPyXE0TYNiXnhsYY+KZMAvHEdZGTz4xVNYO3QEW1ubEHA4kTpkEdt96613PCcSR4o9i/+RmtxXQuy/Ttuj0AJ4eE0NMiRJHHxRC2cdmrpCW3Ro7uJIWDm6+nrO5S1t3fxQXbqzUvJrnbNHBuPBK4QQ093J5P8kSfxTSkWvMta81Rj7zjRJhW5aVEXxV3Gazme7EyziecttMWtVkiJOIzDGXq6U+n7G+fdw7pPK2b6IRff/TvyEgD4pSRsTohHU1e+zjsxfM2Jv2Z1NPhRF0bm2KNEJtDLG1WC08p0gQbvbZ96frx2TSZyc4kod9Vx7T19lwSqpq/rFutG3Lu6hP7r7exqvrSLJ8rtUFN/IWFBJYg7nz5yDaQwo1OFD/8nu8x4HibMEx45fDc45inKOJI6RCYbn3rCCj//9F3711Hr9utIQFklA+4b1n9BifiTtnzeAL6tdDrY9OHNk4mvx6arzURcnc/eZfDREmqaYzWdo5hX2WCQhdLb4/Qp9COrJcZYBzl2d5tmPCylfxgS7mYXMHp/R5gJF2IHBFyXtFGcFk85ZexJgf6q1/mwxefAdPDkM1xosBDYcoGQ+yMcvs8YKweTn6nr3M7o1SIeDOE6Sk1ESPxYOMEbfTs59xlp7wRr71zD2Q0VZPcTY+fser64hStK7oiS9sZNI44Lh3JmzsI3Gfi7h8lioOMLRq49Dqgit9olZVhvEaDAW+tbbH9z5bm202eNOLXfhn5Ap/0jbP28AD6s9khnzSAK9X85XBbSBOYAYGPf8+NaZp+Z5/iwAz+9y5H1N0EAfJgcQ7jTGnFJK/HFVV2guY82gKyTKCOlodBPn0Sc5Y4yc+6m6Kv63bnyRkdHqCOkgh9POaxUUVbjMQ3We9vyaDYdI8sFdSZLeaKz1+EkcYWN9HU1Z9uSiPVYNABErHDl6rC+77RWfHOAsTFv/Vjmb/NLO9nzpK9nl+/Qo3wD+P/ycw/91ZfnhAAAAAElFTkSuQmCC"
@@ -0,0 +1,151 @@
+import logging
+from collections import OrderedDict, deque
+
+log = logging.getLogger("timekeeper.conversation")
+
+CONTEXT_TOKEN_BUDGET = 1500  # History sent with each chat request, per channel
+TRIM_TO_FRACTION = 0.6  # When over budget, drop old turns down to this share of it
+MAX_TURN_TOKENS = 400  # Longer turns are cut short when stored
+MAX_CHANNELS = 1000
+MAX_CACHED_MESSAGES = 10000
+MAX_REPLY_CHAIN = 20
+TURN_OVERHEAD_TOKENS = 4  # Role and separators of each message in the request
+ENCODING_NAME = "o200k_base"
+CHARS_PER_TOKEN = 4  # Estimate used until (or unless) tiktoken is loaded
+
+_encoding = None
+
+
+def load_encoding():
+    """Load tiktoken's encoding for exact token counts; returns whether it is available.
+
+    tiktoken downloads the encoding on first use, so call this from a worker
+    thread (asyncio.to_thread). Until it has finished, and if tiktoken is not
+    installed, tokens are estimated from the text's length.
+    """
+    global _encoding
+    try:
+        import tiktoken
+
+        _encoding = tiktoken.get_encoding(ENCODING_NAME)
+    except Exception as e:  # Not installed, or its encoding data cannot be fetched
+        log.debug(f"Estimating chat tokens from text length, tiktoken is unavailable: {e!r}")
+    return _encoding is not None
+
+
+def count_tokens(text):
+    """Tokens in `text`: exact once tiktoken's encoding is loaded, otherwise estimated."""
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def truncate_tokens(text, limit):
+    """Cut `text` down to about `limit` tokens, marking the cut."""
+    # Text far beyond the limit is cut by length first, so encoding it stays cheap
+    text_limit = limit * CHARS_PER_TOKEN * 2
+    cut = len(text) > text_limit
+    text = text[:text_limit]
+    if count_tokens(text) <= limit:
+        return text + "…" if cut else text
+    if _encoding is not None:
+        return _encoding.decode(_encoding.encode(text)[:limit]) + "…"
+    return text[:limit * CHARS_PER_TOKEN] + "…"
+
+
+class Turn:
+    __slots__ = ("message_id", "channel_id", "role", "text", "reply_to", "tokens")
+
+    def __init__(self, message_id, channel_id, role, text, reply_to=None):
+        self.message_id = message_id
+        self.channel_id = channel_id
+        self.role = role  # "user" or "assistant"
+        self.text = text
+        self.reply_to = reply_to  # ID of the message this one replies to
+        self.tokens = count_tokens(text) + TURN_OVERHEAD_TOKENS
+
+    def as_message(self):
+        return {"role": self.role, "content": self.text}
+
+
+class ConversationStore:
+    """Recent chat turns per channel, kept within a token budget, for mention replies.
+
+    Channels are evicted least recently used beyond `max_channels`. Within a
+    channel, once the stored turns exceed `budget` tokens the oldest are
+    dropped until they fit in TRIM_TO_FRACTION of it. Trimming in steps
+    rather than one turn at a time keeps the start of the history unchanged
+    over several requests, so the provider's prompt cache can reuse it.
+
+    Every stored turn is also indexed by message ID, so reply chains are
+    followed from memory instead of fetching the referenced messages.
+    """
+
+    def __init__(self, budget=CONTEXT_TOKEN_BUDGET, max_channels=MAX_CHANNELS, max_messages=MAX_CACHED_MESSAGES):
+        self.budget = budget
+        self.max_channels = max_channels
+        self.max_messages = max_messages
+        self._channels = OrderedDict()  # channel_id -> [deque of turns, total tokens]
+        self._messages = OrderedDict()  # message_id -> Turn
+
+    def add(self, message_id, channel_id, role, text, reply_to=None):
+        """Record a turn and return it; a message already recorded is returned unchanged."""
+        turn = self._messages.get(message_id)
+        if turn is not None:
+            return turn
+        turn = Turn(message_id, channel_id, role, truncate_tokens(text, MAX_TURN_TOKENS), reply_to)
+        channel = self._channels.get(channel_id)
+        if channel is None:
+            channel = self._channels[channel_id] = [deque(), 0]
+            while len(self._channels) > self.max_channels:
+                _, (evicted, _) = self._channels.popitem(last=False)
+                for old in evicted:
+                    self._messages.pop(old.message_id, None)
+        else:
+            self._channels.move_to_end(channel_id)
+        channel[0].append(turn)
+        channel[1] += turn.tokens
+        if channel[1] > self.budget:
+            while channel[0] and channel[1] > self.budget * TRIM_TO_FRACTION:
+                channel[1] -= channel[0].popleft().tokens
+        self._messages[message_id] = turn
+        while len(self._messages) > self.max_messages:
+            self._messages.popitem(last=False)
+        return turn
+
+    def get(self, message_id):
+        return self._messages.get(message_id)
+
+    def context(self, channel_id, reply_to=None, reserve=0):
+        """Return the history, oldest first, to send before a new message in `channel_id`.
+
+        A reply gets the chain of messages it replies to (as far as it is in
+        memory); anything else gets the channel's recent turns. Either way the
+        history fits in the budget minus `reserve` tokens.
+        """
+        budget = self.budget - reserve
+        if reply_to is not None and reply_to in self._messages:
+            turns = []
+            turn = self._messages.get(reply_to)
+            while turn is not None and len(turns) < MAX_REPLY_CHAIN:
+                turns.append(turn)
+                turn = self._messages.get(turn.reply_to) if turn.reply_to is not None else None
+            turns.reverse()
+        else:
+            channel = self._channels.get(channel_id)
+            turns = list(channel[0]) if channel else []
+
+        # Keep the newest turns that fit
+        used = 0
+        start = len(turns)
+        while start > 0 and used + turns[start - 1].tokens <= budget:
+            start -= 1
+            used += turns[start].tokens
+        return [turn.as_message() for turn in turns[start:]]
+
+    def stats(self):
+        return {
+            "channels": len(self._channels),
+            "messages": len(self._messages),
+            "tokens": sum(tokens for _, tokens in self._channels.values()),
+        }
@@ -0,0 +1,130 @@
+import asyncio
+import logging
+
+from chat_queue import BucketMap, TokenBucket
+
+log = logging.getLogger("timekeeper.dispatcher")
+
+# How long to wait after the first due reminder for others due at the same moment
+BATCH_WINDOW_SECONDS = 0.5
+MAX_BATCH_SIZE = 200
+# Prepares in flight; generations among them are combined by the GenerationBatcher and
+# capped upstream by the LLM gateway, so this only needs to cover a batch window's worth
+GENERATE_CONCURRENCY = 50
+SEND_CONCURRENCY = 10
+
+# Discord allows 50 requests/s per bot and about 5 messages per 5s per channel
+GLOBAL_RATE = 50
+GLOBAL_BURST = 50
+ROUTE_RATE = 1
+ROUTE_BURST = 5
+
+
+class Dispatch:
+    """One due reminder occurrence moving through the dispatcher."""
+
+    def __init__(self, key, fire_at, route=None, content=None, attempt=0):
+        self.key = key
+        self.fire_at = fire_at
+        self.route = route  # Rate-limit bucket key, normally the channel ID
+        self.content = content  # Set up front when retrying or replaying an already prepared send
+        self.attempt = attempt
+        self.sent_at = None
+        self.error = None
+
+
+class ReminderDispatcher:
+    """Sends reminders that come due together as one coordinated batch.
+
+    `submit()` queues a due occurrence. The dispatcher waits BATCH_WINDOW_SECONDS
+    for others due at the same time, then runs the batch: `prepare(dispatch)`
+    fills in the route and content with at most `generate_concurrency` in
+    flight, `deliver(dispatch)` sends with at most `send_concurrency` in flight,
+    each send paced by a global and a per-route token bucket. Once every send
+    in the batch has finished, `record(dispatches)` is called once so the
+    outcomes can be persisted in a single write.
+
+    Batches run concurrently, sharing those limits, so a batch held up by slow
+    generations never delays the reminders due after it.
+    """
+
+    def __init__(self, prepare, deliver, record,
+                 batch_window=BATCH_WINDOW_SECONDS, max_batch=MAX_BATCH_SIZE,
+                 generate_concurrency=GENERATE_CONCURRENCY, send_concurrency=SEND_CONCURRENCY):
+        self._prepare = prepare
+        self._deliver = deliver
+        self._record = record
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self._generate_slots = asyncio.Semaphore(generate_concurrency)
+        self._send_slots = asyncio.Semaphore(send_concurrency)
+        self._global_bucket = TokenBucket(GLOBAL_RATE, GLOBAL_BURST)
+        self._route_buckets = BucketMap(ROUTE_RATE, ROUTE_BURST)
+        self._pending = {}  # (key, fire_at) -> Dispatch, in submission order
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self._batch_tasks = set()
+        self.batches = 0
+        self.sent = 0
+        self.failed = 0
+
+    def submit(self, key, fire_at, route=None, content=None, attempt=0):
+        if (key, fire_at) in self._pending:
+            return  # Already queued for this batch
+        self._pending[(key, fire_at)] = Dispatch(key, fire_at, route, content, attempt)
+        self._wakeup.set()
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for task in self._batch_tasks:
+            task.cancel()
+
+    @property
+    def depth(self):
+        return len(self._pending)
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            await asyncio.sleep(self.batch_window)
+            batch = [self._pending.pop(pending_key) for pending_key in list(self._pending)[:self.max_batch]]
+            if not self._pending:
+                self._wakeup.clear()
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch):
+        try:
+            await self._dispatch_batch(batch)
+        except Exception as e:
+            log.error(f"Reminder batch of {len(batch)} failed: {e!r}")
+
+    async def _dispatch_batch(self, batch):
+        await asyncio.gather(*(self._dispatch(dispatch) for dispatch in batch))
+        self.batches += 1
+        sent = sum(1 for dispatch in batch if dispatch.sent_at)
+        self.sent += sent
+        self.failed += len(batch) - sent
+        log.debug(f"Dispatched reminder batch: {sent}/{len(batch)} sent.")
+        await self._record(batch)
+
+    async def _dispatch(self, dispatch):
+        try:
+            async with self._generate_slots:
+                ready = await self._prepare(dispatch)
+            if not ready:
+                return
+            async with self._send_slots:
+                await self._route_buckets.bucket(dispatch.route).acquire()
+                await self._global_bucket.acquire()
+                dispatch.sent_at = await self._deliver(dispatch)
+        except Exception as e:
+            dispatch.error = e
+            log.error(f"Reminder dispatch failed for {dispatch.key}: {e!r}")
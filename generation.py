@@ -0,0 +1,121 @@
+import asyncio
+import contextvars
+import itertools
+import logging
+import time
+
+from logs import consume_exception
+
+log = logging.getLogger("timekeeper.generation")
+
+# How long to collect prompts after the first one, so reminders due together share calls
+BATCH_WINDOW_SECONDS = 0.25
+MAX_PROMPTS_PER_CALL = 10
+
+
+class GenerationBatcher:
+    """Generates reminder texts for prompts that come in together in as few completions as possible.
+
+    Prompts submitted within BATCH_WINDOW_SECONDS of each other form one batch.
+    Identical shared prompts in a batch get a single text. The distinct prompts
+    go upstream `max_per_call` at a time through `generate_many(prompts)`, which
+    returns one text (or None) per prompt. A prompt the combined reply left out,
+    or a chunk whose call failed, is generated on its own with `generate_one(prompt, shared)`.
+    """
+
+    def __init__(self, generate_one, generate_many,
+                 batch_window=BATCH_WINDOW_SECONDS, max_per_call=MAX_PROMPTS_PER_CALL):
+        self._generate_one = generate_one
+        self._generate_many = generate_many
+        self.batch_window = batch_window
+        self.max_per_call = max_per_call
+        self._pending = {}  # key -> [prompt, future, waiters, shared]
+        self._flush_handle = None
+        self._unshared = itertools.count()
+        self._tasks = set()
+        self.requests = 0  # Texts asked for
+        self.generated = 0  # Distinct texts generated
+        self.calls = 0  # Upstream completions made
+
+    async def generate(self, prompt, shared=True):
+        """Return a text generated from `prompt`.
+
+        With `shared=False` (the guild opted out of cached completions) the text
+        is generated for this caller alone, though still in a combined call.
+        """
+        self.requests += 1
+        key = prompt if shared else (prompt, next(self._unshared))
+        entry = self._pending.get(key)
+        if entry is None:
+            future = asyncio.get_running_loop().create_future()
+            future.add_done_callback(consume_exception)  # Failures are logged by the callers
+            entry = self._pending[key] = [prompt, future, 0, shared]
+            if self._flush_handle is None:
+                # A batch covers many guilds, so it runs in a fresh context rather than inheriting the
+                # first caller's (which would tag the batch's log records with that caller's guild)
+                self._flush_handle = asyncio.get_running_loop().call_later(
+                    self.batch_window, self._flush, context=contextvars.Context())
+        entry[2] += 1
+        # Shielded so one caller giving up does not cancel the text for the others
+        return await asyncio.shield(entry[1])
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "generated": self.generated,
+            "calls": self.calls,
+            "saved": self.requests - self.calls,
+        }
+
+    def _flush(self):
+        self._flush_handle = None
+        batch = list(self._pending.values())
+        self._pending = {}
+        task = asyncio.create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch):
+        started_at = time.monotonic()
+        chunks = [batch[index:index + self.max_per_call] for index in range(0, len(batch), self.max_per_call)]
+        try:
+            calls = sum(await asyncio.gather(*(self._run_chunk(chunk) for chunk in chunks)))
+        finally:
+            for _, future, _, _ in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("Reminder generation was interrupted"))
+        requests = sum(waiters for _, _, waiters, _ in batch)
+        failed = sum(1 for _, future, _, _ in batch if future.exception() is not None)
+        self.generated += len(batch) - failed
+        log.info(f"Generated {len(batch) - failed}/{len(batch)} reminder text(s) for {requests} request(s) "
+                 f"in {calls} completion(s), {requests - calls} call(s) saved, {time.monotonic() - started_at:.1f}s.")
+
+    async def _run_chunk(self, chunk):
+        """Fill in the futures of one chunk; returns the number of upstream calls made."""
+        texts = [None] * len(chunk)
+        calls = 0
+        if len(chunk) > 1:
+            calls += 1
+            try:
+                texts = list(await self._generate_many([prompt for prompt, _, _, _ in chunk]))
+            except Exception as e:
+                log.error(f"Combined generation of {len(chunk)} reminder(s) failed, generating them one by one: {e!r}")
+            if len(texts) != len(chunk):
+                texts = [None] * len(chunk)
+
+        missing = [index for index, text in enumerate(texts) if not text]
+        results = await asyncio.gather(*(self._generate_one(chunk[index][0], chunk[index][3]) for index in missing),
+                                       return_exceptions=True)
+        calls += len(missing)
+        for index, result in zip(missing, results):
+            texts[index] = result
+
+        self.calls += calls
+        for (_, future, _, _), text in zip(chunk, texts):
+            if future.done():
+                continue
+            if isinstance(text, BaseException):
+                future.set_exception(text)
+            else:
+                future.set_result(text)
+        return calls
@@ -0,0 +1,108 @@
+"""Run the bot as several worker processes, each owning a contiguous range of shards.
+
+Usage: python launcher.py --workers 4 [--shards 16]
+
+Every worker is a headless copy of Timekeeper.py (no tray icon, no console
+capture) that schedules reminders only for guilds on its own shards. All
+workers share the SQLite config store. Workers that exit are restarted with
+exponential backoff; Ctrl+C or SIGTERM stops them all.
+"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import time
+
+from storage import SqliteStorage, migrate_json_to_sqlite, CONFIG_FILE, DATABASE_FILE
+
+RESTART_BACKOFF_MAX = 60
+
+
+def shard_ranges(shard_count, workers):
+    """Split shards 0..shard_count-1 into `workers` contiguous, near-equal ranges."""
+    base, extra = divmod(shard_count, workers)
+    ranges = []
+    start = 0
+    for index in range(workers):
+        size = base + (1 if index < extra else 0)
+        ranges.append(list(range(start, start + size)))
+        start += size
+    return ranges
+
+
+def spawn_worker(script, shard_count, shard_ids):
+    env = dict(os.environ)
+    env["TIMEKEEPER_SHARD_COUNT"] = str(shard_count)
+    env["TIMEKEEPER_SHARD_IDS"] = ",".join(str(shard_id) for shard_id in shard_ids)
+    env["TIMEKEEPER_WORKER"] = "1"
+    env["TIMEKEEPER_STORAGE"] = "sqlite"
+    return subprocess.Popen([sys.executable, script], env=env)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="number of worker processes")
+    parser.add_argument("--shards", type=int, default=None, help="total shard count (default: one per worker)")
+    parser.add_argument("--script", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "Timekeeper.py"))
+    args = parser.parse_args()
+
+    shard_count = args.shards or args.workers
+    if shard_count < args.workers:
+        parser.error("--shards must be at least --workers")
+    ranges = shard_ranges(shard_count, args.workers)
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    # Workers share the SQLite store; the legacy JSON config is imported here, once, before
+    # any of them opens it, so they never race to migrate it
+    storage = SqliteStorage(DATABASE_FILE)
+    try:
+        if migrate_json_to_sqlite(CONFIG_FILE, storage):
+            print(f"[DEBUG] Migrated {CONFIG_FILE} to {DATABASE_FILE}.")
+    finally:
+        storage.close()
+
+    workers = []
+    for shard_ids in ranges:
+        workers.append({"shards": shard_ids, "process": spawn_worker(args.script, shard_count, shard_ids),
+                        "failures": 0, "restart_at": None})
+        print(f"[DEBUG] Started worker for shards {shard_ids} (pid {workers[-1]['process'].pid}).")
+
+    while not stopping:
+        time.sleep(1)
+        for worker in workers:
+            process = worker["process"]
+            if worker["restart_at"] is not None:
+                if time.monotonic() >= worker["restart_at"]:
+                    worker["process"] = spawn_worker(args.script, shard_count, worker["shards"])
+                    worker["restart_at"] = None
+                    print(f"[DEBUG] Restarted worker for shards {worker['shards']} (pid {worker['process'].pid}).")
+                continue
+            if process.poll() is not None:
+                worker["failures"] += 1
+                delay = min(RESTART_BACKOFF_MAX, 2 ** worker["failures"])
+                worker["restart_at"] = time.monotonic() + delay
+                print(f"[ERROR] Worker for shards {worker['shards']} exited with code {process.returncode}; "
+                      f"restarting in {delay}s.")
+
+    print("[DEBUG] Stopping workers...")
+    for worker in workers:
+        if worker["restart_at"] is None and worker["process"].poll() is None:
+            worker["process"].terminate()
+    for worker in workers:
+        try:
+            worker["process"].wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            worker["process"].kill()
+
+
+if __name__ == "__main__":
+    main()
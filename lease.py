@@ -0,0 +1,274 @@
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+log = logging.getLogger("timekeeper.lease")
+
+LEASE_FILE = "timekeeper-lease.db"
+LEASE_SECONDS = 15
+RENEW_FRACTION = 1 / 3  # Renew after this share of the lease has passed
+SAFETY_MARGIN_SECONDS = 2  # Stop acting as leader this long before the lease would expire
+
+
+def default_holder():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class FileClock:
+    """Clock read from a file holding a number of seconds, for failover drills.
+
+    Every process pointed at the same file sees the same time, which only moves
+    when the file is rewritten.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def __call__(self):
+        with open(self.path, "r") as f:
+            return float(f.read().strip() or 0)
+
+
+class Lease:
+    """A renewable, named lease in a SQLite database shared by every instance.
+
+    Whoever holds an unexpired lease is the leader; anyone may take it once it
+    has expired. Each change of holder increments a fencing token. `clock`
+    returns wall-clock seconds and must agree between instances (see FileClock
+    for a fake one).
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS leases (
+            name TEXT PRIMARY KEY,
+            holder TEXT NOT NULL,
+            expires_at REAL NOT NULL,
+            token INTEGER NOT NULL
+        );
+    """
+
+    def __init__(self, path, name, holder=None, ttl=LEASE_SECONDS, clock=time.time):
+        self.path = path
+        self.name = name
+        self.holder = holder or default_holder()
+        self.ttl = ttl
+        self.clock = clock
+        self.expires_at = 0.0  # Expiry of our own lease, as far as we know
+        self.token = None
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self.SCHEMA)
+
+    @property
+    def renew_interval(self):
+        return self.ttl * RENEW_FRACTION
+
+    def held(self):
+        """Whether we hold the lease, judged by our clock and the last successful renewal."""
+        return self.clock() < self.expires_at - SAFETY_MARGIN_SECONDS
+
+    def try_acquire(self):
+        """Take the lease if it is free or expired, or renew it if it is ours. Returns whether we hold it."""
+        with self._lock:
+            now = self.clock()
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT holder, expires_at, token FROM leases WHERE name = ?", (self.name,)).fetchone()
+                if row is not None and row[0] != self.holder and row[1] > now:
+                    self._conn.execute("COMMIT")
+                    self.expires_at = 0.0
+                    return False
+                if row is None:
+                    token = 1
+                elif row[0] == self.holder and row[1] > now:
+                    token = row[2]  # Plain renewal
+                else:
+                    token = row[2] + 1  # Taking over (or coming back after our own lease lapsed)
+                self._conn.execute(
+                    "INSERT INTO leases (name, holder, expires_at, token) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET holder=excluded.holder, expires_at=excluded.expires_at, "
+                    "token=excluded.token",
+                    (self.name, self.holder, now + self.ttl, token))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self.expires_at = now + self.ttl
+            self.token = token
+            return True
+
+    def release(self):
+        """Give the lease up early so a standby can take over without waiting for it to expire."""
+        with self._lock:
+            self._conn.execute("UPDATE leases SET expires_at = 0 WHERE name = ? AND holder = ?",
+                               (self.name, self.holder))
+            self.expires_at = 0.0
+
+    def current(self):
+        """Return (holder, expires_at, token) as stored, or None."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT holder, expires_at, token FROM leases WHERE name = ?", (self.name,)).fetchone()
+
+    def check_token(self, token=None):
+        """Whether `token` (by default our own) is still the current fencing token.
+
+        A leader that stalled past its lease may still believe it holds it; the
+        stored token has moved on once someone else took over, so work fenced
+        with the old token is rejected.
+        """
+        token = self.token if token is None else token
+        row = self.current()
+        return token is not None and row is not None and row[0] == self.holder and row[2] == token
+
+    def wait_until_acquired(self):
+        """Block (without an event loop) until we hold the lease."""
+        while not self.try_acquire():
+            time.sleep(self.renew_interval)
+        log.info(f"Acquired lease {self.name!r} as {self.holder} (token {self.token}).")
+
+    async def keep(self):
+        """Renew the lease until it is lost, then return."""
+        while True:
+            await asyncio.sleep(self.renew_interval)
+            try:
+                if await asyncio.to_thread(self.try_acquire):
+                    continue
+                log.error(f"Lease {self.name!r} was taken over by another instance.")
+                return
+            except sqlite3.Error as e:
+                log.error(f"Could not renew lease {self.name!r}: {e}")
+                if not self.held():
+                    return
+
+    def close(self):
+        self._conn.close()
+
+
+def _agent(lease):
+    # One side of the scripted drill: answer commands read from stdin, one per line
+    for line in sys.stdin:
+        command, *args = line.split()
+        if command == "acquire":
+            print(f"{int(lease.try_acquire())} {lease.token}", flush=True)
+        elif command == "check":
+            print(int(lease.check_token(int(args[0]))), flush=True)
+        elif command == "quit":
+            return
+
+
+def drill(ttl=10.0):
+    """Scripted failover drill: two processes share a lease database and a FileClock.
+
+    Checks that a standby takes over once the leader's lease has expired and
+    that the stalled leader's fencing token is then rejected. Returns whether
+    every check passed.
+    """
+    with tempfile.TemporaryDirectory(prefix="timekeeper-drill-") as tmp:
+        db = os.path.join(tmp, "lease.db")
+        clock_file = os.path.join(tmp, "clock.txt")
+
+        def set_clock(now):
+            with open(clock_file, "w") as f:
+                f.write(str(now))
+
+        def spawn(holder):
+            return subprocess.Popen(
+                [sys.executable, os.path.abspath(__file__), "--agent", "--db", db, "--holder", holder,
+                 "--ttl", str(ttl), "--clock-file", clock_file],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+
+        def ask(process, command):
+            process.stdin.write(command + "\n")
+            process.stdin.flush()
+            return process.stdout.readline().split()
+
+        set_clock(0)
+        # Create the schema before both agents start, so they do not race to create it
+        Lease(db, "timekeeper", ttl=ttl, clock=FileClock(clock_file)).close()
+        leader, standby = spawn("leader"), spawn("standby")
+        failures = []
+
+        def expect(ok, description):
+            log.info(f"{'ok  ' if ok else 'FAIL'} {description}")
+            if not ok:
+                failures.append(description)
+
+        try:
+            acquired, old_token = ask(leader, "acquire")
+            expect(acquired == "1", "the first process acquires the free lease")
+            expect(ask(standby, "acquire")[0] == "0", "the second process stays standby while the lease is held")
+
+            set_clock(ttl / 2)
+            expect(ask(leader, "acquire") == ["1", old_token], "the leader renews and keeps its token")
+            expect(ask(standby, "acquire")[0] == "0", "the standby cannot take a renewed lease")
+
+            # The leader stalls: the clock passes its expiry without a renewal
+            set_clock(ttl / 2 + ttl + 1)
+            acquired, new_token = ask(standby, "acquire")
+            expect(acquired == "1", "the standby takes over once the lease has expired")
+            expect(new_token != "None" and int(new_token) > int(old_token), "the takeover increments the fencing token")
+            expect(ask(leader, f"check {old_token}") == ["0"], "the stalled leader's fencing token is rejected")
+            expect(ask(standby, f"check {new_token}") == ["1"], "the new leader's fencing token is accepted")
+            expect(ask(leader, "acquire")[0] == "0", "the old leader cannot take the lease back")
+        finally:
+            for process in (leader, standby):
+                try:
+                    process.stdin.write("quit\n")
+                    process.stdin.close()
+                except OSError:
+                    pass
+                try:
+                    process.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+    return not failures
+
+
+def main():
+    # Failover drill: run this in two terminals against the same database and clock file,
+    # then stop one of them or move the clock forward (echo 100 > clock.txt).
+    # --drill runs a scripted version with two processes and checks the outcome.
+    parser = argparse.ArgumentParser(description="Compete for a lease and report role changes.")
+    parser.add_argument("--db", default=LEASE_FILE)
+    parser.add_argument("--name", default="timekeeper")
+    parser.add_argument("--holder", default=None)
+    parser.add_argument("--ttl", type=float, default=LEASE_SECONDS)
+    parser.add_argument("--clock-file", help="read the time from this file instead of the system clock")
+    parser.add_argument("--poll", type=float, default=1.0, help="seconds between attempts (real time)")
+    parser.add_argument("--drill", action="store_true", help="run the scripted two-process failover drill")
+    parser.add_argument("--agent", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    if args.drill:
+        sys.exit(0 if drill() else 1)
+    clock = FileClock(args.clock_file) if args.clock_file else time.time
+    lease = Lease(args.db, args.name, args.holder, ttl=args.ttl, clock=clock)
+    if args.agent:
+        _agent(lease)
+        return
+    role = None
+    while True:
+        new_role = "leader" if lease.try_acquire() else "standby"
+        if new_role != role:
+            role = new_role
+            holder = lease.current()
+            log.info(f"{lease.holder} is now {role} (holder {holder[0]}, token {holder[2]}, "
+                     f"expires at {holder[1]:.0f}, clock {clock():.0f})")
+        time.sleep(args.poll)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,411 @@
+import asyncio
+import importlib
+import logging
+import random
+import time
+from collections import OrderedDict, deque
+
+log = logging.getLogger("timekeeper.llm")
+
+DEFAULT_MODEL = "gpt-4o"
+DEFAULT_TIMEOUT = 60  # Seconds, across all attempts of a single call
+MAX_CONCURRENCY = 8  # Upstream requests in flight at once, across the whole bot
+MAX_RETRIES = 3
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 10.0
+CACHE_MAX_ENTRIES = 512
+
+# Circuit breaker defaults (see CircuitBreaker)
+BREAKER_WINDOW_SECONDS = 60
+BREAKER_MIN_CALLS = 5
+BREAKER_ERROR_RATE = 0.5
+BREAKER_SLOW_CALL_SECONDS = 20
+BREAKER_SLOW_CALL_RATE = 0.8
+BREAKER_OPEN_SECONDS = 30
+
+
+def retryable_errors():
+    """Errors worth another attempt; anything else (bad request, auth) fails straight away."""
+    import openai
+
+    return (
+        asyncio.TimeoutError,
+        openai.APIConnectionError,
+        openai.APITimeoutError,
+        openai.RateLimitError,
+        openai.InternalServerError,
+    )
+
+
+def build_messages(input_text, instructions, history=()):
+    """Chat messages for a request: the system prompt first, then `history`, then the new user message.
+
+    The system prompt never varies between calls with the same instructions, and
+    history only grows at the end, so consecutive requests share a long prefix
+    that the provider's prompt cache can reuse.
+    """
+    return [{"role": "system", "content": instructions}, *history, {"role": "user", "content": input_text}]
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling upstream while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Stops calling a failing upstream and lets single probes through to detect recovery.
+
+    The outcomes of calls that finished in the last `window` seconds are kept.
+    Once at least `min_calls` of them have finished and the share that failed
+    reaches `error_rate`, or the share that took `slow_call_seconds` or longer
+    reaches `slow_call_rate`, the breaker opens: calls fail fast with
+    CircuitOpenError for `open_seconds`. It then goes half-open and lets one
+    probe through, closing again if the probe succeeds quickly and reopening
+    if it does not.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, window=BREAKER_WINDOW_SECONDS, min_calls=BREAKER_MIN_CALLS, error_rate=BREAKER_ERROR_RATE,
+                 slow_call_seconds=BREAKER_SLOW_CALL_SECONDS, slow_call_rate=BREAKER_SLOW_CALL_RATE,
+                 open_seconds=BREAKER_OPEN_SECONDS):
+        self.window = window
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.open_seconds = open_seconds
+        self.state = self.CLOSED
+        self._calls = deque()  # (finished_at, failed, slow)
+        self._opened_at = 0.0
+        self._probing = False
+        self.times_opened = 0
+        self.rejected = 0
+
+    def before_call(self):
+        """Raise CircuitOpenError unless a call may go upstream now."""
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.open_seconds:
+                self.rejected += 1
+                raise CircuitOpenError(f"LLM circuit open for another {self.retry_after():.1f}s")
+            self.state = self.HALF_OPEN
+            self._probing = False
+        if self.state == self.HALF_OPEN:
+            if self._probing:
+                self.rejected += 1
+                raise CircuitOpenError("LLM circuit half-open, waiting on a probe call")
+            self._probing = True
+
+    def record(self, ok, duration):
+        """Record the outcome of a call that was let through."""
+        slow = duration >= self.slow_call_seconds
+        if self.state == self.HALF_OPEN:
+            if ok and not slow:
+                self.state = self.CLOSED
+                self._calls.clear()
+                log.info("LLM circuit closed: the probe call succeeded.")
+            else:
+                self._open("the probe call failed" if not ok else f"the probe call took {duration:.1f}s")
+            self._probing = False
+            return
+
+        now = time.monotonic()
+        self._calls.append((now, not ok, slow))
+        self._prune(now)
+        if self.state != self.CLOSED or len(self._calls) < self.min_calls:
+            return
+        failures, slow_calls = self._counts()
+        if failures / len(self._calls) >= self.error_rate:
+            self._open(f"{failures}/{len(self._calls)} calls failed")
+        elif slow_calls / len(self._calls) >= self.slow_call_rate:
+            self._open(f"{slow_calls}/{len(self._calls)} calls took {self.slow_call_seconds}s or more")
+
+    def abandon(self):
+        """A call that was let through ended without an outcome (cancelled, or a caller error)."""
+        if self.state == self.HALF_OPEN:
+            self._probing = False
+
+    def retry_after(self):
+        """Seconds until the breaker goes half-open (0 unless it is open)."""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.open_seconds - (time.monotonic() - self._opened_at))
+
+    def stats(self):
+        self._prune(time.monotonic())
+        failures, slow_calls = self._counts()
+        return {
+            "state": self.state,
+            "calls": len(self._calls),
+            "failures": failures,
+            "slow": slow_calls,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+            "retry_after": self.retry_after(),
+        }
+
+    def _counts(self):
+        return sum(1 for _, failed, _ in self._calls if failed), sum(1 for _, _, slow in self._calls if slow)
+
+    def _prune(self, now):
+        while self._calls and self._calls[0][0] < now - self.window:
+            self._calls.popleft()
+
+    def _open(self, reason):
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._calls.clear()
+        self.times_opened += 1
+        log.error(f"LLM circuit opened for {self.open_seconds}s: {reason}.")
+
+
+class ResponseCache:
+    """Bounded LRU of completions with per-entry TTLs and in-flight deduplication.
+
+    Concurrent lookups for a key that is already being generated share the one
+    upstream call instead of starting their own.
+    """
+
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._inflight = {}  # key -> task
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    async def get_or_create(self, key, ttl, factory):
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, ttl, done))
+        # Shield the shared call so one caller timing out does not cancel it for the others
+        return await asyncio.shield(task)
+
+    def lookup(self, key):
+        """Return the cached value for `key`, or None; counts as a hit or a miss."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key, ttl, value):
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _finish(self, key, ttl, task):
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self.put(key, ttl, task.result())
+
+    def stats(self):
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+        }
+
+
+class LLMGateway:
+    """Async access to chat completions through one pooled client.
+
+    Every call shares a global concurrency semaphore, has an overall timeout and
+    is retried on transient errors with full-jitter exponential backoff. Calls
+    made with a `cache_ttl` go through the shared ResponseCache; calls that
+    would go upstream go through the CircuitBreaker first and raise
+    CircuitOpenError straight away while it is open. The openai package is
+    imported in a worker thread by `warm_up()`, which is started at startup
+    and awaited by every request, so the import (most of a second) never
+    blocks the event loop.
+    """
+
+    def __init__(self, api_key, model=DEFAULT_MODEL, max_concurrency=MAX_CONCURRENCY,
+                 default_timeout=DEFAULT_TIMEOUT, max_retries=MAX_RETRIES, breaker=None):
+        self._api_key = api_key
+        self._client = None
+        self._retryable = (asyncio.TimeoutError,)
+        self.model = model
+        self.default_timeout = default_timeout
+        self.max_retries = max_retries
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.cache = ResponseCache()
+        self.breaker = breaker or CircuitBreaker()
+
+    @property
+    def client(self):
+        if self._client is None:
+            from openai import AsyncOpenAI
+
+            # Retries are handled here so they respect the call's deadline and the semaphore
+            self._client = AsyncOpenAI(api_key=self._api_key, max_retries=0)
+            self._retryable = retryable_errors()
+        return self._client
+
+    async def warm_up(self):
+        """Import the openai package off the event loop and return the client."""
+        if self._client is None:
+            await asyncio.to_thread(importlib.import_module, "openai")
+        return self.client
+
+    async def complete(self, input_text, instructions, timeout=None, cache_ttl=0, json_mode=False, history=()):
+        """Return the completion for a system prompt, earlier `history` messages and one user message.
+
+        Raises asyncio.TimeoutError once `timeout` seconds have passed in total.
+        With a non-zero `cache_ttl` the result is cached for that many seconds and
+        identical concurrent calls share one request. With `json_mode` the model
+        is constrained to reply with a JSON object (the instructions must ask for one).
+        """
+        timeout = timeout or self.default_timeout
+        if not cache_ttl:
+            return await self._complete(input_text, instructions, timeout, json_mode, history)
+
+        key = self.cache_key(input_text, instructions, json_mode, history)
+        return await asyncio.wait_for(
+            self.cache.get_or_create(key, cache_ttl,
+                                     lambda: self._complete(input_text, instructions, timeout, json_mode, history)),
+            timeout=timeout
+        )
+
+    def cache_key(self, input_text, instructions, json_mode=False, history=()):
+        """Key of the ResponseCache entry that `complete()` uses for these arguments."""
+        return (self.model, instructions, input_text, json_mode,
+                tuple((message["role"], message["content"]) for message in history))
+
+    async def _complete(self, input_text, instructions, timeout, json_mode=False, history=()):
+        self.breaker.before_call()
+        started_at = time.monotonic()
+        try:
+            result = await self._request(input_text, instructions, timeout, json_mode, history)
+        except self._retryable:
+            self.breaker.record(False, time.monotonic() - started_at)
+            raise
+        except BaseException:
+            self.breaker.abandon()  # Cancelled, or rejected for reasons that say nothing about upstream health
+            raise
+        self.breaker.record(True, time.monotonic() - started_at)
+        return result
+
+    async def _request(self, input_text, instructions, timeout, json_mode, history):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        messages = build_messages(input_text, instructions, history)
+        options = {"response_format": {"type": "json_object"}} if json_mode else {}
+        client = await self.warm_up()
+
+        attempt = 0
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            try:
+                async with self._semaphore:
+                    completion = await asyncio.wait_for(
+                        client.chat.completions.create(model=self.model, messages=messages, **options),
+                        timeout=deadline - loop.time()
+                    )
+                return completion.choices[0].message.content
+            except self._retryable as e:
+                attempt += 1
+                if attempt > self.max_retries or loop.time() >= deadline:
+                    raise
+                await self._backoff(e, attempt, deadline)
+
+    async def stream(self, input_text, instructions, timeout=None, cache_ttl=0, history=()):
+        """Async generator yielding the completion text in pieces as it is produced.
+
+        Transient errors are retried only until the first piece has been yielded.
+        A cached response is yielded whole; with `cache_ttl` the streamed text is
+        cached once complete. The circuit breaker judges the call by how long the
+        first piece took.
+        """
+        timeout = timeout or self.default_timeout
+        key = self.cache_key(input_text, instructions, history=history)
+        if cache_ttl:
+            cached = self.cache.lookup(key)
+            if cached is not None:
+                yield cached
+                return
+
+        self.breaker.before_call()
+        started_at = time.monotonic()
+        first_piece_after = None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        messages = build_messages(input_text, instructions, history)
+
+        attempt = 0
+        parts = []
+        try:
+            client = await self.warm_up()
+            while True:
+                if deadline - loop.time() <= 0:
+                    raise asyncio.TimeoutError()
+                try:
+                    async with self._semaphore:
+                        response = await asyncio.wait_for(
+                            client.chat.completions.create(model=self.model, messages=messages, stream=True),
+                            timeout=deadline - loop.time()
+                        )
+                        chunks = response.__aiter__()
+                        while True:
+                            try:
+                                chunk = await asyncio.wait_for(chunks.__anext__(), timeout=deadline - loop.time())
+                            except StopAsyncIteration:
+                                break
+                            if not chunk.choices:
+                                continue
+                            delta = chunk.choices[0].delta.content
+                            if delta:
+                                if first_piece_after is None:
+                                    first_piece_after = time.monotonic() - started_at
+                                parts.append(delta)
+                                yield delta
+                    break
+                except self._retryable as e:
+                    attempt += 1
+                    if parts or attempt > self.max_retries or loop.time() >= deadline:
+                        raise
+                    await self._backoff(e, attempt, deadline)
+        except self._retryable:
+            self.breaker.record(False, time.monotonic() - started_at)
+            raise
+        except BaseException:
+            self.breaker.abandon()  # Cancelled, closed early by the consumer, or a caller error
+            raise
+        self.breaker.record(True, first_piece_after if first_piece_after is not None else time.monotonic() - started_at)
+
+        if cache_ttl:
+            self.cache.put(key, cache_ttl, "".join(parts))
+
+    async def _backoff(self, error, attempt, deadline):
+        loop = asyncio.get_running_loop()
+        delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (attempt - 1)))
+        delay = min(delay, max(0.0, deadline - loop.time()))
+        log.debug(f"LLM call failed ({type(error).__name__}), retry {attempt} in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.close()
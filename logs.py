@@ -0,0 +1,229 @@
+import contextvars
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+from collections import deque
+from datetime import datetime
+from logging.handlers import QueueHandler
+
+LOG_FILE = "timekeeper.log"
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUPS = 3
+BUFFER_MAX_BYTES = 1024 * 1024  # In-memory history shown when the console is opened
+MAX_RECORD_CHARS = 16 * 1024  # Longer messages (huge tracebacks, LLM output) are truncated
+WRITE_BATCH_SIZE = 500
+
+# Guild the current task is working for; attached to every record it logs
+guild_context = contextvars.ContextVar("guild_id", default=None)
+
+
+class RingBuffer:
+    """Recent log lines, bounded by their total size in bytes rather than their count."""
+
+    def __init__(self, max_bytes=BUFFER_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._lines = deque()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def append(self, line):
+        size = len(line.encode("utf-8", "replace"))
+        with self._lock:
+            self._lines.append((line, size))
+            self._size += size
+            while self._size > self.max_bytes and len(self._lines) > 1:
+                _, dropped = self._lines.popleft()
+                self._size -= dropped
+
+    def tail(self, max_bytes=None):
+        """Return the newest lines, up to `max_bytes` of them (default: everything kept)."""
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        lines = []
+        with self._lock:
+            for line, size in reversed(self._lines):
+                if size > budget:
+                    break
+                budget -= size
+                lines.append(line)
+        return "".join(reversed(lines))
+
+    @property
+    def size(self):
+        return self._size
+
+
+class ContextFilter(logging.Filter):
+    """Fill in `record.guild_id` from guild_context unless it was passed with `extra=`."""
+
+    def filter(self, record):
+        if getattr(record, "guild_id", None) is None:
+            record.guild_id = guild_context.get()
+        return True
+
+
+def _text_line(record):
+    guild = f" [guild {record.guild_id}]" if record.guild_id is not None else ""
+    timestamp = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
+    return f"{timestamp} {record.levelname:<7} {record.name}{guild}: {record.getMessage()}\n"
+
+
+def _json_line(record):
+    return json.dumps({
+        "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+        "level": record.levelname,
+        "logger": record.name,
+        "guild_id": record.guild_id,
+        "message": record.getMessage(),
+    }) + "\n"
+
+
+class _QueueHandler(QueueHandler):
+    def prepare(self, record):
+        record = super().prepare(record)  # Folds args and the traceback into the message
+        if len(record.msg) > MAX_RECORD_CHARS:
+            record.msg = record.msg[:MAX_RECORD_CHARS] + f"... [{len(record.msg) - MAX_RECORD_CHARS} chars truncated]"
+        return record
+
+
+class LogWriter(threading.Thread):
+    """Background thread that moves queued records into the ring buffer, the log file and the console.
+
+    Records are taken off the queue in batches; each batch is one file write
+    and flush, with size-based rotation. Nothing on the event loop touches a
+    file or the console.
+    """
+
+    def __init__(self, path=LOG_FILE, max_bytes=LOG_FILE_MAX_BYTES, backups=LOG_FILE_BACKUPS,
+                 buffer=None):
+        super().__init__(name="log-writer", daemon=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.buffer = buffer or RingBuffer()
+        self.queue = queue.SimpleQueue()
+        self._console = None
+        self._console_lock = threading.Lock()
+        self._file = None
+
+    def attach_console(self, stream):
+        """Print the buffered history to `stream`, then keep writing new lines to it."""
+        with self._console_lock:
+            stream.write(self.buffer.tail())
+            stream.flush()
+            self._console = stream
+
+    def detach_console(self):
+        with self._console_lock:
+            self._console = None
+
+    def run(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write(batch)
+            except Exception as e:
+                if sys.__stderr__ is not None:
+                    sys.__stderr__.write(f"Log writer failed: {e}\n")
+
+    def _write(self, records):
+        text = []
+        for record in records:
+            line = _text_line(record)
+            self.buffer.append(line)
+            text.append(line)
+        with self._console_lock:
+            if self._console is not None:
+                try:
+                    self._console.write("".join(text))
+                    self._console.flush()
+                except (OSError, ValueError):
+                    self._console = None  # Console window was closed
+        if self.path:
+            data = "".join(_json_line(record) for record in records)
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            if self._file.tell() + len(data) > self.max_bytes:
+                self._rotate()
+            self._file.write(data)
+            self._file.flush()
+
+    def _rotate(self):
+        self._file.close()
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backups:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+
+class LogStream:
+    """File-like stand-in for stdout/stderr that logs each complete line.
+
+    Catches output that does not go through logging (stray prints, tracebacks
+    written by libraries), which would otherwise be lost in a windowed build.
+    """
+
+    def __init__(self, logger, level):
+        self._logger = logger
+        self._level = level
+        self._partial = ""
+
+    def write(self, text):
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            if line.strip():
+                self._logger.log(self._level, line)
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+
+def consume_exception(future):
+    """Done callback for futures whose failures are reported elsewhere.
+
+    Retrieving the exception keeps asyncio from logging "exception was never
+    retrieved" when nothing awaits the future.
+    """
+    if not future.cancelled():
+        future.exception()
+
+
+def setup_logging(path=LOG_FILE, level=logging.DEBUG, capture_stdio=True):
+    """Route all logging through a background LogWriter and return it.
+
+    `level` applies to the bot's own "timekeeper.*" loggers; libraries log at
+    INFO and above. With `capture_stdio`, sys.stdout and sys.stderr are
+    replaced with LogStreams; otherwise every line is also echoed to stderr.
+    """
+    writer = LogWriter(path)
+    handler = _QueueHandler(writer.queue)
+    handler.addFilter(ContextFilter())
+    root = logging.getLogger()
+    root.handlers[:] = [handler]
+    root.setLevel(logging.INFO)
+    logging.getLogger("timekeeper").setLevel(level)
+    writer.start()
+
+    if capture_stdio:
+        sys.stdout = LogStream(logging.getLogger("timekeeper.stdout"), logging.INFO)
+        sys.stderr = LogStream(logging.getLogger("timekeeper.stderr"), logging.ERROR)
+    elif sys.__stderr__ is not None:
+        writer.attach_console(sys.__stderr__)
+    return writer
@@ -0,0 +1,152 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+
+log = logging.getLogger("timekeeper.watchdog")
+
+STALL_THRESHOLD_SECONDS = 1.0  # A loop that has not run a callback for this long is stalled
+CHECK_INTERVAL_SECONDS = 0.25
+RECENT_STALLS = 20
+PROFILE_SAMPLE_INTERVAL = 0.005
+PROFILE_MAX_SECONDS = 60
+PROFILE_TOP_FUNCTIONS = 40
+
+
+def _describe_context(frame):
+    """Guild, command and task the loop was busy with, read from the stalled frames' locals."""
+    guild_id = None
+    command = None
+    while frame is not None:
+        local_vars = frame.f_locals
+        interaction = local_vars.get("interaction")
+        if command is None and interaction is not None and getattr(interaction, "command", None) is not None:
+            command = interaction.command.name
+        if guild_id is None:
+            if interaction is not None and getattr(interaction, "guild_id", None) is not None:
+                guild_id = interaction.guild_id
+            elif isinstance(local_vars.get("guild_id"), (int, str)):
+                guild_id = local_vars["guild_id"]
+        frame = frame.f_back
+    return guild_id, command
+
+
+class Stall:
+    """One stretch of time the event loop did not get to run its callbacks."""
+
+    def __init__(self, started_at, task, guild_id, command, stack):
+        self.started_at = started_at  # time.time() when the stall was detected
+        self.duration = None  # Seconds, once the loop is running again
+        self.task = task
+        self.guild_id = guild_id
+        self.command = command
+        self.stack = stack
+
+    def describe(self):
+        where = [f"task {self.task}" if self.task else "no task"]
+        if self.command:
+            where.append(f"/{self.command}")
+        if self.guild_id is not None:
+            where.append(f"guild {self.guild_id}")
+        duration = f"{self.duration:.2f}s" if self.duration is not None else "ongoing"
+        return f"{duration} in {', '.join(where)}"
+
+
+class LoopWatchdog(threading.Thread):
+    """Thread that notices when the event loop stops running callbacks and records what it was doing.
+
+    Every CHECK_INTERVAL_SECONDS it schedules a no-op on the loop. If that has
+    not run within `threshold` seconds, the loop thread's current stack is
+    captured, together with the running task and the guild and command found
+    in the stalled frames, and logged; once the loop catches up, the stall's
+    length is logged and passed to `on_stall(stall)`.
+
+    Create and start it from the loop's own thread.
+    """
+
+    def __init__(self, loop, threshold=STALL_THRESHOLD_SECONDS, on_stall=None):
+        super().__init__(name="loop-watchdog", daemon=True)
+        self.loop = loop
+        self.threshold = threshold
+        self.on_stall = on_stall
+        self.loop_thread_id = threading.get_ident()
+        self.recent = deque(maxlen=RECENT_STALLS)
+        self._stopped = threading.Event()
+
+    def stop(self):
+        self._stopped.set()
+
+    def run(self):
+        while not self._stopped.is_set():
+            answered = threading.Event()
+            sent_at = time.monotonic()
+            try:
+                self.loop.call_soon_threadsafe(answered.set)
+            except RuntimeError:
+                return  # Loop closed
+            if not answered.wait(self.threshold):
+                stall = self._capture()
+                answered.wait()
+                stall.duration = time.monotonic() - sent_at
+                self.recent.append(stall)
+                log.warning(f"Event loop stall over: {stall.describe()}.")
+                if self.on_stall is not None:
+                    try:
+                        self.on_stall(stall)
+                    except Exception as e:
+                        log.error(f"Stall callback failed: {e!r}")
+            self._stopped.wait(CHECK_INTERVAL_SECONDS)
+
+    def _capture(self):
+        frame = sys._current_frames().get(self.loop_thread_id)
+        task = asyncio.current_task(self.loop)
+        guild_id, command = _describe_context(frame)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+        stall = Stall(time.time(), task.get_name() if task else None, guild_id, command, stack)
+        log.warning(f"Event loop stalled for over {self.threshold:.1f}s: {stall.describe()}. "
+                    f"Loop thread stack:\n{stack}")
+        return stall
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+
+
+def sample_profile(thread_id, seconds, interval=PROFILE_SAMPLE_INTERVAL, top=PROFILE_TOP_FUNCTIONS):
+    """Sample a thread's stack for `seconds` and return a text report of its hottest functions.
+
+    Blocks the calling thread, which must not be the one being sampled. "Self"
+    counts samples with the function on top of the stack; "total" counts samples
+    with it anywhere on the stack.
+    """
+    seconds = min(seconds, PROFILE_MAX_SECONDS)
+    own = Counter()
+    total = Counter()
+    samples = 0
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        frame = sys._current_frames().get(thread_id)
+        if frame is not None:
+            samples += 1
+            own[_frame_label(frame)] += 1
+            seen = set()
+            while frame is not None:
+                label = _frame_label(frame)
+                if label not in seen:
+                    seen.add(label)
+                    total[label] += 1
+                frame = frame.f_back
+        time.sleep(interval)
+
+    lines = [f"{samples} samples over {seconds:.0f}s, every {interval * 1000:.0f}ms", ""]
+    for title, counts in (("Self (on top of the stack)", own), ("Total (anywhere on the stack)", total)):
+        lines.append(f"{title}:")
+        lines.append(f"{'samples':>8} {'share':>6}  function")
+        for label, count in counts.most_common(top):
+            lines.append(f"{count:>8} {count / max(samples, 1):>6.1%}  {label}")
+        lines.append("")
+    return "\n".join(lines)
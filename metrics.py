@@ -0,0 +1,217 @@
+import asyncio
+import time
+from contextlib import contextmanager
+
+# Upper bounds in seconds, chosen to cover both sub-millisecond I/O and multi-minute lateness
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(label_key, extra=()):
+    pairs = list(label_key) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value):
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    def __init__(self, name, help):
+        self.name = name
+        self.help = help
+        self._values = {}
+
+    def inc(self, amount=1, **labels):
+        key = _label_key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(_label_key(labels), 0)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for key, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(key)} {_format_value(value)}")
+        return lines
+
+
+class Gauge:
+    """A value that is either set directly or read from a callable at render time."""
+
+    def __init__(self, name, help):
+        self.name = name
+        self.help = help
+        self._values = {}
+
+    def set(self, value, **labels):
+        self._values[_label_key(labels)] = value
+
+    def track(self, function, **labels):
+        self._values[_label_key(labels)] = function
+
+    def value(self, **labels):
+        value = self._values.get(_label_key(labels), 0)
+        return value() if callable(value) else value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge"]
+        for key, value in sorted(self._values.items(), key=lambda item: item[0]):
+            try:
+                value = value() if callable(value) else value
+            except Exception:
+                continue
+            lines.append(f"{self.name}{_format_labels(key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram, plus the maximum seen, per label set."""
+
+    def __init__(self, name, help, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets)
+        self._series = {}  # label key -> [bucket counts, sum, count, max]
+
+    def observe(self, value, **labels):
+        key = _label_key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = [[0] * len(self.buckets), 0.0, 0, 0.0]
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[0][index] += 1
+                break
+        series[1] += value
+        series[2] += 1
+        series[3] = max(series[3], value)
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the wall-clock duration of the `with` block (awaits inside it included)."""
+        started_at = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(time.monotonic() - started_at, **labels)
+
+    def label_sets(self):
+        return [dict(key) for key in sorted(self._series)]
+
+    def summary(self, **labels):
+        """Return count, mean, p50, p95 and max for one label set (estimated from the buckets)."""
+        series = self._series.get(_label_key(labels))
+        if series is None or not series[2]:
+            return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+        counts, total, count, maximum = series
+        return {
+            "count": count,
+            "mean": total / count,
+            "p50": self._quantile(counts, count, maximum, 0.5),
+            "p95": self._quantile(counts, count, maximum, 0.95),
+            "max": maximum,
+        }
+
+    def _quantile(self, counts, count, maximum, q):
+        # Linear interpolation inside the bucket holding the q-th observation
+        rank = q * count
+        seen = 0
+        lower = 0.0
+        for bound, bucket_count in zip(self.buckets, counts):
+            if bucket_count and seen + bucket_count >= rank:
+                return min(maximum, lower + (bound - lower) * (rank - seen) / bucket_count)
+            seen += bucket_count
+            lower = bound
+        return maximum  # Beyond the last bucket
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for key, (counts, total, count, _) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{_format_labels(key, [('le', _format_value(bound))])} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(key, [('le', '+Inf')])} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {count}")
+        return lines
+
+
+REMINDER_LATENESS = Histogram(
+    "timekeeper_reminder_lateness_seconds", "Time from a reminder's scheduled minute to its message being sent.")
+SCHEDULER_LAG = Histogram(
+    "timekeeper_scheduler_lag_seconds", "Time from a reminder's scheduled minute to the scheduler firing it.")
+LLM_LATENCY = Histogram(
+    "timekeeper_llm_latency_seconds", "Duration of chatbot completions by use case.")
+LLM_REQUESTS = Counter(
+    "timekeeper_llm_requests_total", "Chatbot completions by use case and outcome (ok, error).")
+CHAT_FIRST_TEXT = Histogram(
+    "timekeeper_chat_first_text_seconds", "Time from a mention being answered to the first text of the reply being visible.")
+DISCORD_SEND_LATENCY = Histogram(
+    "timekeeper_discord_send_seconds", "Duration of Discord message sends by kind.")
+STORAGE_IO = Histogram(
+    "timekeeper_storage_io_seconds", "Duration of config flushes and outbox syncs.")
+LOOP_LAG = Histogram(
+    "timekeeper_event_loop_lag_seconds", "How much later than requested the event loop woke a sleeping probe.")
+LOOP_STALLS = Counter(
+    "timekeeper_event_loop_stalls_total", "Times the event loop went longer than the stall threshold without running callbacks.")
+QUEUE_DEPTH = Gauge(
+    "timekeeper_queue_depth", "Items waiting in each internal queue.")
+STARTUP_SECONDS = Gauge(
+    "timekeeper_startup_seconds", "Seconds from process start to each startup phase.")
+
+ALL_METRICS = [REMINDER_LATENESS, SCHEDULER_LAG, LLM_LATENCY, LLM_REQUESTS, CHAT_FIRST_TEXT, DISCORD_SEND_LATENCY,
+               STORAGE_IO, LOOP_LAG, LOOP_STALLS, QUEUE_DEPTH, STARTUP_SECONDS]
+
+LOOP_LAG_INTERVAL = 0.5  # seconds between event loop probes
+
+
+def render_prometheus():
+    lines = []
+    for metric in ALL_METRICS:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+async def monitor_loop_lag(interval=LOOP_LAG_INTERVAL):
+    """Sleep `interval` over and over, recording how late each wakeup is."""
+    while True:
+        started_at = time.monotonic()
+        await asyncio.sleep(interval)
+        LOOP_LAG.observe(max(0.0, time.monotonic() - started_at - interval))
+
+
+async def _handle_request(reader, writer):
+    try:
+        request_line = await asyncio.wait_for(reader.readline(), 5)
+        while (await asyncio.wait_for(reader.readline(), 5)) not in (b"\r\n", b"\n", b""):
+            pass  # Headers are not needed
+        parts = request_line.decode("latin-1").split()
+        if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/metrics":
+            status, body = "200 OK", render_prometheus()
+        else:
+            status, body = "404 Not Found", "Not found\n"
+        payload = body.encode()
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+            f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode() + payload)
+        await writer.drain()
+    except (asyncio.TimeoutError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve_metrics(port, host="127.0.0.1"):
+    """Serve GET /metrics in the Prometheus text format. Returns the asyncio server."""
+    return await asyncio.start_server(_handle_request, host, port)
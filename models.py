@@ -0,0 +1,213 @@
+import copy
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+# The guild's original reminder lives in the top-level config fields under this ID.
+# Further reminders are records in guild_config["reminders"], keyed by their own IDs.
+MAIN_REMINDER_ID = "main"
+
+# Fire times are naive local datetimes throughout the scheduler. They are kept as
+# wall-clock seconds since this epoch (not POSIX time) so that every datetime,
+# including ones inside a DST gap, converts back to exactly the same value.
+_EPOCH = datetime(1970, 1, 1)
+
+
+def to_epoch(moment):
+    return (moment - _EPOCH).total_seconds()
+
+
+def from_epoch(seconds):
+    return _EPOCH + timedelta(seconds=seconds)
+
+
+def _minute_of_day(text):
+    hour, minute = text.split(":")[:2]
+    hour, minute = int(hour), int(minute)
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        raise ValueError(f"Invalid time of day: {text}")
+    return hour * 60 + minute
+
+
+class ReminderTime:
+    """A parsed reminder_time dict: weekday and minute of day as integers.
+
+    Instances are immutable and shared: every reminder with the same
+    reminder_time gets the same object from `from_dict()`.
+    """
+
+    __slots__ = ("kind", "minute_of_day", "weekday", "at")
+
+    def __init__(self, kind, minute_of_day=None, weekday=None, at=None):
+        self.kind = kind  # "daily", "weekly" or "specific"
+        self.minute_of_day = minute_of_day  # 0-1439 for daily and weekly reminders
+        self.weekday = weekday  # 0 (Monday) - 6 for weekly reminders
+        self.at = at  # datetime, to the minute, for specific reminders
+
+    @classmethod
+    def from_dict(cls, reminder_time):
+        """Parse a reminder_time dict; raises KeyError or ValueError if it is not valid."""
+        return _parse_reminder_time(
+            reminder_time["type"], reminder_time.get("time"), reminder_time.get("day"), reminder_time.get("datetime"))
+
+    def next_fire(self, after):
+        """Return the first occurrence in or after the minute of `after`, or None if there is none."""
+        window_start = after.replace(second=0, microsecond=0)
+        if self.kind == "specific":
+            return self.at if self.at >= window_start else None
+        now_minute = window_start.hour * 60 + window_start.minute
+        if self.kind == "daily":
+            days = 0 if self.minute_of_day >= now_minute else 1
+        else:
+            days = (self.weekday - window_start.weekday()) % 7
+            if days == 0 and self.minute_of_day < now_minute:
+                days = 7
+        midnight = window_start.replace(hour=0, minute=0)
+        return midnight + timedelta(days=days, minutes=self.minute_of_day)
+
+    def __repr__(self):
+        return f"ReminderTime({self.kind!r}, minute_of_day={self.minute_of_day}, weekday={self.weekday}, at={self.at})"
+
+
+@lru_cache(maxsize=4096)
+def _parse_reminder_time(kind, time, day, moment):
+    if kind == "daily":
+        return ReminderTime(kind, minute_of_day=_minute_of_day(time))
+    if kind == "weekly":
+        return ReminderTime(kind, minute_of_day=_minute_of_day(time), weekday=WEEKDAYS.index(day))
+    if kind == "specific":
+        return ReminderTime(kind, at=datetime.fromisoformat(moment).replace(second=0, microsecond=0))
+    raise ValueError(f"Unknown reminder type: {kind}")
+
+
+def _parse_fire_at(value):
+    if not value:
+        return None
+    try:
+        return to_epoch(datetime.fromisoformat(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _format_fire_at(seconds):
+    return from_epoch(seconds).isoformat() if seconds is not None else None
+
+
+class Reminder:
+    """One reminder's settings, parsed once when its guild config is loaded or saved.
+
+    `reminder_time` is kept as stored; `schedule` is its parsed ReminderTime, or
+    None if it is unset or invalid. Keys this class does not know about are
+    kept in `extra` and written back unchanged.
+    """
+
+    __slots__ = ("channel_id", "reminder_time", "schedule", "reminder_message", "chatbot_prompt",
+                 "message_mode", "last_sent_date", "last_fired_at", "next_fire_epoch", "last_generated_message",
+                 "extra")
+
+    FIELDS = ("channel_id", "reminder_time", "reminder_message", "chatbot_prompt", "message_mode",
+              "last_sent_date", "last_fired_at", "next_fire_at", "last_generated_message")
+
+    @classmethod
+    def from_dict(cls, data):
+        reminder = cls()
+        reminder.channel_id = data.get("channel_id")
+        reminder.reminder_time = copy.copy(data.get("reminder_time"))
+        reminder.schedule = None
+        if reminder.reminder_time:
+            try:
+                reminder.schedule = ReminderTime.from_dict(reminder.reminder_time)
+            except (KeyError, TypeError, ValueError, AttributeError):
+                pass
+        reminder.reminder_message = data.get("reminder_message")
+        reminder.chatbot_prompt = data.get("chatbot_prompt")
+        reminder.message_mode = data.get("message_mode", "static")
+        reminder.last_sent_date = data.get("last_sent_date")
+        reminder.last_fired_at = data.get("last_fired_at")
+        reminder.next_fire_epoch = _parse_fire_at(data.get("next_fire_at"))
+        reminder.last_generated_message = data.get("last_generated_message")  # Fallback while the LLM is down
+        reminder.extra = {key: copy.deepcopy(value) for key, value in data.items() if key not in cls.FIELDS}
+        return reminder
+
+    def to_dict(self):
+        data = {
+            "channel_id": self.channel_id,
+            "reminder_time": copy.copy(self.reminder_time),
+            "reminder_message": self.reminder_message,
+            "chatbot_prompt": self.chatbot_prompt,
+            "message_mode": self.message_mode,
+            "last_sent_date": self.last_sent_date,
+        }
+        if self.last_fired_at is not None:
+            data["last_fired_at"] = self.last_fired_at
+        if self.next_fire_epoch is not None:
+            data["next_fire_at"] = _format_fire_at(self.next_fire_epoch)
+        if self.last_generated_message is not None:
+            data["last_generated_message"] = self.last_generated_message
+        if self.extra:
+            data.update(copy.deepcopy(self.extra))
+        return data
+
+    @property
+    def next_fire_at(self):
+        return from_epoch(self.next_fire_epoch) if self.next_fire_epoch is not None else None
+
+    def is_complete(self):
+        """Whether it has a channel, a time and a message (or prompt) for its mode."""
+        if not self.channel_id or not self.reminder_time:
+            return False
+        if self.message_mode == "prompt":
+            return bool(self.chatbot_prompt)
+        return bool(self.reminder_message)
+
+
+class GuildConfig:
+    """A guild config in the stored JSON shape, pre-parsed for the scheduler.
+
+    The main reminder's settings are the top-level keys of the stored dict; here
+    they are `main`, with the guild's other reminders in `reminders`. Instances
+    are treated as immutable once built: changes go through `to_dict()`, an
+    edit, and `from_dict()` again (see ConfigStore).
+    """
+
+    __slots__ = ("enabled", "main", "reminders", "next_reminder_id")
+
+    # next_due_at is no longer used; configs that still have it drop it when loaded
+    FIELDS = ("enabled", "reminders", "next_reminder_id", "next_due_at")
+
+    @classmethod
+    def from_dict(cls, data):
+        guild = cls()
+        guild.enabled = data.get("enabled")
+        # Unknown top-level keys (such as llm_cache) are kept in the main reminder's extra
+        guild.main = Reminder.from_dict({key: value for key, value in data.items() if key not in cls.FIELDS})
+        guild.reminders = {reminder_id: Reminder.from_dict(reminder)
+                           for reminder_id, reminder in (data.get("reminders") or {}).items()}
+        guild.next_reminder_id = data.get("next_reminder_id")
+        return guild
+
+    def to_dict(self):
+        data = self.main.to_dict()
+        if self.enabled is not None:
+            data["enabled"] = self.enabled
+        if self.reminders:
+            data["reminders"] = {reminder_id: reminder.to_dict() for reminder_id, reminder in self.reminders.items()}
+        if self.next_reminder_id is not None:
+            data["next_reminder_id"] = self.next_reminder_id
+        return data
+
+    @property
+    def llm_cache(self):
+        """The guild's llm_cache setting: whether completions may be reused (on unless turned off)."""
+        return self.main.extra.get("llm_cache", True)
+
+    def reminder(self, reminder_id):
+        """Return the Reminder with this ID, or None if the guild has no such reminder."""
+        if reminder_id == MAIN_REMINDER_ID:
+            return self.main
+        return self.reminders.get(reminder_id)
+
+    def iter_reminders(self):
+        yield MAIN_REMINDER_ID, self.main
+        yield from self.reminders.items()
@@ -0,0 +1,154 @@
+import asyncio
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+
+from metrics import STORAGE_IO
+from storage import write_atomically
+
+log = logging.getLogger("timekeeper.outbox")
+
+# Appends arriving within this window share one write + fsync
+SYNC_DELAY_SECONDS = 0.05
+# Rewrite the journal down to its live entries after this many appended lines
+COMPACT_AFTER_LINES = 5000
+# Finished entries are remembered this long, so a replayed or caught-up occurrence is not sent twice
+FINISHED_RETENTION = timedelta(days=2)
+
+
+def outbox_id(guild_id, reminder_id, fire_at):
+    """Idempotency key of one reminder occurrence."""
+    return f"{guild_id}:{reminder_id}:{fire_at.isoformat()}"
+
+
+class Outbox:
+    """Append-only journal of reminder sends, one JSON record per line.
+
+    An occurrence is journaled as pending (with its channel and final text)
+    before it is sent and as done or dropped afterwards. Pending entries found
+    by `load()` were interrupted by a crash or were still being retried, and
+    are replayed. Appends are group-committed: concurrent `add()`/`finish()`
+    calls share a single write and fsync, and each returns once its record is
+    on disk.
+    """
+
+    def __init__(self, path, sync_delay=SYNC_DELAY_SECONDS):
+        self.path = path
+        self.sync_delay = sync_delay
+        self._pending = {}  # id -> pending record
+        self._finished = {}  # id -> finished_at (ISO string)
+        self._buffer = []  # (line, future) waiting for the next sync
+        self._sync_task = None
+        self._lines = 0
+
+    def load(self):
+        """Read the journal and compact it down to its live entries."""
+        self._pending.clear()
+        self._finished.clear()
+        try:
+            with open(self.path, "r") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Torn final line from a crash mid-append
+                    if record.get("op") == "pending":
+                        self._pending[record["id"]] = record
+                    elif record.get("op") == "forgotten":
+                        self._finished.pop(record["id"], None)
+                    else:
+                        self._pending.pop(record["id"], None)
+                        self._finished[record["id"]] = record.get("at")
+        except FileNotFoundError:
+            pass
+        self._rewrite(self._live_records())
+
+    def pending(self):
+        """Pending records in journal order."""
+        return list(self._pending.values())
+
+    def is_known(self, entry_id):
+        """Whether the occurrence is already pending or finished."""
+        return entry_id in self._pending or entry_id in self._finished
+
+    def is_pending(self, entry_id):
+        return entry_id in self._pending
+
+    @property
+    def pending_count(self):
+        return len(self._pending)
+
+    async def add(self, entry_id, **fields):
+        record = {"op": "pending", "id": entry_id, "at": datetime.now().isoformat(), **fields}
+        self._pending[entry_id] = record
+        await self._append(record)
+
+    async def finish(self, entry_id, status="done"):
+        """Mark an entry 'done' (sent) or 'dropped' (given up on)."""
+        if self._pending.pop(entry_id, None) is None:
+            return
+        record = {"op": status, "id": entry_id, "at": datetime.now().isoformat()}
+        self._finished[entry_id] = record["at"]
+        await self._append(record)
+
+    async def forget(self, prefix):
+        """Forget finished entries whose IDs start with `prefix`, so those occurrences can be sent again.
+
+        Pending entries are kept. Returns the number of entries forgotten.
+        """
+        forgotten = [entry_id for entry_id in self._finished if entry_id.startswith(prefix)]
+        for entry_id in forgotten:
+            del self._finished[entry_id]
+        at = datetime.now().isoformat()
+        await asyncio.gather(*(self._append({"op": "forgotten", "id": entry_id, "at": at}) for entry_id in forgotten))
+        return len(forgotten)
+
+    async def _append(self, record):
+        future = asyncio.get_running_loop().create_future()
+        self._buffer.append((json.dumps(record), future))
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.create_task(self._sync())
+        await future
+
+    async def _sync(self):
+        await asyncio.sleep(self.sync_delay)
+        while self._buffer:
+            batch, self._buffer = self._buffer, []
+            try:
+                with STORAGE_IO.time(operation="outbox_sync"):
+                    await asyncio.to_thread(self._write, [line for line, _ in batch])
+            except Exception as e:
+                log.error(f"Failed to write reminder outbox: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(None)
+            if self._lines >= COMPACT_AFTER_LINES:
+                try:
+                    await asyncio.to_thread(self._rewrite, self._live_records())
+                except Exception as e:
+                    log.error(f"Failed to compact reminder outbox: {e}")
+
+    def _write(self, lines):
+        with open(self.path, "a") as f:
+            f.write("".join(line + "\n" for line in lines))
+            f.flush()
+            os.fsync(f.fileno())
+        self._lines += len(lines)
+
+    def _live_records(self):
+        # Keep pending entries and recently finished IDs; everything else is history
+        cutoff = (datetime.now() - FINISHED_RETENTION).isoformat()
+        self._finished = {entry_id: at for entry_id, at in self._finished.items() if at and at >= cutoff}
+        records = list(self._pending.values())
+        records += [{"op": "done", "id": entry_id, "at": at} for entry_id, at in self._finished.items()]
+        return records
+
+    def _rewrite(self, records):
+        write_atomically(self.path, lambda f: f.write("".join(json.dumps(record) + "\n" for record in records)),
+                         prefix=".timekeeper-outbox-")
+        self._lines = len(records)
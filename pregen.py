@@ -0,0 +1,60 @@
+import asyncio
+from datetime import datetime
+
+from logs import consume_exception
+
+
+class StagedGenerations:
+    """Reminder texts generated ahead of their fire time, waiting to be sent.
+
+    Each entry is keyed by (guild_id, reminder_id, fire_at) and remembers the
+    prompt it was generated from, so a prompt edited after staging is never
+    sent. Entries expire at `expires_at`; the generation runs as a task, so a
+    send that comes while it is still in flight waits for it instead of
+    starting a second call.
+    """
+
+    def __init__(self):
+        self._entries = {}  # key -> (prompt, task, expires_at)
+
+    def start(self, key, prompt, coro, expires_at):
+        self.discard(key)
+        task = asyncio.create_task(coro)
+        task.add_done_callback(consume_exception)  # Failures are reported by the generating coroutine
+        self._entries[key] = (prompt, task, expires_at)
+        self._prune()
+
+    def is_staged(self, key):
+        return key in self._entries
+
+    def discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry and not entry[1].done():
+            entry[1].cancel()
+
+    def discard_prefix(self, prefix):
+        """Drop every entry whose key starts with `prefix`, e.g. (guild_id,) or (guild_id, reminder_id)."""
+        for key in [key for key in self._entries if key[:len(prefix)] == prefix]:
+            self.discard(key)
+
+    async def take(self, key, prompt):
+        """Return the staged text for `key`, or None if there is no usable entry."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        staged_prompt, task, expires_at = entry
+        if staged_prompt != prompt or datetime.now() > expires_at:
+            task.cancel()
+            return None
+        try:
+            return await task
+        except (Exception, asyncio.CancelledError):
+            return None
+
+    def _prune(self):
+        now = datetime.now()
+        for key in [key for key, entry in self._entries.items() if entry[2] < now]:
+            self.discard(key)
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,123 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from datetime import datetime, timedelta
+
+from models import ReminderTime
+
+log = logging.getLogger("timekeeper.scheduler")
+
+# Upper bound on a single sleep so wall-clock jumps (DST, NTP corrections) are picked up
+MAX_SLEEP_SECONDS = 300
+
+
+# What to do with occurrences missed by more than the grace window (downtime, loop stalls):
+#   fire_late - send every missed occurrence, late, once each
+#   skip      - drop them and wait for the next occurrence
+#   coalesce  - send a single late message standing in for all of them
+CATCH_UP_POLICIES = ("fire_late", "skip", "coalesce")
+
+
+def plan_next_fire(reminder_time, after, now, grace, policy):
+    """Return the next fire time at or after `after`, applying the catch-up policy to misfires.
+
+    Occurrences no more than `grace` before `now` are always returned as-is, so
+    they fire immediately (late). Older ones are handled according to `policy`.
+    """
+    if not isinstance(reminder_time, ReminderTime):
+        reminder_time = ReminderTime.from_dict(reminder_time)
+    fire_at = reminder_time.next_fire(after)
+    if fire_at is None or fire_at >= now - grace or policy == "fire_late":
+        return fire_at
+    if policy == "skip":
+        return reminder_time.next_fire(now - grace)
+    if policy == "coalesce":
+        # The most recent missed occurrence stands in for all the earlier ones
+        while True:
+            following = reminder_time.next_fire(fire_at + timedelta(minutes=1))
+            if following is None or following > now:
+                return fire_at
+            fire_at = following
+    raise ValueError(f"Unknown catch-up policy: {policy}")
+
+
+class ReminderScheduler:
+    """Min-heap of next-fire datetimes served by a single sleeping task.
+
+    Entries are keyed (one per reminder); rescheduling or cancelling a key leaves its
+    old heap entry in place and it is discarded lazily when it reaches the top.
+    """
+
+    def __init__(self, callback):
+        self._callback = callback  # async callback(key, fire_at)
+        self._heap = []
+        self._entries = {}  # key -> (fire_at, seq) of the live heap entry
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self._running = set()
+
+    def schedule(self, key, fire_at):
+        seq = next(self._counter)
+        self._entries[key] = (fire_at, seq)
+        heapq.heappush(self._heap, (fire_at, seq, key))
+        self._wakeup.set()
+
+    def cancel(self, key):
+        if self._entries.pop(key, None) is not None:
+            self._wakeup.set()
+
+    def is_scheduled(self, key):
+        return key in self._entries
+
+    def next_fire(self, key):
+        entry = self._entries.get(key)
+        return entry[0] if entry else None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _discard_stale(self):
+        while self._heap:
+            fire_at, seq, key = self._heap[0]
+            if self._entries.get(key) == (fire_at, seq):
+                return
+            heapq.heappop(self._heap)
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            self._discard_stale()
+            now = datetime.now()
+
+            if self._heap and self._heap[0][0] <= now:
+                fire_at, _, key = heapq.heappop(self._heap)
+                del self._entries[key]
+                task = asyncio.create_task(self._fire(key, fire_at))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+                continue
+
+            timeout = MAX_SLEEP_SECONDS
+            if self._heap:
+                timeout = min(timeout, (self._heap[0][0] - now).total_seconds())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _fire(self, key, fire_at):
+        try:
+            await self._callback(key, fire_at)
+        except Exception as e:
+            log.error(f"Reminder callback failed for {key}: {e}")
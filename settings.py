@@ -0,0 +1,52 @@
+import os
+
+# Optional KEY=VALUE file read when a setting is not in the environment
+SETTINGS_FILE = os.environ.get("TIMEKEEPER_CONFIG", "timekeeper.env")
+
+_file_settings = None
+
+
+def _load_file(path):
+    settings = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                key, value = line.split("=", 1)
+                value = value.strip()
+                if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+                    value = value[1:-1]
+                settings[key.strip()] = value
+    except FileNotFoundError:
+        pass
+    return settings
+
+
+def get_setting(name, default=None):
+    """Return a setting from the environment, else from SETTINGS_FILE, else `default`."""
+    global _file_settings
+    if name in os.environ:
+        return os.environ[name]
+    if _file_settings is None:
+        _file_settings = _load_file(SETTINGS_FILE)
+    return _file_settings.get(name, default)
+
+
+def load_credentials():
+    """Return (OpenAI API key, Discord token).
+
+    Read from OPENAI_API_KEY and DISCORD_TOKEN (environment or settings file),
+    falling back to the API_KEY and TOKEN of the legacy tokens.py module.
+    """
+    api_key = get_setting("OPENAI_API_KEY")
+    token = get_setting("DISCORD_TOKEN")
+    if api_key is None or token is None:
+        try:
+            import tokens
+        except ImportError:
+            tokens = None
+        api_key = api_key or getattr(tokens, "API_KEY", None)
+        token = token or getattr(tokens, "TOKEN", None)
+    return api_key, token
@@ -0,0 +1,149 @@
+import asyncio
+import logging
+import re
+from collections import deque
+
+log = logging.getLogger("timekeeper.status")
+
+ROTATE_INTERVAL_SECONDS = 24 * 3600
+BATCH_SIZE = 12  # Statuses asked for in one completion
+REFILL_BELOW = 3  # Start a refill once this few statuses are left
+MAX_STATUS_CHARS = 128  # Discord's limit on an activity name
+RESTART_DELAY_SECONDS = 30
+
+# Status prefix -> discord.ActivityType attribute
+ACTIVITY_PREFIXES = {
+    "Playing": "playing",
+    "Listening to": "listening",
+    "Streaming": "streaming",
+    "Watching": "watching",
+    "Competing in": "competing",
+}
+_STATUS_PATTERN = re.compile(r"^\s*['\"]?(" + "|".join(ACTIVITY_PREFIXES) + r")\s+(.+?)['\"]?\s*$", re.DOTALL)
+
+# Shown when nothing could be generated
+DEFAULT_STATUS = ("watching", "the hourglass drain its last grain.")
+
+
+def parse_status(text):
+    """Return (activity type name, activity name) for a generated status, or None if it is not usable."""
+    if not isinstance(text, str):
+        return None
+    match = _STATUS_PATTERN.match(text)
+    if match is None:
+        return None
+    name = " ".join(match.group(2).split())
+    if not name or len(name) > MAX_STATUS_CHARS:
+        return None
+    return ACTIVITY_PREFIXES[match.group(1)], name
+
+
+def _is_valid_entry(entry):
+    # A persisted queue entry: [activity type name, activity name]
+    return (isinstance(entry, (list, tuple)) and len(entry) == 2
+            and entry[0] in ACTIVITY_PREFIXES.values() and isinstance(entry[1], str) and bool(entry[1]))
+
+
+class StatusEngine:
+    """Rotates the bot's presence through a queue of pre-generated statuses.
+
+    Statuses are generated `batch_size` at a time by `generate(count)`, which
+    returns a list of texts; they are validated with parse_status() and kept
+    in a queue persisted with `save(entries)` and restored with `load()`. A
+    refill runs in the background once fewer than `refill_below` are left, so
+    rotating never waits on the API unless the queue is empty. One supervised
+    task does the rotating and is restarted if it fails.
+    """
+
+    def __init__(self, generate, apply, load, save, interval=ROTATE_INTERVAL_SECONDS,
+                 batch_size=BATCH_SIZE, refill_below=REFILL_BELOW):
+        self._generate = generate  # async generate(count) -> list of status texts
+        self._apply = apply  # async apply(activity_type, name)
+        self._load = load
+        self._save = save
+        self.interval = interval
+        self.batch_size = batch_size
+        self.refill_below = refill_below
+        self._queue = deque()
+        self._loaded = False
+        self._advance = asyncio.Event()
+        self._task = None
+        self._refill_task = None
+        self.current = None
+        self.refills = 0
+
+    def __len__(self):
+        return len(self._queue)
+
+    def start(self):
+        """Start the rotation task unless it is already running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._supervise())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def advance(self):
+        """Move on to the next queued status now. Returns False if the queue is empty and must be refilled first."""
+        self._advance.set()
+        return bool(self._queue)
+
+    async def _supervise(self):
+        while True:
+            try:
+                await self._run()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.error(f"Status rotation failed, restarting in {RESTART_DELAY_SECONDS}s: {e!r}")
+                await asyncio.sleep(RESTART_DELAY_SECONDS)
+
+    async def _run(self):
+        if not self._loaded:
+            self._queue.extend(tuple(entry) for entry in self._load() or [] if _is_valid_entry(entry))
+            self._loaded = True
+        while True:
+            self._advance.clear()
+            if not self._queue:
+                self._start_refill()
+                await asyncio.shield(self._refill_task)
+            status = self._queue.popleft() if self._queue else DEFAULT_STATUS
+            self._save(list(self._queue))
+            if len(self._queue) < self.refill_below:
+                self._start_refill()
+            try:
+                await self._apply(*status)
+                self.current = status
+                log.info(f"Updated status: {status[1]} (Type: {status[0]}), {len(self._queue)} queued.")
+            except Exception as e:
+                log.error(f"Failed to update status: {e}")
+            try:
+                await asyncio.wait_for(self._advance.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def _start_refill(self):
+        if self._refill_task is None or self._refill_task.done():
+            self._refill_task = asyncio.create_task(self._refill())
+
+    async def _refill(self):
+        try:
+            texts = await self._generate(self.batch_size)
+        except Exception as e:
+            log.error(f"Failed to generate statuses: {e!r}")
+            return
+        queued = set(self._queue)
+        added = 0
+        for text in texts or []:
+            status = parse_status(text)
+            if status is None:
+                log.debug(f"Discarding unusable status: {text!r}")
+            elif status not in queued and status != self.current:
+                self._queue.append(status)
+                queued.add(status)
+                added += 1
+        self.refills += 1
+        self._save(list(self._queue))
+        log.debug(f"Generated {added} new status(es) from {len(texts or [])}; {len(self._queue)} queued.")
@@ -0,0 +1,179 @@
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+
+log = logging.getLogger("timekeeper.storage")
+
+CONFIG_FILE = "timekeeper_bot_config.json"
+DATABASE_FILE = "timekeeper_bot_config.db"
+
+
+def write_atomically(path, write, prefix=".timekeeper-"):
+    """Replace `path` with what `write(f)` writes to a text file, all or nothing.
+
+    The data goes to a temporary file in the same directory, is fsynced, and is
+    then moved over `path`, so a crash leaves either the old file or the new one.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=prefix, suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class JsonStorage:
+    """Original storage format: one `{"guilds": {...}}` JSON document rewritten atomically."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            log.debug("Config file not found or corrupted. Creating a new one.")
+            return {"guilds": {}}
+
+    def write(self, config, dirty_ids, dirty_meta=None):
+        # The whole document is rewritten no matter how many guilds or meta keys changed
+        write_atomically(self.path, lambda f: json.dump(config, f, indent=4, default=_encode))
+
+    def enabled_guild_ids(self):
+        return None  # No index; the caller scans memory instead
+
+    def close(self):
+        pass
+
+
+def _encode(value):
+    # ConfigStore hands over GuildConfig models (see models.py); migration passes plain dicts
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class SqliteStorage:
+    """One row per guild in a WAL-mode SQLite database, indexed on `enabled`.
+
+    Only dirty guilds are written on flush. The database can be shared by several
+    processes, each holding its own connection.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS guilds (
+            guild_id TEXT PRIMARY KEY,
+            enabled INTEGER NOT NULL DEFAULT 0,
+            config TEXT NOT NULL
+        );
+        DROP INDEX IF EXISTS idx_guilds_due;
+        CREATE INDEX IF NOT EXISTS idx_guilds_enabled ON guilds (enabled);
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        self._conn.commit()
+
+    def is_empty(self):
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM guilds LIMIT 1").fetchone() is None
+
+    def load(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT guild_id, config FROM guilds").fetchall()
+            meta = self._conn.execute("SELECT key, value FROM meta").fetchall()
+        config = {key: json.loads(value) for key, value in meta}
+        config["guilds"] = {guild_id: json.loads(data) for guild_id, data in rows}
+        return config
+
+    def write(self, config, dirty_ids, dirty_meta=None):
+        """Write the guilds in `dirty_ids` and the meta keys in `dirty_meta` (None: every meta key).
+
+        Only changed meta keys are written, so processes sharing the database do
+        not overwrite each other's values with their stale copies.
+        """
+        guilds = config.get("guilds", {})
+        upserts = []
+        deletes = []
+        for guild_id in dirty_ids:
+            guild_config = guilds.get(guild_id)
+            if hasattr(guild_config, "to_dict"):
+                guild_config = guild_config.to_dict()
+            if guild_config is None:
+                deletes.append((guild_id,))
+            else:
+                upserts.append((guild_id, 1 if guild_config.get("enabled") else 0, json.dumps(guild_config)))
+        meta = [(key, json.dumps(value)) for key, value in config.items()
+                if key != "guilds" and (dirty_meta is None or key in dirty_meta)]
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO guilds (guild_id, enabled, config) VALUES (?, ?, ?) "
+                "ON CONFLICT(guild_id) DO UPDATE SET enabled=excluded.enabled, config=excluded.config",
+                upserts,
+            )
+            self._conn.executemany("DELETE FROM guilds WHERE guild_id = ?", deletes)
+            self._conn.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+                meta,
+            )
+
+    def enabled_guild_ids(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT guild_id FROM guilds WHERE enabled = 1").fetchall()
+        return [row[0] for row in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def migrate_json_to_sqlite(json_path, storage):
+    """One-shot import of the legacy JSON config into an empty SQLite database.
+
+    The JSON file is renamed to `<name>.migrated` afterwards so the import never runs twice.
+    """
+    if not os.path.exists(json_path) or not storage.is_empty():
+        return False
+
+    config = JsonStorage(json_path).load()
+    storage.write(config, set(config.get("guilds", {})))
+    try:
+        os.replace(json_path, json_path + ".migrated")
+    except FileNotFoundError:
+        return False  # Another process sharing the database migrated it at the same time
+    log.debug(f"Migrated {len(config.get('guilds', {}))} guild(s) from {json_path} to {storage.path}.")
+    return True
+
+
+def open_storage(backend, json_path, sqlite_path):
+    """Create the configured storage backend ('json' or 'sqlite')."""
+    if backend == "json":
+        return JsonStorage(json_path)
+    if backend == "sqlite":
+        storage = SqliteStorage(sqlite_path)
+        migrate_json_to_sqlite(json_path, storage)
+        return storage
+    raise ValueError(f"Unknown storage backend: {backend}")
@@ -0,0 +1,65 @@
+import asyncio
+import time
+
+from logs import consume_exception
+
+DISCORD_MESSAGE_LIMIT = 2000
+EDIT_INTERVAL_SECONDS = 1.2  # Discord allows roughly 5 edits per 5 seconds per channel
+TYPING_SUFFIX = " ⏳"
+
+
+def _in_progress(text):
+    return text[:DISCORD_MESSAGE_LIMIT - len(TYPING_SUFFIX)] + TYPING_SUFFIX
+
+
+async def stream_to_channel(channel, pieces, started_at, edit_interval=EDIT_INTERVAL_SECONDS):
+    """Post streamed text as one message that is progressively edited.
+
+    A message is sent as soon as the first piece arrives. Later pieces are
+    coalesced into at most one edit per `edit_interval`, and a final edit lands
+    when the stream ends. Returns (message, seconds to first visible text,
+    seconds to completion), both measured from `started_at` (time.monotonic()).
+    Returns (None, None, None) if the stream produced no text.
+    """
+    message = None
+    first_text = None
+    text = ""
+    shown = ""
+    last_edit = 0.0
+    pending_edit = None
+
+    try:
+        async for piece in pieces:
+            text = (text + piece)[:DISCORD_MESSAGE_LIMIT]
+            if message is None:
+                message = await channel.send(_in_progress(text))
+                first_text = time.monotonic() - started_at
+                shown = text
+                last_edit = time.monotonic()
+                continue
+
+            # Edits run in the background so a slow edit never holds up reading the stream
+            if text != shown and time.monotonic() - last_edit >= edit_interval and (
+                    pending_edit is None or pending_edit.done()):
+                shown = text
+                last_edit = time.monotonic()
+                pending_edit = asyncio.create_task(message.edit(content=_in_progress(shown)))
+                # A failed progress edit is superseded by the next one or the final edit
+                pending_edit.add_done_callback(consume_exception)
+    except Exception:
+        if pending_edit is not None:
+            pending_edit.cancel()  # Must not land after the final text below
+        if message is not None:
+            # Leave what was received without the typing marker before reporting the failure
+            await message.edit(content=text)
+        raise
+
+    if message is None:
+        return None, None, None
+    if pending_edit is not None:
+        try:
+            await pending_edit
+        except Exception:
+            pass  # The final edit below carries the full text anyway
+    await message.edit(content=text)
+    return message, first_text, time.monotonic() - started_at